@@ -0,0 +1,10 @@
+"""Performance benchmarks for ForgingBlocks building blocks.
+
+Each module exposes a ``main(argv)`` entry point and can be run through the
+package dispatcher::
+
+    PYTHONPATH=src python -m benchmarks <benchmark> [options]
+
+Benchmarks only use the standard library. Pass ``--json PATH`` to write
+machine-readable results next to the printed table.
+"""
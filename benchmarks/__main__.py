@@ -0,0 +1,33 @@
+"""Dispatch ``python -m benchmarks <name>`` to ``benchmarks.<name>.main``."""
+
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+
+def _available() -> list[str]:
+    package_dir = Path(__file__).parent
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules([str(package_dir)])
+        if not module.name.startswith("_")
+    )
+
+
+def main(argv: list[str]) -> int:
+    """Run the benchmark named by ``argv[0]`` with the remaining arguments."""
+    available = _available()
+    if not argv or argv[0] not in available:
+        print("usage: python -m benchmarks <benchmark> [options]")
+        print("available benchmarks:")
+        for name in available:
+            print(f"  {name}")
+        return 2
+    module = importlib.import_module(f"benchmarks.{argv[0]}")
+    module.main(argv[1:])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""Event and aggregate fixtures shared by the benchmarks."""
+
+from typing import Self, cast
+from uuid import UUID
+
+from forging_blocks.domain.aggregate_root.snapshottable_aggregate_root import (
+    SnapshottableAggregateRoot,
+)
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+
+
+class CounterIncremented(Event[dict[str, object]]):
+    """Small event with a realistic dict payload."""
+
+    def __init__(self, amount: int, note: str = "", metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._amount = amount
+        self._note = note
+
+    @property
+    def _payload(self) -> dict[str, object]:
+        return {"amount": self._amount, "note": self._note}
+
+    @property
+    def value(self) -> dict[str, object]:
+        return self._payload
+
+    @classmethod
+    def from_payload_fields(cls, data: dict[str, object], metadata: MessageMetadata) -> Self:
+        return cls(int(str(data["amount"])), str(data.get("note", "")), metadata)
+
+
+class Counter(SnapshottableAggregateRoot[UUID, dict[str, object]]):
+    """Aggregate whose state is the running sum of its events."""
+
+    def __init__(self, aggregate_id: UUID) -> None:
+        super().__init__(aggregate_id)
+        self.total = 0
+
+    def snapshot_state(self) -> object:
+        return {"total": self.total}
+
+    def _restore_snapshot_state(self, state: object) -> None:
+        self.total = int(str(cast(dict[str, object], state)["total"]))
+
+    def _handle(self, event: Event[dict[str, object]]) -> None:
+        self.total += int(str(event.value["amount"]))
+
+
+def make_events(count: int, note: str = "benchmark") -> list[CounterIncremented]:
+    """Return *count* fresh ``CounterIncremented`` events."""
+    return [CounterIncremented(i, note) for i in range(count)]
@@ -0,0 +1,146 @@
+"""Shared measurement, argument parsing and reporting helpers for benchmarks."""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """One benchmark data point.
+
+    ``operations`` is the number of logical operations performed in
+    ``seconds`` of wall-clock time. ``latencies`` optionally holds
+    per-sample durations (seconds) used for percentile reporting.
+    """
+
+    benchmark: str
+    case: str
+    params: dict[str, object]
+    operations: int
+    seconds: float
+    latencies: Sequence[float] = field(default=(), repr=False)
+
+    @property
+    def ops_per_second(self) -> float:
+        """Return throughput in operations per second."""
+        return self.operations / self.seconds if self.seconds > 0 else float("inf")
+
+    def percentile_us(self, percentile: float) -> float | None:
+        """Return the given latency percentile in microseconds, if sampled."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, round(percentile / 100 * (len(ordered) - 1)))
+        return ordered[index] * 1e6
+
+    def as_dict(self) -> dict[str, object]:
+        """Return a JSON-serializable representation."""
+        result: dict[str, object] = {
+            "benchmark": self.benchmark,
+            "case": self.case,
+            "params": self.params,
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "ops_per_second": self.ops_per_second,
+        }
+        if self.latencies:
+            result["latency_us"] = {
+                "mean": statistics.fmean(self.latencies) * 1e6,
+                "p50": self.percentile_us(50),
+                "p95": self.percentile_us(95),
+                "p99": self.percentile_us(99),
+            }
+        return result
+
+
+def parser(description: str, sizes: Sequence[int]) -> argparse.ArgumentParser:
+    """Return an argument parser with the options every benchmark accepts."""
+    result = argparse.ArgumentParser(description=description)
+    result.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(sizes),
+        help="problem sizes to run (default: %(default)s)",
+    )
+    result.add_argument("--json", type=Path, default=None, help="write results as JSON")
+    return result
+
+
+def timed(operations: int, fn: Callable[[], object]) -> tuple[int, float]:
+    """Run *fn* once and return ``(operations, elapsed_seconds)``."""
+    start = time.perf_counter()
+    fn()
+    return operations, time.perf_counter() - start
+
+
+async def timed_async(operations: int, fn: Callable[[], Awaitable[object]]) -> tuple[int, float]:
+    """Await *fn* once and return ``(operations, elapsed_seconds)``."""
+    start = time.perf_counter()
+    await fn()
+    return operations, time.perf_counter() - start
+
+
+async def sample_async(samples: int, fn: Callable[[int], Awaitable[object]]) -> list[float]:
+    """Await ``fn(i)`` for ``i in range(samples)`` and return each duration."""
+    latencies: list[float] = []
+    for i in range(samples):
+        start = time.perf_counter()
+        await fn(i)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(measurements: Sequence[Measurement], json_path: Path | None = None) -> None:
+    """Print a table of *measurements* and optionally write them as JSON."""
+    header = f"{'benchmark':<28} {'case':<34} {'ops/s':>14} {'p50 us':>10} {'p99 us':>10}"
+    print(header)
+    print("-" * len(header))
+    for m in measurements:
+        p50 = m.percentile_us(50)
+        p99 = m.percentile_us(99)
+        print(
+            f"{m.benchmark:<28} {m.case:<34} {m.ops_per_second:>14,.0f} "
+            f"{'' if p50 is None else f'{p50:,.1f}':>10} "
+            f"{'' if p99 is None else f'{p99:,.1f}':>10}"
+        )
+    if json_path is not None:
+        document = {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "results": [m.as_dict() for m in measurements],
+        }
+        json_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+def regressions(
+    measurements: Sequence[Measurement], baseline_path: Path, tolerance: float
+) -> list[str]:
+    """Return a description of each measurement slower than its baseline.
+
+    *baseline_path* is a file written by `report`; measurements are
+    matched by benchmark and case. A measurement regresses when its
+    throughput is more than *tolerance* (a fraction) below the baseline.
+    """
+    document = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline = {
+        (str(result["benchmark"]), str(result["case"])): float(result["ops_per_second"])
+        for result in document["results"]
+    }
+    found: list[str] = []
+    for m in measurements:
+        expected = baseline.get((m.benchmark, m.case))
+        if expected is not None and m.ops_per_second < expected * (1 - tolerance):
+            found.append(
+                f"{m.case:<34} {m.ops_per_second:>14,.0f} ops/s, baseline {expected:,.0f} "
+                f"({m.ops_per_second / expected - 1:+.0%})"
+            )
+    return found
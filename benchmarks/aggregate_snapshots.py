@@ -0,0 +1,128 @@
+"""Cold-load latency of ``AggregateRepository`` with and without snapshots.
+
+For each stream size a ``Counter`` aggregate is written through a
+repository whose ``EventCountSnapshotPolicy`` snapshots every
+``--snapshot-every`` events. Each sample then loads the aggregate through
+a fresh repository (so the in-memory cache is cold):
+
+* ``full-replay`` — no snapshot store; every event is replayed.
+* ``snapshot`` — the latest snapshot is loaded and only the events after
+  it are replayed.
+
+Pass ``--file`` to use ``FileEventStore`` and ``FileSnapshotStore`` in a
+temporary directory instead of the in-memory adapters.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks aggregate_snapshots --sizes 1000 10000 100000
+"""
+
+import asyncio
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from uuid import UUID, uuid7
+
+from benchmarks._events import Counter, CounterIncremented
+from benchmarks._harness import Measurement, parser, report, sample_async
+from forging_blocks.application.ports.outbound.event_store_port import EventStorePort
+from forging_blocks.application.ports.outbound.snapshot_store_port import SnapshotStorePort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores import FileEventStore, InMemoryEventStore
+from forging_blocks.infrastructure.repositories import AggregateRepository
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+from forging_blocks.infrastructure.snapshots import (
+    EventCountSnapshotPolicy,
+    FileSnapshotStore,
+    InMemorySnapshotStore,
+)
+
+NAME = "aggregate_snapshots"
+
+type _Repository = AggregateRepository[dict[str, object], Counter, UUID]
+
+
+def _stores(
+    directory: Path | None,
+) -> tuple[EventStorePort[dict[str, object]], SnapshotStorePort]:
+    if directory is None:
+        return InMemoryEventStore[dict[str, object]](), InMemorySnapshotStore()
+    event_store = FileEventStore[dict[str, object]](
+        directory / "events",
+        codec=DictMessageCodec[Event[dict[str, object]]](),
+        event_types=[CounterIncremented],
+        fsync=False,
+    )
+    return event_store, FileSnapshotStore(directory / "snapshots", fsync=False)
+
+
+async def _run_size(
+    size: int, snapshot_every: int, samples: int, directory: Path | None
+) -> list[Measurement]:
+    params: dict[str, object] = {
+        "events": size,
+        "snapshot_every": snapshot_every,
+        "store": "memory" if directory is None else "file",
+    }
+    event_store, snapshot_store = _stores(directory)
+    writer: _Repository = AggregateRepository(
+        event_store=event_store,
+        aggregate_type=Counter,
+        snapshot_store=snapshot_store,
+        snapshot_policy=EventCountSnapshotPolicy(snapshot_every),
+    )
+    aggregate = Counter(uuid7())
+    aggregate_id = UUID(str(aggregate.id))
+    for i in range(size):
+        aggregate.apply(CounterIncremented(i % 7))
+        if (i + 1) % snapshot_every == 0 or i + 1 == size:
+            await writer.save(aggregate)
+            aggregate.discard_events()
+    expected = aggregate.total
+
+    async def load(with_snapshots: bool) -> None:
+        reader: _Repository = AggregateRepository(
+            event_store=event_store,
+            aggregate_type=Counter,
+            snapshot_store=snapshot_store if with_snapshots else None,
+        )
+        loaded = await reader.get_by_id(aggregate_id)
+        if loaded is None or loaded.total != expected:
+            raise RuntimeError("aggregate was not restored correctly")
+
+    full = await sample_async(samples, lambda _: load(False))
+    snapshot = await sample_async(samples, lambda _: load(True))
+    if isinstance(event_store, FileEventStore):
+        event_store.close()
+    return [
+        Measurement(NAME, f"full-replay n={size:,}", params, samples, sum(full), full),
+        Measurement(NAME, f"snapshot n={size:,}", params, samples, sum(snapshot), snapshot),
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[1_000, 10_000, 100_000])
+    arguments.add_argument("--snapshot-every", type=int, default=100)
+    arguments.add_argument("--samples", type=int, default=20)
+    arguments.add_argument("--file", action="store_true", help="use the file-backed stores")
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        if options.file:
+            with tempfile.TemporaryDirectory() as directory:
+                measurements.extend(
+                    asyncio.run(
+                        _run_size(size, options.snapshot_every, options.samples, Path(directory))
+                    )
+                )
+        else:
+            measurements.extend(
+                asyncio.run(_run_size(size, options.snapshot_every, options.samples, None))
+            )
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Publisher-side latency of inline versus queued event publishing.
+
+Registers ``--handlers`` handlers that each sleep ``--io-ms``
+milliseconds, then publishes ``size`` events, pausing ``--gap-ms``
+after each as a stream of commands would (the pause is part of each
+sample):
+
+* ``inline`` — ``InMemoryEventBus.publish``; the caller waits for every
+  handler.
+* ``queued`` — ``AsyncQueueEventBus`` with ``--workers`` workers; the
+  caller only waits for the event to be queued. Draining the queue is
+  not part of the measured latency; the highest queue lag is printed
+  below the table.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks async_queue_event_bus --sizes 200 1000
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report, sample_async
+from forging_blocks.application.ports.outbound.event_bus_port import EventBusPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_buses import AsyncQueueEventBus, InMemoryEventBus
+
+NAME = "async_queue_event_bus"
+
+
+class _IoHandler:
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    async def handle(self, event: Event[dict[str, object]]) -> None:
+        await asyncio.sleep(self._seconds)
+
+
+async def _run_case(
+    label: str, size: int, handlers: int, io_ms: float, gap_ms: float, workers: int
+) -> Measurement:
+    inner = InMemoryEventBus[dict[str, object], object, object]()
+    for _ in range(handlers):
+        inner.register_handler(CounterIncremented, _IoHandler(io_ms / 1000))
+    bus: EventBusPort[dict[str, object], object, object] = inner
+    queued = None
+    if label == "queued":
+        queued = bus = AsyncQueueEventBus(inner, workers=workers, max_size=size)
+    events = make_events(size)
+
+    async def publish(i: int) -> None:
+        assert (await bus.publish(events[i])).is_ok
+        await asyncio.sleep(gap_ms / 1000)
+
+    latencies = await sample_async(size, publish)
+    params: dict[str, object] = {
+        "events": size,
+        "handlers": handlers,
+        "io_ms": io_ms,
+        "gap_ms": gap_ms,
+        "workers": workers,
+    }
+    if queued is not None:
+        await queued.close()
+        params["max_lag"] = queued.stats.max_lag
+    return Measurement(NAME, f"{label} n={size:,}", params, size, sum(latencies), latencies)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[200, 1_000])
+    arguments.add_argument("--handlers", type=int, default=5)
+    arguments.add_argument("--io-ms", type=float, default=2.0)
+    arguments.add_argument("--gap-ms", type=float, default=1.0)
+    arguments.add_argument("--workers", type=int, default=8)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("inline", "queued"):
+            case = _run_case(
+                label, size, options.handlers, options.io_ms, options.gap_ms, options.workers
+            )
+            measurements.append(asyncio.run(case))
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        if "max_lag" in measurement.params:
+            lag = float(str(measurement.params["max_lag"]))
+            print(f"{measurement.case:<34} max lag {lag * 1000:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""``__hash__`` and ``__eq__`` throughput of ``auto_hash``/``auto_eq`` per field count.
+
+Builds a slotted class with ``size`` fields (strings, ints and a UUID,
+as value objects and messages usually hold) and calls each method
+``--calls`` times:
+
+* ``generated`` — the methods ``auto_hash`` and ``auto_eq`` install: one
+  compiled function per class with direct attribute reads.
+* ``closure`` — a reference of the previous implementation: a generic
+  closure that loops over the field names with ``getattr``, converting
+  every value with ``HashableConverter`` (hash) or feeding a generator
+  to ``all`` (eq).
+
+Equality is measured between two distinct, equal instances, so every
+field is compared.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks auto_hash_eq --sizes 1 4 8 16
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from uuid import uuid4
+
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.foundation.autoeq import auto_eq
+from forging_blocks.foundation.autohash import auto_hash
+from forging_blocks.foundation.autohash.helpers import HashableConverter
+
+NAME = "auto_hash_eq"
+
+
+def _closure_hash(field_names: tuple[str, ...]) -> Callable[[object], int]:
+    def __hash__(self: object) -> int:
+        values = tuple(getattr(self, f) for f in field_names)
+        converted = (
+            HashableConverter.convert(v, field_name=f)
+            for f, v in zip(field_names, values, strict=True)
+        )
+        return hash(tuple(converted))
+
+    return __hash__
+
+
+def _closure_eq(field_names: tuple[str, ...]) -> Callable[[object, object], bool]:
+    def __eq__(self: object, other: object) -> bool:
+        if type(self) is not type(other):
+            return False
+        return all(getattr(self, f) == getattr(other, f) for f in field_names)
+
+    return __eq__
+
+
+def _make_class(size: int) -> type:
+    field_names = tuple(f"f{index}" for index in range(size))
+
+    def __init__(self: object, *values: object) -> None:
+        for name, value in zip(field_names, values, strict=True):
+            object.__setattr__(self, name, value)
+
+    return type(f"Fields{size}", (), {"__slots__": field_names, "__init__": __init__})
+
+
+def _values(size: int) -> list[object]:
+    identifier = uuid4()
+    samples: list[object] = [identifier, "name", 42]
+    return [samples[index % len(samples)] for index in range(size)]
+
+
+def _time(call: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return time.perf_counter() - start
+
+
+def _run_case(label: str, size: int, calls: int) -> list[Measurement]:
+    class_ = _make_class(size)
+    if label == "generated":
+        auto_eq(auto_hash(class_))
+    else:
+        field_names = tuple(sorted(class_.__slots__))
+        class_.__hash__ = _closure_hash(field_names)
+        class_.__eq__ = _closure_eq(field_names)
+    values = _values(size)
+    left, right = class_(*values), class_(*values)
+    params: dict[str, object] = {"fields": size, "calls": calls, "implementation": label}
+    return [
+        Measurement(
+            NAME,
+            f"hash {label} fields={size}",
+            {**params, "method": "hash"},
+            calls,
+            _time(lambda: hash(left), calls),
+        ),
+        Measurement(
+            NAME,
+            f"eq {label} fields={size}",
+            {**params, "method": "eq"},
+            calls,
+            _time(lambda: left == right, calls),
+        ),
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[1, 4, 8, 16])
+    arguments.add_argument("--calls", type=int, default=200_000)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("closure", "generated"):
+            measurements.extend(_run_case(label, size, options.calls))
+    report(measurements, options.json)
+    print()
+    by_case = {measurement.case: measurement for measurement in measurements}
+    for size in options.sizes:
+        for method in ("hash", "eq"):
+            closure = by_case[f"{method} closure fields={size}"]
+            generated = by_case[f"{method} generated fields={size}"]
+            speedup = closure.seconds / generated.seconds
+            print(f"{f'{method} fields={size}':<34} speedup {speedup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""N+1 lookups through ``get_by_id`` versus ``BatchingReadRepository``.
+
+A read repository charges ``--io-ms`` milliseconds per round trip and
+serves at most ``--connections`` round trips at a time, as a database
+behind a connection pool would. A query handler resolves ``size`` related entities,
+one ``get_by_id`` each, concurrently:
+
+* ``per-id`` — every lookup is its own round trip.
+* ``batched`` — the repository is wrapped in
+  ``BatchingReadRepository`` (``--max-batch`` IDs per ``get_many``);
+  the lookups of one tick become one round trip per batch.
+
+Throughput is reported in lookups per second over ``--rounds`` handler
+calls; the number of round trips is printed below the table.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks batched_lookups --sizes 10 100 1000
+"""
+
+import asyncio
+import time
+from collections.abc import Mapping, Sequence
+
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.application.ports.outbound.repository_port import ReadOnlyRepositoryPort
+from forging_blocks.infrastructure.repositories import (
+    BatchingReadRepository,
+    InMemoryReadRepository,
+)
+
+NAME = "batched_lookups"
+
+
+class _RemoteReadRepository(InMemoryReadRepository[dict[str, object], int]):
+    def __init__(self, size: int, io_seconds: float, connections: int) -> None:
+        super().__init__({i: {"id": i, "name": f"customer-{i}"} for i in range(size)})
+        self._io_seconds = io_seconds
+        self._pool = asyncio.Semaphore(connections)
+        self.round_trips = 0
+
+    async def get_by_id(self, entity_id: int) -> dict[str, object] | None:
+        await self._round_trip()
+        return self._storage.get(entity_id)
+
+    async def get_many(self, entity_ids: Sequence[int]) -> Mapping[int, dict[str, object]]:
+        await self._round_trip()
+        return {i: self._storage[i] for i in entity_ids if i in self._storage}
+
+    async def _round_trip(self) -> None:
+        async with self._pool:
+            self.round_trips += 1
+            await asyncio.sleep(self._io_seconds)
+
+
+async def _run_case(
+    label: str, size: int, rounds: int, io_ms: float, connections: int, max_batch: int
+) -> Measurement:
+    remote = _RemoteReadRepository(size, io_ms / 1000, connections)
+    repository: ReadOnlyRepositoryPort[dict[str, object], int] = remote
+    if label == "batched":
+        repository = BatchingReadRepository(remote, max_batch_size=max_batch)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        found = await asyncio.gather(*(repository.get_by_id(i) for i in range(size)))
+        assert all(entity is not None for entity in found)
+    seconds = time.perf_counter() - start
+    params: dict[str, object] = {
+        "lookups": size,
+        "rounds": rounds,
+        "io_ms": io_ms,
+        "connections": connections,
+        "max_batch": max_batch,
+        "round_trips": remote.round_trips,
+    }
+    return Measurement(NAME, f"{label} n={size:,}", params, size * rounds, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10, 100, 1_000])
+    arguments.add_argument("--rounds", type=int, default=20)
+    arguments.add_argument("--io-ms", type=float, default=1.0)
+    arguments.add_argument("--connections", type=int, default=4)
+    arguments.add_argument("--max-batch", type=int, default=500)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("per-id", "batched"):
+            case = _run_case(
+                label, size, options.rounds, options.io_ms, options.connections, options.max_batch
+            )
+            measurements.append(asyncio.run(case))
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        print(f"{measurement.case:<34} round trips {measurement.params['round_trips']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
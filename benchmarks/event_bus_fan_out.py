@@ -0,0 +1,81 @@
+"""Publish latency of ``InMemoryEventBus`` per dispatch strategy and handler count.
+
+Registers ``size`` handlers for ``CounterIncremented``; each simulates an
+I/O-bound projection by sleeping ``--io-ms`` milliseconds. Every
+``DispatchStrategy`` publishes ``--samples`` events and the per-publish
+latency is reported (``bounded`` uses ``--max-concurrency``). With
+sequential dispatch the latency grows with the number of handlers; with
+concurrent fan-out it stays close to a single handler's.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks event_bus_fan_out --sizes 1 10 100
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report, sample_async
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_buses import DispatchStrategy, InMemoryEventBus
+
+NAME = "event_bus_fan_out"
+
+
+class _IoHandler:
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    async def handle(self, event: Event[dict[str, object]]) -> None:
+        await asyncio.sleep(self._seconds)
+
+
+async def _run_case(
+    size: int, dispatch: DispatchStrategy, samples: int, io_ms: float, max_concurrency: int
+) -> Measurement:
+    bus = InMemoryEventBus[dict[str, object], object, object](
+        dispatch, max_concurrency if dispatch is DispatchStrategy.BOUNDED else None
+    )
+    for _ in range(size):
+        bus.register_handler(CounterIncremented, _IoHandler(io_ms / 1000))
+    events = make_events(samples)
+
+    async def publish(i: int) -> None:
+        assert (await bus.publish(events[i])).is_ok
+
+    latencies = await sample_async(samples, publish)
+    params: dict[str, object] = {
+        "handlers": size,
+        "dispatch": str(dispatch),
+        "io_ms": io_ms,
+        "max_concurrency": max_concurrency,
+    }
+    return Measurement(
+        NAME, f"{dispatch} handlers={size}", params, samples, sum(latencies), latencies
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[1, 10, 100])
+    arguments.add_argument("--samples", type=int, default=50)
+    arguments.add_argument("--io-ms", type=float, default=1.0)
+    arguments.add_argument("--max-concurrency", type=int, default=10)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for dispatch in DispatchStrategy:
+            measurements.append(
+                asyncio.run(
+                    _run_case(
+                        size, dispatch, options.samples, options.io_ms, options.max_concurrency
+                    )
+                )
+            )
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Throughput of ``append_batch`` versus one ``append_events`` per stream.
+
+Simulates a Unit of Work touching ``size`` aggregates, each receiving
+``--events`` new events, and commits it ``--commits`` times. For every
+store it reports:
+
+* ``sequential`` — aggregates committed per second when awaiting
+  ``append_events`` once per aggregate.
+* ``batched`` — aggregates committed per second with a single
+  ``append_batch`` call per commit.
+
+Stores measured are ``InMemoryEventStore`` and ``FileEventStore``; pass
+``--fsync`` to make every file write durable, which is where batching
+pays off most (one fsync per commit instead of one per aggregate).
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks event_store_batch_append --sizes 10 200 --fsync
+"""
+
+import asyncio
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from uuid import UUID, uuid7
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.application.ports.outbound.event_store_port import EventStorePort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores import FileEventStore, InMemoryEventStore
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+
+NAME = "event_store_batch_append"
+
+type _Store = EventStorePort[dict[str, object]]
+
+
+async def _sequential(
+    store: _Store, aggregate_ids: Sequence[UUID], events: Sequence[Event[dict[str, object]]]
+) -> None:
+    for aggregate_id in aggregate_ids:
+        current = (await store.get_current_version(aggregate_id)).value
+        result = await store.append_events(aggregate_id, events, expected_version=current)
+        assert result.is_ok
+
+
+async def _batched(
+    store: _Store, aggregate_ids: Sequence[UUID], events: Sequence[Event[dict[str, object]]]
+) -> None:
+    appends = [
+        (aggregate_id, events, (await store.get_current_version(aggregate_id)).value)
+        for aggregate_id in aggregate_ids
+    ]
+    result = await store.append_batch(appends)
+    assert result.is_ok
+
+
+async def _measure(
+    label: str,
+    open_store: Callable[[], _Store],
+    size: int,
+    events_per_aggregate: int,
+    commits: int,
+    params: dict[str, object],
+) -> list[Measurement]:
+    measurements: list[Measurement] = []
+    events = make_events(events_per_aggregate)
+    for mode, commit in (("sequential", _sequential), ("batched", _batched)):
+        store = open_store()
+        aggregate_ids = [uuid7() for _ in range(size)]
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(commits):
+            await commit(store, aggregate_ids, events)
+        seconds = loop.time() - start
+        close = getattr(store, "close", None)
+        if close is not None:
+            close()
+        measurements.append(
+            Measurement(
+                NAME, f"{label} {mode} aggregates={size:,}", params, size * commits, seconds
+            )
+        )
+    return measurements
+
+
+async def _run_size(
+    size: int, events_per_aggregate: int, commits: int, fsync: bool
+) -> list[Measurement]:
+    params: dict[str, object] = {
+        "aggregates": size,
+        "events": events_per_aggregate,
+        "commits": commits,
+        "fsync": fsync,
+    }
+    measurements = await _measure(
+        "memory", InMemoryEventStore[dict[str, object]], size, events_per_aggregate, commits, params
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        counter = iter(range(1_000_000))
+
+        def open_file_store() -> _Store:
+            return FileEventStore[dict[str, object]](
+                Path(directory) / str(next(counter)),
+                codec=DictMessageCodec[Event[dict[str, object]]](),
+                event_types=[CounterIncremented],
+                fsync=fsync,
+            )
+
+        measurements.extend(
+            await _measure("file", open_file_store, size, events_per_aggregate, commits, params)
+        )
+    return measurements
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10, 100, 200])
+    arguments.add_argument("--events", type=int, default=2, help="events per aggregate")
+    arguments.add_argument("--commits", type=int, default=20)
+    arguments.add_argument("--fsync", action="store_true", help="fsync every file write")
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        measurements.extend(
+            asyncio.run(_run_size(size, options.events, options.commits, options.fsync))
+        )
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
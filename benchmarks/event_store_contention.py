@@ -0,0 +1,103 @@
+"""Throughput and conflict rate of many tasks appending to ``InMemoryEventStore``.
+
+Starts ``size`` concurrent tasks spread over ``--aggregates`` streams.
+Each task reads its stream's version and appends ``--appends`` events
+one at a time with that ``expected_version``, re-reading the version and
+retrying on a ``ConcurrencyError``. Writes go through a store whose
+``_persist`` yields to the event loop, as real I/O would, so tasks
+interleave between the version check and the write.
+
+Cases compare ``--stripes`` lock stripes against a single lock shared by
+every aggregate. Throughput is reported in successful appends per
+second; the conflict rate (rejected appends / attempts) is printed below
+the table and stored as ``conflict_rate`` in the ``--json`` output.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks event_store_contention --sizes 1000 5000
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from uuid import UUID, uuid7
+
+from benchmarks._events import make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.application.errors.concurrency_error import ConcurrencyError
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores import InMemoryEventStore
+
+NAME = "event_store_contention"
+
+
+class _IoEventStore(InMemoryEventStore[dict[str, object]]):
+    async def _persist(
+        self, aggregate_id: UUID, base_version: int, events: Sequence[Event[dict[str, object]]]
+    ) -> None:
+        await asyncio.sleep(0)
+
+
+async def _writer(
+    store: _IoEventStore,
+    aggregate_id: UUID,
+    events: Sequence[Event[dict[str, object]]],
+    attempts: list[int],
+) -> None:
+    for event in events:
+        while True:
+            attempts[0] += 1
+            version = (await store.get_current_version(aggregate_id)).value
+            result = await store.append_events(aggregate_id, [event], expected_version=version)
+            if result.is_ok:
+                break
+            assert isinstance(result.error, ConcurrencyError)
+            attempts[1] += 1
+
+
+async def _run_case(size: int, aggregates: int, appends: int, stripes: int) -> Measurement:
+    store = _IoEventStore(lock_stripes=stripes)
+    aggregate_ids = [uuid7() for _ in range(aggregates)]
+    events = make_events(appends)
+    attempts = [0, 0]
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(_writer(store, aggregate_ids[i % aggregates], events, attempts) for i in range(size))
+    )
+    seconds = time.perf_counter() - start
+
+    assert store.position == size * appends
+    params: dict[str, object] = {
+        "tasks": size,
+        "aggregates": aggregates,
+        "appends": appends,
+        "stripes": stripes,
+        "conflict_rate": attempts[1] / attempts[0],
+    }
+    return Measurement(NAME, f"stripes={stripes} n={size:,}", params, size * appends, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[1_000, 5_000])
+    arguments.add_argument("--aggregates", type=int, default=100)
+    arguments.add_argument("--appends", type=int, default=5)
+    arguments.add_argument("--stripes", type=int, default=64)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for stripes in (1, options.stripes):
+            measurements.append(
+                asyncio.run(_run_case(size, options.aggregates, options.appends, stripes))
+            )
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        rate = float(str(measurement.params["conflict_rate"]))
+        print(f"{measurement.case:<34} conflicts {rate:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
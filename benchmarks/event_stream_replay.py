@@ -0,0 +1,99 @@
+"""Peak memory and throughput of loading a long stream at once versus in batches.
+
+Writes one ``Counter`` stream of each requested size to a
+``FileEventStore`` and rebuilds the aggregate twice:
+
+* ``materialized`` — ``get_events`` plus ``AggregateRoot.reconstitute``.
+* ``streamed`` — ``stream_events`` plus ``AggregateRoot.reconstitute_stream``
+  with batches of ``--batch``.
+
+Throughput is reported in events per second. The peak traced memory of
+each load (``tracemalloc``) is printed below the table and stored as
+``peak_bytes`` in the ``--json`` output; it should stay flat for the
+streamed case as the stream grows.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks event_stream_replay --sizes 10000 100000
+"""
+
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from uuid import UUID, uuid7
+
+from benchmarks._events import Counter, CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores import FileEventStore
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+
+NAME = "event_stream_replay"
+
+_WRITE_BATCH = 1_000
+
+
+async def _traced(load: Callable[[], Awaitable[Counter]]) -> tuple[Counter, float, int]:
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        counter = await load()
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return counter, seconds, peak
+
+
+async def _run_size(size: int, batch: int) -> list[Measurement]:
+    with tempfile.TemporaryDirectory() as directory:
+        store = FileEventStore[dict[str, object]](
+            directory,
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[CounterIncremented],
+            fsync=False,
+        )
+        aggregate_id: UUID = uuid7()
+        events = make_events(_WRITE_BATCH)
+        for version in range(0, size, _WRITE_BATCH):
+            count = min(_WRITE_BATCH, size - version)
+            await store.append_events(aggregate_id, events[:count], expected_version=version)
+
+        async def materialized() -> Counter:
+            loaded = (await store.get_events(aggregate_id)).value
+            return Counter.reconstitute(aggregate_id, loaded)
+
+        async def streamed() -> Counter:
+            batches = store.stream_events(aggregate_id, batch_size=batch)
+            return await Counter.reconstitute_stream(aggregate_id, batches)
+
+        measurements: list[Measurement] = []
+        for label, load in (("materialized", materialized), ("streamed", streamed)):
+            counter, seconds, peak = await _traced(load)
+            assert counter.version.value == size
+            params: dict[str, object] = {"events": size, "batch": batch, "peak_bytes": peak}
+            measurements.append(Measurement(NAME, f"{label} n={size:,}", params, size, seconds))
+        store.close()
+    return measurements
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000, 100_000])
+    arguments.add_argument("--batch", type=int, default=512)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        measurements.extend(asyncio.run(_run_size(size, options.batch)))
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        peak = int(str(measurement.params["peak_bytes"]))
+        print(f"{measurement.case:<34} peak {peak / 1024:>12,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
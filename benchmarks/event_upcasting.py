@@ -0,0 +1,110 @@
+"""Decode rate of a mixed-version event stream with and without upcasting.
+
+Encodes ``size`` ``CounterIncremented`` events whose schema version is
+spread evenly over ``1..--versions`` and decodes them three ways:
+
+* ``current`` — every event already at the current version, no registry.
+* ``chain-walk`` — each event walks the single-step upcasters one by
+  one, looking each step up on every decode.
+* ``cached`` — ``DictMessageCodec`` with an ``UpcasterRegistry``, which
+  applies one composed chain per source version.
+
+Throughput is reported in decoded events per second.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks event_upcasting --sizes 10000 100000
+"""
+
+import time
+from collections.abc import Sequence
+from typing import cast
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.infrastructure.serialization import (
+    DictMessageCodec,
+    PayloadUpcaster,
+    UpcasterRegistry,
+)
+
+NAME = "event_upcasting"
+
+_TYPE = CounterIncremented.__name__
+
+
+def _step(version: int) -> PayloadUpcaster:
+    def upcast(payload: dict[str, object]) -> dict[str, object]:
+        payload[f"v{version + 1}"] = version
+        return payload
+
+    return upcast
+
+
+def _stream(size: int, versions: int) -> list[dict[str, object]]:
+    codec = DictMessageCodec[CounterIncremented]()
+    encoded: list[dict[str, object]] = []
+    for index, event in enumerate(make_events(size)):
+        data = codec.encode(event)
+        data["payload"] = dict(cast(dict[str, object], data["payload"]))
+        data["schema_version"] = index % versions + 1
+        encoded.append(data)
+    return encoded
+
+
+def _decode_all(
+    codec: DictMessageCodec[CounterIncremented], stream: list[dict[str, object]]
+) -> float:
+    start = time.perf_counter()
+    for data in stream:
+        codec.decode(
+            {**data, "payload": dict(cast(dict[str, object], data["payload"]))}, CounterIncremented
+        )
+    return time.perf_counter() - start
+
+
+def _chain_walk(
+    steps: dict[int, PayloadUpcaster], current: int, stream: list[dict[str, object]]
+) -> float:
+    codec = DictMessageCodec[CounterIncremented]()
+    start = time.perf_counter()
+    for data in stream:
+        payload = dict(cast(dict[str, object], data["payload"]))
+        for version in range(cast(int, data["schema_version"]), current):
+            payload = steps[version](payload)
+        codec.decode({**data, "payload": payload}, CounterIncremented)
+    return time.perf_counter() - start
+
+
+def _run_size(size: int, versions: int) -> list[Measurement]:
+    stream = _stream(size, versions)
+    registry = UpcasterRegistry()
+    steps: dict[int, PayloadUpcaster] = {}
+    for version in range(1, versions):
+        steps[version] = _step(version)
+        registry.register(_TYPE, version, steps[version])
+    current_stream = [{**data, "schema_version": versions} for data in stream]
+    params: dict[str, object] = {"events": size, "versions": versions}
+
+    cases = (
+        ("current", _decode_all(DictMessageCodec[CounterIncremented](), current_stream)),
+        ("chain-walk", _chain_walk(steps, versions, stream)),
+        ("cached", _decode_all(DictMessageCodec[CounterIncremented](registry), stream)),
+    )
+    return [Measurement(NAME, f"{label} n={size:,}", params, size, s) for label, s in cases]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000, 100_000])
+    arguments.add_argument("--versions", type=int, default=5)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        measurements.extend(_run_size(size, options.versions))
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Append throughput and range-read latency of ``FileEventStore``.
+
+Grows a single stream to each requested size and reports:
+
+* ``append`` — events appended per second in batches of ``--batch``.
+* ``range-read`` — latency of reading ``--window`` events at random
+  positions, which should stay flat as the stream grows.
+* ``tail-read`` — latency of reading the newest ``--window`` events.
+* ``replay`` — events per second when iterating the whole stream once,
+  as ``AggregateRoot.reconstitute`` does.
+
+Pass ``--memory-map`` to measure the memory-mapped lazy read path.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks file_event_store --sizes 100000 1000000
+"""
+
+import asyncio
+import random
+import tempfile
+from collections.abc import Sequence
+from uuid import uuid7
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report, sample_async
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores import FileEventStore
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+
+NAME = "file_event_store"
+
+
+async def _run_size(
+    size: int, batch: int, window: int, samples: int, fsync: bool, memory_map: bool
+) -> list[Measurement]:
+    params: dict[str, object] = {
+        "events": size,
+        "batch": batch,
+        "window": window,
+        "fsync": fsync,
+        "memory_map": memory_map,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        store = FileEventStore[dict[str, object]](
+            directory,
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[CounterIncremented],
+            fsync=fsync,
+            memory_map=memory_map,
+        )
+        aggregate_id = uuid7()
+        events = make_events(batch)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for version in range(0, size, batch):
+            count = min(batch, size - version)
+            await store.append_events(aggregate_id, events[:count], expected_version=version)
+        append_seconds = loop.time() - start
+
+        rng = random.Random(size)
+        positions = [rng.randrange(0, max(1, size - window)) for _ in range(samples)]
+
+        async def read_range(i: int) -> None:
+            first = positions[i]
+            for _ in (await store.get_events(aggregate_id, first, first + window - 1)).value:
+                pass
+
+        async def read_tail(_: int) -> None:
+            for _ in (await store.get_events(aggregate_id, max(0, size - window))).value:
+                pass
+
+        range_latencies = await sample_async(samples, read_range)
+        tail_latencies = await sample_async(samples, read_tail)
+
+        start = loop.time()
+        for _ in (await store.get_events(aggregate_id)).value:
+            pass
+        replay_seconds = loop.time() - start
+        store.close()
+
+    return [
+        Measurement(NAME, f"append n={size:,}", params, size, append_seconds),
+        Measurement(
+            NAME,
+            f"range-read n={size:,}",
+            params,
+            samples * window,
+            sum(range_latencies),
+            range_latencies,
+        ),
+        Measurement(
+            NAME,
+            f"tail-read n={size:,}",
+            params,
+            samples * window,
+            sum(tail_latencies),
+            tail_latencies,
+        ),
+        Measurement(NAME, f"replay n={size:,}", params, size, replay_seconds),
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000, 100_000, 1_000_000])
+    arguments.add_argument("--batch", type=int, default=100)
+    arguments.add_argument("--window", type=int, default=100)
+    arguments.add_argument("--samples", type=int, default=200)
+    arguments.add_argument("--fsync", action="store_true", help="fsync every append")
+    arguments.add_argument(
+        "--memory-map", action="store_true", help="read through memory-mapped segments"
+    )
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        measurements.extend(
+            asyncio.run(
+                _run_size(
+                    size,
+                    options.batch,
+                    options.window,
+                    options.samples,
+                    options.fsync,
+                    options.memory_map,
+                )
+            )
+        )
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
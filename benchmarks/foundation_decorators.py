@@ -0,0 +1,297 @@
+"""Per-instance cost of the foundation decorators on common operations.
+
+Runs each operation over ``size`` instances of every variant, a class
+with the fields ``a``, ``b`` and ``c``:
+
+* ``plain`` — hand-written ``__eq__`` and ``__hash__`` over the fields.
+* ``slotted`` — the same with ``__slots__``.
+* ``dataclass`` — ``@dataclass(frozen=True)``.
+* ``decorated`` — ``auto_freeze``, ``auto_hash(cache=True)`` and
+  ``auto_eq`` on a plain class.
+* ``value-object`` — a slotted ``ValueObject`` subclass.
+* ``entity`` — an ``Entity`` subclass identified by ``a``.
+* ``message`` — an ``Event`` subclass with fixed metadata ids, so uuid
+  generation is not measured.
+
+Operations (new instances are built for each, outside the timing):
+
+* ``construct`` — create the instances.
+* ``hash`` — ``hash()`` every instance, after one untimed pass.
+* ``eq`` — compare every instance with an equal twin.
+* ``set`` — insert every instance into a new set.
+* ``lookup`` — look every twin up in a dict keyed by the instances.
+* ``getattr`` — read the field ``a`` of every instance.
+
+Each case reports its best of ``--repeat`` runs, with the garbage
+collector paused while timing; the lines below the table put each
+variant relative to ``plain``. ``--json`` writes the results, and
+``--baseline`` compares against such a file from an earlier run: cases
+more than ``--tolerance`` slower are listed and the exit status is 1.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks foundation_decorators --sizes 10000 --json before.json
+    PYTHONPATH=src python -m benchmarks foundation_decorators --sizes 10000 --baseline before.json
+"""
+
+import gc
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Protocol, Self
+from uuid import UUID
+
+from benchmarks._harness import Measurement, parser, regressions, report
+from forging_blocks.domain.entity import Entity
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.value_object import ValueObject
+from forging_blocks.foundation.autoeq import auto_eq
+from forging_blocks.foundation.autofreeze import auto_freeze
+from forging_blocks.foundation.autohash import auto_hash
+
+NAME = "foundation_decorators"
+_FIELDS = ["a", "b", "c"]
+_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+_CREATED_AT = datetime(2025, 6, 11, 19, 36, 6, tzinfo=timezone.utc)
+
+
+class _Fields(Protocol):
+    @property
+    def a(self) -> int: ...
+
+
+class _FieldEquality:
+    __slots__ = ()
+    a: int
+    b: int
+    c: str
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return False
+        return (self.a, self.b, self.c) == (other.a, other.b, other.c)
+
+    def __hash__(self) -> int:
+        return hash((self.a, self.b, self.c))
+
+
+class _Plain(_FieldEquality):
+    def __init__(self, seed: int) -> None:
+        self.a = seed
+        self.b = seed * 2
+        self.c = "foundation"
+
+
+class _Slotted(_FieldEquality):
+    __slots__ = ("a", "b", "c")
+
+    def __init__(self, seed: int) -> None:
+        self.a = seed
+        self.b = seed * 2
+        self.c = "foundation"
+
+
+@dataclass(frozen=True)
+class _Dataclass:
+    a: int
+    b: int
+    c: str
+
+    @classmethod
+    def create(cls, seed: int) -> Self:
+        return cls(seed, seed * 2, "foundation")
+
+
+class _Decorated:
+    def __init__(self, seed: int) -> None:
+        self.a = seed
+        self.b = seed * 2
+        self.c = "foundation"
+
+
+auto_freeze(auto_eq(auto_hash(_Decorated, fields=_FIELDS, cache=True), fields=_FIELDS))
+
+
+class _Value(ValueObject[tuple[int, int, str]]):
+    __slots__ = ("a", "b", "c")
+
+    def __init__(self, seed: int) -> None:
+        super().__init__()
+        self.a = seed
+        self.b = seed * 2
+        self.c = "foundation"
+
+    @property
+    def value(self) -> tuple[int, int, str]:
+        return (self.a, self.b, self.c)
+
+
+class _Record(Entity[int]):
+    def __init__(self, seed: int) -> None:
+        super().__init__(seed)
+        self.a = seed
+        self.b = seed * 2
+        self.c = "foundation"
+
+
+class _Happened(Event[dict[str, object]]):
+    def __init__(self, a: int, b: int, c: str, metadata: MessageMetadata | None = None) -> None:
+        super().__init__(metadata)
+        self.a = a
+        self.b = b
+        self.c = c
+
+    @property
+    def _payload(self) -> dict[str, object]:
+        return {"a": self.a, "b": self.b, "c": self.c}
+
+    @property
+    def value(self) -> dict[str, object]:
+        return self._payload
+
+    @classmethod
+    def from_payload_fields(cls, data: dict[str, object], metadata: MessageMetadata) -> Self:
+        return cls(int(str(data["a"])), int(str(data["b"])), str(data["c"]), metadata)
+
+    @classmethod
+    def create(cls, seed: int) -> Self:
+        metadata = MessageMetadata("Happened", UUID(int=seed), _CREATED_AT, _ID, _ID)
+        return cls(seed, seed * 2, "foundation", metadata)
+
+
+_VARIANTS: dict[str, Callable[[int], _Fields]] = {
+    "plain": _Plain,
+    "slotted": _Slotted,
+    "dataclass": _Dataclass.create,
+    "decorated": _Decorated,
+    "value-object": _Value,
+    "entity": _Record,
+    "message": _Happened.create,
+}
+
+
+def _construct(factory: Callable[[int], _Fields], size: int) -> float:
+    start = time.perf_counter()
+    for seed in range(size):
+        factory(seed)
+    return time.perf_counter() - start
+
+
+def _hash(factory: Callable[[int], _Fields], size: int) -> float:
+    instances = [factory(seed) for seed in range(size)]
+    for instance in instances:
+        hash(instance)
+    start = time.perf_counter()
+    for instance in instances:
+        hash(instance)
+    return time.perf_counter() - start
+
+
+def _eq(factory: Callable[[int], _Fields], size: int) -> float:
+    pairs = [(factory(seed), factory(seed)) for seed in range(size)]
+    start = time.perf_counter()
+    for instance, twin in pairs:
+        instance == twin  # noqa: B015
+    return time.perf_counter() - start
+
+
+def _set(factory: Callable[[int], _Fields], size: int) -> float:
+    instances = [factory(seed) for seed in range(size)]
+    start = time.perf_counter()
+    members: set[object] = set()
+    for instance in instances:
+        members.add(instance)
+    return time.perf_counter() - start
+
+
+def _lookup(factory: Callable[[int], _Fields], size: int) -> float:
+    index = {factory(seed): seed for seed in range(size)}
+    twins = [factory(seed) for seed in range(size)]
+    start = time.perf_counter()
+    for twin in twins:
+        index[twin]
+    return time.perf_counter() - start
+
+
+def _getattr(factory: Callable[[int], _Fields], size: int) -> float:
+    instances = [factory(seed) for seed in range(size)]
+    start = time.perf_counter()
+    for instance in instances:
+        instance.a  # noqa: B018
+    return time.perf_counter() - start
+
+
+_OPERATIONS: dict[str, Callable[[Callable[[int], _Fields], int], float]] = {
+    "construct": _construct,
+    "hash": _hash,
+    "eq": _eq,
+    "set": _set,
+    "lookup": _lookup,
+    "getattr": _getattr,
+}
+
+
+def _run_case(variant: str, operation: str, size: int, repeat: int) -> Measurement:
+    factory, run = _VARIANTS[variant], _OPERATIONS[operation]
+    timings: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            timings.append(run(factory, size))
+        finally:
+            gc.enable()
+    params: dict[str, object] = {
+        "variant": variant,
+        "operation": operation,
+        "instances": size,
+        "repeat": repeat,
+    }
+    return Measurement(NAME, f"{variant} {operation} n={size:,}", params, size, min(timings))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000])
+    arguments.add_argument("--variants", nargs="+", choices=list(_VARIANTS), default=None)
+    arguments.add_argument("--operations", nargs="+", choices=list(_OPERATIONS), default=None)
+    arguments.add_argument("--repeat", type=int, default=5)
+    arguments.add_argument("--baseline", type=Path, default=None)
+    arguments.add_argument("--tolerance", type=float, default=0.2)
+    options = arguments.parse_args(argv)
+    variants = options.variants or list(_VARIANTS)
+    operations = options.operations or list(_OPERATIONS)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for operation in operations:
+            for variant in variants:
+                measurements.append(_run_case(variant, operation, size, options.repeat))
+    report(measurements, options.json)
+
+    plain = {
+        (m.params["operation"], m.params["instances"]): m
+        for m in measurements
+        if m.params["variant"] == "plain"
+    }
+    print()
+    for m in measurements:
+        reference = plain.get((m.params["operation"], m.params["instances"]))
+        if reference is not None and reference is not m:
+            print(f"{m.case:<34} {m.seconds / reference.seconds:>8.2f}x plain")
+
+    if options.baseline is not None:
+        found = regressions(measurements, options.baseline, options.tolerance)
+        print()
+        print(f"{len(found)} regression(s) beyond {options.tolerance:.0%} of {options.baseline}")
+        for line in found:
+            print(line)
+        if found:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Construction throughput and memory of ``auto_freeze`` under allocation churn.
+
+Constructs ``size`` frozen instances while keeping only the last
+``--live`` of them alive, so instances are garbage collected as fast as
+they are created, like short-lived messages in a busy service:
+
+* ``dict`` — a plain class; state lives in the instance ``__dict__``.
+* ``slots`` — a slotted class whose ``__slots__`` include
+  ``FrozenStateManager.STATE_SLOTS``.
+* ``side-table`` — a slotted class with ``__weakref__`` but no room
+  for the state; it uses the side table cleaned up by weak-reference
+  callbacks.
+* ``event`` — ``CounterIncremented`` events, frozen messages with frozen
+  metadata.
+
+Throughput should not depend on ``size``. A second, traced pass
+reports the peak traced memory per live instance and the number of
+side-table entries left afterwards (``peak_bytes_per_live`` and
+``leftover_entries`` in ``--json``).
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks freeze_churn --sizes 10000 100000
+"""
+
+import gc
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Sequence
+
+from benchmarks._events import CounterIncremented
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.foundation.autofreeze import auto_freeze
+from forging_blocks.foundation.autofreeze.helpers import FrozenStateManager
+
+NAME = "freeze_churn"
+
+
+@auto_freeze
+class _Plain:
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+        self.note = "churn"
+
+
+@auto_freeze
+class _Slotted:
+    __slots__ = ("amount", "note", *FrozenStateManager.STATE_SLOTS)
+
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+        self.note = "churn"
+
+
+@auto_freeze
+class _SideTable:
+    __slots__ = ("__weakref__", "amount", "note")
+
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+        self.note = "churn"
+
+
+_FACTORIES: dict[str, Callable[[int], object]] = {
+    "dict": _Plain,
+    "slots": _Slotted,
+    "side-table": _SideTable,
+    "event": CounterIncremented,
+}
+
+
+def _churn(factory: Callable[[int], object], size: int, live: int) -> None:
+    window: deque[object] = deque(maxlen=live)
+    for index in range(size):
+        window.append(factory(index))
+
+
+def _run_case(label: str, size: int, live: int) -> Measurement:
+    factory = _FACTORIES[label]
+    gc.collect()
+    start = time.perf_counter()
+    _churn(factory, size, live)
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    _churn(factory, size, live)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+
+    params: dict[str, object] = {
+        "instances": size,
+        "live": live,
+        "peak_bytes_per_live": peak / live,
+        "leftover_entries": len(FrozenStateManager._side_table),
+    }
+    return Measurement(NAME, f"{label} n={size:,}", params, size, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000, 100_000])
+    arguments.add_argument("--live", type=int, default=1_000)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in _FACTORIES:
+            measurements.append(_run_case(label, size, options.live))
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        per_live = float(str(measurement.params["peak_bytes_per_live"]))
+        leftover = measurement.params["leftover_entries"]
+        print(f"{measurement.case:<34} {per_live:>8,.0f} B/live  {leftover} side-table entries")
+
+
+if __name__ == "__main__":
+    main()
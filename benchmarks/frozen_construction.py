@@ -0,0 +1,123 @@
+"""Construction rate of frozen value objects by ``__setattr__`` implementation.
+
+Constructs ``size`` instances of two frozen value objects:
+
+* ``metadata`` — ``MessageMetadata`` with fixed ids and timestamp, so
+  only attribute writes and freezing are measured.
+* ``value-object-10`` — a slotted ``ValueObject`` with ten fields.
+
+Each is built twice:
+
+* ``get_state`` — a subclass whose ``__setattr__`` builds a
+  ``FrozenStateConfig`` with ``FrozenStateManager.get_state`` on every
+  write, as the frozen ``__setattr__`` used to.
+* ``fast`` — the frozen ``__setattr__`` installed by ``auto_freeze``,
+  which reads the freeze flags without allocating.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks frozen_construction --sizes 10000 100000
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.value_object import ValueObject
+from forging_blocks.foundation.autofreeze.helpers import FrozenStateManager
+from forging_blocks.foundation.errors import CantModifyImmutableAttributeError
+
+NAME = "frozen_construction"
+_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+_CREATED_AT = datetime(2025, 6, 11, 19, 36, 6, tzinfo=timezone.utc)
+
+
+def _get_state_setattr(instance: Any, name: str, value: Any) -> None:
+    state = FrozenStateManager.get_state(instance)
+    if state.is_full_freeze or (state.frozen_attrs is not None and name in state.frozen_attrs):
+        raise CantModifyImmutableAttributeError(
+            class_name=instance.__class__.__name__, attribute_name=name
+        )
+    object.__setattr__(instance, name, value)
+
+
+FrozenStateManager.mark_as_decorated(_get_state_setattr)
+
+
+class _Fields(ValueObject[tuple[int, ...]]):
+    __slots__ = ("f0", "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9")
+
+    def __init__(self, seed: int) -> None:
+        super().__init__()
+        self.f0 = seed
+        self.f1 = seed + 1
+        self.f2 = seed + 2
+        self.f3 = seed + 3
+        self.f4 = seed + 4
+        self.f5 = seed + 5
+        self.f6 = seed + 6
+        self.f7 = seed + 7
+        self.f8 = seed + 8
+        self.f9 = seed + 9
+
+    @property
+    def value(self) -> tuple[int, ...]:
+        return (self.f0, self.f1, self.f2, self.f3, self.f4)
+
+
+class _GetStateMetadata(MessageMetadata):
+    __slots__ = ()
+    __setattr__ = _get_state_setattr
+
+
+class _GetStateFields(_Fields):
+    __slots__ = ()
+    __setattr__ = _get_state_setattr
+
+
+def _metadata(class_: type[MessageMetadata]) -> Callable[[int], object]:
+    def build(seed: int) -> object:
+        return class_("CounterIncremented", _ID, _CREATED_AT, _ID, _ID)
+
+    return build
+
+
+_FACTORIES: dict[tuple[str, str], Callable[[int], object]] = {
+    ("metadata", "get_state"): _metadata(_GetStateMetadata),
+    ("metadata", "fast"): _metadata(MessageMetadata),
+    ("value-object-10", "get_state"): _GetStateFields,
+    ("value-object-10", "fast"): _Fields,
+}
+
+
+def _run_case(subject: str, label: str, size: int) -> Measurement:
+    factory = _FACTORIES[subject, label]
+    start = time.perf_counter()
+    for seed in range(size):
+        factory(seed)
+    seconds = time.perf_counter() - start
+    params: dict[str, object] = {"subject": subject, "setattr": label, "instances": size}
+    return Measurement(NAME, f"{subject} {label} n={size:,}", params, size, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    options = parser(__doc__ or NAME, sizes=[10_000, 100_000]).parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for subject, label in _FACTORIES:
+            measurements.append(_run_case(subject, label, size))
+    report(measurements, options.json)
+    print()
+    for reference, fast in zip(measurements[::2], measurements[1::2], strict=True):
+        speedup = reference.seconds / fast.seconds
+        print(f"{fast.case:<34} speedup {speedup:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Dict-lookup throughput of frozen value objects with and without a cached hash.
+
+Builds a frozen value object (``auto_freeze`` + ``auto_hash`` +
+``auto_eq``) whose single field is a nested payload of depth ``size``:
+each level is a dict of ``--width`` keys holding lists with one nested
+dict each. A dict keyed by such objects is then queried ``--lookups``
+times with the stored keys:
+
+* ``uncached`` — ``auto_hash()``: every lookup re-converts the whole
+  payload with ``HashableConverter``.
+* ``cached`` — ``auto_hash(cache=True)``: the hash is computed on the
+  first lookup after freezing and reused.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks hash_caching --sizes 1 3 5
+"""
+
+import time
+from collections.abc import Sequence
+
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.foundation.autoeq import auto_eq
+from forging_blocks.foundation.autofreeze import auto_freeze
+from forging_blocks.foundation.autohash import auto_hash
+
+NAME = "hash_caching"
+_KEYS = 64
+
+
+def _payload(depth: int, width: int, seed: int) -> object:
+    if depth == 0:
+        return seed
+    return {f"k{index}": [_payload(depth - 1, width, seed)] for index in range(width)}
+
+
+def _make_class(cache: bool) -> type:
+    class Criteria:
+        def __init__(self, payload: object) -> None:
+            self.payload = payload
+
+    return auto_freeze(
+        auto_eq(auto_hash(Criteria, fields=["payload"], cache=cache), fields=["payload"])
+    )
+
+
+def _run_case(label: str, size: int, width: int, lookups: int) -> Measurement:
+    class_ = _make_class(cache=label == "cached")
+    keys = [class_(_payload(size, width, seed)) for seed in range(_KEYS)]
+    index = {key: position for position, key in enumerate(keys)}
+
+    start = time.perf_counter()
+    for position in range(lookups):
+        index[keys[position % _KEYS]]
+    seconds = time.perf_counter() - start
+    params: dict[str, object] = {"depth": size, "width": width, "lookups": lookups}
+    return Measurement(NAME, f"{label} depth={size}", params, lookups, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[1, 3, 5])
+    arguments.add_argument("--width", type=int, default=3)
+    arguments.add_argument("--lookups", type=int, default=20_000)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("uncached", "cached"):
+            measurements.append(_run_case(label, size, options.width, options.lookups))
+    report(measurements, options.json)
+    print()
+    for size, uncached, cached in zip(
+        options.sizes, measurements[::2], measurements[1::2], strict=True
+    ):
+        speedup = uncached.seconds / cached.seconds
+        print(f"{f'depth={size}':<34} speedup {speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Throughput of CPU-bound handlers on ``InMemoryMessageBus`` per executor.
+
+Dispatches ``size`` messages concurrently to a handler that burns CPU
+for ``--work`` loop iterations:
+
+* ``inline`` — the handler runs on the event loop.
+* ``threads`` — registered with a ``ThreadPoolExecutor`` of
+  ``--workers`` threads (still bound by the GIL on CPython builds that
+  have one).
+* ``processes`` — registered with a ``ProcessPoolExecutor`` of
+  ``--workers`` processes and a ``DictMessageCodec``.
+
+Throughput is reported in messages per second. A ticker task measures
+how long the event loop stayed blocked; the longest stall is printed
+below the table.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks message_bus_executors --sizes 64 256 --workers 4
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.infrastructure.message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+
+NAME = "message_bus_executors"
+_TICK = 0.001
+
+
+def _burn(event: CounterIncremented, work: int) -> int:
+    total = int(str(event.value["amount"]))
+    for i in range(work):
+        total = (total * 31 + i) % 1_000_003
+    return total
+
+
+class _Handler:
+    """Picklable callable wrapping `_burn`."""
+
+    def __init__(self, work: int) -> None:
+        self._work = work
+
+    def __call__(self, event: CounterIncremented) -> int:
+        return _burn(event, self._work)
+
+
+async def _ticker(stop: asyncio.Event, stalls: list[float]) -> None:
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(_TICK)
+        stalls.append(time.perf_counter() - before - _TICK)
+
+
+async def _run_case(label: str, size: int, work: int, workers: int) -> Measurement:
+    bus = InMemoryMessageBus[Message[object], object]()
+    handler = _Handler(work)
+    executor: Executor | None = None
+    if label == "threads":
+        executor = ThreadPoolExecutor(max_workers=workers)
+        bus.register(CounterIncremented, handler, executor=executor)
+    elif label == "processes":
+        executor = ProcessPoolExecutor(max_workers=workers)
+        bus.register(CounterIncremented, handler, executor=executor, codec=DictMessageCodec())
+        # Start the worker processes before timing.
+        await asyncio.gather(*(bus.dispatch(event) for event in make_events(workers)))
+    else:
+        bus.register(CounterIncremented, handler)
+    events = make_events(size)
+
+    stop = asyncio.Event()
+    stalls: list[float] = []
+    ticker = asyncio.create_task(_ticker(stop, stalls))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(bus.dispatch(event) for event in events))
+    seconds = time.perf_counter() - start
+    stop.set()
+    await ticker
+    if executor is not None:
+        executor.shutdown()
+
+    params: dict[str, object] = {
+        "messages": size,
+        "work": work,
+        "workers": workers,
+        "max_stall": max(stalls, default=0.0),
+    }
+    return Measurement(NAME, f"{label} n={size:,}", params, size, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[64, 256])
+    arguments.add_argument("--work", type=int, default=200_000)
+    arguments.add_argument("--workers", type=int, default=4)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("inline", "threads", "processes"):
+            measurements.append(asyncio.run(_run_case(label, size, options.work, options.workers)))
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        stall = float(str(measurement.params["max_stall"]))
+        print(f"{measurement.case:<34} max loop stall {stall * 1000:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Dispatch overhead of ``InMemoryMessageBus`` middleware chains.
+
+Builds a bus with ``size`` pass-through middlewares and dispatches
+``--messages`` messages to a trivial async handler:
+
+* ``precomposed`` — the bus as shipped: the chain is composed once per
+  message type at ``register`` time.
+* ``per-message`` — a reference dispatcher that walks the middleware
+  list for every message, building the chain on each call.
+
+``size`` 0 shows the cost of a bare dispatch.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks message_bus_middleware --sizes 0 1 5 10
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.foundation.middleware import Middleware, NextHandler
+from forging_blocks.infrastructure.message_bus import InMemoryMessageBus
+
+NAME = "message_bus_middleware"
+
+type _Dispatch = Callable[[Message[object]], Awaitable[object]]
+
+
+class _PassThrough:
+    async def process(
+        self, request: Message[object], next_handler: NextHandler[Message[object], object]
+    ) -> object:
+        return await next_handler(request)
+
+
+async def _handle(message: Message[object]) -> object:
+    return message
+
+
+def _per_message(middlewares: Sequence[Middleware[Message[object], object]]) -> _Dispatch:
+    async def dispatch(message: Message[object]) -> object:
+        async def call(index: int, request: Message[object]) -> object:
+            if index == len(middlewares):
+                return await _handle(request)
+            return await middlewares[index].process(request, lambda r: call(index + 1, r))
+
+        return await call(0, message)
+
+    return dispatch
+
+
+async def _run_case(label: str, size: int, messages: int) -> Measurement:
+    middlewares = [_PassThrough() for _ in range(size)]
+    if label == "precomposed":
+        bus = InMemoryMessageBus[Message[object], object](middlewares)
+        bus.register(CounterIncremented, _handle)
+        dispatch: _Dispatch = bus.dispatch
+    else:
+        dispatch = _per_message(middlewares)
+    events = make_events(messages)
+
+    start = time.perf_counter()
+    for event in events:
+        await dispatch(event)
+    seconds = time.perf_counter() - start
+    params: dict[str, object] = {"middlewares": size, "messages": messages}
+    return Measurement(NAME, f"{label} middlewares={size}", params, messages, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[0, 1, 5, 10])
+    arguments.add_argument("--messages", type=int, default=20_000)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("precomposed", "per-message"):
+            measurements.append(asyncio.run(_run_case(label, size, options.messages)))
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Relay throughput of ``OutboxRelay`` over in-memory and SQLite outboxes.
+
+Adds ``size`` events to an outbox in commits of ``--commit`` events,
+then drains it with an ``OutboxRelay`` publishing to an
+``InMemoryEventBus`` with one no-op handler. Each ``--batch-sizes``
+value is one case, reporting events relayed per second (fetch, publish
+and acknowledge included). The rate at which commits were written to
+the outbox is printed below the table.
+
+Pass ``--fsync`` to run SQLite with ``synchronous=FULL``.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks outbox_relay --sizes 10000 --batch-sizes 10 100 1000
+"""
+
+import asyncio
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.application.ports.outbound.outbox_port import OutboxPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_buses import EventBusEventPublisher, InMemoryEventBus
+from forging_blocks.infrastructure.outbox import InMemoryOutbox, OutboxRelay, SqliteOutbox
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+
+NAME = "outbox_relay"
+
+
+class _NoOpHandler:
+    async def handle(self, event: Event[dict[str, object]]) -> None:
+        pass
+
+
+async def _measure(
+    label: str,
+    outbox: OutboxPort[dict[str, object]],
+    size: int,
+    commit: int,
+    batch_size: int,
+    params: dict[str, object],
+) -> Measurement:
+    events = make_events(size)
+    start = time.perf_counter()
+    for first in range(0, size, commit):
+        assert (await outbox.add(events[first : first + commit])).is_ok
+    add_seconds = time.perf_counter() - start
+
+    bus = InMemoryEventBus[dict[str, object], object, object]()
+    bus.register_handler(CounterIncremented, _NoOpHandler())
+    relay = OutboxRelay(outbox, EventBusEventPublisher(bus), batch_size=batch_size)
+    start = time.perf_counter()
+    delivered = await relay.drain()
+    seconds = time.perf_counter() - start
+
+    assert delivered == size
+    case_params = {**params, "batch_size": batch_size, "add_rate": size / add_seconds}
+    return Measurement(
+        NAME, f"{label} batch={batch_size} n={size:,}", case_params, delivered, seconds
+    )
+
+
+async def _run_size(
+    size: int, commit: int, batch_sizes: Sequence[int], fsync: bool
+) -> list[Measurement]:
+    params: dict[str, object] = {"events": size, "commit": commit, "fsync": fsync}
+    measurements: list[Measurement] = []
+    for batch_size in batch_sizes:
+        memory = InMemoryOutbox[dict[str, object]]()
+        measurements.append(await _measure("memory", memory, size, commit, batch_size, params))
+        with tempfile.TemporaryDirectory() as directory:
+            sqlite = SqliteOutbox[dict[str, object]](
+                Path(directory) / "outbox.db",
+                codec=DictMessageCodec[Event[dict[str, object]]](),
+                event_types=[CounterIncremented],
+                fsync=fsync,
+            )
+            measurements.append(await _measure("sqlite", sqlite, size, commit, batch_size, params))
+            sqlite.close()
+    return measurements
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000])
+    arguments.add_argument("--commit", type=int, default=10)
+    arguments.add_argument("--batch-sizes", type=int, nargs="+", default=[10, 100, 1_000])
+    arguments.add_argument("--fsync", action="store_true", help="synchronous=FULL")
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        measurements.extend(
+            asyncio.run(_run_size(size, options.commit, options.batch_sizes, options.fsync))
+        )
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        rate = float(str(measurement.params["add_rate"]))
+        print(f"{measurement.case:<34} outbox writes {rate:>12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Throughput of ``CachingQueryFetcher`` under bursts of identical queries.
+
+Fires ``size`` concurrent queries drawn from ``--distinct`` distinct
+ones at a read model that takes ``--io-ms`` milliseconds per query, in
+``--rounds`` rounds:
+
+* ``direct`` — ``MessageBusQueryFetcher`` straight to the handler.
+* ``cached`` — the same fetcher behind ``CachingQueryFetcher`` with an
+  ``InMemoryCache``; the first round is answered with one handler call
+  per distinct query (single-flight), later rounds from the cache.
+
+Throughput is reported in queries per second; the number of handler
+calls is printed below the table.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks query_cache --sizes 100 1000
+"""
+
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Self
+
+from benchmarks._harness import Measurement, parser, report
+from forging_blocks.application.ports.outbound.query_fetcher_port import QueryFetcherPort
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.messages.query import Query
+from forging_blocks.infrastructure.caching import CachingQueryFetcher, InMemoryCache
+from forging_blocks.infrastructure.message_bus import InMemoryMessageBus, MessageBusQueryFetcher
+
+NAME = "query_cache"
+
+
+class GetCounter(Query[dict[str, object]]):
+    """Query for one counter's summary."""
+
+    def __init__(self, counter: int, metadata: MessageMetadata | None = None) -> None:
+        super().__init__(metadata)
+        self._counter = counter
+
+    @property
+    def _payload(self) -> dict[str, object]:
+        return {"counter": self._counter}
+
+    @property
+    def value(self) -> dict[str, object]:
+        return self._payload
+
+    @classmethod
+    def from_payload_fields(cls, data: dict[str, object], metadata: MessageMetadata) -> Self:
+        return cls(int(str(data["counter"])), metadata)
+
+
+async def _run_case(label: str, size: int, distinct: int, rounds: int, io_ms: float) -> Measurement:
+    calls = [0]
+
+    async def handle(query: GetCounter) -> object:
+        calls[0] += 1
+        await asyncio.sleep(io_ms / 1000)
+        return {"counter": query.value["counter"], "total": 42}
+
+    bus = InMemoryMessageBus[Query[dict[str, object]], object]()
+    bus.register(GetCounter, handle)
+    fetcher: QueryFetcherPort[dict[str, object], object] = MessageBusQueryFetcher(bus)
+    if label == "cached":
+        fetcher = CachingQueryFetcher(fetcher, InMemoryCache[str, object](), ttl=60)
+    queries = [GetCounter(i % distinct) for i in range(size)]
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(fetcher.fetch(query) for query in queries))
+    seconds = time.perf_counter() - start
+    params: dict[str, object] = {
+        "queries": size,
+        "distinct": distinct,
+        "rounds": rounds,
+        "io_ms": io_ms,
+        "handler_calls": calls[0],
+    }
+    return Measurement(NAME, f"{label} n={size:,}", params, size * rounds, seconds)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[100, 1_000])
+    arguments.add_argument("--distinct", type=int, default=10)
+    arguments.add_argument("--rounds", type=int, default=5)
+    arguments.add_argument("--io-ms", type=float, default=2.0)
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        for label in ("direct", "cached"):
+            case = _run_case(label, size, options.distinct, options.rounds, options.io_ms)
+            measurements.append(asyncio.run(case))
+    report(measurements, options.json)
+    print()
+    for measurement in measurements:
+        print(f"{measurement.case:<34} handler calls {measurement.params['handler_calls']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Append rate and read latency of ``SqliteEventStore`` versus ``InMemoryEventStore``.
+
+Spreads ``size`` events over ``--streams`` aggregates and reports for
+each store:
+
+* ``append`` — events appended per second in batches of ``--batch``,
+  each batch checked against its expected version.
+* ``get-events`` — latency of reading ``--window`` events at random
+  positions of a random stream.
+* ``replay`` — events per second when reading whole streams.
+
+Pass ``--fsync`` to run SQLite with ``synchronous=FULL``.
+
+Example::
+
+    PYTHONPATH=src python -m benchmarks sqlite_event_store --sizes 10000 100000
+"""
+
+import asyncio
+import random
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from uuid import uuid7
+
+from benchmarks._events import CounterIncremented, make_events
+from benchmarks._harness import Measurement, parser, report, sample_async
+from forging_blocks.application.ports.outbound.event_store_port import EventStorePort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores import InMemoryEventStore, SqliteEventStore
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+
+NAME = "sqlite_event_store"
+
+
+async def _measure(
+    label: str,
+    store: EventStorePort[dict[str, object]],
+    size: int,
+    streams: int,
+    batch: int,
+    window: int,
+    samples: int,
+    params: dict[str, object],
+) -> list[Measurement]:
+    aggregate_ids = [uuid7() for _ in range(streams)]
+    per_stream = max(1, size // streams)
+    events = make_events(batch)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    appended = 0
+    for aggregate_id in aggregate_ids:
+        for version in range(0, per_stream, batch):
+            count = min(batch, per_stream - version)
+            result = await store.append_events(
+                aggregate_id, events[:count], expected_version=version
+            )
+            assert result.is_ok
+            appended += count
+    append_seconds = loop.time() - start
+
+    rng = random.Random(size)
+    picks = [
+        (rng.choice(aggregate_ids), rng.randrange(0, max(1, per_stream - window)))
+        for _ in range(samples)
+    ]
+
+    async def read_window(i: int) -> None:
+        aggregate_id, first = picks[i]
+        for _ in (await store.get_events(aggregate_id, first, first + window - 1)).value:
+            pass
+
+    latencies = await sample_async(samples, read_window)
+
+    start = loop.time()
+    for aggregate_id in aggregate_ids:
+        for _ in (await store.get_events(aggregate_id)).value:
+            pass
+    replay_seconds = loop.time() - start
+
+    return [
+        Measurement(NAME, f"{label} append n={size:,}", params, appended, append_seconds),
+        Measurement(
+            NAME,
+            f"{label} get-events n={size:,}",
+            params,
+            samples * window,
+            sum(latencies),
+            latencies,
+        ),
+        Measurement(NAME, f"{label} replay n={size:,}", params, appended, replay_seconds),
+    ]
+
+
+async def _run_size(
+    size: int, streams: int, batch: int, window: int, samples: int, fsync: bool
+) -> list[Measurement]:
+    params: dict[str, object] = {
+        "events": size,
+        "streams": streams,
+        "batch": batch,
+        "window": window,
+        "fsync": fsync,
+    }
+    arguments = (size, streams, batch, window, samples, params)
+    measurements = await _measure("memory", InMemoryEventStore[dict[str, object]](), *arguments)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SqliteEventStore[dict[str, object]](
+            Path(directory) / "events.db",
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[CounterIncremented],
+            fsync=fsync,
+        )
+        measurements.extend(await _measure("sqlite", store, *arguments))
+        store.close()
+    return measurements
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmark and print (and optionally save) the results."""
+    arguments = parser(__doc__ or NAME, sizes=[10_000, 100_000])
+    arguments.add_argument("--streams", type=int, default=100)
+    arguments.add_argument("--batch", type=int, default=10)
+    arguments.add_argument("--window", type=int, default=20)
+    arguments.add_argument("--samples", type=int, default=200)
+    arguments.add_argument("--fsync", action="store_true", help="synchronous=FULL")
+    options = arguments.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    for size in options.sizes:
+        measurements.extend(
+            asyncio.run(
+                _run_size(
+                    size,
+                    options.streams,
+                    options.batch,
+                    options.window,
+                    options.samples,
+                    options.fsync,
+                )
+            )
+        )
+    report(measurements, options.json)
+
+
+if __name__ == "__main__":
+    main()
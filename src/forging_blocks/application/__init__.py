@@ -3,9 +3,9 @@
 Exports inbound ports (UseCasePort, CommandHandlerPort, EventHandlerPort, QueryHandlerPort,
 MessageHandlerPort, ApplicationServicePort, AuthorizationPort, ValidationPort),
 outbound ports (RepositoryPort, UnitOfWorkPort, MessageBusPort, EventBusPort,
-EventStorePort, CachePort, LoggerPort, FileSystemPort, NotifierPort,
-HttpClientPort, TransactionManagerPort, and more), and application-level
-errors (ConcurrencyError, EventBusError, EventStoreError, UnitOfWorkError).
+EventStorePort, SnapshotStorePort, OutboxPort, CachePort, LoggerPort, MetricsPort,
+FileSystemPort, NotifierPort, HttpClientPort, TransactionManagerPort, and more), and
+application-level errors (ConcurrencyError, EventBusError, EventStoreError, UnitOfWorkError).
 """
 
 from .errors import ConcurrencyError, EventBusError, EventStoreError, UnitOfWorkError
@@ -16,6 +16,8 @@ from .ports import (
     EventPublisherPort,
     MessageBusPort,
     MessageHandlerPort,
+    MetricsPort,
+    MetricTags,
     QueryFetcherPort,
     QueryHandlerPort,
     RepositoryPort,
@@ -31,8 +33,13 @@ from .ports.outbound import (
     HttpClientPort,
     LoggerPort,
     NotifierPort,
+    OutboxMessage,
+    OutboxPort,
     ReadOnlyRepositoryPort,
+    Snapshot,
+    SnapshotStorePort,
     SpecificationRepositoryPort,
+    StreamAppend,
     TransactionManagerPort,
     WriteOnlyRepositoryPort,
 )
@@ -55,12 +62,19 @@ __all__ = [
     "LoggerPort",
     "MessageBusPort",
     "MessageHandlerPort",
+    "MetricTags",
+    "MetricsPort",
     "NotifierPort",
+    "OutboxMessage",
+    "OutboxPort",
     "QueryFetcherPort",
     "QueryHandlerPort",
     "ReadOnlyRepositoryPort",
     "RepositoryPort",
+    "Snapshot",
+    "SnapshotStorePort",
     "SpecificationRepositoryPort",
+    "StreamAppend",
     "TransactionManagerPort",
     "UnitOfWorkError",
     "UnitOfWorkPort",
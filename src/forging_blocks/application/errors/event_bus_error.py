@@ -5,6 +5,8 @@ cannot deliver an event. Extends ``RuntimeErrorMixin``, making it catchable as
 ``RuntimeError``.
 """
 
+from collections.abc import Sequence
+
 from forging_blocks.foundation.errors.base.error import Error
 from forging_blocks.foundation.errors.builtin.runtime_error_mixin import RuntimeErrorMixin
 from forging_blocks.foundation.errors.core import ErrorMessage
@@ -17,6 +19,11 @@ class EventBusError[MetadataValueType = object](RuntimeErrorMixin, Error[Metadat
     deliver an event. Extends ``RuntimeErrorMixin``, making it
     catchable as ``RuntimeError``.
 
+    Attributes:
+        causes: The handler exceptions behind this error, in handler
+            registration order. Empty when no handler failed, e.g. when
+            no handler was registered.
+
     Example:
         ```python
         error = EventBusError("Failed to publish event to message bus")
@@ -25,5 +32,13 @@ class EventBusError[MetadataValueType = object](RuntimeErrorMixin, Error[Metadat
 
     """
 
-    def __init__(self, message: str) -> None:
+    def __init__(self, message: str, causes: Sequence[Exception] = ()) -> None:
+        """Initialise with a description and the exceptions that caused it.
+
+        Args:
+            message: Human-readable description of the failure.
+            causes: Exceptions raised by the failing handlers.
+
+        """
+        self.causes = tuple(causes)
         super().__init__(ErrorMessage(message))
@@ -20,11 +20,18 @@ from .outbound import (
     HttpClientPort,
     LoggerPort,
     MessageBusPort,
+    MetricsPort,
+    MetricTags,
     NotifierPort,
+    OutboxMessage,
+    OutboxPort,
     QueryFetcherPort,
     ReadOnlyRepositoryPort,
     RepositoryPort,
+    Snapshot,
+    SnapshotStorePort,
     SpecificationRepositoryPort,
+    StreamAppend,
     TransactionManagerPort,
     UnitOfWorkPort,
     WriteOnlyRepositoryPort,
@@ -43,12 +50,19 @@ __all__ = [
     "LoggerPort",
     "MessageBusPort",
     "MessageHandlerPort",
+    "MetricTags",
+    "MetricsPort",
     "NotifierPort",
+    "OutboxMessage",
+    "OutboxPort",
     "QueryFetcherPort",
     "ReadOnlyRepositoryPort",
     "RepositoryPort",
     "WriteOnlyRepositoryPort",
+    "Snapshot",
+    "SnapshotStorePort",
     "SpecificationRepositoryPort",
+    "StreamAppend",
     "TransactionManagerPort",
     "UnitOfWorkPort",
     "QueryHandlerPort",
@@ -4,14 +4,17 @@ from .cache_port import CachePort
 from .command_sender_port import CommandSenderPort
 from .event_bus_port import EventBusPort
 from .event_publisher_port import EventPublisherPort
-from .event_store_port import EventStorePort
+from .event_store_port import EventStorePort, StreamAppend
 from .file_system_port import FileSystemPort
 from .http_client_port import HttpClientPort
 from .logger_port import LoggerPort
 from .message_bus_port import MessageBusPort
+from .metrics_port import MetricsPort, MetricTags
 from .notifier_port import NotifierPort
+from .outbox_port import OutboxMessage, OutboxPort
 from .query_fetcher_port import QueryFetcherPort
 from .repository_port import ReadOnlyRepositoryPort, RepositoryPort, WriteOnlyRepositoryPort
+from .snapshot_store_port import Snapshot, SnapshotStorePort
 from .specification_repository_port import SpecificationRepositoryPort
 from .transaction_manager_port import TransactionManagerPort
 from .unit_of_work_port import UnitOfWorkPort
@@ -26,12 +29,19 @@ __all__ = [
     "FileSystemPort",
     "LoggerPort",
     "MessageBusPort",
+    "MetricTags",
+    "MetricsPort",
     "NotifierPort",
+    "OutboxMessage",
+    "OutboxPort",
     "QueryFetcherPort",
     "ReadOnlyRepositoryPort",
     "RepositoryPort",
     "WriteOnlyRepositoryPort",
+    "Snapshot",
+    "SnapshotStorePort",
     "SpecificationRepositoryPort",
+    "StreamAppend",
     "TransactionManagerPort",
     "UnitOfWorkPort",
 ]
@@ -6,12 +6,13 @@ with separate policies for events (multi-handler fan-out) and commands
 """
 
 from abc import abstractmethod
+from collections.abc import Sequence
 
 from forging_blocks.application.errors.event_bus_error import EventBusError
 from forging_blocks.domain.messages.command import Command
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.foundation.ports import OutboundPort
-from forging_blocks.foundation.result import Result
+from forging_blocks.foundation.result import Ok, Result
 
 
 class EventBusPort[EventPayloadType, CommandPayloadType, HandlerType](
@@ -51,6 +52,28 @@ class EventBusPort[EventPayloadType, CommandPayloadType, HandlerType](
         """
         ...
 
+    async def publish_many(
+        self, events: Sequence[Event[EventPayloadType]]
+    ) -> Result[None, EventBusError]:
+        """Publish several domain events to their registered handlers.
+
+        The default implementation publishes them one by one, in order,
+        and stops at the first failure. Implementations able to hand a
+        batch to handlers more cheaply override it.
+
+        Args:
+            events: The domain events to publish.
+
+        Returns:
+            A ``Result`` indicating success or the first ``EventBusError``.
+
+        """
+        for event in events:
+            result = await self.publish(event)
+            if not result.is_ok:
+                return result
+        return Ok(None)
+
     @abstractmethod
     async def send(self, command: Command[CommandPayloadType]) -> Result[None, EventBusError]:
         """Send a command to its registered handler.
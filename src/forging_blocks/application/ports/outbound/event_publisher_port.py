@@ -5,7 +5,8 @@ to an external message bus or event broker.  Infrastructure implementations
 determine durability, ordering, and delivery guarantees.
 
 Responsibilities:
-    - Publish domain events after domain changes occur.
+    - Publish domain events after domain changes occur, one at a time or
+      several in one call.
 
 Non-Responsibilities:
     - Persist events.
@@ -13,6 +14,7 @@ Non-Responsibilities:
 """
 
 from abc import abstractmethod
+from collections.abc import Sequence
 
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.foundation.ports import OutboundPort
@@ -27,6 +29,7 @@ class EventPublisherPort[EventPayloadType](
         ```python
         publisher = MyEventPublisher[OrderEventData]()
         await publisher.publish(OrderPlaced(order_id="42"))
+        await publisher.publish_many([OrderPlaced(order_id="43"), OrderPaid(order_id="43")])
         ```
     """
 
@@ -38,3 +41,16 @@ class EventPublisherPort[EventPayloadType](
             event: The domain event to publish.
 
         """
+
+    async def publish_many(self, events: Sequence[Event[EventPayloadType]]) -> None:
+        """Publish several domain events.
+
+        The default implementation publishes them one by one, in order.
+        Implementations able to deliver a batch more cheaply override it.
+
+        Args:
+            events: The domain events to publish.
+
+        """
+        for event in events:
+            await self.publish(event)
@@ -3,16 +3,73 @@
 Defines the ``EventStorePort`` contract for appending and retrieving
 domain events. The interface is agnostic of storage backend — in-memory,
 relational, or event-native implementations are all supported.
+
+``append_batch`` writes to several streams in one call so that a Unit of
+Work touching many aggregates pays for a single round trip, and
+``stream_events`` reads long streams in bounded batches.
 """
 
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from uuid import UUID
 
+from forging_blocks.application.errors.concurrency_error import ConcurrencyError
 from forging_blocks.application.errors.event_store_error import EventStoreError
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.foundation.ports import OutboundPort
-from forging_blocks.foundation.result import Result
+from forging_blocks.foundation.result import Err, Ok, Result
+
+DEFAULT_STREAM_BATCH_SIZE = 512
+"""Batch size ``stream_events`` uses when none is given."""
+
+type StreamAppend[EventPayloadType] = tuple[UUID, Sequence[Event[EventPayloadType]], int | None]
+"""One stream write of a batch: ``(aggregate_id, events, expected_version)``."""
+
+type EventRangeReader[EventPayloadType] = Callable[
+    [UUID, int | None, int | None],
+    Awaitable[Result[Sequence[Event[EventPayloadType]], EventStoreError]],
+]
+"""A ``get_events``-shaped callable: ``(aggregate_id, from_version, to_version)``."""
+
+
+async def stream_in_batches[EventPayloadType](
+    get_events: EventRangeReader[EventPayloadType],
+    aggregate_id: UUID,
+    from_version: int | None = None,
+    batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Event[EventPayloadType]]]:
+    """Read a stream through successive *get_events* version windows.
+
+    This is the default ``stream_events`` of every event store.
+
+    Args:
+        get_events: Reads the events of a stream between two versions.
+        aggregate_id: The aggregate identifier.
+        from_version: Start version (inclusive). ``None`` means from the
+            beginning.
+        batch_size: Maximum number of events per batch.
+
+    Yields:
+        Non-empty batches of events in version order.
+
+    Raises:
+        ValueError: If *batch_size* is not positive.
+        EventStoreError: If reading a batch fails.
+
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    start = from_version if from_version is not None else 0
+    while True:
+        result = await get_events(aggregate_id, start, start + batch_size - 1)
+        if not result.is_ok:
+            raise result.error
+        batch = result.value
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        start += batch_size
 
 
 class EventStorePort[EventPayloadType](
@@ -65,6 +122,59 @@ class EventStorePort[EventPayloadType](
         """
         ...
 
+    async def append_batch(
+        self, appends: Sequence[StreamAppend[EventPayloadType]]
+    ) -> Result[list[int], EventStoreError]:
+        """Append events to several streams as one unit.
+
+        Every expected version is validated before anything is written; if
+        one check fails, no stream is modified. Each aggregate may appear
+        at most once per batch.
+
+        The default implementation validates all versions and then calls
+        `append_events` stream by stream, so it is only atomic when no
+        other writer interleaves. Implementations able to write all
+        streams in one transaction should override it.
+
+        Args:
+            appends: ``(aggregate_id, events, expected_version)`` tuples.
+                An ``expected_version`` of ``None`` skips the check for
+                that stream.
+
+        Returns:
+            A ``Result`` containing the new version of each stream, in the
+            order of *appends*, or an ``EventStoreError`` (a
+            ``ConcurrencyError`` for a version mismatch).
+
+        Example:
+            ```python
+            result = await store.append_batch(
+                [
+                    (order_id, [OrderPlaced(order_id="42")], 0),
+                    (customer_id, [OrderRecorded(order_id="42")], 7),
+                ]
+            )
+            ```
+        """
+        duplicate = self._check_distinct(appends)
+        if duplicate is not None:
+            return Err(duplicate)
+        for aggregate_id, _, expected_version in appends:
+            if expected_version is None:
+                continue
+            current = await self.get_current_version(aggregate_id)
+            if not current.is_ok:
+                return Err(current.error)
+            if current.value != expected_version:
+                return Err(ConcurrencyError(aggregate_id, expected_version, current.value))
+        versions: list[int] = []
+        for aggregate_id, events, expected_version in appends:
+            result = await self.append_events(aggregate_id, events, expected_version)
+            if not result.is_ok:
+                return Err(result.error)
+            versions.append(result.value)
+        return Ok(versions)
+
     @abstractmethod
     async def get_events(
         self,
@@ -88,6 +198,41 @@ class EventStorePort[EventPayloadType](
         """
         ...
 
+    def stream_events(
+        self,
+        aggregate_id: UUID,
+        from_version: int | None = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Event[EventPayloadType]]]:
+        """Stream an aggregate's events in batches of at most *batch_size*.
+
+        Unlike `get_events`, the stream is never materialized as a
+        whole, so peak memory is bounded by the batch size rather than
+        the stream length. The default implementation reads successive
+        version windows through `get_events` with `stream_in_batches`.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+            from_version: Start version (inclusive). ``None`` means from
+                the beginning.
+            batch_size: Maximum number of events per batch.
+
+        Yields:
+            Non-empty batches of events in version order.
+
+        Raises:
+            ValueError: If *batch_size* is not positive.
+            EventStoreError: If reading a batch fails.
+
+        Example:
+            ```python
+            async for batch in store.stream_events(order_id, batch_size=1_000):
+                for event in batch:
+                    projection.apply(event)
+            ```
+        """
+        return stream_in_batches(self.get_events, aggregate_id, from_version, batch_size)
+
     @abstractmethod
     async def get_current_version(self, aggregate_id: UUID) -> Result[int, EventStoreError]:
         """Retrieve the current version of an aggregate's event stream.
@@ -101,3 +246,15 @@ class EventStorePort[EventPayloadType](
 
         """
         ...
+
+    @staticmethod
+    def _check_distinct(
+        appends: Sequence[StreamAppend[EventPayloadType]],
+    ) -> EventStoreError | None:
+        """Return an error if an aggregate appears more than once in *appends*."""
+        seen: set[UUID] = set()
+        for aggregate_id, _, _ in appends:
+            if aggregate_id in seen:
+                return EventStoreError(f"Aggregate {aggregate_id} appears more than once in batch")
+            seen.add(aggregate_id)
+        return None
@@ -0,0 +1,71 @@
+"""MetricsPort contract for recording application metrics.
+
+Defines the ``MetricsPort`` ABC that application and infrastructure code
+report counters, histograms and gauges to, decoupled from any metrics
+backend (Prometheus, StatsD, OpenTelemetry, ...).
+"""
+
+from abc import abstractmethod
+from collections.abc import Mapping
+
+from forging_blocks.foundation.ports import OutboundPort
+
+type MetricTags = Mapping[str, str]
+"""Dimensions of a metric sample, e.g. ``{"message_type": "OrderPlaced"}``."""
+
+
+class MetricsPort(OutboundPort):
+    """ABC for recording metrics.
+
+    Responsibilities:
+        - Add to monotonically increasing counters.
+        - Record samples into histograms (latencies, sizes).
+        - Set the current value of gauges.
+
+    Non-Responsibilities:
+        - Aggregate, export or expose the metrics — that is the
+          backend's job.
+        - Schedule async I/O — this is a synchronous contract; calls
+          happen on hot paths and must be cheap.
+
+    Example:
+        ```python
+        metrics = MyMetrics()
+        metrics.increment("orders.placed", tags={"channel": "web"})
+        metrics.observe("orders.checkout_seconds", 0.182)
+        metrics.set_gauge("orders.open", 17)
+        ```
+    """
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1, tags: MetricTags | None = None) -> None:
+        """Add *value* to the counter *name*.
+
+        Args:
+            name: Metric name.
+            value: Non-negative amount to add.
+            tags: Optional dimensions of the sample.
+
+        """
+
+    @abstractmethod
+    def observe(self, name: str, value: float, tags: MetricTags | None = None) -> None:
+        """Record *value* as a sample of the histogram *name*.
+
+        Args:
+            name: Metric name.
+            value: The observed value, e.g. a duration in seconds.
+            tags: Optional dimensions of the sample.
+
+        """
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, tags: MetricTags | None = None) -> None:
+        """Set the gauge *name* to *value*.
+
+        Args:
+            name: Metric name.
+            value: The current value.
+            tags: Optional dimensions of the sample.
+
+        """
@@ -0,0 +1,127 @@
+"""Outbox port for reliable, deferred event publication.
+
+Defines the ``OutboxPort`` contract of a transactional outbox, plus the
+``OutboxMessage`` record it returns. A unit of work writes the events of
+a commit to the outbox instead of publishing them; a relay later reads
+the pending messages, publishes them and marks them delivered. Because
+a message is only marked after it was published, delivery is
+at-least-once: consumers must tolerate duplicates.
+"""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.ports import OutboundPort
+from forging_blocks.foundation.result import Result
+
+
+class OutboxMessage[EventPayloadType]:
+    """Event waiting in an outbox.
+
+    Attributes:
+        position: Outbox-wide, increasing position of the message; used
+            to acknowledge it.
+        event: The event to publish.
+
+    Example:
+        ```python
+        message = OutboxMessage(1, OrderPlaced(order_id="42"))
+        ```
+    """
+
+    __slots__ = ("_event", "_position")
+
+    def __init__(self, position: int, event: Event[EventPayloadType]) -> None:
+        self._position = position
+        self._event = event
+
+    @property
+    def position(self) -> int:
+        """Return the position of the message in the outbox."""
+        return self._position
+
+    @property
+    def event(self) -> Event[EventPayloadType]:
+        """Return the event to publish."""
+        return self._event
+
+    def __repr__(self) -> str:
+        return f"OutboxMessage(position={self._position}, event={type(self._event).__name__})"
+
+
+class OutboxPort[EventPayloadType](
+    OutboundPort,
+):
+    """Abstract base class for transactional outboxes.
+
+    Responsibilities:
+        - Store the events of a commit durably and in order.
+        - Return the oldest messages not yet delivered.
+        - Forget messages once they are acknowledged.
+
+    Non-Responsibilities:
+        - Publish events — that is the relay's job.
+        - Deduplicate deliveries; consumers must be idempotent.
+
+    Example:
+        ```python
+        outbox = MyOutbox[OrderData]()
+        await outbox.add([OrderPlaced(order_id="42")])
+        pending = (await outbox.fetch_pending(limit=100)).value
+        await publisher.publish_many([message.event for message in pending])
+        await outbox.mark_delivered([message.position for message in pending])
+        ```
+    """
+
+    @abstractmethod
+    async def add(self, events: Sequence[Event[EventPayloadType]]) -> Result[None, EventStoreError]:
+        """Store *events*, in order, as pending messages.
+
+        Either all events are stored or none.
+
+        Args:
+            events: Events to publish later.
+
+        Returns:
+            A ``Result`` that is ``Ok(None)`` on success or carries an
+            ``EventStoreError`` on failure.
+
+        """
+        ...
+
+    @abstractmethod
+    async def fetch_pending(
+        self, limit: int
+    ) -> Result[Sequence[OutboxMessage[EventPayloadType]], EventStoreError]:
+        """Return up to *limit* undelivered messages, oldest first.
+
+        Messages stay pending until they are marked delivered, so a
+        second call may return the same messages again.
+
+        Args:
+            limit: Maximum number of messages to return.
+
+        Returns:
+            A ``Result`` containing the messages in position order, or an
+            ``EventStoreError``.
+
+        """
+        ...
+
+    @abstractmethod
+    async def mark_delivered(self, positions: Sequence[int]) -> Result[None, EventStoreError]:
+        """Acknowledge the messages at *positions* as published.
+
+        Unknown or already delivered positions are ignored.
+
+        Args:
+            positions: Positions of the delivered messages.
+
+        Returns:
+            A ``Result`` that is ``Ok(None)`` on success or carries an
+            ``EventStoreError`` on failure.
+
+        """
+        ...
@@ -1,7 +1,7 @@
 """Read-only repository abstraction for query-side operations."""
 
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from forging_blocks.foundation.ports import OutboundPort
 
@@ -20,6 +20,7 @@ class ReadOnlyRepositoryPort[TReadAggregateRoot, TId](OutboundPort):
 
 
         order: Order | None = await repo.get_by_id("order-42")
+        orders: Mapping[str, Order] = await repo.get_many(["order-42", "order-43"])
         all_orders: list[Order] = await repo.list_all()
         ```
     """
@@ -43,6 +44,28 @@ class ReadOnlyRepositoryPort[TReadAggregateRoot, TId](OutboundPort):
         """
         ...
 
+    async def get_many(self, entity_ids: Sequence[TId]) -> Mapping[TId, TReadAggregateRoot]:
+        """Retrieve several aggregates or read models by ID.
+
+        The default implementation calls ``get_by_id`` for each ID.
+        Implementations able to fetch many rows in one round trip (e.g.
+        ``WHERE id IN (...)``) override it.
+
+        Args:
+            entity_ids: Unique identifiers of the resources.
+
+        Returns:
+            The found instances by ID; IDs that were not found are
+            absent.
+
+        """
+        found: dict[TId, TReadAggregateRoot] = {}
+        for entity_id in entity_ids:
+            entity = await self.get_by_id(entity_id)
+            if entity is not None:
+                found[entity_id] = entity
+        return found
+
     @abstractmethod
     async def list_all(self) -> Sequence[TReadAggregateRoot]:
         """Retrieve all resources.
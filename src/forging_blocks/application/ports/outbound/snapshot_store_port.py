@@ -0,0 +1,124 @@
+"""Snapshot store port for event-sourced aggregates.
+
+Defines the ``SnapshotStorePort`` contract for persisting and loading
+aggregate snapshots, plus the ``Snapshot`` record it stores. A snapshot
+captures an aggregate's state at a given stream version so that loading
+only has to replay the events appended after it.
+"""
+
+from abc import abstractmethod
+from datetime import UTC, datetime
+from uuid import UUID
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.foundation.ports import OutboundPort
+from forging_blocks.foundation.result import Result
+
+
+class Snapshot:
+    """State of an aggregate captured at a specific stream version.
+
+    Attributes:
+        aggregate_id: Identity of the snapshotted aggregate.
+        version: Number of events folded into ``state``. Loading replays
+            events from this version onwards.
+        state: Opaque state produced by ``SnapshottableAggregateRoot.snapshot_state``.
+        taken_at: UTC timestamp at which the snapshot was captured.
+
+    Example:
+        ```python
+        snapshot = Snapshot(UUID("00000000-0000-0000-0000-000000000001"), 42, {"total": 1_000})
+        ```
+    """
+
+    __slots__ = ("_aggregate_id", "_state", "_taken_at", "_version")
+
+    def __init__(
+        self,
+        aggregate_id: UUID,
+        version: int,
+        state: object,
+        taken_at: datetime | None = None,
+    ) -> None:
+        self._aggregate_id = aggregate_id
+        self._version = version
+        self._state = state
+        self._taken_at = taken_at or datetime.now(UTC)
+
+    @property
+    def aggregate_id(self) -> UUID:
+        """Return the identity of the snapshotted aggregate."""
+        return self._aggregate_id
+
+    @property
+    def version(self) -> int:
+        """Return the stream version the snapshot was taken at."""
+        return self._version
+
+    @property
+    def state(self) -> object:
+        """Return the captured aggregate state."""
+        return self._state
+
+    @property
+    def taken_at(self) -> datetime:
+        """Return when the snapshot was captured."""
+        return self._taken_at
+
+    def __repr__(self) -> str:
+        return f"Snapshot(aggregate_id={self._aggregate_id!r}, version={self._version})"
+
+
+class SnapshotStorePort(
+    OutboundPort,
+):
+    """Abstract base class for stores that persist aggregate snapshots.
+
+    Responsibilities:
+        - Persist the latest snapshot of an aggregate.
+        - Return the latest snapshot of an aggregate, if any.
+
+    Non-Responsibilities:
+        - Decide when a snapshot should be taken — that is a policy of
+          the repository.
+        - Replay the events recorded after a snapshot.
+
+    Example:
+        ```python
+        store = MySnapshotStore()
+        await store.save_snapshot(Snapshot(aggregate_id, 100, aggregate.snapshot_state()))
+        result = await store.get_latest_snapshot(aggregate_id)
+        ```
+    """
+
+    @abstractmethod
+    async def save_snapshot(self, snapshot: Snapshot) -> Result[None, EventStoreError]:
+        """Persist *snapshot*, replacing an older snapshot of the same aggregate.
+
+        Snapshots older than the one already stored are ignored.
+
+        Args:
+            snapshot: The snapshot to persist.
+
+        Returns:
+            A ``Result`` that is ``Ok(None)`` on success or carries an
+            ``EventStoreError`` on failure.
+
+        """
+        ...
+
+    @abstractmethod
+    async def get_latest_snapshot(
+        self, aggregate_id: UUID
+    ) -> Result[Snapshot | None, EventStoreError]:
+        """Retrieve the most recent snapshot of an aggregate.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+
+        Returns:
+            A ``Result`` containing the snapshot, ``None`` if the aggregate
+            has never been snapshotted, or an ``EventStoreError``.
+
+        """
+        ...
@@ -29,6 +29,7 @@ from .value_object import ValueObject
 if TYPE_CHECKING:
     from .aggregate_root.aggregate_root import AggregateRoot
     from .aggregate_root.aggregate_version import AggregateVersion
+    from .aggregate_root.snapshottable_aggregate_root import SnapshottableAggregateRoot
 
 __all__ = [
     "AggregateRoot",
@@ -53,6 +54,7 @@ __all__ = [
     "Query",
     "RangeValidator",
     "RequiredValidator",
+    "SnapshottableAggregateRoot",
     "Specification",
     "ValueObject",
 ]
@@ -67,5 +69,9 @@ def __getattr__(name: str):
         from .aggregate_root.aggregate_version import AggregateVersion
 
         return AggregateVersion
+    if name == "SnapshottableAggregateRoot":
+        from .aggregate_root.snapshottable_aggregate_root import SnapshottableAggregateRoot
+
+        return SnapshottableAggregateRoot
     msg = f"module {__name__!r} has no attribute {name!r}"
     raise AttributeError(msg)
@@ -2,8 +2,10 @@
 
 from .aggregate_root import AggregateRoot
 from .aggregate_version import AggregateVersion
+from .snapshottable_aggregate_root import SnapshottableAggregateRoot
 
 __all__ = [
     "AggregateRoot",
     "AggregateVersion",
+    "SnapshottableAggregateRoot",
 ]
@@ -1,7 +1,7 @@
 """Base AggregateRoot class for Domain-Driven Design."""
 
 from abc import abstractmethod
-from collections.abc import Hashable, Sequence
+from collections.abc import AsyncIterable, Hashable, Sequence
 from typing import Self
 
 from forging_blocks.domain.entity import Entity
@@ -100,6 +100,40 @@ class AggregateRoot[TId: Hashable, EventPayloadType](Entity[TId], metaclass=Fina
             instance.replay(event)
         return instance
 
+    @classmethod
+    async def reconstitute_stream(
+        cls,
+        aggregate_id: TId,
+        batches: AsyncIterable[Sequence[Event[EventPayloadType]]],
+    ) -> Self:
+        """Reconstitute an aggregate from an asynchronous stream of event batches.
+
+        Behaves like `reconstitute` but replays each batch as it
+        arrives, so only one batch has to be held in memory at a time.
+        Pair it with ``EventStorePort.stream_events`` for very long
+        streams.
+
+        Args:
+            aggregate_id: The identity for the reconstituted aggregate.
+            batches: Batches of stored events in chronological order.
+
+        Returns:
+            A fully reconstituted aggregate with version equal to the number
+            of events replayed.
+
+        Example:
+            ```python
+            cart = await ShoppingCart.reconstitute_stream(
+                cart_id, store.stream_events(cart_id, batch_size=1_000)
+            )
+            ```
+        """
+        instance = cls(aggregate_id)
+        async for batch in batches:
+            for event in batch:
+                instance.replay(event)
+        return instance
+
     @runtime_final
     def collect_events(self) -> list[Event[EventPayloadType]]:
         """Drain uncommitted events for the dispatcher.
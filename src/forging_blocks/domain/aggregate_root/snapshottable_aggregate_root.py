@@ -0,0 +1,84 @@
+"""Aggregate Root base class for aggregates that support snapshots."""
+
+from abc import abstractmethod
+from collections.abc import Hashable, Sequence
+from typing import Self
+
+from forging_blocks.domain.messages.event import Event
+
+from .aggregate_root import AggregateRoot
+from .aggregate_version import AggregateVersion
+
+
+class SnapshottableAggregateRoot[TId: Hashable, EventPayloadType](
+    AggregateRoot[TId, EventPayloadType]
+):
+    """Aggregate Root whose state can be captured in and restored from a snapshot.
+
+    Repositories configured with a snapshot store only accept aggregates
+    deriving from this class. Subclasses implement `snapshot_state` and
+    `_restore_snapshot_state`; the value returned by `snapshot_state`
+    must be understood by the snapshot store in use (the file-backed
+    store requires JSON-serializable values).
+
+    Example:
+        ```python
+        class Counter(SnapshottableAggregateRoot[str, int]):
+            def __init__(self, counter_id: str) -> None:
+                super().__init__(counter_id)
+                self.total = 0
+
+            def snapshot_state(self) -> object:
+                return self.total
+
+            def _restore_snapshot_state(self, state: object) -> None:
+                self.total = int(state)
+
+            def _handle(self, event: Event[int]) -> None:
+                self.total += event.value
+
+
+        counter = Counter.from_snapshot("counter-1", AggregateVersion(10), 42, [])
+        print(counter.total, counter.version)  # 42 AggregateVersion(10)
+        ```
+    """
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        aggregate_id: TId,
+        version: AggregateVersion,
+        state: object,
+        events: Sequence[Event[EventPayloadType]],
+    ) -> Self:
+        """Restore an aggregate from a snapshot and the events recorded after it.
+
+        Creates a new aggregate from *aggregate_id* alone, moves it to
+        *version*, hands *state* to `_restore_snapshot_state` and replays
+        *events* on top of it.
+
+        Args:
+            aggregate_id: The identity for the restored aggregate.
+            version: Stream version the snapshot was taken at.
+            state: State previously returned by `snapshot_state`.
+            events: Events appended after the snapshot, in chronological
+                order.
+
+        Returns:
+            An aggregate whose version is *version* plus the number of
+            events replayed.
+        """
+        instance = cls(aggregate_id)
+        instance._version = version
+        instance._restore_snapshot_state(state)
+        for event in events:
+            instance.replay(event)
+        return instance
+
+    @abstractmethod
+    def snapshot_state(self) -> object:
+        """Return the aggregate state to store in a snapshot."""
+
+    @abstractmethod
+    def _restore_snapshot_state(self, state: object) -> None:
+        """Restore aggregate state from a value produced by `snapshot_state`."""
@@ -68,10 +68,11 @@ class Message[MessageRawType](ABC):
         ``@message_dataclass`` patches ``__abstractmethods__`` later.
         ``auto_hash`` and ``auto_eq`` use ``fields=["message_id"]`` so that
         message identity (equality and hashing) is driven solely by the
-        unique message identifier, not by payload fields.
+        unique message identifier, not by payload fields. The hash is
+        cached once the message is frozen.
         """
         super().__init_subclass__(**kwargs)
-        auto_hash(cls, fields=["message_id"])
+        auto_hash(cls, fields=["message_id"], cache=True)
         auto_eq(cls, fields=["message_id"])
         if not inspect.isabstract(cls):
             auto_freeze(cls)
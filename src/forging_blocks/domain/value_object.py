@@ -26,7 +26,8 @@ class ValueObject[RawValueType](ABC):
     exactly one concern:
 
     - `@auto_freeze` enforces immutability.
-    - `@auto_hash` generates `__hash__` from class fields.
+    - `@auto_hash` generates `__hash__` from class fields; the hash is
+      computed once per frozen instance and cached.
     - `@auto_eq` generates `__eq__` from class fields.
 
     Intermediate abstract classes are skipped so leaf subclasses finish
@@ -61,7 +62,7 @@ class ValueObject[RawValueType](ABC):
         super().__init_subclass__(**kwargs)
         if not inspect.isabstract(cls):
             auto_freeze(cls)
-            auto_hash(cls)
+            auto_hash(cls, cache=True)
             auto_eq(cls)
 
     def __str__(self) -> str:
@@ -26,6 +26,7 @@ from .errors import (
 from .identified import Identified
 from .mapper import Mapper
 from .meta import FinalABCMeta, FinalMeta, runtime_final
+from .middleware import Middleware, NextHandler, Pipeline
 from .permission import Permission
 from .ports import (
     InboundPort,
@@ -56,10 +57,13 @@ __all__ = [
     "Identified",
     "InboundPort",
     "Mapper",
+    "Middleware",
+    "NextHandler",
     "NoneNotAllowedError",
     "Ok",
     "OutboundPort",
     "Permission",
+    "Pipeline",
     "Port",
     "Result",
     "ResultAccessError",
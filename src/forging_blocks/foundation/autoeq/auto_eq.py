@@ -7,6 +7,9 @@ class fields. Works on plain classes with
 Can be used as ``@auto_eq``, ``@auto_eq()``, or
 ``@auto_eq(fields=[...])`` to compare only specific attributes.
 
+The generated ``__eq__`` is compiled once per class with each field
+compared directly, like the methods ``dataclasses`` generates.
+
 Does NOT generate ``__hash__`` — use `auto_hash` when
 hashability is required.
 
@@ -48,8 +51,9 @@ Example:
 """
 
 from collections.abc import Callable, Sequence
-from typing import Any, overload
+from typing import overload
 
+from forging_blocks.foundation.autoeq.helpers.eq_method_builder import EqMethodBuilder
 from forging_blocks.foundation.autoeq.helpers.field_resolver import (
     FieldResolver,
 )
@@ -104,15 +108,7 @@ class _AutoEqDecorator:
         field_names = FieldResolver.resolve(class_, self._fields)
         _field_names = tuple(field_names)
 
-        def _eq_impl(self: Any, other: object) -> bool:
-            if type(self) is not type(other):
-                return False
-            return all(getattr(self, f) == getattr(other, f) for f in _field_names)
-
-        _eq_impl.__name__ = "__eq__"
-        _eq_impl.__qualname__ = f"{class_.__name__}.__eq__"
-
-        class_.__eq__ = _eq_impl
+        class_.__eq__ = EqMethodBuilder.build(class_, _field_names)
         type.__setattr__(class_, "__auto_eq_fields__", _field_names)
         return class_
 
@@ -3,10 +3,14 @@
 These are implementation details and not part of the public API.
 """
 
+from forging_blocks.foundation.autoeq.helpers.eq_method_builder import (
+    EqMethodBuilder,
+)
 from forging_blocks.foundation.autoeq.helpers.field_resolver import (
     FieldResolver,
 )
 
 __all__ = [
+    "EqMethodBuilder",
     "FieldResolver",
 ]
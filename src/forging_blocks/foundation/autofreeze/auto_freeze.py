@@ -114,10 +114,12 @@ class _AutoFreezeDecorator:
         if FrozenStateManager.is_decorated(class_.__init__):
             return class_
 
-        init_wrapper = FrozenInitWrapper(class_.__init__, class_, self._attrs)
+        setattr_handler = FrozenSetattrHandler(class_)
+        init_wrapper = FrozenInitWrapper(
+            class_.__init__, class_, self._attrs, arm_hash_cache=setattr_handler.enforces_freeze()
+        )
         class_.__init__ = init_wrapper.wrap()
 
-        setattr_handler = FrozenSetattrHandler(class_)
         if setattr_handler.should_override_setattr():
             class_.__setattr__ = setattr_handler.create_frozen_setattr()
 
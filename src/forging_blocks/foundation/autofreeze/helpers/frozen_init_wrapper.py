@@ -2,7 +2,8 @@
 
 The wrapper tracks init-depth to handle inheritance chains: freeze is
 only applied when the outermost ``__init__`` returns (depth == 0),
-and only for concrete (non-abstract) classes.
+and only for concrete (non-abstract) classes. A fully frozen instance also
+gets its hash cache armed when its class uses ``auto_hash(cache=True)``.
 """
 
 import inspect
@@ -13,6 +14,7 @@ from typing import Any
 from forging_blocks.foundation.autofreeze.helpers.frozen_state import (
     FrozenStateManager,
 )
+from forging_blocks.foundation.autohash.helpers.hash_cache import HashCache
 
 
 class FrozenInitWrapper:
@@ -24,6 +26,8 @@ class FrozenInitWrapper:
     3. Decrements the depth in a ``finally`` block.
     4. When depth reaches zero and the class is concrete, applies the
        appropriate freeze (full or selective).
+    5. After a full freeze enforced by the frozen ``__setattr__``, arms
+       the instance's hash cache (see `HashCache`).
 
     Example:
         ```python
@@ -49,6 +53,7 @@ class FrozenInitWrapper:
         original_init: Callable[..., None],
         target_class: type[object],
         freeze_attrs: Sequence[str] | None,
+        arm_hash_cache: bool = False,
     ) -> None:
         """Initialise the wrapper.
 
@@ -57,11 +62,14 @@ class FrozenInitWrapper:
             target_class: The class being decorated.
             freeze_attrs: Attribute names for selective freezing, or
                 ``None`` for full freeze.
+            arm_hash_cache: Whether a fully frozen instance can no longer
+                change, so its hash may be cached.
 
         """
         self.original_init = original_init
         self.target_class = target_class
         self.freeze_attrs = freeze_attrs
+        self.arm_hash_cache = arm_hash_cache and freeze_attrs is None
 
     def wrap(self) -> Callable[..., None]:
         """Return the wrapped ``__init__``, tagged with the auto-freeze marker.
@@ -83,6 +91,8 @@ class FrozenInitWrapper:
                 if new_depth == 0 and not inspect.isabstract(self.target_class):
                     if self.freeze_attrs is None:
                         FrozenStateManager.apply_full_freeze(instance)
+                        if self.arm_hash_cache:
+                            HashCache.arm(instance)
                     else:
                         FrozenStateManager.apply_selective_freeze(instance, self.freeze_attrs)
 
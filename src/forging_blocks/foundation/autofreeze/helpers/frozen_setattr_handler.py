@@ -1,7 +1,8 @@
 """``__setattr__`` override handler for auto-frozen classes.
 
 Wraps a class's ``__setattr__`` to enforce frozen-attribute checks
-at write time.
+at write time. The check reads the instance's freeze flags directly,
+without building a `FrozenStateConfig` per write.
 """
 
 from collections.abc import Callable
@@ -51,6 +52,15 @@ class FrozenSetattrHandler:
         """Return ``True`` when it is safe to replace ``__setattr__``."""
         return not self.has_custom_setattr
 
+    def enforces_freeze(self) -> bool:
+        """Return ``True`` when instances end up with a frozen ``__setattr__``.
+
+        That is the case when ``__setattr__`` is about to be replaced, or
+        when it is already the frozen setattr inherited from a decorated
+        base class.
+        """
+        return not self.has_custom_setattr or FrozenStateManager.is_decorated(self.original_setattr)
+
     def create_frozen_setattr(self) -> Callable[..., None]:
         """Build a ``__setattr__`` that enforces freeze rules.
 
@@ -63,21 +73,17 @@ class FrozenSetattrHandler:
         if self.has_custom_setattr:
             return self.original_setattr
 
-        def frozen_setattr(instance: Any, name: str, value: Any) -> None:
-            state = FrozenStateManager.get_state(instance)
-
-            if state.is_full_freeze:
-                raise CantModifyImmutableAttributeError(
-                    class_name=instance.__class__.__name__,
-                    attribute_name=name,
-                )
+        blocks_write = FrozenStateManager.blocks_write
+        object_setattr = object.__setattr__
 
-            if state.frozen_attrs is not None and name in state.frozen_attrs:
+        def frozen_setattr(instance: Any, name: str, value: Any) -> None:
+            if blocks_write(instance, name):
                 raise CantModifyImmutableAttributeError(
                     class_name=instance.__class__.__name__,
                     attribute_name=name,
                 )
 
-            object.__setattr__(instance, name, value)
+            object_setattr(instance, name, value)
 
+        FrozenStateManager.mark_as_decorated(frozen_setattr)
         return frozen_setattr
@@ -3,22 +3,29 @@
 Provides state flags, configuration objects, and a central manager that
 tracks init depth and freeze state on decorated instances.
 
-Fallback storage uses weak references when the instance supports them,
-so entries are automatically cleaned up when the instance is garbage
-collected.  For slotted classes that exclude ``__weakref__``, the
-manager falls back to ``id()``-keyed dicts with a type-qualifier guard
-to prevent stale reads from ``id`` reuse.
+State lives on the instance itself, in reserved attributes, whenever
+the instance has a ``__dict__`` or slots for them
+(`FrozenStateManager.STATE_SLOTS`); this needs no global bookkeeping
+and costs nothing when the instance is garbage collected. Only slotted
+instances without room for the attributes use a side table keyed by
+``id()``. Its entries are removed in O(1) by a weak-reference callback,
+or when the state returns to its defaults; instances that support
+neither weak references nor the reserved attributes keep their entry
+while they stay frozen, guarded against ``id`` reuse by the class's
+qualified name.
 """
 
 import weakref
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import partial
 from typing import cast
 
 _AUTO_FREEZE_MARKER = "__auto_freeze_applied"
 _FROZEN_FLAG = "_autofreeze__frozen"
 _FROZEN_ATTRS_FLAG = "_autofreeze__frozen_attrs"
 _INIT_DEPTH_FLAG = "_autofreeze__init_depth"
+_MISSING = object()
 
 
 @dataclass(frozen=True)
@@ -40,21 +47,39 @@ class FrozenStateConfig:
     frozen_attrs: frozenset[str] | None
 
 
+class _SideEntry:
+    """Frozen state of one instance that cannot hold the reserved attributes.
+
+    Slot names equal the reserved attribute names, so the manager reads
+    and writes an entry exactly like the instance itself.
+    """
+
+    __slots__ = (_FROZEN_ATTRS_FLAG, _FROZEN_FLAG, _INIT_DEPTH_FLAG, "qualname", "ref")
+
+    def __init__(self, qualname: str) -> None:
+        self.qualname = qualname
+        self.ref: weakref.ReferenceType[object] | None = None
+        setattr(self, _FROZEN_FLAG, False)
+        setattr(self, _FROZEN_ATTRS_FLAG, None)
+        setattr(self, _INIT_DEPTH_FLAG, 0)
+
+    def is_default(self) -> bool:
+        return (
+            getattr(self, _INIT_DEPTH_FLAG) == 0
+            and getattr(self, _FROZEN_FLAG) is False
+            and getattr(self, _FROZEN_ATTRS_FLAG) is None
+        )
+
+
 class FrozenStateManager:
     """Central state tracker for auto-frozen instances.
 
-    Stores per-instance init-depth, frozen-flag, and frozen-attrs state.
-    For classes whose instances support weak references the entries are
-    automatically cleaned up on garbage collection.  For slotted classes
-    that exclude ``__weakref__`` the ``id()`` entries persist until the
-    end of the process — their count is bounded by the number of
-    concurrently-live instances, which is acceptable for typical
-    workloads.
-
-    All internal dicts are keyed by ``id(instance)`` (an `int`)
-    so that lookups never trigger ``__hash__`` on the instance — the
-    instance may still be inside ``__init__`` and its fields may not be
-    populated yet.
+    Stores per-instance init-depth, frozen-flag, and frozen-attrs state
+    in reserved attributes on the instance. Slotted classes can make
+    room for them by adding `STATE_SLOTS` to their ``__slots__``;
+    otherwise their instances fall back to a side table keyed by
+    ``id(instance)`` (an `int`), so that lookups never trigger
+    ``__hash__`` on an instance that may still be inside ``__init__``.
 
     Example:
         ```python
@@ -71,132 +96,108 @@ class FrozenStateManager:
         ```
     """
 
-    _RefKey = int
-    """Key type for all internal tracking dicts — always ``id(instance)``."""
-
-    _refs_by_id: dict[_RefKey, weakref.ReferenceType[object]] = {}
-    """``id(instance)`` → ``weakref.ref``.
+    STATE_SLOTS = (_FROZEN_FLAG, _FROZEN_ATTRS_FLAG, _INIT_DEPTH_FLAG)
+    """Reserved attribute names; add them to ``__slots__`` to keep state on the instance."""
 
-    Maintained only for instances that support weak references so that
-    the callback can clean up stale entries from the fallback dicts when
-    the instance is garbage-collected.  Slotted classes without
-    ``__weakref__`` are absent from this map.
-    """
+    _side_table: dict[int, _SideEntry] = {}
+    """``id(instance)`` → state of instances without room for the reserved attributes."""
 
-    _init_depth_fallback: dict[_RefKey, tuple[str, int]] = {}
-    _frozen_fallback: dict[_RefKey, tuple[str, bool]] = {}
-    _frozen_attrs_fallback: dict[_RefKey, tuple[str, set[str]]] = {}
     # ------------------------------------------------------------------
-    # key management
+    # storage
     # ------------------------------------------------------------------
 
     @classmethod
-    def _fallback_key(cls, instance: object) -> _RefKey:
-        """Return the stable ``id(instance)`` key used in all tracking dicts.
+    def _side_entry(cls, instance: object, create: bool) -> _SideEntry | None:
+        """Return the side-table entry of *instance*, creating it if asked.
 
-        As a side effect, registers a `weakref.ref` for instances
-        that support weak references so that entries are cleaned up on
-        garbage collection.
+        Entries whose weak reference no longer points to *instance*, or
+        whose class name differs, belong to a dead instance whose ``id``
+        was reused and are discarded.
         """
-        iid = id(instance)
-        if iid in cls._refs_by_id:
-            return iid
-        try:
-            ref: weakref.ReferenceType[object] = weakref.ref(instance, cls._cleanup_fallback)
-        except TypeError:
-            # Instance does not support weak references (slotted without
-            # ``__weakref__``).  No cleanup; entries persist until exit.
-            pass
-        else:
-            cls._refs_by_id[iid] = ref
-        return iid
+        key = id(instance)
+        entry = cls._side_table.get(key)
+        if entry is not None:
+            if entry.ref is not None:
+                stale = entry.ref() is not instance
+            else:
+                stale = entry.qualname != type(instance).__qualname__
+            if stale:
+                del cls._side_table[key]
+                entry = None
+        if entry is None and create:
+            entry = _SideEntry(type(instance).__qualname__)
+            try:
+                entry.ref = weakref.ref(instance, partial(cls._forget, key))
+            except TypeError:
+                # No ``__weakref__``: the entry is dropped once the state
+                # is back to its defaults, or kept while frozen.
+                pass
+            cls._side_table[key] = entry
+        return entry
 
     @classmethod
-    def _cleanup_fallback(cls, ref: weakref.ReferenceType[object]) -> None:
-        """Remove all per-instance entries from every tracking dict.
+    def _forget(cls, key: int, ref: weakref.ReferenceType[object]) -> None:
+        """Drop the side-table entry of a garbage-collected instance in O(1)."""
+        entry = cls._side_table.get(key)
+        if entry is not None and entry.ref is ref:
+            del cls._side_table[key]
 
-        Installed as the callback on every `weakref.ref` stored in
-        `_refs_by_id`.  Called automatically by the runtime when the
-        referent is garbage-collected.
-        """
-        # Find the id that maps to this ref.
-        for iid, cached in list(cls._refs_by_id.items()):
-            if cached is ref:
-                del cls._refs_by_id[iid]
-                cls._init_depth_fallback.pop(iid, None)
-                cls._frozen_fallback.pop(iid, None)
-                cls._frozen_attrs_fallback.pop(iid, None)
-                return
+    @classmethod
+    def _read(cls, instance: object, flag: str, default: object) -> object:
+        value = getattr(instance, flag, _MISSING)
+        if value is not _MISSING:
+            return value
+        if not cls._side_table:
+            return default
+        entry = cls._side_entry(instance, create=False)
+        return default if entry is None else getattr(entry, flag)
+
+    @classmethod
+    def _write(cls, instance: object, flag: str, value: object) -> None:
+        try:
+            object.__setattr__(instance, flag, value)
+        except AttributeError:
+            entry = cls._side_entry(instance, create=True)
+            setattr(entry, flag, value)
 
     # ------------------------------------------------------------------
     # init depth
     # ------------------------------------------------------------------
 
-    @classmethod
-    def _qualname_of(cls, instance: object) -> str:
-        return type(instance).__qualname__
-
     @classmethod
     def _read_init_depth(cls, instance: object) -> int:
-        try:
-            return cast(int, getattr(instance, _INIT_DEPTH_FLAG))
-        except AttributeError:
-            key = cls._fallback_key(instance)
-            entry = cls._init_depth_fallback.get(key)
-            if entry is not None and entry[0] == cls._qualname_of(instance):
-                return entry[1]
-            return 0
+        return cast(int, cls._read(instance, _INIT_DEPTH_FLAG, 0))
 
     @classmethod
     def _write_init_depth(cls, instance: object, depth: int) -> None:
-        try:
-            object.__setattr__(instance, _INIT_DEPTH_FLAG, depth)
-        except AttributeError:
-            cls._init_depth_fallback[cls._fallback_key(instance)] = (
-                cls._qualname_of(instance),
-                depth,
-            )
+        cls._write(instance, _INIT_DEPTH_FLAG, depth)
 
     @classmethod
     def _erase_init_depth(cls, instance: object) -> None:
         try:
             object.__delattr__(instance, _INIT_DEPTH_FLAG)
-        except (AttributeError, TypeError):
-            # Instance cannot have the tracking attribute removed
-            # (e.g., it was never set, or the class is slotted).
-            # Fallback map cleanup happens unconditionally below.
-            pass
-        cls._init_depth_fallback.pop(cls._fallback_key(instance), None)
+        except AttributeError:
+            # No room for the attribute (or it was never set): reset the
+            # side-table entry and drop it if nothing else is recorded.
+            entry = cls._side_entry(instance, create=False)
+            if entry is not None:
+                setattr(entry, _INIT_DEPTH_FLAG, 0)
+                if entry.is_default():
+                    del cls._side_table[id(instance)]
 
     # ------------------------------------------------------------------
     # frozen flag
     # ------------------------------------------------------------------
+
     @classmethod
     def _read_is_frozen(cls, instance: object) -> bool:
         if cls._read_init_depth(instance) > 0:
             return False
-        try:
-            return cast("bool", getattr(instance, _FROZEN_FLAG))
-        except AttributeError:
-            key = cls._fallback_key(instance)
-            entry = cls._frozen_fallback.get(key)
-            if entry is None:
-                return False
-            qualifier, value = entry
-            if qualifier == cls._qualname_of(instance):
-                return value
-            del cls._frozen_fallback[key]
-            return False
+        return cast(bool, cls._read(instance, _FROZEN_FLAG, False))
 
     @classmethod
     def _write_is_frozen(cls, instance: object, value: bool) -> None:
-        try:
-            object.__setattr__(instance, _FROZEN_FLAG, value)
-        except AttributeError:
-            cls._frozen_fallback[cls._fallback_key(instance)] = (
-                cls._qualname_of(instance),
-                value,
-            )
+        cls._write(instance, _FROZEN_FLAG, value)
 
     # ------------------------------------------------------------------
     # frozen attrs
@@ -206,28 +207,11 @@ class FrozenStateManager:
     def _read_frozen_attrs(cls, instance: object) -> set[str] | None:
         if cls._read_init_depth(instance) > 0:
             return None
-        try:
-            return cast("set[str] | None", getattr(instance, _FROZEN_ATTRS_FLAG))
-        except AttributeError:
-            key = cls._fallback_key(instance)
-            entry = cls._frozen_attrs_fallback.get(key)
-            if entry is None:
-                return None
-            qualifier, value = entry
-            if qualifier == cls._qualname_of(instance):
-                return value
-            del cls._frozen_attrs_fallback[key]
-            return None
+        return cast("set[str] | None", cls._read(instance, _FROZEN_ATTRS_FLAG, None))
 
     @classmethod
     def _write_frozen_attrs(cls, instance: object, attrs: set[str]) -> None:
-        try:
-            object.__setattr__(instance, _FROZEN_ATTRS_FLAG, attrs)
-        except AttributeError:
-            cls._frozen_attrs_fallback[cls._fallback_key(instance)] = (
-                cls._qualname_of(instance),
-                attrs,
-            )
+        cls._write(instance, _FROZEN_ATTRS_FLAG, attrs)
 
     # ------------------------------------------------------------------
     # public api
@@ -241,6 +225,32 @@ class FrozenStateManager:
         frozen = frozenset(frozen_attrs) if frozen_attrs is not None else None
         return FrozenStateConfig(is_full_freeze=is_frozen, frozen_attrs=frozen)
 
+    @classmethod
+    def blocks_write(cls, instance: object, name: str) -> bool:
+        """Return ``True`` when assigning *name* on *instance* must be refused.
+
+        Allocation-free equivalent of checking `get_state`, used by the
+        frozen ``__setattr__`` on every write: an instance under
+        construction costs two attribute lookups, and the init depth is
+        only read once a freeze flag says the write may be refused.
+        """
+        frozen = getattr(instance, _FROZEN_FLAG, _MISSING)
+        if frozen is True:
+            return cls._read_init_depth(instance) == 0
+        frozen_attrs = getattr(instance, _FROZEN_ATTRS_FLAG, _MISSING)
+        if frozen_attrs is not _MISSING:
+            return (
+                frozen_attrs is not None
+                and name in cast("set[str]", frozen_attrs)
+                and cls._read_init_depth(instance) == 0
+            )
+        if frozen is _MISSING and cls._side_table:
+            state = cls.get_state(instance)
+            return state.is_full_freeze or (
+                state.frozen_attrs is not None and name in state.frozen_attrs
+            )
+        return False
+
     @classmethod
     def mark_as_decorated(cls, init_method: object) -> None:
         """Tag *init_method* so that ``is_decorated`` returns ``True``."""
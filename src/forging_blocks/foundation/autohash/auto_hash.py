@@ -6,6 +6,8 @@ based on class fields. Works on plain classes with ``__slots__`` or
 
 Can be used as ``@auto_hash``, ``@auto_hash()``, or
 ``@auto_hash(fields=[...])`` to hash only specific attributes.
+``@auto_hash(cache=True)`` computes the hash of a fully frozen
+(``auto_freeze``) instance once and reuses it.
 
 Does NOT generate ``__eq__`` — combine with `auto_eq` when structural
 equality is needed alongside hashing.
@@ -45,14 +47,28 @@ Example:
     assert hash(r1) == hash(r2)
     ```
 
+    With a cached hash on a frozen class:
+    ```python
+    @auto_freeze
+    @auto_hash(cache=True)
+    class Filter:
+        def __init__(self, criteria: dict[str, list[str]]) -> None:
+            self.criteria = criteria
+
+
+    f = Filter({"status": ["open", "pending"]})
+    assert hash(f) == hash(f)  # the second call does not convert the dict again
+    ```
+
 """
 
 import dataclasses
 from collections.abc import Callable, Sequence
-from typing import Any, overload
+from typing import overload
 
-from forging_blocks.foundation.autohash.helpers.hashable_converter import (
-    HashableConverter,
+from forging_blocks.foundation.autohash.helpers.hash_cache import HashCache
+from forging_blocks.foundation.autohash.helpers.hash_method_builder import (
+    HashMethodBuilder,
 )
 
 
@@ -61,7 +77,8 @@ class _AutoHashDecorator:
 
     Generates ``__hash__`` only, based on the class's fields.
     The hash is computed by converting each field value to a hashable form and
-    then hashing the resulting tuple.
+    then hashing the resulting tuple. The method is compiled once per class
+    with direct attribute reads; see `HashMethodBuilder`.
 
     Example:
         ```python
@@ -78,16 +95,19 @@ class _AutoHashDecorator:
         ```
     """
 
-    def __init__(self, *, fields: Sequence[str] | None = None) -> None:
+    def __init__(self, *, fields: Sequence[str] | None = None, cache: bool = False) -> None:
         """Initialise the decorator with optional field selector.
 
         Args:
             fields: Specific field names to hash. When ``None``, all
                 all fields declared in ``__slots__`` or
                 ``__annotations__`` are used.
+            cache: Cache the hash of instances once ``auto_freeze`` has
+                fully frozen them.
 
         """
         self._fields = fields
+        self._cache = cache
 
     def __call__[T](self, class_: type[T]) -> type[T]:
         """Apply auto-hash behaviour to *class_*.
@@ -104,18 +124,8 @@ class _AutoHashDecorator:
         field_names = self._resolve_field_names(class_)
         _field_names = tuple(field_names)
 
-        def _hash_impl(self: Any) -> int:
-            values = tuple(getattr(self, f) for f in _field_names)
-            converted = (
-                HashableConverter.convert(v, field_name=f)
-                for f, v in zip(_field_names, values, strict=True)
-            )
-            return hash(tuple(converted))
-
-        _hash_impl.__name__ = "__hash__"
-        _hash_impl.__qualname__ = f"{class_.__name__}.__hash__"
-
-        class_.__hash__ = _hash_impl
+        class_.__hash__ = HashMethodBuilder.build(class_, _field_names, cache=self._cache)
+        HashCache.enable(class_, self._cache)
         type.__setattr__(class_, "__auto_hash_fields__", _field_names)
         return class_
 
@@ -200,6 +210,7 @@ def auto_hash[T](
     class_: type[T],
     *,
     fields: Sequence[str] | None = None,
+    cache: bool = False,
 ) -> type[T]: ...
 
 
@@ -208,6 +219,7 @@ def auto_hash[T](
     class_: None = None,
     *,
     fields: Sequence[str] | None = None,
+    cache: bool = False,
 ) -> Callable[[type[T]], type[T]]: ...
 
 
@@ -215,6 +227,7 @@ def auto_hash[T](
     class_: type[T] | None = None,
     *,
     fields: Sequence[str] | None = None,
+    cache: bool = False,
 ) -> type[T] | Callable[[type[T]], type[T]]:
     """Generate ``__hash__`` for a class based on its fields.
 
@@ -230,6 +243,10 @@ def auto_hash[T](
         fields: Optional sequence of field names to include in the hash.
             When ``None``, all fields declared in ``__slots__`` or
             ``__annotations__`` are used.
+        cache: When ``True``, the hash of an instance is computed on the
+            first call after ``auto_freeze`` has fully frozen it and
+            reused afterwards. Only safe when the hashed values are not
+            mutated in place after construction.
 
     Returns:
         The decorated class if *class_* is provided; otherwise a callable
@@ -240,7 +257,7 @@ def auto_hash[T](
             *fields* is ``None``.
 
     """
-    decorator = _AutoHashDecorator(fields=fields)
+    decorator = _AutoHashDecorator(fields=fields, cache=cache)
 
     if class_ is not None:
         return decorator(class_)
@@ -3,10 +3,16 @@
 These are implementation details and not part of the public API.
 """
 
+from forging_blocks.foundation.autohash.helpers.hash_cache import HashCache
+from forging_blocks.foundation.autohash.helpers.hash_method_builder import (
+    HashMethodBuilder,
+)
 from forging_blocks.foundation.autohash.helpers.hashable_converter import (
     HashableConverter,
 )
 
 __all__ = [
+    "HashCache",
+    "HashMethodBuilder",
     "HashableConverter",
 ]
@@ -0,0 +1,71 @@
+"""Per-instance hash caching for ``auto_hash(cache=True)``.
+
+A class opts in with ``auto_hash(cache=True)``. Its instances are
+*armed* by ``auto_freeze`` once the outermost ``__init__`` has returned
+and the whole instance is frozen: a reserved attribute is set to
+``None``. The generated ``__hash__`` then computes the hash on the first
+call and stores it in that attribute; later calls return it directly.
+Instances that are never armed (not frozen, selectively frozen, or
+slotted without room for the attribute) are hashed on every call.
+
+The stored hash is paired with a token created in this process, so a
+copy that crossed a process boundary (where ``str`` hashes differ)
+recomputes its hash instead of trusting a stale one. Such copies come
+from ``pickle`` for classes keeping their fields in ``__dict__``;
+slotted frozen classes such as ``MessageMetadata`` cannot be unpickled,
+because unpickling writes their slots through the frozen
+``__setattr__``.
+"""
+
+_CACHE_ENABLED_MARKER = "__auto_hash_cached__"
+
+
+class HashCache:
+    """Arms and identifies the reserved hash slot of frozen instances.
+
+    Attributes:
+        ATTRIBUTE: Instance attribute holding ``None`` (armed, not yet
+            computed) or ``(TOKEN, hash)``.
+        TOKEN: Identifies hashes computed in this process.
+
+    Example:
+        ```python
+        @auto_freeze
+        @auto_hash(cache=True)
+        class Tag:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+
+        tag = Tag("urgent")
+        hash(tag)  # computed once, then served from the cache
+        ```
+    """
+
+    ATTRIBUTE = "_autohash__hash"
+    TOKEN = object()
+
+    @classmethod
+    def enable(cls, class_: type[object], enabled: bool) -> None:
+        """Record whether instances of *class_* may cache their hash."""
+        type.__setattr__(class_, _CACHE_ENABLED_MARKER, enabled)
+
+    @classmethod
+    def is_enabled(cls, class_: type[object]) -> bool:
+        """Return ``True`` when *class_* was decorated with ``auto_hash(cache=True)``."""
+        return getattr(class_, _CACHE_ENABLED_MARKER, False) is True
+
+    @classmethod
+    def arm(cls, instance: object) -> None:
+        """Let the generated ``__hash__`` of *instance* store its result.
+
+        Does nothing when the class did not opt in, or when *instance*
+        has no room for the reserved attribute.
+        """
+        if not cls.is_enabled(type(instance)):
+            return
+        try:
+            object.__setattr__(instance, cls.ATTRIBUTE, None)
+        except AttributeError:
+            # Slotted without ``__dict__`` or a slot for the cache.
+            pass
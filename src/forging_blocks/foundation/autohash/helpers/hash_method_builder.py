@@ -0,0 +1,128 @@
+"""Compile a class-specific ``__hash__`` for the auto_hash decorator.
+
+Instead of looping over field names with ``getattr`` on every call, the
+builder generates the source of a ``__hash__`` that reads each field
+directly, the way ``dataclasses`` does, and compiles it once per class.
+Values of common immutable built-in types skip `HashableConverter`;
+everything else is converted exactly as before, so hashes are
+unchanged. With ``cache=True`` the method also reads and fills the
+reserved attribute managed by `HashCache`.
+"""
+
+import datetime
+import decimal
+import keyword
+import uuid
+from collections.abc import Callable, Sequence
+from types import FunctionType
+from typing import cast
+
+from forging_blocks.foundation.autohash.helpers.hash_cache import HashCache
+from forging_blocks.foundation.autohash.helpers.hashable_converter import (
+    HashableConverter,
+)
+
+_PLAIN_TYPES: frozenset[type] = frozenset(
+    {
+        bool,
+        bytes,
+        complex,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        decimal.Decimal,
+        float,
+        int,
+        str,
+        type(None),
+        uuid.UUID,
+    }
+)
+"""Types `HashableConverter.convert` returns unchanged, checked exactly."""
+
+
+class HashMethodBuilder:
+    """Generates an unrolled ``__hash__`` for a fixed tuple of fields.
+
+    The generated method returns ``hash((v0, v1, ...))`` where each
+    ``v`` is the field value, passed through `HashableConverter` unless
+    its exact type is a plain immutable built-in.
+
+    Example:
+        ```python
+        from forging_blocks.foundation.autohash.helpers.hash_method_builder import (
+            HashMethodBuilder,
+        )
+
+
+        class Point:
+            __slots__ = ("x", "y")
+
+            def __init__(self, x: int, y: int) -> None:
+                self.x = x
+                self.y = y
+
+
+        Point.__hash__ = HashMethodBuilder.build(Point, ("x", "y"))
+        assert hash(Point(1, 2)) == hash((1, 2))
+        ```
+    """
+
+    @classmethod
+    def build(
+        cls, class_: type[object], field_names: Sequence[str], cache: bool = False
+    ) -> Callable[[object], int]:
+        """Compile ``__hash__`` for *class_* over *field_names*.
+
+        Args:
+            class_: The class the method is generated for; used for its
+                ``__qualname__``.
+            field_names: Fields hashed, in order.
+            cache: Store the hash of instances armed by `HashCache` and
+                return it on later calls.
+
+        Returns:
+            The compiled ``__hash__`` function.
+
+        """
+        lines = ["def __hash__(self):"]
+        if cache:
+            lines += [
+                "    try:",
+                f"        cached = self.{HashCache.ATTRIBUTE}",
+                "    except AttributeError:",
+                "        cached = False",
+                "    if cached and cached[0] is token:",
+                "        return cached[1]",
+            ]
+        for index, name in enumerate(field_names):
+            lines.append(f"    v{index} = {cls._read('self', name)}")
+            lines.append(f"    if type(v{index}) not in plain_types:")
+            lines.append(f"        v{index} = convert(v{index}, field_name={name!r})")
+        values = "".join(f"v{index}, " for index in range(len(field_names)))
+        lines.append(f"    result = hash(({values}))")
+        if cache:
+            lines += [
+                "    if cached is not False:",
+                f"        object_setattr(self, {HashCache.ATTRIBUTE!r}, (token, result))",
+            ]
+        lines.append("    return result")
+
+        namespace: dict[str, object] = {
+            "plain_types": _PLAIN_TYPES,
+            "convert": HashableConverter.convert,
+            "token": HashCache.TOKEN,
+            "object_setattr": object.__setattr__,
+        }
+        exec("\n".join(lines), namespace)  # nosec B102 - source built from field names only
+        method = cast(FunctionType, namespace["__hash__"])
+        method.__module__ = class_.__module__
+        method.__qualname__ = f"{class_.__name__}.__hash__"
+        return method
+
+    @staticmethod
+    def _read(target: str, name: str) -> str:
+        if name.isidentifier() and not keyword.iskeyword(name):
+            return f"{target}.{name}"
+        return f"getattr({target}, {name!r})"
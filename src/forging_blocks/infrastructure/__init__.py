@@ -3,21 +3,44 @@
 Provides generic, reusable infrastructure building blocks implementing
 the outbound ports defined in the application layer. Includes in-memory
 adapters for repositories, event buses, event stores, message buses,
-caching, logging, file system, and HTTP; plus MessageCodec/DictMessageCodec, abstract
-errors.
+caching, logging, file system, and HTTP; a background queue-backed
+event bus; a bounded LRU/LFU cache; a single-flight query result cache;
+DataLoader-style lookup batching;
+durable file-backed and SQLite event stores; in-memory and SQLite
+transactional outboxes with a relay; handler-level dispatch metrics
+with an in-memory recorder; in-memory and file-backed
+snapshot stores with snapshot policies; plus MessageCodec/DictMessageCodec
+with an event upcaster registry, abstract errors.
 """
 
-from .caching.in_memory_cache import InMemoryCache
+from .batching import BatchLoader
+from .caching import (
+    BoundedCache,
+    CacheStats,
+    CachingQueryFetcher,
+    EvictionPolicy,
+    InMemoryCache,
+    QueryCacheInvalidator,
+)
 from .errors.repository_errors import RepositoryError, RepositoryNotFoundError
 from .event_buses import (
+    AsyncQueueEventBus,
+    BackpressurePolicy,
+    DispatchStrategy,
     EventBusBase,
+    EventBusEventPublisher,
     InMemoryEventBus,
     InMemoryEventBusBase,
+    QueueStats,
 )
 from .event_stores import (
     EventStoreBase,
+    FileEventStore,
     InMemoryEventStore,
     InMemoryEventStoreBase,
+    LazyEventSequence,
+    RecordedEvent,
+    SqliteEventStore,
 )
 from .file_system.os_file_system import OSFileSystem
 from .http_client.urllib_client import URLLibClient
@@ -26,37 +49,76 @@ from .message_bus.in_memory_message_bus import InMemoryMessageBus
 from .message_bus.message_bus_command_sender import MessageBusCommandSender
 from .message_bus.message_bus_event_publisher import MessageBusEventPublisher
 from .message_bus.message_bus_query_fetcher import MessageBusQueryFetcher
+from .metrics import DispatchInstrumentation, InMemoryMetrics
+from .outbox import InMemoryOutbox, OutboxRelay, SqliteOutbox
 from .repositories import (
     AggregateRepository,
+    BatchingReadRepository,
     InMemoryReadRepository,
     InMemoryRepository,
     InMemoryWriteRepository,
 )
-from .serialization import DictMessageCodec, MessageCodec
+from .serialization import DictMessageCodec, MessageCodec, UpcasterRegistry
+from .snapshots import (
+    EventCountSnapshotPolicy,
+    FileSnapshotStore,
+    InMemorySnapshotStore,
+    IntervalSnapshotPolicy,
+    ReplayCostSnapshotPolicy,
+    SnapshotPolicy,
+)
 from .unit_of_work.in_memory_unit_of_work import InMemoryUnitOfWork
 
 __all__ = [
     "AggregateRepository",
+    "AsyncQueueEventBus",
+    "BackpressurePolicy",
+    "BatchLoader",
+    "BatchingReadRepository",
+    "BoundedCache",
+    "CacheStats",
+    "CachingQueryFetcher",
+    "DispatchInstrumentation",
+    "DispatchStrategy",
     "EventBusBase",
+    "EventBusEventPublisher",
+    "EventCountSnapshotPolicy",
+    "EvictionPolicy",
     "EventStoreBase",
+    "FileEventStore",
+    "FileSnapshotStore",
     "InMemoryCache",
     "InMemoryEventBus",
     "InMemoryEventBusBase",
     "InMemoryEventStore",
     "InMemoryEventStoreBase",
     "InMemoryMessageBus",
+    "InMemoryMetrics",
+    "InMemoryOutbox",
     "InMemoryReadRepository",
+    "InMemorySnapshotStore",
     "InMemoryRepository",
     "InMemoryUnitOfWork",
     "InMemoryWriteRepository",
+    "IntervalSnapshotPolicy",
+    "LazyEventSequence",
     "MessageBusCommandSender",
     "MessageBusEventPublisher",
     "MessageBusQueryFetcher",
+    "OutboxRelay",
+    "QueryCacheInvalidator",
+    "QueueStats",
+    "RecordedEvent",
     "OSFileSystem",
     "RepositoryError",
+    "ReplayCostSnapshotPolicy",
     "RepositoryNotFoundError",
     "DictMessageCodec",
     "MessageCodec",
+    "SnapshotPolicy",
+    "SqliteEventStore",
+    "SqliteOutbox",
     "StdlibLogger",
     "URLLibClient",
+    "UpcasterRegistry",
 ]
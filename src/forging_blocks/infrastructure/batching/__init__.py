@@ -0,0 +1,5 @@
+"""Coalescing of individual lookups into bulk calls."""
+
+from .batch_loader import BatchLoader, BulkLoad
+
+__all__ = ["BatchLoader", "BulkLoad"]
@@ -0,0 +1,160 @@
+"""DataLoader-style coalescing of individual lookups into bulk calls.
+
+`BatchLoader` collects the keys requested through `load` while the
+current event-loop tick (or a configurable window) lasts, then resolves
+all of them with one call to a bulk function such as
+``ReadOnlyRepositoryPort.get_many``. Code written as "one lookup per
+item" keeps its shape while the storage sees one round trip per batch
+instead of N.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping, Sequence
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+type BulkLoad[KeyType, ValueType] = Callable[
+    [Sequence[KeyType]], Awaitable[Mapping[KeyType, ValueType]]
+]
+"""Resolves many keys at once; keys missing from the result load as ``None``."""
+
+
+class BatchLoader[KeyType: Hashable, ValueType]:
+    """Coalesces concurrent `load` calls into batched bulk calls.
+
+    The first `load` of a batch schedules its dispatch: on the next
+    loop iteration when *window* is 0, otherwise *window* seconds
+    later. Every key requested until then joins the batch, each
+    distinct key once. A batch reaching *max_batch_size* is dispatched
+    immediately and a new one starts.
+
+    Results are not remembered once a batch is resolved; put a cache in
+    front of the loader for that. If the bulk function raises, every
+    `load` of that batch raises the same exception.
+
+    Attributes:
+        _bulk_load: Resolves a batch of keys.
+        _window: Seconds to wait for more keys before dispatching.
+        _max_batch_size: Largest number of keys per bulk call, or
+            ``None``.
+        _pending: Futures of the keys in the current batch.
+        _scheduled: Handle of the scheduled dispatch of that batch.
+        _running: Bulk calls in progress, kept referenced until done.
+        _batches: Number of bulk calls made.
+
+    Example:
+        ```python
+        loader = BatchLoader(customer_repository.get_many)
+
+
+        async def customer_name(order: Order) -> str | None:
+            customer = await loader.load(order.customer_id)
+            return None if customer is None else customer.name
+
+
+        # One get_many call for all orders instead of one get_by_id each
+        names = await asyncio.gather(*(customer_name(order) for order in orders))
+        ```
+    """
+
+    __slots__ = (
+        "_batches",
+        "_bulk_load",
+        "_max_batch_size",
+        "_pending",
+        "_running",
+        "_scheduled",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        bulk_load: BulkLoad[KeyType, ValueType],
+        window: float = 0.0,
+        max_batch_size: int | None = None,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            bulk_load: Async function resolving a sequence of distinct
+                keys to a mapping of the keys it found.
+            window: Seconds to collect keys before dispatching a batch;
+                0 collects the keys requested in the current loop tick.
+            max_batch_size: Largest number of keys passed to one call of
+                *bulk_load*; ``None`` means unbounded.
+
+        Raises:
+            ConfigurationError: If *window* is negative or
+                *max_batch_size* is not positive.
+
+        """
+        if window < 0:
+            raise ConfigurationError(f"window must not be negative, got {window}")
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ConfigurationError(f"max_batch_size must be positive, got {max_batch_size}")
+        self._bulk_load = bulk_load
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: dict[KeyType, asyncio.Future[ValueType | None]] = {}
+        self._scheduled: asyncio.Handle | None = None
+        self._running: set[asyncio.Task[None]] = set()
+        self._batches = 0
+
+    @property
+    def batches(self) -> int:
+        """Return the number of bulk calls made so far."""
+        return self._batches
+
+    async def load(self, key: KeyType) -> ValueType | None:
+        """Return the value of *key*, resolved together with its batch.
+
+        Returns:
+            The value found by the bulk function, or ``None``.
+
+        Raises:
+            Exception: Whatever the bulk function raised for the batch.
+
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if self._max_batch_size is not None and len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._scheduled is None:
+                if self._window:
+                    self._scheduled = loop.call_later(self._window, self._dispatch)
+                else:
+                    self._scheduled = loop.call_soon(self._dispatch)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[KeyType]) -> list[ValueType | None]:
+        """Return the values of *keys*, in order, resolved in as few batches as possible."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        self._batches += 1
+        task = asyncio.get_running_loop().create_task(self._resolve(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _resolve(self, batch: dict[KeyType, asyncio.Future[ValueType | None]]) -> None:
+        try:
+            found = await self._bulk_load(list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    # Mark the exception as retrieved in case the caller was cancelled.
+                    future.exception()
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(key))
@@ -1,5 +1,14 @@
 """Caching infrastructure implementations."""
 
+from .bounded_cache import BoundedCache, CacheStats, EvictionPolicy
+from .caching_query_fetcher import CachingQueryFetcher, QueryCacheInvalidator
 from .in_memory_cache import InMemoryCache
 
-__all__ = ["InMemoryCache"]
+__all__ = [
+    "BoundedCache",
+    "CacheStats",
+    "CachingQueryFetcher",
+    "EvictionPolicy",
+    "InMemoryCache",
+    "QueryCacheInvalidator",
+]
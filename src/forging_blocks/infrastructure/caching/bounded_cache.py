@@ -0,0 +1,324 @@
+"""Size-bounded in-process mapping with LRU or LFU eviction and optional TTL.
+
+``BoundedCache`` is a ``MutableMapping`` meant to back identity maps such
+as the storage of `AggregateRepository`. Lookups through `get`
+count as cache hits or misses and refresh an entry's recency (LRU) or
+frequency (LFU); plain indexing and iteration only peek. When a new key
+would exceed ``max_entries`` the least recently or least frequently used
+entry is evicted. Entries older than ``ttl`` seconds are dropped lazily
+on access.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from enum import StrEnum
+from typing import cast, overload
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+
+class EvictionPolicy(StrEnum):
+    """Which entry a full `BoundedCache` evicts."""
+
+    LRU = "lru"
+    """Least recently used."""
+
+    LFU = "lfu"
+    """Least frequently used; ties are broken by recency."""
+
+
+class CacheStats:
+    """Counters describing how well a `BoundedCache` is sized.
+
+    Attributes:
+        hits: Lookups that found a live entry.
+        misses: Lookups that found nothing or an expired entry.
+        evictions: Entries removed to make room for new ones.
+        expirations: Entries removed because their TTL elapsed.
+
+    Example:
+        ```python
+        stats = cache.stats
+        print(f"hit ratio {stats.hit_ratio:.1%}, {stats.evictions} evictions")
+        ```
+    """
+
+    __slots__ = ("evictions", "expirations", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the fraction of lookups that were hits (0.0 if none)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, expirations={self.expirations})"
+        )
+
+
+class _LruOrder[KeyType]:
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: OrderedDict[KeyType, None] = OrderedDict()
+
+    def add(self, key: KeyType) -> None:
+        self._keys[key] = None
+
+    def touch(self, key: KeyType) -> None:
+        self._keys.move_to_end(key)
+
+    def remove(self, key: KeyType) -> None:
+        del self._keys[key]
+
+    def victim(self) -> KeyType:
+        return next(iter(self._keys))
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+class _LfuOrder[KeyType]:
+    """Constant-time LFU bookkeeping with one recency-ordered bucket per count."""
+
+    __slots__ = ("_buckets", "_counts", "_min_count")
+
+    def __init__(self) -> None:
+        self._counts: dict[KeyType, int] = {}
+        self._buckets: dict[int, OrderedDict[KeyType, None]] = {}
+        self._min_count = 0
+
+    def add(self, key: KeyType) -> None:
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def touch(self, key: KeyType) -> None:
+        count = self._counts[key]
+        self._unlink(key, count)
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+        if self._min_count == count and count not in self._buckets:
+            self._min_count = count + 1
+
+    def remove(self, key: KeyType) -> None:
+        count = self._counts.pop(key)
+        self._unlink(key, count)
+        if self._min_count == count and count not in self._buckets:
+            self._min_count = min(self._buckets, default=0)
+
+    def victim(self) -> KeyType:
+        return next(iter(self._buckets[self._min_count]))
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def _unlink(self, key: KeyType, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+
+class BoundedCache[KeyType, ValueType](MutableMapping[KeyType, ValueType]):
+    """Mapping holding at most ``max_entries`` items.
+
+    Only `get` is treated as a cache lookup: it updates `stats` and
+    the eviction order. ``cache[key]``, ``in`` and iteration never do, so
+    scanning the cache (``values()``, ``items()``) does not disturb it.
+    Expired entries are skipped by every read and removed when found;
+    ``len`` removes every expired entry first, so it agrees with
+    iteration.
+
+    Attributes:
+        _max_entries: Capacity of the cache.
+        _ttl: Entry lifetime in seconds, or ``None`` for no expiry.
+        _values: Cached values.
+        _expires_at: Monotonic expiry deadline per key when a TTL is set.
+        _order: LRU or LFU bookkeeping deciding the next victim.
+        _listeners: Callbacks notified of evicted and expired keys.
+        _stats: Hit, miss, eviction and expiration counters.
+
+    Example:
+        ```python
+        cache = BoundedCache[UUID, Order](max_entries=10_000, policy=EvictionPolicy.LFU, ttl=600)
+        repository = AggregateRepository[OrderEvent, Order, UUID](
+            event_store=store, aggregate_type=Order, cache=cache
+        )
+        ...
+        print(cache.stats)
+        ```
+    """
+
+    __slots__ = (
+        "_expires_at",
+        "_listeners",
+        "_max_entries",
+        "_order",
+        "_stats",
+        "_ttl",
+        "_values",
+    )
+
+    def __init__(
+        self,
+        max_entries: int,
+        policy: EvictionPolicy = EvictionPolicy.LRU,
+        ttl: float | None = None,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept.
+            policy: Eviction policy used once the cache is full.
+            ttl: Optional lifetime of each entry in seconds, counted from
+                the moment it was stored.
+
+        Raises:
+            ConfigurationError: If *max_entries* or *ttl* is not positive.
+
+        """
+        if max_entries <= 0:
+            raise ConfigurationError(f"max_entries must be positive, got {max_entries}")
+        if ttl is not None and ttl <= 0:
+            raise ConfigurationError(f"ttl must be positive, got {ttl}")
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._values: dict[KeyType, ValueType] = {}
+        self._expires_at: dict[KeyType, float] = {}
+        self._order: _LruOrder[KeyType] | _LfuOrder[KeyType] = (
+            _LfuOrder() if policy is EvictionPolicy.LFU else _LruOrder()
+        )
+        self._listeners: list[Callable[[KeyType], None]] = []
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the live hit, miss, eviction and expiration counters."""
+        return self._stats
+
+    @property
+    def max_entries(self) -> int:
+        """Return the capacity of the cache."""
+        return self._max_entries
+
+    def add_removal_listener(self, listener: Callable[[KeyType], None]) -> None:
+        """Call *listener* with every key that is evicted or expires.
+
+        Owners use this to drop bookkeeping kept alongside cached entries.
+        """
+        self._listeners.append(listener)
+
+    @overload
+    def get(self, key: KeyType, /) -> ValueType | None: ...
+
+    @overload
+    def get[DefaultType](
+        self, key: KeyType, /, default: ValueType | DefaultType
+    ) -> ValueType | DefaultType: ...
+
+    def get[DefaultType](
+        self, key: KeyType, /, default: ValueType | DefaultType | None = None
+    ) -> ValueType | DefaultType | None:
+        """Look *key* up, recording a hit or miss and refreshing its rank.
+
+        Args:
+            key: Key to look up.
+            default: Value returned on a miss.
+
+        Returns:
+            The cached value, or *default* if absent or expired.
+
+        """
+        if key not in self._values or self._expire_if_due(key):
+            self._stats.misses += 1
+            return default
+        self._stats.hits += 1
+        self._order.touch(key)
+        return self._values[key]
+
+    def __getitem__(self, key: KeyType) -> ValueType:
+        if self._is_expired(key):
+            raise KeyError(key)
+        return self._values[key]
+
+    def __setitem__(self, key: KeyType, value: ValueType) -> None:
+        if key in self._values:
+            self._order.touch(key)
+        else:
+            if len(self._values) >= self._max_entries:
+                self._evict()
+            self._order.add(key)
+        self._values[key] = value
+        if self._ttl is not None:
+            self._expires_at[key] = time.monotonic() + self._ttl
+
+    def __delitem__(self, key: KeyType) -> None:
+        del self._values[key]
+        self._expires_at.pop(key, None)
+        self._order.remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values and not self._is_expired(cast(KeyType, key))
+
+    def __iter__(self) -> Iterator[KeyType]:
+        return iter([key for key in self._values if not self._is_expired(key)])
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Remove every entry without counting evictions."""
+        self._values.clear()
+        self._expires_at.clear()
+        self._order.clear()
+
+    def __repr__(self) -> str:
+        return f"BoundedCache(len={len(self._values)}, max_entries={self._max_entries})"
+
+    def _is_expired(self, key: KeyType) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and time.monotonic() >= expires_at
+
+    def _expire_if_due(self, key: KeyType) -> bool:
+        if not self._is_expired(key):
+            return False
+        del self[key]
+        self._stats.expirations += 1
+        self._notify(key)
+        return True
+
+    def _purge_expired(self) -> None:
+        if not self._expires_at:
+            return
+        now = time.monotonic()
+        for key in [key for key, expires_at in self._expires_at.items() if now >= expires_at]:
+            del self[key]
+            self._stats.expirations += 1
+            self._notify(key)
+
+    def _evict(self) -> None:
+        victim = self._order.victim()
+        del self[victim]
+        self._stats.evictions += 1
+        self._notify(victim)
+
+    def _notify(self, key: KeyType) -> None:
+        for listener in self._listeners:
+            listener(key)
@@ -0,0 +1,204 @@
+"""Caching decorator for ``QueryFetcherPort``.
+
+`CachingQueryFetcher` wraps another fetcher. Results are stored in any
+``CachePort`` under a key derived from the query type and payload, and
+concurrent identical queries share a single call to the wrapped
+fetcher (single-flight). `QueryCacheInvalidator` is an event handler
+that drops cached results when the events that change them are
+published.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable, Iterable
+from functools import partial
+
+from forging_blocks.application.ports.inbound.message_handler_port import EventHandlerPort
+from forging_blocks.application.ports.outbound.cache_port import CachePort
+from forging_blocks.application.ports.outbound.query_fetcher_port import QueryFetcherPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.query import Query
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+
+def _default_key(query: Query[object]) -> str:
+    """Return ``"<module>.<QueryType>:<payload as canonical JSON>"``.
+
+    Raises:
+        ConfigurationError: If the payload is not JSON-serializable. An
+            object's ``repr`` is not a usable key: it embeds a memory
+            address, so equal queries would miss and, once the address
+            is reused, different queries would share a result.
+
+    """
+    query_type = type(query)
+    name = f"{query_type.__module__}.{query_type.__qualname__}"
+    try:
+        payload = json.dumps(query.value, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError) as exc:
+        raise ConfigurationError(
+            f"Cannot derive a cache key for {name}: its payload is not JSON-serializable "
+            f"({exc}). Pass key= to CachingQueryFetcher."
+        ) from exc
+    return f"{name}:{payload}"
+
+
+class CachingQueryFetcher[QueryPayloadType, QueryFetcherResult](
+    QueryFetcherPort[QueryPayloadType, QueryFetcherResult]
+):
+    """Query fetcher serving repeated queries from a cache.
+
+    A miss calls the wrapped fetcher once, however many identical
+    queries are waiting for it; they all receive its result or its
+    exception. The call runs in a task owned by the fetcher, so a
+    cancelled caller only stops its own wait: the other callers still
+    get the result, which is cached even if every caller gave up.
+    Results are stored with *ttl*. A ``None`` result is
+    indistinguishable from a miss in ``CachePort`` and is fetched again
+    next time.
+
+    `invalidate` drops a cached result. A fetch still running for an
+    invalidated query does not write its (possibly stale) result back
+    to the cache, and later identical queries start a new fetch.
+
+    Attributes:
+        _inner: Fetcher answering cache misses.
+        _cache: Storage for results, keyed by string.
+        _ttl: Time-to-live of stored results in seconds, or ``None``.
+        _key: Derives the cache key of a query.
+        _in_flight: Tasks of the fetches identical queries may join, by
+            key.
+        _running: Every fetch task not finished yet, including
+            invalidated ones, so none is garbage collected mid-flight.
+
+    Example:
+        ```python
+        fetcher = CachingQueryFetcher(
+            MessageBusQueryFetcher(bus), InMemoryCache[str, object](), ttl=30
+        )
+        summary = await fetcher.fetch(GetOrderSummary(order_id="42"))
+
+        # Drop the summary whenever the order changes
+        invalidator = QueryCacheInvalidator(
+            fetcher, lambda event: [GetOrderSummary(order_id=event.value["order_id"])]
+        )
+        event_bus.register_handler(OrderShipped, invalidator)
+        ```
+    """
+
+    __slots__ = ("_cache", "_in_flight", "_inner", "_key", "_running", "_ttl")
+
+    def __init__(
+        self,
+        inner: QueryFetcherPort[QueryPayloadType, QueryFetcherResult],
+        cache: CachePort[str, QueryFetcherResult],
+        ttl: float | None = None,
+        key: Callable[[Query[QueryPayloadType]], str] = _default_key,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            inner: Fetcher answering cache misses.
+            cache: Cache storing results.
+            ttl: Time-to-live of stored results in seconds; ``None``
+                keeps them until evicted or invalidated.
+            key: Function deriving the cache key of a query. The
+                default combines the query's class with its payload
+                serialized as canonical JSON; queries whose payload is
+                not JSON-serializable need a custom *key*.
+
+        """
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+        self._key = key
+        self._in_flight: dict[str, asyncio.Task[QueryFetcherResult]] = {}
+        self._running: set[asyncio.Task[QueryFetcherResult]] = set()
+
+    async def fetch(self, query: Query[QueryPayloadType]) -> QueryFetcherResult:
+        """Return the cached result of *query*, fetching it on a miss.
+
+        Raises:
+            ConfigurationError: If the default key cannot encode the
+                query's payload.
+            Exception: Whatever the wrapped fetcher raises; nothing is
+                cached in that case.
+
+        """
+        key = self._key(query)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        running = self._in_flight.get(key)
+        if running is None:
+            running = asyncio.get_running_loop().create_task(self._load(key, query))
+            self._in_flight[key] = running
+            self._running.add(running)
+            running.add_done_callback(partial(self._settle, key))
+        return await asyncio.shield(running)
+
+    async def _load(self, key: str, query: Query[QueryPayloadType]) -> QueryFetcherResult:
+        result = await self._cache.get(key)
+        if result is None:
+            result = await self._inner.fetch(query)
+            if self._in_flight.get(key) is asyncio.current_task():
+                await self._cache.set(key, result, self._ttl)
+        return result
+
+    def _settle(self, key: str, task: asyncio.Task[QueryFetcherResult]) -> None:
+        self._running.discard(task)
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller gave up.
+            task.exception()
+
+    async def invalidate(self, query: Query[QueryPayloadType]) -> None:
+        """Drop the cached result of *query*, if any."""
+        key = self._key(query)
+        self._in_flight.pop(key, None)
+        await self._cache.delete(key)
+
+
+class QueryCacheInvalidator[EventPayloadType, QueryPayloadType](EventHandlerPort[EventPayloadType]):
+    """Event handler invalidating the cached queries affected by an event.
+
+    Register it on an event bus for every event type that changes the
+    results of cached queries.
+
+    Attributes:
+        _fetcher: Caching fetcher to invalidate.
+        _affected: Maps an event to the queries whose results it
+            changes.
+
+    Example:
+        ```python
+        invalidator = QueryCacheInvalidator(
+            fetcher, lambda event: [GetOrderSummary(order_id=event.value["order_id"])]
+        )
+        event_bus.register_handler(OrderShipped, invalidator)
+        ```
+    """
+
+    __slots__ = ("_affected", "_fetcher")
+
+    def __init__(
+        self,
+        fetcher: CachingQueryFetcher[QueryPayloadType, object],
+        affected: Callable[[Event[EventPayloadType]], Iterable[Query[QueryPayloadType]]],
+    ) -> None:
+        """Initialize the invalidator.
+
+        Args:
+            fetcher: Caching fetcher whose entries are dropped.
+            affected: Returns the queries invalidated by an event.
+
+        """
+        self._fetcher = fetcher
+        self._affected = affected
+
+    async def handle(self, message: Event[EventPayloadType]) -> None:
+        """Invalidate every query affected by *message*."""
+        for query in self._affected(message):
+            await self._fetcher.invalidate(query)
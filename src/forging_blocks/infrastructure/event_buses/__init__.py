@@ -1,11 +1,19 @@
 """In-memory event bus implementations and base class."""
 
+from .async_queue_event_bus import AsyncQueueEventBus, BackpressurePolicy, QueueStats
+from .dispatch_strategy import DispatchStrategy
 from .event_bus_base import EventBusBase
+from .event_bus_event_publisher import EventBusEventPublisher
 from .in_memory_event_bus import InMemoryEventBus
 from .in_memory_event_bus_base import InMemoryEventBusBase
 
 __all__ = [
+    "AsyncQueueEventBus",
+    "BackpressurePolicy",
+    "DispatchStrategy",
     "EventBusBase",
+    "EventBusEventPublisher",
     "InMemoryEventBus",
     "InMemoryEventBusBase",
+    "QueueStats",
 ]
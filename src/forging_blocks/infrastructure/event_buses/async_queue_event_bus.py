@@ -0,0 +1,366 @@
+"""Event bus that publishes in the background through a bounded queue.
+
+`AsyncQueueEventBus` wraps another `EventBusPort`. ``publish`` only puts
+the event on a bounded ``asyncio.Queue`` and returns; worker tasks take
+events off the queue and publish them on the wrapped bus. The caller's
+latency no longer depends on how slow the handlers are, at the price of
+handlers running after ``publish`` has returned.
+
+When the queue is full the `BackpressurePolicy` decides whether
+publishers wait, the oldest queued event is dropped, or the new event
+is rejected. Commands are not queued: ``send`` calls the wrapped bus
+directly. Closing the bus rejects publishers still waiting for room.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from enum import StrEnum
+from typing import Self
+
+from forging_blocks.application.errors.event_bus_error import EventBusError
+from forging_blocks.application.ports.outbound.event_bus_port import EventBusPort
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.foundation.result import Err, Ok, Result
+
+_DEFAULT_MAX_QUEUE_SIZE = 1_000
+
+
+class BackpressurePolicy(StrEnum):
+    """What a full `AsyncQueueEventBus` does with a new event."""
+
+    BLOCK = "block"
+    """Wait until a worker frees a slot."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued event to make room."""
+
+    REJECT = "reject"
+    """Refuse the new event with an ``EventBusError``."""
+
+
+class QueueStats:
+    """Counters describing the load on an `AsyncQueueEventBus`.
+
+    Lag is the time an event spent in the queue before a worker picked
+    it up.
+
+    Attributes:
+        enqueued: Publications accepted into the queue.
+        processed: Publications handed to the wrapped bus successfully.
+        failed: Publications the wrapped bus reported an error for.
+        dropped: Queued publications discarded by ``DROP_OLDEST`` or by
+            ``close(drain=False)``.
+        rejected: Publications refused by ``REJECT`` or by shutdown.
+        last_lag: Lag of the most recently dequeued publication, in
+            seconds.
+        max_lag: Highest lag observed, in seconds.
+
+    Example:
+        ```python
+        stats = bus.stats
+        print(f"depth {bus.depth}, lag {stats.last_lag * 1000:.1f} ms, {stats.dropped} dropped")
+        ```
+    """
+
+    __slots__ = ("dropped", "enqueued", "failed", "last_lag", "max_lag", "processed", "rejected")
+
+    def __init__(self) -> None:
+        self.enqueued = 0
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def record_lag(self, lag: float) -> None:
+        """Record the queueing delay of one dequeued publication."""
+        self.last_lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+    def __repr__(self) -> str:
+        return (
+            f"QueueStats(enqueued={self.enqueued}, processed={self.processed}, "
+            f"failed={self.failed}, dropped={self.dropped}, rejected={self.rejected}, "
+            f"max_lag={self.max_lag:.6f})"
+        )
+
+
+type _Publication[EventPayloadType] = tuple[Sequence[Event[EventPayloadType]], float]
+
+
+class AsyncQueueEventBus[EventPayloadType, CommandPayloadType, HandlerType](
+    EventBusPort[EventPayloadType, CommandPayloadType, HandlerType]
+):
+    """Event bus decoupling publishers from handlers with a bounded queue.
+
+    Workers are started on the first publication (or by `start`) and
+    run until `close`, which by default waits for the queue to drain.
+    Use the bus as an async context manager to tie it to a scope.
+
+    ``publish`` returns ``Ok`` once the event is queued; failures of
+    the wrapped bus are counted in `stats` and passed to *on_error*. An
+    exception raised by *on_error* goes to the event loop's exception
+    handler and does not stop the worker.
+    ``publish_many`` queues its events as one item, so the wrapped bus
+    receives them through its own ``publish_many``.
+
+    Attributes:
+        _inner: Bus that publishes dequeued events and handles commands.
+        _queue: Pending publications with their enqueue time; created
+            on start.
+        _max_size: Queue capacity in publications.
+        _worker_count: Number of worker tasks.
+        _workers: Running worker tasks.
+        _blocked: ``put`` calls of publishers waiting for room under
+            ``BLOCK``; cancelled by `close`.
+        _backpressure: Behaviour when the queue is full.
+        _on_error: Optional callback receiving wrapped-bus errors.
+        _closed: Whether `close` has been called.
+        _stats: Load counters.
+
+    Example:
+        ```python
+        projections = InMemoryEventBus[dict[str, object], object, object]()
+        projections.register_handler(OrderPlaced, OrderSummaryProjection())
+
+        async with AsyncQueueEventBus(
+            projections, workers=4, backpressure=BackpressurePolicy.DROP_OLDEST
+        ) as bus:
+            await bus.publish(OrderPlaced(order_id="42"))  # returns immediately
+            print(bus.depth, bus.stats)
+        # leaving the block waits until every queued event is handled
+        ```
+    """
+
+    __slots__ = (
+        "_backpressure",
+        "_blocked",
+        "_closed",
+        "_inner",
+        "_max_size",
+        "_on_error",
+        "_queue",
+        "_stats",
+        "_worker_count",
+        "_workers",
+    )
+
+    def __init__(
+        self,
+        inner: EventBusPort[EventPayloadType, CommandPayloadType, HandlerType],
+        workers: int = 1,
+        max_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+        backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        on_error: Callable[[EventBusError], None] | None = None,
+    ) -> None:
+        """Initialize the bus without starting any worker.
+
+        Args:
+            inner: Bus that receives the dequeued events and all
+                commands and handler registrations.
+            workers: Number of worker tasks publishing concurrently.
+            max_size: Maximum number of queued publications.
+            backpressure: What to do when the queue is full.
+            on_error: Called with the error of every publication the
+                wrapped bus rejects.
+
+        Raises:
+            ConfigurationError: If *workers* or *max_size* is not
+                positive.
+
+        """
+        if workers <= 0:
+            raise ConfigurationError(f"workers must be positive, got {workers}")
+        if max_size <= 0:
+            raise ConfigurationError(f"max_size must be positive, got {max_size}")
+        self._inner = inner
+        self._worker_count = workers
+        self._max_size = max_size
+        self._backpressure = backpressure
+        self._on_error = on_error
+        self._queue: asyncio.Queue[_Publication[EventPayloadType]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._blocked: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self._stats = QueueStats()
+
+    @property
+    def stats(self) -> QueueStats:
+        """Return the load counters."""
+        return self._stats
+
+    @property
+    def depth(self) -> int:
+        """Return the number of publications waiting in the queue."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    async def __aenter__(self) -> Self:
+        """Start the workers."""
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Drain the queue and stop the workers."""
+        await self.close()
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop, if not already started.
+
+        Raises:
+            EventBusError: If the bus has been closed.
+
+        """
+        if self._closed:
+            raise EventBusError("AsyncQueueEventBus is closed")
+        self._started_queue()
+
+    async def close(self, drain: bool = True) -> None:
+        """Stop accepting events and shut the workers down.
+
+        Publishers still waiting for room under ``BLOCK`` are released
+        with an ``EventBusError``.
+
+        Args:
+            drain: When ``True`` wait until every queued publication has
+                been handled; otherwise discard what is still queued.
+
+        """
+        self._closed = True
+        for put in self._blocked:
+            put.cancel()
+        if self._queue is None:
+            return
+        if drain:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._stats.dropped += 1
+
+    def register_handler(
+        self,
+        message_type: type[Event[EventPayloadType]] | type[Command[CommandPayloadType]],
+        handler: HandlerType,
+    ) -> None:
+        """Register a handler on the wrapped bus."""
+        self._inner.register_handler(message_type, handler)
+
+    async def publish(self, event: Event[EventPayloadType]) -> Result[None, EventBusError]:
+        """Queue *event* for publication on the wrapped bus.
+
+        Returns:
+            ``Ok(None)`` once the event is queued, or ``Err(EventBusError)``
+            if the queue is full under ``REJECT`` or the bus is closed.
+
+        """
+        return await self._enqueue((event,))
+
+    async def publish_many(
+        self, events: Sequence[Event[EventPayloadType]]
+    ) -> Result[None, EventBusError]:
+        """Queue *events* as one publication for the wrapped bus's ``publish_many``.
+
+        Returns:
+            ``Ok(None)`` once the events are queued, or
+            ``Err(EventBusError)`` if the queue is full under ``REJECT``
+            or the bus is closed.
+
+        """
+        if not events:
+            return Ok(None)
+        return await self._enqueue(tuple(events))
+
+    async def send(self, command: Command[CommandPayloadType]) -> Result[None, EventBusError]:
+        """Send *command* through the wrapped bus without queueing it."""
+        return await self._inner.send(command)
+
+    def _started_queue(self) -> asyncio.Queue[_Publication[EventPayloadType]]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self._max_size)
+            self._workers = [
+                asyncio.create_task(self._work(self._queue), name=f"async-queue-event-bus-{index}")
+                for index in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def _enqueue(
+        self, events: Sequence[Event[EventPayloadType]]
+    ) -> Result[None, EventBusError]:
+        if self._closed:
+            self._stats.rejected += 1
+            return Err(EventBusError("AsyncQueueEventBus is closed"))
+        queue = self._started_queue()
+        item = (events, time.monotonic())
+        if queue.full():
+            if self._backpressure is BackpressurePolicy.REJECT:
+                self._stats.rejected += 1
+                return Err(EventBusError(f"Event queue is full ({self._max_size} publications)"))
+            if self._backpressure is BackpressurePolicy.DROP_OLDEST:
+                queue.get_nowait()
+                queue.task_done()
+                self._stats.dropped += 1
+            else:
+                return await self._wait_for_room(queue, item)
+        queue.put_nowait(item)
+        self._stats.enqueued += 1
+        return Ok(None)
+
+    async def _wait_for_room(
+        self,
+        queue: asyncio.Queue[_Publication[EventPayloadType]],
+        item: _Publication[EventPayloadType],
+    ) -> Result[None, EventBusError]:
+        put = asyncio.ensure_future(queue.put(item))
+        self._blocked.add(put)
+        try:
+            await put
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if not put.cancelled() or (current is not None and current.cancelling()):
+                raise
+            self._stats.rejected += 1
+            return Err(EventBusError("AsyncQueueEventBus is closed"))
+        finally:
+            self._blocked.discard(put)
+        self._stats.enqueued += 1
+        return Ok(None)
+
+    async def _work(self, queue: asyncio.Queue[_Publication[EventPayloadType]]) -> None:
+        while True:
+            events, enqueued_at = await queue.get()
+            self._stats.record_lag(time.monotonic() - enqueued_at)
+            try:
+                try:
+                    if len(events) == 1:
+                        result = await self._inner.publish(events[0])
+                    else:
+                        result = await self._inner.publish_many(events)
+                except Exception as exc:
+                    result = Err(EventBusError(str(exc), (exc,)))
+                if result.is_ok:
+                    self._stats.processed += 1
+                else:
+                    self._stats.failed += 1
+                    if self._on_error is not None:
+                        _report(self._on_error, result.error)
+            finally:
+                # Only now may `join` return: stats and on_error are settled.
+                queue.task_done()
+
+
+def _report(on_error: Callable[[EventBusError], None], error: EventBusError) -> None:
+    try:
+        on_error(error)
+    except Exception as exc:
+        asyncio.get_running_loop().call_exception_handler(
+            {"message": "AsyncQueueEventBus on_error callback failed", "exception": exc}
+        )
@@ -0,0 +1,20 @@
+"""How an event bus runs the handlers of one published event."""
+
+from enum import StrEnum
+
+
+class DispatchStrategy(StrEnum):
+    """How `InMemoryEventBus` runs the handlers registered for an event.
+
+    Whatever the strategy, every handler runs and all failures are
+    reported together in one ``EventBusError``.
+    """
+
+    SEQUENTIAL = "sequential"
+    """Await the handlers one after another, in registration order."""
+
+    CONCURRENT = "concurrent"
+    """Run all handlers at once in an ``asyncio.TaskGroup``."""
+
+    BOUNDED = "bounded"
+    """Run handlers concurrently, at most ``max_concurrency`` at a time."""
@@ -0,0 +1,53 @@
+"""Event-bus-backed EventPublisherPort adapter.
+
+Delegates event publishing to an injected ``EventBusPort``.
+"""
+
+from collections.abc import Sequence
+
+from forging_blocks.application.ports.outbound.event_bus_port import EventBusPort
+from forging_blocks.application.ports.outbound.event_publisher_port import EventPublisherPort
+from forging_blocks.domain.messages.event import Event
+
+
+class EventBusEventPublisher[EventPayloadType](EventPublisherPort[EventPayloadType]):
+    """Infrastructure adapter that publishes events via an ``EventBusPort``.
+
+    Implements ``EventPublisherPort`` by delegating ``publish`` and
+    ``publish_many`` to the bus and raising the ``EventBusError`` of a
+    failed ``Result``. Combined with `AsyncQueueEventBus` it lets
+    `InMemoryUnitOfWork` hand events to a background queue on commit.
+
+    Example:
+        ```python
+        bus = AsyncQueueEventBus(InMemoryEventBus[dict[str, object], object, object]())
+        uow = InMemoryUnitOfWork(EventBusEventPublisher[dict[str, object]](bus))
+        ```
+    """
+
+    __slots__ = ("_event_bus",)
+
+    def __init__(self, event_bus: EventBusPort[EventPayloadType, object, object]) -> None:
+        self._event_bus = event_bus
+
+    async def publish(self, event: Event[EventPayloadType]) -> None:
+        """Publish a domain event via the event bus.
+
+        Raises:
+            EventBusError: If the bus reports a failure.
+
+        """
+        result = await self._event_bus.publish(event)
+        if not result.is_ok:
+            raise result.error
+
+    async def publish_many(self, events: Sequence[Event[EventPayloadType]]) -> None:
+        """Publish several domain events via the event bus.
+
+        Raises:
+            EventBusError: If the bus reports a failure.
+
+        """
+        result = await self._event_bus.publish_many(events)
+        if not result.is_ok:
+            raise result.error
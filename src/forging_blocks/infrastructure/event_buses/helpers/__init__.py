@@ -0,0 +1,12 @@
+"""Internal helpers for the event bus implementations.
+
+These are implementation details and not part of the public API.
+"""
+
+from forging_blocks.infrastructure.event_buses.helpers.event_handler_table import (
+    EventHandlerTable,
+)
+
+__all__ = [
+    "EventHandlerTable",
+]
@@ -0,0 +1,49 @@
+"""Event handler registrations with an inheritance-aware dispatch cache.
+
+A handler registered for an event class also receives instances of its
+subclasses. The handlers of a concrete event type are gathered from its
+``__mro__`` the first time that type is published and cached, so later
+lookups are a single dictionary access.
+"""
+
+
+class EventHandlerTable[EventType, HandlerType]:
+    """Handlers per event class, resolved polymorphically per concrete type.
+
+    Resolved handlers are ordered by the ``__mro__`` of the published
+    type, most specific class first, and by registration order within a
+    class. Registering a handler clears the resolved table.
+
+    Attributes:
+        _handlers: Handlers registered directly for each event class.
+        _resolved: Handlers for each concrete event type published so
+            far, including those registered for its base classes.
+
+    Example:
+        ```python
+        table = EventHandlerTable[Event[object], Handler]()
+        table.add(Event, audit_handler)
+        table.add(OrderPlaced, projection)
+        table.resolve(OrderPlaced)  # (projection, audit_handler)
+        ```
+    """
+
+    __slots__ = ("_handlers", "_resolved")
+
+    def __init__(self) -> None:
+        self._handlers: dict[type[EventType], list[HandlerType]] = {}
+        self._resolved: dict[type[EventType], tuple[HandlerType, ...]] = {}
+
+    def add(self, event_type: type[EventType], handler: HandlerType) -> None:
+        """Register *handler* for *event_type* and its subclasses."""
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def resolve(self, event_type: type[EventType]) -> tuple[HandlerType, ...]:
+        """Return every handler that receives events of exactly *event_type*."""
+        resolved = self._resolved.get(event_type)
+        if resolved is None:
+            resolved = self._resolved[event_type] = tuple(
+                handler for klass in event_type.__mro__ for handler in self._handlers.get(klass, ())
+            )
+        return resolved
@@ -1,17 +1,39 @@
 """In-memory implementation of the EventBusPort port.
 
 Dispatches events to multiple registered handlers (fan-out) and
-commands to a single registered handler.  Handlers are looked up
-by the exact type of the message.
+commands to a single registered handler.  Command handlers are looked
+up by the exact type of the command; an event handler also receives
+instances of subclasses of the event type it was registered for.
+
+The handlers of one event run sequentially, concurrently, or
+concurrently with a bound, as chosen by `DispatchStrategy`. Every
+handler runs even if another one fails; the failures are combined into
+one ``EventBusError``.
+
+``publish_many`` groups events by type; a handler that defines
+``handle_batch`` receives each group in one call. With a
+`DispatchInstrumentation`, dispatch counts and handler latencies,
+errors and in-flight calls are recorded as metrics.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
 from typing import Protocol, cast
 
 from forging_blocks.application.errors.event_bus_error import EventBusError
 from forging_blocks.application.ports.outbound.event_bus_port import EventBusPort
 from forging_blocks.domain.messages.command import Command
 from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
 from forging_blocks.foundation.result import Err, Ok, Result
+from forging_blocks.infrastructure.event_buses.dispatch_strategy import DispatchStrategy
+from forging_blocks.infrastructure.event_buses.helpers.event_handler_table import (
+    EventHandlerTable,
+)
+from forging_blocks.infrastructure.metrics.dispatch_instrumentation import (
+    DispatchInstrumentation,
+)
 
 
 class _Handler[T](Protocol):
@@ -33,14 +55,69 @@ class _Handler[T](Protocol):
     async def handle(self, message: T) -> None: ...
 
 
+class _BatchHandler[T](Protocol):
+    """Handler that also accepts all events of one type at once.
+
+    Example:
+        ```python
+        class OrderProjection:
+            async def handle(self, message: OrderPlaced) -> None:
+                await self.handle_batch([message])
+
+            async def handle_batch(self, messages: Sequence[OrderPlaced]) -> None:
+                await table.insert_many(row_for(message) for message in messages)
+        ```
+
+    """
+
+    async def handle_batch(self, messages: Sequence[T]) -> None: ...
+
+
+type _Call = Callable[[], Awaitable[None]]
+"""A handler call, made only once it is attempted so synchronous raises are caught."""
+
+
+async def _handle_each[T](handler: _Handler[T], messages: Sequence[T]) -> None:
+    for message in messages:
+        await handler.handle(message)
+
+
+async def _invoke(call: _Call) -> None:
+    await call()
+
+
+async def _observe(
+    instrumentation: DispatchInstrumentation, message_type: type, handler: object, call: _Call
+) -> None:
+    await instrumentation.observe(message_type, handler, _invoke(call))
+
+
+async def _attempt(call: _Call) -> Exception | None:
+    try:
+        await call()
+    except Exception as exc:
+        return exc
+    return None
+
+
+async def _attempt_bounded(semaphore: asyncio.Semaphore, call: _Call) -> Exception | None:
+    async with semaphore:
+        return await _attempt(call)
+
+
 class InMemoryEventBus[EventPayloadType, CommandPayloadType, HandlerType](
     EventBusPort[EventPayloadType, CommandPayloadType, HandlerType]
 ):
     """In-memory event bus with separate event/command dispatch.
 
     Attributes:
-        _event_handlers: Per-event-type list of handlers.
+        _event_handlers: Handlers per event type, resolved through the
+            event's ``__mro__`` once per concrete type.
         _command_handlers: Per-command-type single handler.
+        _dispatch: How the handlers of one event are run.
+        _max_concurrency: Handler limit per event for
+            ``DispatchStrategy.BOUNDED``.
+        _instrumentation: Records metrics of every dispatch, if set.
 
     Example:
         ```python
@@ -62,15 +139,56 @@ class InMemoryEventBus[EventPayloadType, CommandPayloadType, HandlerType](
         bus = InMemoryEventBus[dict[str, object], object, object]()
         bus.register_handler(OrderCompleted, OrderCompletedHandler())
         await bus.publish(OrderCompleted(order_id="abc-123"))
+
+        projections = InMemoryEventBus[dict[str, object], object, object](
+            dispatch=DispatchStrategy.BOUNDED, max_concurrency=8
+        )
         ```
     """
 
-    __slots__ = ("_command_handlers", "_event_handlers")
+    __slots__ = (
+        "_command_handlers",
+        "_dispatch",
+        "_event_handlers",
+        "_instrumentation",
+        "_max_concurrency",
+    )
 
-    def __init__(self) -> None:
-        self._event_handlers: dict[
-            type[Event[EventPayloadType]], list[_Handler[Event[EventPayloadType]]]
-        ] = {}
+    def __init__(
+        self,
+        dispatch: DispatchStrategy = DispatchStrategy.SEQUENTIAL,
+        max_concurrency: int | None = None,
+        instrumentation: DispatchInstrumentation | None = None,
+    ) -> None:
+        """Initialize the bus.
+
+        Args:
+            dispatch: How the handlers of one event are run.
+            max_concurrency: Maximum number of handlers of one event
+                running at the same time. Required for, and only
+                accepted with, ``DispatchStrategy.BOUNDED``.
+            instrumentation: Records dispatch counts and per-handler
+                latency, errors and in-flight calls; ``None`` disables
+                metrics.
+
+        Raises:
+            ConfigurationError: If *max_concurrency* is missing or not
+                positive for ``BOUNDED``, or given for another strategy.
+
+        """
+        if dispatch is DispatchStrategy.BOUNDED:
+            if max_concurrency is None or max_concurrency <= 0:
+                raise ConfigurationError(
+                    f"max_concurrency must be positive for bounded dispatch, got {max_concurrency}"
+                )
+        elif max_concurrency is not None:
+            raise ConfigurationError("max_concurrency is only used with bounded dispatch")
+        self._dispatch = dispatch
+        self._max_concurrency = max_concurrency
+        self._instrumentation = instrumentation
+        self._event_handlers: EventHandlerTable[
+            Event[EventPayloadType], _Handler[Event[EventPayloadType]]
+        ] = EventHandlerTable()
         self._command_handlers: dict[
             type[Command[CommandPayloadType]], _Handler[Command[CommandPayloadType]]
         ] = {}
@@ -82,8 +200,9 @@ class InMemoryEventBus[EventPayloadType, CommandPayloadType, HandlerType](
     ) -> None:
         """Register a handler for a message type.
 
-        For event types, multiple handlers can be registered (fan-out).
-        For command types, only one handler is allowed per type.
+        For event types, multiple handlers can be registered (fan-out),
+        and each also handles subclasses of the event type. For command
+        types, only one handler is allowed per type.
 
         Args:
             message_type: The message class to handle.
@@ -91,31 +210,111 @@ class InMemoryEventBus[EventPayloadType, CommandPayloadType, HandlerType](
 
         """
         if issubclass(message_type, Event):
-            self._event_handlers.setdefault(message_type, []).append(
-                cast(_Handler[Event[EventPayloadType]], handler)
-            )
+            self._event_handlers.add(message_type, cast(_Handler[Event[EventPayloadType]], handler))
             return
         self._command_handlers[message_type] = cast(_Handler[Command[CommandPayloadType]], handler)
 
     async def publish(self, event: Event[EventPayloadType]) -> Result[None, EventBusError]:
         """Publish an event to all registered handlers.
 
+        Every handler is run according to the bus's `DispatchStrategy`,
+        even when an earlier one fails.
+
         Args:
             event: The domain event.
 
         Returns:
-            ``Ok(None)`` on success, or ``Err(EventBusError)`` if any
-            handler raises.
+            ``Ok(None)`` on success, or ``Err(EventBusError)`` whose
+            ``causes`` hold the exception of every handler that raised.
 
         """
-        handlers = self._event_handlers.get(type(event), [])
-        for handler in handlers:
-            try:
-                await handler.handle(event)
-            except Exception as exc:
-                return Err(EventBusError(str(exc)))
+        event_type = type(event)
+        handlers = self._event_handlers.resolve(event_type)
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            instrumentation.dispatched(event_type)
+        if not handlers:
+            return Ok(None)
+        work: list[_Call] = [partial(handler.handle, event) for handler in handlers]
+        if instrumentation is not None:
+            work = [
+                partial(_observe, instrumentation, event_type, handler, call)
+                for handler, call in zip(handlers, work, strict=True)
+            ]
+        return await self._run(work, event_type.__name__)
+
+    async def publish_many(
+        self, events: Sequence[Event[EventPayloadType]]
+    ) -> Result[None, EventBusError]:
+        """Publish several events, handing each type's events over together.
+
+        Events are grouped by concrete type, in order of first
+        appearance. For every group, a handler defining ``handle_batch``
+        is called once with all events of the group in publication
+        order; other handlers get ``handle`` once per event. The
+        handler calls are run according to the bus's `DispatchStrategy`,
+        and all of them run even when one fails.
+
+        Args:
+            events: The domain events to publish.
+
+        Returns:
+            ``Ok(None)`` on success, or ``Err(EventBusError)`` whose
+            ``causes`` hold the exception of every handler call that
+            raised.
+
+        """
+        groups: dict[type[Event[EventPayloadType]], list[Event[EventPayloadType]]] = {}
+        for event in events:
+            groups.setdefault(type(event), []).append(event)
+        instrumentation = self._instrumentation
+        work: list[_Call] = []
+        for event_type, group in groups.items():
+            if instrumentation is not None:
+                instrumentation.dispatched(event_type, len(group))
+            for handler in self._event_handlers.resolve(event_type):
+                item: _Call
+                if getattr(handler, "handle_batch", None) is not None:
+                    batch_handler = cast(_BatchHandler[Event[EventPayloadType]], handler)
+                    item = partial(batch_handler.handle_batch, group)
+                else:
+                    item = partial(_handle_each, handler, group)
+                if instrumentation is not None:
+                    item = partial(_observe, instrumentation, event_type, handler, item)
+                work.append(item)
+        if not work:
+            return Ok(None)
+        return await self._run(work, f"a batch of {len(events)} events")
+
+    async def _run(self, work: Sequence[_Call], subject: str) -> Result[None, EventBusError]:
+        if len(work) == 1 or self._dispatch is DispatchStrategy.SEQUENTIAL:
+            failures = [await _attempt(item) for item in work]
+        else:
+            failures = await self._fan_out(work)
+        errors = [failure for failure in failures if failure is not None]
+        if errors:
+            return Err(self._combine(subject, len(work), errors))
         return Ok(None)
 
+    async def _fan_out(self, work: Sequence[_Call]) -> list[Exception | None]:
+        async with asyncio.TaskGroup() as group:
+            if self._max_concurrency is None:
+                tasks = [group.create_task(_attempt(item)) for item in work]
+            else:
+                semaphore = asyncio.Semaphore(self._max_concurrency)
+                tasks = [group.create_task(_attempt_bounded(semaphore, item)) for item in work]
+        return [task.result() for task in tasks]
+
+    @staticmethod
+    def _combine(subject: str, handler_count: int, errors: Sequence[Exception]) -> EventBusError:
+        if len(errors) == 1:
+            return EventBusError(str(errors[0]), errors)
+        details = "; ".join(f"{type(error).__name__}: {error}" for error in errors)
+        return EventBusError(
+            f"{len(errors)} of {handler_count} handlers failed for {subject}: {details}",
+            errors,
+        )
+
     async def send(self, command: Command[CommandPayloadType]) -> Result[None, EventBusError]:
         """Send a command to its registered handler.
 
@@ -127,11 +326,20 @@ class InMemoryEventBus[EventPayloadType, CommandPayloadType, HandlerType](
             handler raises or no handler is registered.
 
         """
-        handler = self._command_handlers.get(type(command))
+        command_type = type(command)
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            instrumentation.dispatched(command_type)
+        handler = self._command_handlers.get(command_type)
         if handler is None:
-            return Err(EventBusError(f"No handler registered for {type(command).__name__}"))
+            return Err(EventBusError(f"No handler registered for {command_type.__name__}"))
         try:
-            await handler.handle(command)
+            if instrumentation is None:
+                await handler.handle(command)
+            else:
+                await _observe(
+                    instrumentation, command_type, handler, partial(handler.handle, command)
+                )
         except Exception as exc:
             return Err(EventBusError(str(exc)))
         return Ok(None)
@@ -1,8 +1,9 @@
 """In-memory implementation of the EventBusBase.
 
 Dispatches events to multiple registered handlers (fan-out) and
-commands to a single registered handler.  Handlers are looked up
-by the exact type of the message.
+commands to a single registered handler.  Command handlers are looked
+up by the exact type of the command; an event handler also receives
+instances of subclasses of the event type it was registered for.
 """
 
 from typing import Protocol, cast
@@ -12,6 +13,9 @@ from forging_blocks.domain.messages.command import Command
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.foundation.result import Err, Ok, Result
 from forging_blocks.infrastructure.event_buses.event_bus_base import EventBusBase
+from forging_blocks.infrastructure.event_buses.helpers.event_handler_table import (
+    EventHandlerTable,
+)
 
 
 class _Handler[T](Protocol):
@@ -39,7 +43,8 @@ class InMemoryEventBusBase[EventPayloadType, CommandPayloadType, HandlerType](
     """In-memory event bus with separate event/command dispatch.
 
     Attributes:
-        _event_handlers: Per-event-type list of handlers.
+        _event_handlers: Handlers per event type, resolved through the
+            event's ``__mro__`` once per concrete type.
         _command_handlers: Per-command-type single handler.
 
     Example:
@@ -85,9 +90,9 @@ class InMemoryEventBusBase[EventPayloadType, CommandPayloadType, HandlerType](
     __slots__ = ("_command_handlers", "_event_handlers")
 
     def __init__(self) -> None:
-        self._event_handlers: dict[
-            type[Event[EventPayloadType]], list[_Handler[Event[EventPayloadType]]]
-        ] = {}
+        self._event_handlers: EventHandlerTable[
+            Event[EventPayloadType], _Handler[Event[EventPayloadType]]
+        ] = EventHandlerTable()
         self._command_handlers: dict[
             type[Command[CommandPayloadType]], _Handler[Command[CommandPayloadType]]
         ] = {}
@@ -99,8 +104,9 @@ class InMemoryEventBusBase[EventPayloadType, CommandPayloadType, HandlerType](
     ) -> None:
         """Register a handler for a message type.
 
-        For event types, multiple handlers can be registered (fan-out).
-        For command types, only one handler is allowed per type.
+        For event types, multiple handlers can be registered (fan-out),
+        and each also handles subclasses of the event type. For command
+        types, only one handler is allowed per type.
 
         Args:
             message_type: The message class to handle.
@@ -108,9 +114,7 @@ class InMemoryEventBusBase[EventPayloadType, CommandPayloadType, HandlerType](
 
         """
         if issubclass(message_type, Event):
-            self._event_handlers.setdefault(message_type, []).append(
-                cast(_Handler[Event[EventPayloadType]], handler)
-            )
+            self._event_handlers.add(message_type, cast(_Handler[Event[EventPayloadType]], handler))
         else:
             self._command_handlers[message_type] = cast(
                 _Handler[Command[CommandPayloadType]], handler
@@ -127,7 +131,7 @@ class InMemoryEventBusBase[EventPayloadType, CommandPayloadType, HandlerType](
             handler raises.
 
         """
-        handlers = self._event_handlers.get(type(event), [])
+        handlers = self._event_handlers.resolve(type(event))
         for handler in handlers:
             try:
                 await handler.handle(event)
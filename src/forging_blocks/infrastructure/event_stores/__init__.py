@@ -1,11 +1,19 @@
-"""In-memory event store implementations and base class."""
+"""Event store implementations and base class."""
 
 from .event_store_base import EventStoreBase
+from .file_event_store import FileEventStore
 from .in_memory_event_store import InMemoryEventStore
 from .in_memory_event_store_base import InMemoryEventStoreBase
+from .lazy_event_sequence import LazyEventSequence
+from .recorded_event import RecordedEvent
+from .sqlite_event_store import SqliteEventStore
 
 __all__ = [
     "EventStoreBase",
+    "FileEventStore",
     "InMemoryEventStore",
     "InMemoryEventStoreBase",
+    "LazyEventSequence",
+    "RecordedEvent",
+    "SqliteEventStore",
 ]
@@ -5,10 +5,14 @@ domain events for aggregate roots following the Event Sourcing pattern.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.event_store_port import (
+    DEFAULT_STREAM_BATCH_SIZE,
+    stream_in_batches,
+)
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.foundation.result import Result
 
@@ -85,6 +89,18 @@ class EventStoreBase[EventPayloadType](ABC):
 
         """
 
+    def stream_events(
+        self,
+        aggregate_id: UUID,
+        from_version: int | None = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Event[EventPayloadType]]]:
+        """Stream an aggregate's events in batches of at most *batch_size*.
+
+        Behaves like `EventStorePort.stream_events`.
+        """
+        return stream_in_batches(self.get_events, aggregate_id, from_version, batch_size)
+
     @abstractmethod
     async def get_current_version(self, aggregate_id: UUID) -> Result[int, EventStoreError]:
         """Retrieve the current version of an aggregate's event stream.
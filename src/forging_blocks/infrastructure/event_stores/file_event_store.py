@@ -0,0 +1,267 @@
+"""Durable, file-backed implementation of the EventStorePort port.
+
+Events are encoded with a ``MessageCodec`` producing ``dict[str, object]``
+(typically `DictMessageCodec`), serialized as compact JSON and appended
+to numbered segment files. A per-aggregate offset index of
+``(segment, offset, size)`` entries is kept in memory and rebuilt from the
+record headers on startup, so ``get_events`` reads only the requested
+version range instead of the whole stream.
+
+With ``memory_map=True`` reads memory-map the segment files and return a
+`LazyEventSequence` whose events are decoded straight from
+``memoryview`` slices of the mapping on access, so replaying a long
+stream never copies its records into intermediate byte strings.
+
+The store assumes a single writer process per directory.
+"""
+
+import asyncio
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from uuid import UUID
+
+from forging_blocks.application.errors.concurrency_error import ConcurrencyError
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.event_store_port import (
+    EventStorePort,
+    StreamAppend,
+)
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.foundation.result import Err, Ok, Result
+from forging_blocks.infrastructure.event_stores.helpers.event_segment_log import (
+    EventSegmentLog,
+)
+from forging_blocks.infrastructure.event_stores.helpers.json_event_codec import JsonEventCodec
+from forging_blocks.infrastructure.event_stores.lazy_event_sequence import LazyEventSequence
+from forging_blocks.infrastructure.serialization import MessageCodec
+
+_DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+class FileEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
+    """Append-only event store persisted to segment files.
+
+    Appends are serialized through an ``asyncio.Lock`` and executed in a
+    worker thread, so the ``expected_version`` check and the write are
+    atomic with respect to other coroutines and never block the event
+    loop. Each append is a single ``write`` (plus ``fsync`` when enabled);
+    `append_batch` writes all of its streams with one ``write`` and one
+    ``fsync`` and is recovered all-or-nothing after a crash.
+
+    Attributes:
+        _codec: Turns events into JSON record bodies and back.
+        _log: Segment files plus the per-aggregate offset index.
+        _write_lock: Serializes version checks and appends.
+        _memory_map: Whether reads return lazily decoded mapped views.
+
+    Example:
+        ```python
+        class OrderCompleted(Event[dict[str, object]]):
+            def __init__(self, order_id: str, metadata: MessageMetadata | None = None) -> None:
+                super().__init__(metadata)
+                self._order_id = order_id
+
+            @property
+            def _payload(self) -> dict[str, object]:
+                return {"order_id": self._order_id}
+
+            @property
+            def value(self) -> dict[str, object]:
+                return self._payload
+
+            @classmethod
+            def from_payload_fields(
+                cls, data: dict[str, object], metadata: MessageMetadata
+            ) -> OrderCompleted:
+                return cls(str(data["order_id"]), metadata)
+
+
+        store = FileEventStore[dict[str, object]](
+            "/var/lib/orders/events",
+            codec=DictMessageCodec(),
+            event_types=[OrderCompleted],
+        )
+        aggregate_id = UUID("00000000-0000-0000-0000-000000000001")
+        await store.append_events(aggregate_id, [OrderCompleted("abc-123")], expected_version=0)
+        events = await store.get_events(aggregate_id, from_version=0)
+        store.close()
+        ```
+    """
+
+    __slots__ = ("_codec", "_log", "_memory_map", "_write_lock")
+
+    def __init__(
+        self,
+        directory: Path | str,
+        codec: MessageCodec[Event[EventPayloadType], dict[str, object]],
+        event_types: Iterable[type[Event[EventPayloadType]]],
+        *,
+        max_segment_bytes: int = _DEFAULT_MAX_SEGMENT_BYTES,
+        fsync: bool = True,
+        memory_map: bool = False,
+    ) -> None:
+        """Open (or create) the store and rebuild its offset index.
+
+        Args:
+            directory: Directory holding the segment files. Created if
+                missing.
+            codec: Codec used to encode and decode events.
+            event_types: Event classes that may appear in the store. They
+                are resolved by class name, which is what
+                ``MessageMetadata.message_type`` records by default.
+            max_segment_bytes: Size after which a new segment file is
+                started.
+            fsync: Whether every append is flushed to stable storage
+                before it is acknowledged.
+            memory_map: When ``True``, `get_events` memory-maps the
+                segments and returns a `LazyEventSequence` decoding each
+                event from a ``memoryview`` on access. Corrupt records
+                then raise ``EventStoreError`` while iterating instead of
+                being reported through the returned ``Result``.
+
+        Raises:
+            ConfigurationError: If *max_segment_bytes* is not positive.
+            EventStoreError: If an existing segment is corrupt.
+
+        """
+        if max_segment_bytes <= 0:
+            raise ConfigurationError(f"max_segment_bytes must be positive, got {max_segment_bytes}")
+        self._codec = JsonEventCodec(codec, event_types)
+        self._log = EventSegmentLog(Path(directory), max_segment_bytes, fsync)
+        self._write_lock = asyncio.Lock()
+        self._memory_map = memory_map
+
+    async def append_events(
+        self,
+        aggregate_id: UUID,
+        events: Sequence[Event[EventPayloadType]],
+        expected_version: int | None = None,
+    ) -> Result[int, EventStoreError]:
+        """Append events to an aggregate's stream with optional concurrency check.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+            events: Events to append.
+            expected_version: Expected current version. If provided and
+                it does not match the actual version, a ``ConcurrencyError``
+                is returned.
+
+        Returns:
+            A ``Result`` containing the new stream version, or an
+            ``EventStoreError`` if encoding or the write fails.
+
+        """
+        try:
+            bodies = [self._codec.encode(event) for event in events]
+        except (TypeError, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to encode events: {exc}"))
+
+        async with self._write_lock:
+            current = self._log.version(aggregate_id)
+            if expected_version is not None and current != expected_version:
+                return Err(ConcurrencyError(aggregate_id, expected_version, current))
+            try:
+                new_version = await asyncio.to_thread(self._log.append, aggregate_id, bodies)
+            except EventStoreError as exc:
+                return Err(exc)
+            except OSError as exc:
+                return Err(EventStoreError(f"Failed to append events: {exc}"))
+        return Ok(new_version)
+
+    async def append_batch(
+        self, appends: Sequence[StreamAppend[EventPayloadType]]
+    ) -> Result[list[int], EventStoreError]:
+        """Append to several streams with a single write and fsync.
+
+        All expected versions are checked under the write lock before
+        anything is written. The batch carries one commit marker, so
+        after a crash recovery restores either every stream of the batch
+        or none of them.
+
+        Args:
+            appends: ``(aggregate_id, events, expected_version)`` tuples.
+
+        Returns:
+            A ``Result`` containing the new version of each stream, or an
+            ``EventStoreError`` if an aggregate is repeated, encoding or
+            the write fails, or a ``ConcurrencyError`` if a version check
+            fails.
+
+        """
+        duplicate = self._check_distinct(appends)
+        if duplicate is not None:
+            return Err(duplicate)
+        try:
+            encoded = [
+                (aggregate_id, [self._codec.encode(event) for event in events])
+                for aggregate_id, events, _ in appends
+            ]
+        except (TypeError, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to encode events: {exc}"))
+
+        async with self._write_lock:
+            for aggregate_id, _, expected_version in appends:
+                current = self._log.version(aggregate_id)
+                if expected_version is not None and current != expected_version:
+                    return Err(ConcurrencyError(aggregate_id, expected_version, current))
+            try:
+                versions = await asyncio.to_thread(self._log.append_many, encoded)
+            except EventStoreError as exc:
+                return Err(exc)
+            except OSError as exc:
+                return Err(EventStoreError(f"Failed to append events: {exc}"))
+        return Ok(versions)
+
+    async def get_events(
+        self,
+        aggregate_id: UUID,
+        from_version: int | None = None,
+        to_version: int | None = None,
+    ) -> Result[Sequence[Event[EventPayloadType]], EventStoreError]:
+        """Retrieve events within an optional version range.
+
+        Only the records inside the range are read from disk. In
+        memory-mapped mode nothing is read or decoded until the returned
+        sequence is accessed.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+            from_version: Inclusive start (0-indexed). ``None`` = beginning.
+            to_version: Inclusive end (0-indexed). ``None`` = end.
+
+        Returns:
+            A ``Result`` containing the matching events.
+
+        """
+        start = from_version if from_version is not None else 0
+        stop = to_version + 1 if to_version is not None else self._log.version(aggregate_id)
+        try:
+            if self._memory_map:
+                records = self._log.map_range(aggregate_id, start, stop)
+                return Ok(LazyEventSequence(records, self._codec.decode))
+            events = await asyncio.to_thread(self._read, aggregate_id, start, stop)
+        except EventStoreError as exc:
+            return Err(exc)
+        except (OSError, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to read events: {exc}"))
+        return Ok(events)
+
+    async def get_current_version(self, aggregate_id: UUID) -> Result[int, EventStoreError]:
+        """Get the current version of an aggregate's stream.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+
+        Returns:
+            A ``Result`` containing the version number (0 for empty streams).
+
+        """
+        return Ok(self._log.version(aggregate_id))
+
+    def close(self) -> None:
+        """Release the file handles held by the store."""
+        self._log.close()
+
+    def _read(self, aggregate_id: UUID, start: int, stop: int) -> list[Event[EventPayloadType]]:
+        return [self._codec.decode(body) for body in self._log.read(aggregate_id, start, stop)]
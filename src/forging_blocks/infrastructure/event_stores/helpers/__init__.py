@@ -0,0 +1,16 @@
+"""Internal helpers for the durable event store implementations.
+
+These are implementation details and not part of the public API.
+"""
+
+from forging_blocks.infrastructure.event_stores.helpers.event_segment_log import (
+    EventSegmentLog,
+    StreamIndex,
+)
+from forging_blocks.infrastructure.event_stores.helpers.json_event_codec import JsonEventCodec
+
+__all__ = [
+    "EventSegmentLog",
+    "JsonEventCodec",
+    "StreamIndex",
+]
@@ -0,0 +1,481 @@
+"""Append-only segment files with an in-memory per-stream offset index.
+
+Records are laid out back to back inside numbered segment files::
+
+    segment-00000000.log
+    segment-00000001.log
+    ...
+
+Each record is a fixed-size header followed by an opaque body::
+
+    aggregate_id (16 bytes) | stream_index (u64) | body_size (u32) | crc32 (u32) | flags (u8)
+
+The ``_COMMIT`` flag marks the last record of every append so recovery can
+discard a batch that was only partially written before a crash.
+"""
+
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from io import FileIO
+from pathlib import Path
+from typing import overload
+from uuid import UUID
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+
+RECORD_HEADER = struct.Struct("<16sQIIB")
+_COMMIT = 0x01
+_SEGMENT_PATTERN = re.compile(r"^segment-(\d{8})\.log$")
+
+
+def segment_name(segment: int) -> str:
+    """Return the file name used for segment number *segment*."""
+    return f"segment-{segment:08d}.log"
+
+
+class StreamIndex:
+    """Compact per-stream offset index.
+
+    Stores one ``(segment, offset, size)`` triple per event in parallel
+    typed arrays (16 bytes per event) instead of a list of tuples, so
+    streams with millions of events stay cheap to keep resident. The
+    position of an entry in the arrays is the event's stream version.
+
+    Example:
+        ```python
+        index = StreamIndex()
+        index.add(segment=0, offset=0, size=120)
+        assert len(index) == 1
+        ```
+    """
+
+    __slots__ = ("offsets", "segments", "sizes")
+
+    def __init__(self) -> None:
+        self.segments = array("I")
+        self.offsets = array("Q")
+        self.sizes = array("I")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def add(self, segment: int, offset: int, size: int) -> None:
+        """Append the location of the next event in the stream."""
+        self.segments.append(segment)
+        self.offsets.append(offset)
+        self.sizes.append(size)
+
+
+class MappedRecords(Sequence[memoryview]):
+    """Lazily verified ``memoryview`` bodies over memory-mapped segments.
+
+    Holds only the compact index slice for the requested range plus the
+    segment mappings; a body view is created, checksum-verified and
+    returned when an item is accessed. No ``bytes`` copy of a record is
+    ever made, and nothing is retained per event after access.
+
+    Example:
+        ```python
+        records = log.map_range(aggregate_id, 0, log.version(aggregate_id))
+        for body in records:
+            payload = str(body, "utf-8")
+        ```
+    """
+
+    __slots__ = ("_aggregate_id", "_maps", "_offsets", "_segments", "_sizes", "_versions")
+
+    def __init__(
+        self,
+        aggregate_id: UUID,
+        versions: range,
+        segments: array[int],
+        offsets: array[int],
+        sizes: array[int],
+        maps: dict[int, mmap.mmap],
+    ) -> None:
+        self._aggregate_id = aggregate_id
+        self._versions = versions
+        self._segments = segments
+        self._offsets = offsets
+        self._sizes = sizes
+        self._maps = maps
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    @overload
+    def __getitem__(self, index: int) -> memoryview: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> MappedRecords: ...
+
+    def __getitem__(self, index: int | slice) -> memoryview | MappedRecords:
+        if isinstance(index, slice):
+            return MappedRecords(
+                self._aggregate_id,
+                self._versions[index],
+                self._segments[index],
+                self._offsets[index],
+                self._sizes[index],
+                self._maps,
+            )
+        return self._view(range(len(self._versions))[index])
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for position in range(len(self._versions)):
+            yield self._view(position)
+
+    def _view(self, position: int) -> memoryview:
+        mapping = self._maps[self._segments[position]]
+        offset = self._offsets[position]
+        raw_id, stream_index, size, checksum, _ = RECORD_HEADER.unpack_from(mapping, offset)
+        body_start = offset + RECORD_HEADER.size
+        body = memoryview(mapping)[body_start : body_start + size]
+        version = self._versions[position]
+        if (
+            raw_id != self._aggregate_id.bytes
+            or stream_index != version
+            or (zlib.crc32(body) != checksum)
+        ):
+            raise EventStoreError(
+                f"Corrupt event record for aggregate {self._aggregate_id} at version {version}"
+            )
+        return body
+
+
+class EventSegmentLog:
+    """Blocking, single-writer append-only log of event records.
+
+    Callers serialize ``append`` themselves. Reads use positional
+    ``os.pread`` (`read`) or read-only memory maps (`map_range`) and may
+    run concurrently with each other and with an append: the index is
+    extended and sliced under an internal lock, so a reader never sees
+    the three arrays of a `StreamIndex` at different lengths. Reader
+    descriptors and memory maps are cached per segment and created
+    under a second lock, so concurrent readers open each segment once.
+
+    A failed write is cut off the active segment again. If that is not
+    possible either, the log refuses further appends, since the next
+    record would be written after bytes that are not indexed.
+
+    Example:
+        ```python
+        log = EventSegmentLog(Path("/tmp/events"), max_segment_bytes=1 << 20, fsync=False)
+        aggregate_id = UUID("00000000-0000-0000-0000-000000000001")
+        log.append(aggregate_id, [b'{"a": 1}', b'{"a": 2}'])
+        assert log.read(aggregate_id, 0, 2) == [b'{"a": 1}', b'{"a": 2}']
+        log.close()
+        ```
+    """
+
+    def __init__(self, directory: Path, max_segment_bytes: int, fsync: bool) -> None:
+        self._directory = directory
+        self._max_segment_bytes = max_segment_bytes
+        self._fsync = fsync
+        self._streams: dict[UUID, StreamIndex] = {}
+        self._readers: dict[int, int] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._active_segment = 0
+        self._active_size = 0
+        self._index_lock = threading.Lock()
+        self._readers_lock = threading.Lock()
+        self._failure: str | None = None
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._recover()
+        self._writer = self._open_writer(self._active_segment)
+
+    @property
+    def directory(self) -> Path:
+        """Return the directory holding the segment files."""
+        return self._directory
+
+    def version(self, aggregate_id: UUID) -> int:
+        """Return the number of events stored for *aggregate_id*."""
+        with self._index_lock:
+            stream = self._streams.get(aggregate_id)
+            return len(stream) if stream is not None else 0
+
+    def append(self, aggregate_id: UUID, bodies: Sequence[bytes]) -> int:
+        """Append *bodies* to the stream of *aggregate_id* as one write.
+
+        The index is only updated after the write (and optional fsync)
+        succeeds, and the bytes of a failed write are truncated away, so
+        a failed append leaves the log as it was.
+
+        Returns:
+            The new stream version.
+
+        Raises:
+            OSError: If the write fails.
+            EventStoreError: If an earlier failed write could not be
+                truncated away.
+
+        """
+        return self.append_many([(aggregate_id, bodies)])[0]
+
+    def append_many(self, appends: Sequence[tuple[UUID, Sequence[bytes]]]) -> list[int]:
+        """Append to several streams with a single write.
+
+        Only the last record of the write carries the commit marker, so
+        recovery either restores every stream of the batch or none of
+        them. Each aggregate may appear at most once in *appends*.
+
+        Returns:
+            The new version of each stream, in the order of *appends*.
+
+        Raises:
+            OSError: If the write fails.
+            EventStoreError: If an earlier failed write could not be
+                truncated away.
+
+        """
+        if self._failure is not None:
+            raise EventStoreError(self._failure)
+        if not any(bodies for _, bodies in appends):
+            return [self.version(aggregate_id) for aggregate_id, _ in appends]
+
+        if self._active_size >= self._max_segment_bytes:
+            self._roll_segment()
+
+        last = sum(len(bodies) for _, bodies in appends) - 1
+        chunks: list[bytes] = []
+        locations: list[tuple[UUID, int, int]] = []
+        offset = self._active_size
+
+        for aggregate_id, bodies in appends:
+            start = self.version(aggregate_id)
+            raw_id = aggregate_id.bytes
+            for position, body in enumerate(bodies):
+                flags = _COMMIT if len(locations) == last else 0
+                chunks.append(
+                    RECORD_HEADER.pack(raw_id, start + position, len(body), zlib.crc32(body), flags)
+                )
+                chunks.append(body)
+                locations.append((aggregate_id, offset, len(body)))
+                offset += RECORD_HEADER.size + len(body)
+
+        self._write(b"".join(chunks))
+        self._active_size = offset
+        self._commit_pending(self._active_segment, locations)
+        return [self.version(aggregate_id) for aggregate_id, _ in appends]
+
+    def read(self, aggregate_id: UUID, start: int, stop: int) -> list[bytes]:
+        """Return the bodies of events ``[start, stop)`` of *aggregate_id*.
+
+        Physically adjacent records are coalesced into a single positional
+        read, so a stream written in large appends is fetched with a
+        handful of syscalls regardless of its length.
+
+        Raises:
+            EventStoreError: If a record fails its header or checksum check.
+
+        """
+        segments, offsets, sizes = self._slice(aggregate_id, start, stop)
+        start = max(start, 0)
+        stop = start + len(offsets)
+        header_size = RECORD_HEADER.size
+        bodies: list[bytes] = []
+        i = start
+
+        while i < stop:
+            segment = segments[i - start]
+            run_start = offsets[i - start]
+            run_end = run_start + header_size + sizes[i - start]
+            j = i + 1
+            while j < stop and segments[j - start] == segment and offsets[j - start] == run_end:
+                run_end += header_size + sizes[j - start]
+                j += 1
+
+            chunk = os.pread(self._reader(segment), run_end - run_start, run_start)
+            cursor = 0
+            for version in range(i, j):
+                bodies.append(self._unpack(chunk, cursor, aggregate_id, version))
+                cursor += header_size + sizes[version - start]
+            i = j
+
+        return bodies
+
+    def map_range(self, aggregate_id: UUID, start: int, stop: int) -> MappedRecords:
+        """Return lazily verified views of events ``[start, stop)`` of *aggregate_id*.
+
+        Segments are memory-mapped read-only and cached; a mapping is
+        replaced when the active segment has grown past its mapped length.
+        Mappings still referenced by earlier results stay valid.
+
+        """
+        segments, offsets, sizes = self._slice(aggregate_id, start, stop)
+        if not offsets:
+            return MappedRecords(aggregate_id, range(0), segments, offsets, sizes, {})
+
+        start = max(start, 0)
+        stop = start + len(offsets)
+        maps: dict[int, mmap.mmap] = {}
+        for segment in range(segments[0], segments[-1] + 1):
+            last = bisect_right(segments, segment) - 1
+            if last < 0 or segments[last] != segment:
+                continue
+            maps[segment] = self._mapping(segment, offsets[last] + RECORD_HEADER.size + sizes[last])
+        return MappedRecords(aggregate_id, range(start, stop), segments, offsets, sizes, maps)
+
+    def close(self) -> None:
+        """Close the writer and every cached reader descriptor.
+
+        Mappings are dropped rather than closed so that views handed out
+        by `map_range` remain readable until they are released.
+        """
+        self._writer.close()
+        with self._readers_lock:
+            for descriptor in self._readers.values():
+                os.close(descriptor)
+            self._readers.clear()
+            self._maps.clear()
+
+    def _slice(
+        self, aggregate_id: UUID, start: int, stop: int
+    ) -> tuple[array[int], array[int], array[int]]:
+        """Copy the index entries ``[start, stop)`` of *aggregate_id* under the lock."""
+        start = max(start, 0)
+        with self._index_lock:
+            stream = self._streams.get(aggregate_id)
+            if stream is None or start >= stop:
+                return array("I"), array("Q"), array("I")
+            return (
+                stream.segments[start:stop],
+                stream.offsets[start:stop],
+                stream.sizes[start:stop],
+            )
+
+    def _write(self, data: bytes) -> None:
+        descriptor = self._writer.fileno()
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(descriptor, view) :]
+            if self._fsync:
+                os.fsync(descriptor)
+        except OSError:
+            self._discard_unacknowledged()
+            raise
+
+    def _discard_unacknowledged(self) -> None:
+        """Truncate the active segment back to its last acknowledged record."""
+        try:
+            os.ftruncate(self._writer.fileno(), self._active_size)
+        except OSError as exc:
+            path = self._directory / segment_name(self._active_segment)
+            self._failure = f"Event segment {path} holds an unindexed failed write: {exc}"
+
+    def _roll_segment(self) -> None:
+        writer = self._open_writer(self._active_segment + 1)
+        self._writer.close()
+        self._writer = writer
+        self._active_segment += 1
+        self._active_size = 0
+
+    def _open_writer(self, segment: int) -> FileIO:
+        return open(self._directory / segment_name(segment), "ab", buffering=0)
+
+    def _reader(self, segment: int) -> int:
+        descriptor = self._readers.get(segment)
+        if descriptor is not None:
+            return descriptor
+        with self._readers_lock:
+            return self._open_reader(segment)
+
+    def _open_reader(self, segment: int) -> int:
+        """Return the cached descriptor of *segment*, opening it; hold ``_readers_lock``."""
+        descriptor = self._readers.get(segment)
+        if descriptor is None:
+            path = self._directory / segment_name(segment)
+            descriptor = self._readers[segment] = os.open(path, os.O_RDONLY)
+        return descriptor
+
+    def _mapping(self, segment: int, required_size: int) -> mmap.mmap:
+        mapping = self._maps.get(segment)
+        if mapping is not None and len(mapping) >= required_size:
+            return mapping
+        with self._readers_lock:
+            mapping = self._maps.get(segment)
+            if mapping is None or len(mapping) < required_size:
+                descriptor = self._open_reader(segment)
+                mapping = self._maps[segment] = mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ)
+            return mapping
+
+    def _unpack(self, chunk: bytes, cursor: int, aggregate_id: UUID, version: int) -> bytes:
+        raw_id, stream_index, size, checksum, _ = RECORD_HEADER.unpack_from(chunk, cursor)
+        body_start = cursor + RECORD_HEADER.size
+        body = chunk[body_start : body_start + size]
+        if raw_id != aggregate_id.bytes or stream_index != version or zlib.crc32(body) != checksum:
+            raise EventStoreError(
+                f"Corrupt event record for aggregate {aggregate_id} at version {version}"
+            )
+        return body
+
+    def _recover(self) -> None:
+        """Rebuild the offset index by scanning record headers.
+
+        Only headers are read; bodies are skipped with ``seek``. Records
+        after the last commit marker of the newest segment belong to a
+        torn append and are truncated away.
+        """
+        segments = sorted(
+            int(match.group(1))
+            for path in self._directory.iterdir()
+            if (match := _SEGMENT_PATTERN.match(path.name)) is not None
+        )
+        for segment in segments:
+            is_last = segment == segments[-1]
+            committed_size = self._scan_segment(segment, is_last)
+            self._active_segment = segment
+            self._active_size = committed_size
+
+    def _scan_segment(self, segment: int, is_last: bool) -> int:
+        path = self._directory / segment_name(segment)
+        size = path.stat().st_size
+        header_size = RECORD_HEADER.size
+        pending: list[tuple[UUID, int, int]] = []
+        pending_counts: dict[UUID, int] = {}
+        committed = 0
+        offset = 0
+
+        with open(path, "rb") as handle:
+            while offset + header_size <= size:
+                header = handle.read(header_size)
+                raw_id, stream_index, body_size, _, flags = RECORD_HEADER.unpack(header)
+                end = offset + header_size + body_size
+                if end > size:
+                    break
+                aggregate_id = UUID(bytes=raw_id)
+                expected = self.version(aggregate_id) + pending_counts.get(aggregate_id, 0)
+                if stream_index != expected:
+                    break
+                pending.append((aggregate_id, offset, body_size))
+                pending_counts[aggregate_id] = expected + 1 - self.version(aggregate_id)
+                if flags & _COMMIT:
+                    self._commit_pending(segment, pending)
+                    pending_counts.clear()
+                    committed = end
+                handle.seek(end)
+                offset = end
+
+        if committed < size:
+            if not is_last:
+                raise EventStoreError(f"Corrupt event segment {path}: unreadable tail")
+            os.truncate(path, committed)
+        return committed
+
+    def _commit_pending(self, segment: int, pending: list[tuple[UUID, int, int]]) -> None:
+        with self._index_lock:
+            for aggregate_id, offset, size in pending:
+                stream = self._streams.get(aggregate_id)
+                if stream is None:
+                    stream = self._streams[aggregate_id] = StreamIndex()
+                stream.add(segment, offset, size)
+        pending.clear()
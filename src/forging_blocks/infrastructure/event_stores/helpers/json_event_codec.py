@@ -0,0 +1,62 @@
+"""Compact JSON encoding of events shared by the durable event stores.
+
+Events are turned into ``dict[str, object]`` by a ``MessageCodec`` (usually
+`DictMessageCodec`) and serialized as compact UTF-8 JSON. Decoding
+resolves the event class from ``metadata.message_type``.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import cast
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.serialization import MessageCodec
+
+
+class JsonEventCodec[EventPayloadType]:
+    """Encode events to JSON bytes and decode them back.
+
+    Example:
+        ```python
+        codec = JsonEventCodec(DictMessageCodec[Event[dict[str, object]]](), [OrderPlaced])
+        body = codec.encode(OrderPlaced(order_id="42"))
+        event = codec.decode(body)
+        ```
+    """
+
+    __slots__ = ("_codec", "_event_types")
+
+    def __init__(
+        self,
+        codec: MessageCodec[Event[EventPayloadType], dict[str, object]],
+        event_types: Iterable[type[Event[EventPayloadType]]],
+    ) -> None:
+        self._codec = codec
+        self._event_types = {event_type.__name__: event_type for event_type in event_types}
+
+    def encode(self, event: Event[EventPayloadType]) -> bytes:
+        """Return the compact JSON document for *event*.
+
+        Raises:
+            TypeError: If the encoded event is not JSON-serializable.
+            ValueError: If the encoded event contains circular references.
+
+        """
+        return json.dumps(self._codec.encode(event), separators=(",", ":")).encode()
+
+    def decode(self, body: bytes | memoryview) -> Event[EventPayloadType]:
+        """Rebuild the event stored in *body*.
+
+        Raises:
+            EventStoreError: If the event type was not registered.
+            ValueError: If *body* is not valid JSON.
+
+        """
+        raw = cast(dict[str, object], json.loads(str(body, "utf-8")))
+        metadata = cast(dict[str, object], raw.get("metadata", {}))
+        message_type = str(metadata.get("message_type"))
+        event_type = self._event_types.get(message_type)
+        if event_type is None:
+            raise EventStoreError(f"Unknown event type {message_type!r} in event store")
+        return self._codec.decode(raw, event_type)
@@ -3,19 +3,39 @@
 Stores ``Event`` objects in a dictionary keyed by aggregate UUID.
 Supports optimistic concurrency via ``expected_version`` checks.
 
+Every appended event is also recorded in a store-wide log (the ``$all``
+stream) under a monotonically increasing position. Projections read it
+in batches with ``read_all`` and follow it live with ``subscribe``.
+
+Appends to one aggregate are serialized by an ``asyncio.Lock`` taken
+from a fixed pool of stripes chosen by the aggregate id, so the version
+check and the write stay atomic even when a subclass awaits I/O in
+``_persist``, while aggregates on different stripes never wait for
+each other.
+
 This implementation is suitable for testing and single-process
 applications. For persistence, replace with a database-backed
 implementation.
 """
 
-from collections.abc import Sequence
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from forging_blocks.application.errors.concurrency_error import ConcurrencyError
 from forging_blocks.application.errors.event_store_error import EventStoreError
-from forging_blocks.application.ports.outbound.event_store_port import EventStorePort
+from forging_blocks.application.ports.outbound.event_store_port import (
+    DEFAULT_STREAM_BATCH_SIZE,
+    EventStorePort,
+    StreamAppend,
+)
 from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
 from forging_blocks.foundation.result import Err, Ok, Result
+from forging_blocks.infrastructure.event_stores.recorded_event import RecordedEvent
+
+_DEFAULT_LOCK_STRIPES = 64
 
 
 class InMemoryEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
@@ -24,6 +44,12 @@ class InMemoryEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
     Attributes:
         _streams: Per-aggregate ordered event lists.
         _versions: Per-aggregate current version counters.
+        _log: Every appended event in global order; the index is the
+            event's position.
+        _appended: Set (and replaced) whenever events are appended, to
+            wake subscribers.
+        _locks: Append lock stripes; an aggregate always maps to the same
+            stripe.
 
     Example:
         ```python
@@ -43,14 +69,33 @@ class InMemoryEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
 
         result = await store.append_events(aggregate_id, [event])
         events = await store.get_events(aggregate_id)
+
+        async for batch in store.read_all(from_position=0, batch_size=1000):
+            ...
         ```
     """
 
-    __slots__ = ("_streams", "_versions")
+    __slots__ = ("_appended", "_locks", "_log", "_streams", "_versions")
+
+    def __init__(self, lock_stripes: int = _DEFAULT_LOCK_STRIPES) -> None:
+        """Initialize an empty store.
+
+        Args:
+            lock_stripes: Number of append locks shared by all
+                aggregates. More stripes make it less likely that two
+                unrelated aggregates wait for the same lock.
 
-    def __init__(self) -> None:
+        Raises:
+            ConfigurationError: If *lock_stripes* is not positive.
+
+        """
+        if lock_stripes <= 0:
+            raise ConfigurationError(f"lock_stripes must be positive, got {lock_stripes}")
+        self._locks = tuple(asyncio.Lock() for _ in range(lock_stripes))
         self._streams: dict[UUID, list[Event[EventPayloadType]]] = {}
         self._versions: dict[UUID, int] = {}
+        self._log: list[RecordedEvent[EventPayloadType]] = []
+        self._appended = asyncio.Event()
 
     async def append_events(
         self,
@@ -71,16 +116,55 @@ class InMemoryEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
             A ``Result`` containing the new stream version.
 
         """
-        current = self._versions.get(aggregate_id, 0)
+        async with self._locks[self._stripe(aggregate_id)]:
+            current = self._versions.get(aggregate_id, 0)
 
-        if expected_version is not None and current != expected_version:
-            return Err(ConcurrencyError(aggregate_id, expected_version, current))
+            if expected_version is not None and current != expected_version:
+                return Err(ConcurrencyError(aggregate_id, expected_version, current))
 
-        stream = self._streams.setdefault(aggregate_id, [])
-        stream.extend(events)
-        new_version = current + len(events)
-        self._versions[aggregate_id] = new_version
-        return Ok(new_version)
+            await self._persist(aggregate_id, current, events)
+            return Ok(self._apply(aggregate_id, current, events))
+
+    async def append_batch(
+        self, appends: Sequence[StreamAppend[EventPayloadType]]
+    ) -> Result[list[int], EventStoreError]:
+        """Append to several streams atomically.
+
+        The lock stripes of every aggregate in the batch are acquired in
+        ascending order, so concurrent batches cannot deadlock. All
+        expected versions are checked before any stream changes, and the
+        events become visible without yielding to the event loop, so
+        other tasks observe either none or all of the batch.
+
+        Args:
+            appends: ``(aggregate_id, events, expected_version)`` tuples.
+
+        Returns:
+            A ``Result`` containing the new version of each stream, or an
+            ``EventStoreError`` if an aggregate is repeated or a
+            ``ConcurrencyError`` if a version check fails.
+
+        """
+        duplicate = self._check_distinct(appends)
+        if duplicate is not None:
+            return Err(duplicate)
+        async with contextlib.AsyncExitStack() as stack:
+            for stripe in sorted({self._stripe(aggregate_id) for aggregate_id, _, _ in appends}):
+                await stack.enter_async_context(self._locks[stripe])
+            currents: list[int] = []
+            for aggregate_id, _, expected_version in appends:
+                current = self._versions.get(aggregate_id, 0)
+                if expected_version is not None and current != expected_version:
+                    return Err(ConcurrencyError(aggregate_id, expected_version, current))
+                currents.append(current)
+            for (aggregate_id, events, _), current in zip(appends, currents, strict=True):
+                await self._persist(aggregate_id, current, events)
+            return Ok(
+                [
+                    self._apply(aggregate_id, current, events)
+                    for (aggregate_id, events, _), current in zip(appends, currents, strict=True)
+                ]
+            )
 
     async def get_events(
         self,
@@ -116,3 +200,106 @@ class InMemoryEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
 
         """
         return Ok(self._versions.get(aggregate_id, 0))
+
+    @property
+    def position(self) -> int:
+        """Return the position the next appended event will receive."""
+        return len(self._log)
+
+    async def read_all(
+        self, from_position: int = 0, batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[RecordedEvent[EventPayloadType]]]:
+        """Stream the global event log in batches.
+
+        Iteration stops once the end of the log is reached. Events
+        appended while iterating are included if the reader has not
+        finished yet.
+
+        Args:
+            from_position: Position of the first event to return.
+            batch_size: Maximum number of events per batch.
+
+        Yields:
+            Non-empty batches of `RecordedEvent` in position order.
+
+        Raises:
+            ValueError: If *from_position* is negative or *batch_size* is
+                not positive.
+
+        """
+        self._check_position(from_position)
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        position = from_position
+        while position < len(self._log):
+            batch = self._log[position : position + batch_size]
+            position += len(batch)
+            yield batch
+
+    async def subscribe(
+        self, from_position: int = 0
+    ) -> AsyncIterator[RecordedEvent[EventPayloadType]]:
+        """Yield every event from *from_position* on, then wait for new ones.
+
+        The iterator catches up on the events already in the log and then
+        suspends until further events are appended; it never ends on its
+        own. Close it (``break`` or ``aclose()``) to unsubscribe.
+
+        Args:
+            from_position: Position of the first event to yield.
+
+        Yields:
+            `RecordedEvent` objects in position order, without gaps.
+
+        Raises:
+            ValueError: If *from_position* is negative.
+
+        """
+        self._check_position(from_position)
+        position = from_position
+        while True:
+            while position < len(self._log):
+                recorded = self._log[position]
+                position += 1
+                yield recorded
+            await self._appended.wait()
+
+    async def _persist(
+        self, aggregate_id: UUID, base_version: int, events: Sequence[Event[EventPayloadType]]
+    ) -> None:
+        """Write *events* somewhere durable before they become visible.
+
+        Called while the aggregate's lock stripe is held, after the
+        version check succeeded. The in-memory store has nothing to
+        write; subclasses adding persistence or I/O override this.
+        """
+
+    def _stripe(self, aggregate_id: UUID) -> int:
+        return aggregate_id.int % len(self._locks)
+
+    def _apply(
+        self, aggregate_id: UUID, current: int, events: Sequence[Event[EventPayloadType]]
+    ) -> int:
+        stream = self._streams.setdefault(aggregate_id, [])
+        stream.extend(events)
+        new_version = current + len(events)
+        self._versions[aggregate_id] = new_version
+        if events:
+            self._record(aggregate_id, current, events)
+        return new_version
+
+    def _record(
+        self, aggregate_id: UUID, base_version: int, events: Sequence[Event[EventPayloadType]]
+    ) -> None:
+        start = len(self._log)
+        self._log.extend(
+            RecordedEvent(start + offset, aggregate_id, base_version + offset + 1, event)
+            for offset, event in enumerate(events)
+        )
+        appended, self._appended = self._appended, asyncio.Event()
+        appended.set()
+
+    @staticmethod
+    def _check_position(position: int) -> None:
+        if position < 0:
+            raise ValueError(f"from_position must not be negative, got {position}")
@@ -0,0 +1,70 @@
+"""Lazily decoded, read-only sequence of events.
+
+Returned by event stores that can hand out raw records without
+materializing every event up front (for example `FileEventStore` in
+memory-mapped mode). Each event is decoded from its raw record only when
+it is accessed, so iterating a long stream — as
+``AggregateRoot.reconstitute`` does — keeps a single decoded event alive
+at a time instead of the whole list.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import overload
+
+from forging_blocks.domain.messages.event import Event
+
+
+class LazyEventSequence[RawEventType, EventPayloadType](Sequence[Event[EventPayloadType]]):
+    """Sequence view that decodes events from raw records on access.
+
+    Decoding is not cached: indexing the same position twice decodes
+    twice. Iterate once (or copy into a ``list``) when events are needed
+    repeatedly. Decoding errors surface at access time.
+
+    Attributes:
+        _records: The raw records backing the sequence.
+        _decode: Turns one raw record into an event.
+
+    Example:
+        ```python
+        records = [b'{"name": "a"}', b'{"name": "b"}']
+        events = LazyEventSequence(records, decode_event)
+        assert len(events) == 2
+        first = events[0]  # decoded now
+        tail = events[1:]  # still lazy
+        ```
+    """
+
+    __slots__ = ("_decode", "_records")
+
+    def __init__(
+        self,
+        records: Sequence[RawEventType],
+        decode: Callable[[RawEventType], Event[EventPayloadType]],
+    ) -> None:
+        self._records = records
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> Event[EventPayloadType]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazyEventSequence[RawEventType, EventPayloadType]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> Event[EventPayloadType] | LazyEventSequence[RawEventType, EventPayloadType]:
+        if isinstance(index, slice):
+            return LazyEventSequence(self._records[index], self._decode)
+        return self._decode(self._records[index])
+
+    def __iter__(self) -> Iterator[Event[EventPayloadType]]:
+        decode = self._decode
+        for record in self._records:
+            yield decode(record)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self._records)})"
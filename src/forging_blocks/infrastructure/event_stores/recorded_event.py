@@ -0,0 +1,47 @@
+"""Event together with its position in the global event log."""
+
+from uuid import UUID
+
+from forging_blocks.domain.messages.event import Event
+
+
+class RecordedEvent[EventPayloadType]:
+    """An appended event and where it was recorded.
+
+    Attributes:
+        position: 0-based position in the store-wide log. Positions are
+            assigned in append order and never reused, so a projection
+            can resume from the position after the last one it handled.
+        aggregate_id: Stream the event was appended to.
+        version: Stream version reached by this event (1 for the first
+            event of a stream).
+        event: The domain event itself.
+
+    Example:
+        ```python
+        async for batch in store.read_all(from_position=checkpoint):
+            for recorded in batch:
+                project(recorded.event)
+                checkpoint = recorded.position + 1
+        ```
+    """
+
+    __slots__ = ("aggregate_id", "event", "position", "version")
+
+    def __init__(
+        self,
+        position: int,
+        aggregate_id: UUID,
+        version: int,
+        event: Event[EventPayloadType],
+    ) -> None:
+        self.position = position
+        self.aggregate_id = aggregate_id
+        self.version = version
+        self.event = event
+
+    def __repr__(self) -> str:
+        return (
+            f"RecordedEvent(position={self.position}, aggregate_id={self.aggregate_id!r}, "
+            f"version={self.version}, event={self.event!r})"
+        )
@@ -0,0 +1,299 @@
+"""Durable, SQLite-backed implementation of the EventStorePort port.
+
+Events are encoded with a ``MessageCodec`` producing ``dict[str, object]``
+(typically `DictMessageCodec`), serialized as compact JSON and stored in
+a single ``events`` table of a stdlib ``sqlite3`` database::
+
+    position INTEGER PRIMARY KEY | aggregate_id BLOB | version INTEGER | body BLOB
+
+A unique index on ``(aggregate_id, version)`` backs optimistic concurrency
+and serves ``get_events`` range reads. The database runs in WAL mode so
+readers never block the writer.
+
+Every statement runs on one dedicated worker thread owning the
+connection, so the event loop is never blocked and the connection's
+prepared-statement cache is reused across calls.
+"""
+
+import asyncio
+import sqlite3
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from uuid import UUID
+
+from forging_blocks.application.errors.concurrency_error import ConcurrencyError
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.event_store_port import (
+    EventStorePort,
+    StreamAppend,
+)
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.result import Err, Ok, Result
+from forging_blocks.infrastructure.event_stores.helpers.json_event_codec import JsonEventCodec
+from forging_blocks.infrastructure.outbox.sqlite_outbox_table import (
+    OUTBOX_INSERT,
+    OUTBOX_SCHEMA,
+)
+from forging_blocks.infrastructure.serialization import MessageCodec
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    position INTEGER PRIMARY KEY,
+    aggregate_id BLOB NOT NULL,
+    version INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS events_stream ON events (aggregate_id, version);
+"""
+_CURRENT_VERSION = "SELECT COALESCE(MAX(version), 0) FROM events WHERE aggregate_id = ?"
+_INSERT = "INSERT INTO events (aggregate_id, version, body) VALUES (?, ?, ?)"
+_SELECT_RANGE = (
+    "SELECT body FROM events WHERE aggregate_id = ? AND version > ? AND version <= ? "
+    "ORDER BY version"
+)
+_DEFAULT_BUSY_TIMEOUT = 5.0
+
+type _EncodedAppend = tuple[UUID, list[bytes], int | None]
+
+
+class SqliteEventStore[EventPayloadType](EventStorePort[EventPayloadType]):
+    """Event store persisted to a SQLite database in WAL mode.
+
+    ``append_events`` checks the expected version and bulk-inserts the
+    events with ``executemany`` inside one ``BEGIN IMMEDIATE``
+    transaction; `append_batch` does the same for several streams in
+    a single transaction. Should another process sharing the database
+    race an append, the unique ``(aggregate_id, version)`` index rejects
+    it.
+
+    With ``outbox=True`` every appended event is also inserted into the
+    ``outbox`` table read by `SqliteOutbox`, inside the same transaction,
+    so an event is stored if and only if it is queued for publication.
+
+    Attributes:
+        _codec: Turns events into JSON bodies and back.
+        _executor: Single worker thread owning the connection.
+        _connection: Connection used by the worker thread only.
+        _outbox: Whether appends also fill the ``outbox`` table.
+
+    Example:
+        ```python
+        store = SqliteEventStore[dict[str, object]](
+            "/var/lib/orders/events.db",
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[OrderCompleted],
+        )
+        aggregate_id = UUID("00000000-0000-0000-0000-000000000001")
+        await store.append_events(aggregate_id, [OrderCompleted("abc-123")], expected_version=0)
+        events = (await store.get_events(aggregate_id)).value
+        store.close()
+        ```
+    """
+
+    __slots__ = ("_codec", "_connection", "_executor", "_outbox")
+
+    def __init__(
+        self,
+        path: Path | str,
+        codec: MessageCodec[Event[EventPayloadType], dict[str, object]],
+        event_types: Iterable[type[Event[EventPayloadType]]],
+        *,
+        fsync: bool = True,
+        busy_timeout: float = _DEFAULT_BUSY_TIMEOUT,
+        outbox: bool = False,
+    ) -> None:
+        """Open (or create) the database and its schema.
+
+        Args:
+            path: Database file. Created if missing; ``":memory:"`` gives a
+                private, non-durable database.
+            codec: Codec used to encode and decode events.
+            event_types: Event classes that may appear in the store. They
+                are resolved by class name, which is what
+                ``MessageMetadata.message_type`` records by default.
+            fsync: Whether every commit is synced to stable storage
+                (``synchronous=FULL``). With ``False`` the WAL is only
+                synced at checkpoints (``synchronous=NORMAL``): the last
+                commits may be lost on power failure, but the database
+                stays consistent.
+            busy_timeout: Seconds to wait for a lock held by another
+                connection before failing.
+            outbox: Whether appended events are also inserted into the
+                ``outbox`` table, in the same transaction, for a
+                `SqliteOutbox` opened on the same database.
+
+        Raises:
+            EventStoreError: If the database cannot be opened.
+
+        """
+        self._codec = JsonEventCodec(codec, event_types)
+        self._outbox = outbox
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-event-store")
+        try:
+            self._connection = self._executor.submit(
+                self._connect, str(path), fsync, busy_timeout, outbox
+            ).result()
+        except sqlite3.Error as exc:
+            self._executor.shutdown()
+            raise EventStoreError(f"Failed to open event store database: {exc}") from exc
+
+    async def append_events(
+        self,
+        aggregate_id: UUID,
+        events: Sequence[Event[EventPayloadType]],
+        expected_version: int | None = None,
+    ) -> Result[int, EventStoreError]:
+        """Append events to an aggregate's stream with optional concurrency check.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+            events: Events to append.
+            expected_version: Expected current version. If provided and
+                it does not match the actual version, a ``ConcurrencyError``
+                is returned.
+
+        Returns:
+            A ``Result`` containing the new stream version, or an
+            ``EventStoreError`` if encoding or the write fails.
+
+        """
+        result = await self.append_batch([(aggregate_id, events, expected_version)])
+        if not result.is_ok:
+            return Err(result.error)
+        return Ok(result.value[0])
+
+    async def append_batch(
+        self, appends: Sequence[StreamAppend[EventPayloadType]]
+    ) -> Result[list[int], EventStoreError]:
+        """Append to several streams in one transaction.
+
+        All expected versions are checked inside the transaction before
+        anything is inserted, so either every stream is appended or none.
+
+        Args:
+            appends: ``(aggregate_id, events, expected_version)`` tuples.
+
+        Returns:
+            A ``Result`` containing the new version of each stream, or an
+            ``EventStoreError`` if an aggregate is repeated, encoding or
+            the write fails, or a ``ConcurrencyError`` if a version check
+            fails.
+
+        """
+        duplicate = self._check_distinct(appends)
+        if duplicate is not None:
+            return Err(duplicate)
+        try:
+            encoded = [
+                (aggregate_id, [self._codec.encode(event) for event in events], expected_version)
+                for aggregate_id, events, expected_version in appends
+            ]
+        except (TypeError, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to encode events: {exc}"))
+        try:
+            return await self._run(self._append, encoded)
+        except sqlite3.Error as exc:
+            return Err(EventStoreError(f"Failed to append events: {exc}"))
+
+    async def get_events(
+        self,
+        aggregate_id: UUID,
+        from_version: int | None = None,
+        to_version: int | None = None,
+    ) -> Result[Sequence[Event[EventPayloadType]], EventStoreError]:
+        """Retrieve events within an optional version range.
+
+        The range is served by the ``(aggregate_id, version)`` index and
+        decoded on the worker thread.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+            from_version: Inclusive start (0-indexed). ``None`` = beginning.
+            to_version: Inclusive end (0-indexed). ``None`` = end.
+
+        Returns:
+            A ``Result`` containing the matching events.
+
+        """
+        start = from_version if from_version is not None else 0
+        stop = to_version + 1 if to_version is not None else sys.maxsize
+        try:
+            return Ok(await self._run(self._read, aggregate_id, start, stop))
+        except EventStoreError as exc:
+            return Err(exc)
+        except (sqlite3.Error, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to read events: {exc}"))
+
+    async def get_current_version(self, aggregate_id: UUID) -> Result[int, EventStoreError]:
+        """Get the current version of an aggregate's stream.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+
+        Returns:
+            A ``Result`` containing the version number (0 for empty streams).
+
+        """
+        try:
+            return Ok(await self._run(self._current_version, aggregate_id))
+        except sqlite3.Error as exc:
+            return Err(EventStoreError(f"Failed to read stream version: {exc}"))
+
+    def close(self) -> None:
+        """Close the connection and stop the worker thread."""
+        self._executor.submit(self._connection.close).result()
+        self._executor.shutdown()
+
+    async def _run[**P, R](self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    @staticmethod
+    def _connect(path: str, fsync: bool, busy_timeout: float, outbox: bool) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+        connection.executescript(_SCHEMA)
+        if outbox:
+            connection.executescript(OUTBOX_SCHEMA)
+        return connection
+
+    def _append(self, appends: Sequence[_EncodedAppend]) -> Result[list[int], EventStoreError]:
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            versions: list[int] = []
+            rows: list[tuple[bytes, int, bytes]] = []
+            for aggregate_id, bodies, expected_version in appends:
+                raw_id = aggregate_id.bytes
+                current: int = connection.execute(_CURRENT_VERSION, (raw_id,)).fetchone()[0]
+                if expected_version is not None and current != expected_version:
+                    connection.execute("ROLLBACK")
+                    return Err(ConcurrencyError(aggregate_id, expected_version, current))
+                rows.extend(
+                    (raw_id, current + offset + 1, body) for offset, body in enumerate(bodies)
+                )
+                versions.append(current + len(bodies))
+            connection.executemany(_INSERT, rows)
+            if self._outbox:
+                connection.executemany(OUTBOX_INSERT, [(body,) for _, _, body in rows])
+            connection.execute("COMMIT")
+        except sqlite3.IntegrityError as exc:
+            connection.execute("ROLLBACK")
+            return Err(EventStoreError(f"Concurrent append rejected: {exc}"))
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        return Ok(versions)
+
+    def _read(self, aggregate_id: UUID, start: int, stop: int) -> list[Event[EventPayloadType]]:
+        rows = self._connection.execute(_SELECT_RANGE, (aggregate_id.bytes, start, stop))
+        return [self._codec.decode(body) for (body,) in rows]
+
+    def _current_version(self, aggregate_id: UUID) -> int:
+        row = self._connection.execute(_CURRENT_VERSION, (aggregate_id.bytes,)).fetchone()
+        return int(row[0])
@@ -1,15 +1,37 @@
 """In-memory message bus implementation for intra-process message routing.
 
 Provides a simple synchronous dispatch mechanism that routes messages
-to registered handlers based on message type.
+to registered handlers based on message type. CPU-bound handlers can be
+registered with an executor so they run on a thread or process pool
+instead of blocking the event loop, and every handler can be wrapped in
+a middleware chain composed once at registration and instrumented with
+handler metrics.
 """
 
 import asyncio
-from collections.abc import Callable
+import inspect
+from collections.abc import Callable, Coroutine, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
 from typing import cast
 
 from forging_blocks.application.ports.outbound.message_bus_port import MessageBusPort
 from forging_blocks.domain.messages.message import Message
+from forging_blocks.foundation.middleware import Middleware, Pipeline
+from forging_blocks.infrastructure.metrics.dispatch_instrumentation import (
+    DispatchInstrumentation,
+)
+from forging_blocks.infrastructure.serialization import MessageCodec
+
+
+def _decode_and_handle[MT: Message[object], Raw](
+    handler: Callable[[MT], object],
+    codec: MessageCodec[MT, Raw],
+    message_type: type[MT],
+    data: Raw,
+) -> object:
+    """Rebuild the message from *data* and run *handler* on it, in a worker."""
+    return handler(codec.decode(data, message_type))
 
 
 class InMemoryMessageBus[MessageType: Message[object], MessageBusResultType](
@@ -21,6 +43,27 @@ class InMemoryMessageBus[MessageType: Message[object], MessageBusResultType](
     message of that type is dispatched. Suitable for testing, prototyping,
     and simple intra-process communication.
 
+    A synchronous handler registered with an *executor* runs through
+    ``loop.run_in_executor`` so the event loop stays responsive. With a
+    ``ThreadPoolExecutor`` the message is passed as is. A message's
+    ``MessageMetadata`` is slotted and frozen, and unpickling writes
+    its slots through the frozen ``__setattr__``, so messages cannot
+    cross a process boundary through ``pickle``. A
+    ``ProcessPoolExecutor`` therefore also needs a *codec*: the message
+    is encoded in the caller, shipped to the worker process and decoded
+    there before the handler runs.
+    The handler, the codec and the handler's result must then be
+    picklable, i.e. module-level functions and plain data.
+
+    *middlewares* given to the constructor wrap every handler, first
+    element outermost, exactly like a ``Pipeline``. The
+    chain is composed once per message type in `register`, so
+    ``dispatch`` remains one call per message. Middleware runs on the
+    event loop, around an executor hand-off if there is one.
+
+    With an *instrumentation*, every dispatch is counted and each
+    handler call (inside the middleware chain) is timed.
+
     Example:
         ```python
         class Command[T]:
@@ -41,18 +84,45 @@ class InMemoryMessageBus[MessageType: Message[object], MessageBusResultType](
         bus = InMemoryMessageBus[MyCommand, None]()
         bus.register(MyCommand, my_handler)
         await bus.dispatch(MyCommand())
+
+        # CPU-bound handler on four cores
+        pool = ProcessPoolExecutor(max_workers=4)
+        bus.register(PriceQuote, price_quote, executor=pool, codec=DictMessageCodec())
+
+        # Timing and tracing around every handler
+        traced = InMemoryMessageBus[MyCommand, None]([TimingMiddleware(logger), tracing])
         ```
 
     """
 
-    __slots__ = ("_handlers",)
+    __slots__ = ("_handlers", "_instrumentation", "_middlewares")
 
-    def __init__(self) -> None:
-        """Initialize the message bus with an empty handler registry."""
-        self._handlers: dict[type[Message[object]], Callable[[Message[object]], object]] = {}
+    def __init__(
+        self,
+        middlewares: Sequence[Middleware[MessageType, MessageBusResultType]] = (),
+        instrumentation: DispatchInstrumentation | None = None,
+    ) -> None:
+        """Initialize the message bus with an empty handler registry.
+
+        Args:
+            middlewares: Middleware wrapping every handler registered
+                afterwards; the first element is the outermost.
+            instrumentation: Records dispatch counts and per-handler
+                latency, errors and in-flight calls; ``None`` disables
+                metrics.
 
-    def register[MT: Message[object]](
-        self, message_type: type[MT], handler: Callable[[MT], object]
+        """
+        self._handlers: dict[type[Message[object]], Callable[[Message[object]], object]] = {}
+        self._middlewares = tuple(middlewares)
+        self._instrumentation = instrumentation
+
+    def register[MT: Message[object], Raw](
+        self,
+        message_type: type[MT],
+        handler: Callable[[MT], object],
+        *,
+        executor: Executor | None = None,
+        codec: MessageCodec[MT, Raw] | None = None,
     ) -> None:
         """Register a handler for a specific message type.
 
@@ -60,16 +130,44 @@ class InMemoryMessageBus[MessageType: Message[object], MessageBusResultType](
             message_type: The message type to handle.
             handler: A callable that processes the message. It should accept
                 a message instance and return the appropriate result type.
+            executor: Optional thread or process pool the handler runs on.
+                The handler must then be synchronous. The bus does not
+                shut the executor down.
+            codec: Codec serializing the message for the executor's
+                workers; required for process pools.
 
         Raises:
-            ValueError: If the message type is already registered.
+            ValueError: If the message type is already registered, a
+                *codec* is given without an *executor*, a
+                ``ProcessPoolExecutor`` is given without a *codec*, or a
+                coroutine function is registered with an *executor*.
 
         """
         if message_type in self._handlers:
             raise ValueError(
                 f"Handler already registered for message type '{message_type.__name__}'."
             )
-        self._handlers[message_type] = cast(Callable[[Message[object]], object], handler)
+        route: Callable[[MT], object] = handler
+        if executor is None:
+            if codec is not None:
+                raise ValueError("A codec is only used together with an executor.")
+        elif codec is None and isinstance(executor, ProcessPoolExecutor):
+            raise ValueError(
+                f"Handler for '{message_type.__name__}' needs a codec to run on a process pool."
+            )
+        elif inspect.iscoroutinefunction(handler):
+            raise ValueError(
+                f"Handler for '{message_type.__name__}' must be synchronous to run on an executor."
+            )
+        else:
+            route = self._offloaded(message_type, handler, executor, codec)
+        if self._instrumentation is not None:
+            route = self._observed(self._instrumentation, message_type, handler, route)
+        if self._middlewares:
+            terminal = self._terminal(cast(Callable[[MessageType], object], route))
+            pipeline = Pipeline(self._middlewares, terminal)
+            route = cast(Callable[[MT], object], pipeline.execute)
+        self._handlers[message_type] = cast(Callable[[Message[object]], object], route)
 
     async def dispatch(self, message: MessageType) -> MessageBusResultType:
         """Dispatch a message to the registered handler.
@@ -85,7 +183,61 @@ class InMemoryMessageBus[MessageType: Message[object], MessageBusResultType](
 
         """
         handler = self._handlers[type(message)]
+        if self._instrumentation is not None:
+            self._instrumentation.dispatched(type(message))
         result = handler(message)
         if asyncio.iscoroutine(result):
             result = await result
         return cast(MessageBusResultType, result)
+
+    @staticmethod
+    def _terminal(
+        handler: Callable[[MessageType], object],
+    ) -> Callable[[MessageType], Coroutine[object, object, MessageBusResultType]]:
+        """Adapt *handler*, sync or async, to the awaitable shape a pipeline expects."""
+
+        async def terminal(message: MessageType) -> MessageBusResultType:
+            result = handler(message)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return cast(MessageBusResultType, result)
+
+        return terminal
+
+    @staticmethod
+    def _observed[MT: Message[object]](
+        instrumentation: DispatchInstrumentation,
+        message_type: type[MT],
+        handler: object,
+        route: Callable[[MT], object],
+    ) -> Callable[[MT], Coroutine[object, object, object]]:
+        """Wrap *route* so each call is recorded under *handler*'s name."""
+
+        async def call(message: MT) -> object:
+            result = route(message)
+            if asyncio.iscoroutine(result):
+                return await result
+            return result
+
+        async def observed(message: MT) -> object:
+            return await instrumentation.observe(message_type, handler, call(message))
+
+        return observed
+
+    @staticmethod
+    def _offloaded[MT: Message[object], Raw](
+        message_type: type[MT],
+        handler: Callable[[MT], object],
+        executor: Executor,
+        codec: MessageCodec[MT, Raw] | None,
+    ) -> Callable[[MT], Coroutine[object, object, object]]:
+        """Wrap *handler* so each call is submitted to *executor*."""
+
+        async def submit(message: MT) -> object:
+            loop = asyncio.get_running_loop()
+            if codec is None:
+                return await loop.run_in_executor(executor, handler, message)
+            work = partial(_decode_and_handle, handler, codec, message_type)
+            return await loop.run_in_executor(executor, work, codec.encode(message))
+
+        return submit
@@ -0,0 +1,6 @@
+"""Metrics recording and dispatch instrumentation."""
+
+from .dispatch_instrumentation import DispatchInstrumentation
+from .in_memory_metrics import InMemoryMetrics
+
+__all__ = ["DispatchInstrumentation", "InMemoryMetrics"]
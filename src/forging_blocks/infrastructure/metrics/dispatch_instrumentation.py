@@ -0,0 +1,160 @@
+"""Handler-level metrics for message and event dispatch.
+
+`DispatchInstrumentation` is handed to `InMemoryEventBus` or
+`InMemoryMessageBus`; the buses report every dispatched message and
+wrap every handler call with it. It records, through a ``MetricsPort``:
+
+* ``messages.dispatched`` — counter per ``message_type``.
+* ``handler.duration`` — histogram of handler latency in seconds, per
+  ``message_type`` and ``handler``.
+* ``handler.errors`` — counter per ``message_type``, ``handler`` and
+  ``error`` (the exception class name).
+* ``handler.in_flight`` — gauge of handler calls currently running.
+* ``handler.slow`` — counter of calls exceeding the slow threshold,
+  which are also logged as warnings.
+
+Buses without instrumentation skip all of it; the only cost left is a
+``None`` check per dispatch.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+
+from forging_blocks.application.ports.outbound.logger_port import LoggerPort
+from forging_blocks.application.ports.outbound.metrics_port import MetricsPort, MetricTags
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+MESSAGES_DISPATCHED = "messages.dispatched"
+HANDLER_DURATION = "handler.duration"
+HANDLER_ERRORS = "handler.errors"
+HANDLER_IN_FLIGHT = "handler.in_flight"
+HANDLER_SLOW = "handler.slow"
+
+
+def _handler_name(handler: object) -> str:
+    qualname = getattr(handler, "__qualname__", None)
+    return qualname if isinstance(qualname, str) else type(handler).__qualname__
+
+
+class _HandlerSeries:
+    """Tags and in-flight count of one handler for one message type."""
+
+    __slots__ = ("handler", "in_flight", "tags")
+
+    def __init__(self, handler: object, tags: MetricTags) -> None:
+        self.handler = handler
+        self.tags = tags
+        self.in_flight = 0
+
+
+class DispatchInstrumentation:
+    """Records dispatch and handler metrics for a bus.
+
+    Tags are built once per message type and handler, so a handler call
+    costs two gauge updates, one histogram sample and two clock reads.
+
+    Attributes:
+        _metrics: Receives the metrics.
+        _logger: Receives slow-handler warnings, if given.
+        _slow_threshold: Duration in seconds from which a call is slow,
+            or ``None``.
+        _clock: Monotonic clock in seconds.
+        _message_tags: Tags per message type.
+        _series: Handler series per message type and handler identity.
+
+    Example:
+        ```python
+        instrumentation = DispatchInstrumentation(
+            PrometheusMetrics(registry), logger=StdlibLogger("bus"), slow_threshold=0.25
+        )
+        event_bus = InMemoryEventBus[dict[str, object], object, object](
+            instrumentation=instrumentation
+        )
+        message_bus = InMemoryMessageBus[Query[object], object](instrumentation=instrumentation)
+        ```
+    """
+
+    __slots__ = ("_clock", "_logger", "_message_tags", "_metrics", "_series", "_slow_threshold")
+
+    def __init__(
+        self,
+        metrics: MetricsPort,
+        logger: LoggerPort | None = None,
+        slow_threshold: float | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initialize the instrumentation.
+
+        Args:
+            metrics: Port receiving the metrics.
+            logger: Logger receiving a warning for every slow call.
+            slow_threshold: Seconds from which a handler call counts as
+                slow; ``None`` disables slow-call detection.
+            clock: Monotonic clock returning seconds.
+
+        Raises:
+            ConfigurationError: If *slow_threshold* is not positive.
+
+        """
+        if slow_threshold is not None and slow_threshold <= 0:
+            raise ConfigurationError(f"slow_threshold must be positive, got {slow_threshold}")
+        self._metrics = metrics
+        self._logger = logger
+        self._slow_threshold = slow_threshold
+        self._clock = clock
+        self._message_tags: dict[type, MetricTags] = {}
+        self._series: dict[tuple[type, int], _HandlerSeries] = {}
+
+    def dispatched(self, message_type: type, count: int = 1) -> None:
+        """Count *count* dispatched messages of *message_type*."""
+        tags = self._message_tags.get(message_type)
+        if tags is None:
+            tags = self._message_tags[message_type] = {"message_type": message_type.__name__}
+        self._metrics.increment(MESSAGES_DISPATCHED, count, tags)
+
+    async def observe[T](self, message_type: type, handler: object, work: Awaitable[T]) -> T:
+        """Await *work*, the call of *handler* for *message_type*, and record it.
+
+        Returns:
+            The result of *work*.
+
+        Raises:
+            Exception: Whatever *work* raises, after counting the error.
+
+        """
+        series = self._series_for(message_type, handler)
+        metrics = self._metrics
+        series.in_flight += 1
+        metrics.set_gauge(HANDLER_IN_FLIGHT, series.in_flight, series.tags)
+        start = self._clock()
+        try:
+            return await work
+        except Exception as exc:
+            metrics.increment(HANDLER_ERRORS, tags={**series.tags, "error": type(exc).__name__})
+            raise
+        finally:
+            elapsed = self._clock() - start
+            series.in_flight -= 1
+            metrics.set_gauge(HANDLER_IN_FLIGHT, series.in_flight, series.tags)
+            metrics.observe(HANDLER_DURATION, elapsed, series.tags)
+            if self._slow_threshold is not None and elapsed >= self._slow_threshold:
+                self._report_slow(series.tags, elapsed, self._slow_threshold)
+
+    def _series_for(self, message_type: type, handler: object) -> _HandlerSeries:
+        key = (message_type, id(handler))
+        series = self._series.get(key)
+        if series is None or series.handler is not handler:
+            tags = {"message_type": message_type.__name__, "handler": _handler_name(handler)}
+            series = self._series[key] = _HandlerSeries(handler, tags)
+        return series
+
+    def _report_slow(self, tags: MetricTags, elapsed: float, threshold: float) -> None:
+        self._metrics.increment(HANDLER_SLOW, tags=tags)
+        if self._logger is not None:
+            self._logger.warning(
+                "Slow handler: handler=%s message_type=%s duration=%s threshold=%s",
+                tags["handler"],
+                tags["message_type"],
+                f"{elapsed:.6f}",
+                f"{threshold:.6f}",
+            )
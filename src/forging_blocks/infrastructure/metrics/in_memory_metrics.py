@@ -0,0 +1,68 @@
+"""In-memory implementation of the MetricsPort port.
+
+Keeps every counter, histogram sample and gauge in dictionaries keyed
+by metric name and tags. Suitable for tests and for exposing metrics
+from a single process through a custom endpoint.
+"""
+
+from collections.abc import Sequence
+
+from forging_blocks.application.ports.outbound.metrics_port import MetricsPort, MetricTags
+
+type _SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _key(name: str, tags: MetricTags | None) -> _SeriesKey:
+    return name, tuple(sorted(tags.items())) if tags else ()
+
+
+class InMemoryMetrics(MetricsPort):
+    """Metrics recorder backed by dictionaries.
+
+    A series is identified by its name and its tags; tag order does not
+    matter. Histograms keep every sample.
+
+    Attributes:
+        _counters: Counter totals by series.
+        _histograms: Recorded samples by series.
+        _gauges: Last value by series.
+
+    Example:
+        ```python
+        metrics = InMemoryMetrics()
+        metrics.increment("orders.placed", tags={"channel": "web"})
+        assert metrics.counter("orders.placed", {"channel": "web"}) == 1
+        ```
+    """
+
+    __slots__ = ("_counters", "_gauges", "_histograms")
+
+    def __init__(self) -> None:
+        self._counters: dict[_SeriesKey, float] = {}
+        self._histograms: dict[_SeriesKey, list[float]] = {}
+        self._gauges: dict[_SeriesKey, float] = {}
+
+    def increment(self, name: str, value: float = 1, tags: MetricTags | None = None) -> None:
+        """Add *value* to the counter *name*."""
+        key = _key(name, tags)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, tags: MetricTags | None = None) -> None:
+        """Append *value* to the samples of the histogram *name*."""
+        self._histograms.setdefault(_key(name, tags), []).append(value)
+
+    def set_gauge(self, name: str, value: float, tags: MetricTags | None = None) -> None:
+        """Set the gauge *name* to *value*."""
+        self._gauges[_key(name, tags)] = value
+
+    def counter(self, name: str, tags: MetricTags | None = None) -> float:
+        """Return the total of a counter series; 0 if never incremented."""
+        return self._counters.get(_key(name, tags), 0)
+
+    def histogram(self, name: str, tags: MetricTags | None = None) -> Sequence[float]:
+        """Return the samples of a histogram series, oldest first."""
+        return tuple(self._histograms.get(_key(name, tags), ()))
+
+    def gauge(self, name: str, tags: MetricTags | None = None) -> float | None:
+        """Return the last value of a gauge series, or ``None`` if never set."""
+        return self._gauges.get(_key(name, tags))
@@ -0,0 +1,11 @@
+"""Transactional outbox implementations and the relay publishing from them."""
+
+from .in_memory_outbox import InMemoryOutbox
+from .outbox_relay import OutboxRelay
+from .sqlite_outbox import SqliteOutbox
+
+__all__ = [
+    "InMemoryOutbox",
+    "OutboxRelay",
+    "SqliteOutbox",
+]
@@ -0,0 +1,81 @@
+"""In-memory implementation of the OutboxPort port.
+
+Keeps pending messages in an insertion-ordered dictionary keyed by
+position, so reading the oldest messages and acknowledging any of them
+are cheap. Suitable for testing and single-process applications; the
+messages do not survive a restart.
+"""
+
+from collections.abc import Sequence
+from itertools import islice
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.outbox_port import OutboxMessage, OutboxPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.result import Ok, Result
+
+
+class InMemoryOutbox[EventPayloadType](OutboxPort[EventPayloadType]):
+    """Outbox backed by a dictionary.
+
+    Attributes:
+        _pending: Undelivered messages by position, oldest first.
+        _next_position: Position given to the next added event.
+
+    Example:
+        ```python
+        outbox = InMemoryOutbox[dict[str, object]]()
+        await outbox.add([OrderPlaced(order_id="42")])
+        pending = (await outbox.fetch_pending(limit=100)).value
+        await outbox.mark_delivered([message.position for message in pending])
+        ```
+    """
+
+    __slots__ = ("_next_position", "_pending")
+
+    def __init__(self) -> None:
+        self._pending: dict[int, OutboxMessage[EventPayloadType]] = {}
+        self._next_position = 1
+
+    def __len__(self) -> int:
+        """Return the number of pending messages."""
+        return len(self._pending)
+
+    async def add(self, events: Sequence[Event[EventPayloadType]]) -> Result[None, EventStoreError]:
+        """Store *events* as pending messages.
+
+        Args:
+            events: Events to publish later.
+
+        Returns:
+            ``Ok(None)``.
+
+        """
+        for event in events:
+            self._pending[self._next_position] = OutboxMessage(self._next_position, event)
+            self._next_position += 1
+        return Ok(None)
+
+    async def fetch_pending(
+        self, limit: int
+    ) -> Result[Sequence[OutboxMessage[EventPayloadType]], EventStoreError]:
+        """Return up to *limit* undelivered messages, oldest first.
+
+        Raises:
+            ValueError: If *limit* is not positive.
+
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        return Ok(list(islice(self._pending.values(), limit)))
+
+    async def mark_delivered(self, positions: Sequence[int]) -> Result[None, EventStoreError]:
+        """Forget the messages at *positions*.
+
+        Returns:
+            ``Ok(None)``.
+
+        """
+        for position in positions:
+            self._pending.pop(position, None)
+        return Ok(None)
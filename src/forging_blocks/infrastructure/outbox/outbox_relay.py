@@ -0,0 +1,149 @@
+"""Relay moving events from an outbox to an event publisher.
+
+`OutboxRelay` reads pending messages in batches, publishes them with
+``publish_many`` and only then acknowledges them. A crash or publisher
+failure between the two steps leaves the messages pending, so they are
+published again later: delivery is at-least-once.
+"""
+
+import asyncio
+from collections.abc import Callable
+
+from forging_blocks.application.ports.outbound.event_publisher_port import EventPublisherPort
+from forging_blocks.application.ports.outbound.outbox_port import OutboxPort
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+_DEFAULT_BATCH_SIZE = 100
+_DEFAULT_POLL_INTERVAL = 0.1
+
+
+class OutboxRelay[EventPayloadType]:
+    """Publishes the pending messages of an outbox in batches.
+
+    Run `run` as a background task, or call `relay_once` / `drain` from
+    a scheduler of your own.
+
+    Attributes:
+        _outbox: Source of pending messages.
+        _publisher: Receives each batch through ``publish_many``.
+        _batch_size: Maximum number of messages per batch.
+        _poll_interval: Seconds `run` waits when the outbox is empty
+            or a batch failed.
+        _on_error: Optional callback receiving exceptions raised while
+            relaying in `run`.
+        _delivered: Number of messages acknowledged so far.
+
+    Example:
+        ```python
+        relay = OutboxRelay(outbox, EventBusEventPublisher(bus), batch_size=500)
+        task = asyncio.create_task(relay.run())
+        ...
+        task.cancel()
+        ```
+    """
+
+    __slots__ = (
+        "_batch_size",
+        "_delivered",
+        "_on_error",
+        "_outbox",
+        "_poll_interval",
+        "_publisher",
+    )
+
+    def __init__(
+        self,
+        outbox: OutboxPort[EventPayloadType],
+        publisher: EventPublisherPort[EventPayloadType],
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Initialize the relay.
+
+        Args:
+            outbox: Outbox to read pending messages from.
+            publisher: Publisher receiving each batch.
+            batch_size: Maximum number of messages per batch.
+            poll_interval: Seconds `run` sleeps when the outbox is empty
+                or a batch failed.
+            on_error: Called with every exception `run` recovers from.
+
+        Raises:
+            ConfigurationError: If *batch_size* or *poll_interval* is not
+                positive.
+
+        """
+        if batch_size <= 0:
+            raise ConfigurationError(f"batch_size must be positive, got {batch_size}")
+        if poll_interval <= 0:
+            raise ConfigurationError(f"poll_interval must be positive, got {poll_interval}")
+        self._outbox = outbox
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._on_error = on_error
+        self._delivered = 0
+
+    @property
+    def delivered(self) -> int:
+        """Return the number of messages acknowledged so far."""
+        return self._delivered
+
+    async def relay_once(self) -> int:
+        """Publish and acknowledge one batch of pending messages.
+
+        Returns:
+            The number of messages delivered; 0 if the outbox is empty.
+
+        Raises:
+            EventStoreError: If the outbox cannot be read or updated.
+            Exception: Whatever the publisher raises; the batch then
+                stays pending.
+
+        """
+        fetched = await self._outbox.fetch_pending(self._batch_size)
+        if not fetched.is_ok:
+            raise fetched.error
+        messages = fetched.value
+        if not messages:
+            return 0
+        await self._publisher.publish_many([message.event for message in messages])
+        marked = await self._outbox.mark_delivered([message.position for message in messages])
+        if not marked.is_ok:
+            raise marked.error
+        self._delivered += len(messages)
+        return len(messages)
+
+    async def drain(self) -> int:
+        """Relay batches until the outbox is empty.
+
+        Returns:
+            The number of messages delivered.
+
+        Raises:
+            EventStoreError: If the outbox cannot be read or updated.
+            Exception: Whatever the publisher raises.
+
+        """
+        total = 0
+        while delivered := await self.relay_once():
+            total += delivered
+        return total
+
+    async def run(self) -> None:
+        """Relay forever; cancel the task to stop.
+
+        Full batches are relayed back to back. After a partial batch, an
+        empty outbox or a failure the relay sleeps for the poll
+        interval. Failures are passed to *on_error* and retried.
+        """
+        while True:
+            try:
+                delivered = await self.relay_once()
+            except Exception as exc:
+                if self._on_error is not None:
+                    self._on_error(exc)
+                delivered = 0
+            if delivered < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
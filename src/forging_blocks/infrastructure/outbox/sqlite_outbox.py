@@ -0,0 +1,192 @@
+"""Durable, SQLite-backed implementation of the OutboxPort port.
+
+Events are encoded with a ``MessageCodec`` producing ``dict[str, object]``
+(typically `DictMessageCodec`), serialized as compact JSON and stored in
+an ``outbox`` table of a stdlib ``sqlite3`` database::
+
+    position INTEGER PRIMARY KEY | body BLOB
+
+Delivered messages are deleted, so the table only holds pending ones
+and reading the oldest is a short scan of the primary key. As with
+`SqliteEventStore`, the database runs in WAL mode and every statement
+runs on one dedicated worker thread owning the connection.
+
+Opened on the database of a `SqliteEventStore` created with
+``outbox=True``, it serves the rows the store inserts in the same
+transaction as the events, which makes it a transactional outbox.
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.outbox_port import OutboxMessage, OutboxPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.result import Err, Ok, Result
+from forging_blocks.infrastructure.event_stores.helpers.json_event_codec import JsonEventCodec
+from forging_blocks.infrastructure.outbox.sqlite_outbox_table import (
+    OUTBOX_INSERT,
+    OUTBOX_SCHEMA,
+)
+from forging_blocks.infrastructure.serialization import MessageCodec
+
+_SELECT_PENDING = "SELECT position, body FROM outbox ORDER BY position LIMIT ?"
+_DELETE = "DELETE FROM outbox WHERE position = ?"
+_DEFAULT_BUSY_TIMEOUT = 5.0
+
+
+class SqliteOutbox[EventPayloadType](OutboxPort[EventPayloadType]):
+    """Outbox persisted to a SQLite database in WAL mode.
+
+    ``add`` inserts all events of a commit with ``executemany`` in one
+    transaction; ``mark_delivered`` deletes the acknowledged rows the
+    same way. Positions come from ``AUTOINCREMENT`` and are never
+    reused, even after the table was emptied.
+
+    Attributes:
+        _codec: Turns events into JSON bodies and back.
+        _executor: Single worker thread owning the connection.
+        _connection: Connection used by the worker thread only.
+
+    Example:
+        ```python
+        outbox = SqliteOutbox[dict[str, object]](
+            "/var/lib/orders/outbox.db",
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[OrderPlaced],
+        )
+        await outbox.add([OrderPlaced(order_id="42")])
+        pending = (await outbox.fetch_pending(limit=100)).value
+        outbox.close()
+        ```
+    """
+
+    __slots__ = ("_codec", "_connection", "_executor")
+
+    def __init__(
+        self,
+        path: Path | str,
+        codec: MessageCodec[Event[EventPayloadType], dict[str, object]],
+        event_types: Iterable[type[Event[EventPayloadType]]],
+        *,
+        fsync: bool = True,
+        busy_timeout: float = _DEFAULT_BUSY_TIMEOUT,
+    ) -> None:
+        """Open (or create) the database and its schema.
+
+        Args:
+            path: Database file. Created if missing; ``":memory:"`` gives a
+                private, non-durable database.
+            codec: Codec used to encode and decode events.
+            event_types: Event classes that may appear in the outbox.
+                They are resolved by class name, which is what
+                ``MessageMetadata.message_type`` records by default.
+            fsync: Whether every commit is synced to stable storage
+                (``synchronous=FULL``) or only at checkpoints
+                (``synchronous=NORMAL``).
+            busy_timeout: Seconds to wait for a lock held by another
+                connection before failing.
+
+        Raises:
+            EventStoreError: If the database cannot be opened.
+
+        """
+        self._codec = JsonEventCodec(codec, event_types)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-outbox")
+        try:
+            self._connection = self._executor.submit(
+                self._connect, str(path), fsync, busy_timeout
+            ).result()
+        except sqlite3.Error as exc:
+            self._executor.shutdown()
+            raise EventStoreError(f"Failed to open outbox database: {exc}") from exc
+
+    async def add(self, events: Sequence[Event[EventPayloadType]]) -> Result[None, EventStoreError]:
+        """Store *events* as pending messages in one transaction.
+
+        Args:
+            events: Events to publish later.
+
+        Returns:
+            ``Ok(None)``, or an ``EventStoreError`` if encoding or the
+            write fails.
+
+        """
+        try:
+            bodies = [(self._codec.encode(event),) for event in events]
+        except (TypeError, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to encode events: {exc}"))
+        try:
+            await self._run(self._write, OUTBOX_INSERT, bodies)
+        except sqlite3.Error as exc:
+            return Err(EventStoreError(f"Failed to add events to the outbox: {exc}"))
+        return Ok(None)
+
+    async def fetch_pending(
+        self, limit: int
+    ) -> Result[Sequence[OutboxMessage[EventPayloadType]], EventStoreError]:
+        """Return up to *limit* undelivered messages, oldest first.
+
+        Raises:
+            ValueError: If *limit* is not positive.
+
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        try:
+            return Ok(await self._run(self._read, limit))
+        except EventStoreError as exc:
+            return Err(exc)
+        except (sqlite3.Error, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to read the outbox: {exc}"))
+
+    async def mark_delivered(self, positions: Sequence[int]) -> Result[None, EventStoreError]:
+        """Delete the messages at *positions* in one transaction.
+
+        Returns:
+            ``Ok(None)``, or an ``EventStoreError`` if the write fails.
+
+        """
+        try:
+            await self._run(self._write, _DELETE, [(position,) for position in positions])
+        except sqlite3.Error as exc:
+            return Err(EventStoreError(f"Failed to acknowledge outbox messages: {exc}"))
+        return Ok(None)
+
+    def close(self) -> None:
+        """Close the connection and stop the worker thread."""
+        self._executor.submit(self._connection.close).result()
+        self._executor.shutdown()
+
+    async def _run[**P, R](self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    @staticmethod
+    def _connect(path: str, fsync: bool, busy_timeout: float) -> sqlite3.Connection:
+        connection = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+        connection.executescript(OUTBOX_SCHEMA)
+        return connection
+
+    def _write(self, statement: str, rows: Sequence[tuple[object]]) -> None:
+        if not rows:
+            return
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(statement, rows)
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    def _read(self, limit: int) -> list[OutboxMessage[EventPayloadType]]:
+        rows = self._connection.execute(_SELECT_PENDING, (limit,))
+        return [OutboxMessage(position, self._codec.decode(body)) for position, body in rows]
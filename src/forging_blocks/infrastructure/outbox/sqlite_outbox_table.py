@@ -0,0 +1,14 @@
+"""SQLite ``outbox`` table shared by `SqliteOutbox` and `SqliteEventStore`.
+
+`SqliteEventStore` created with ``outbox=True`` inserts into this table
+in the transaction that appends the events; `SqliteOutbox` opened on the
+same database file reads and acknowledges the rows.
+"""
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    body BLOB NOT NULL
+);
+"""
+OUTBOX_INSERT = "INSERT INTO outbox (body) VALUES (?)"
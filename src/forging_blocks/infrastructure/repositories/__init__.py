@@ -1,12 +1,14 @@
 """In-memory repository implementations for the infrastructure layer."""
 
 from .aggregate_repository import AggregateRepository
+from .batching_read_repository import BatchingReadRepository
 from .in_memory_read_repository import InMemoryReadRepository
 from .in_memory_repository import InMemoryRepository
 from .in_memory_write_repository import InMemoryWriteRepository
 
 __all__ = [
     "AggregateRepository",
+    "BatchingReadRepository",
     "InMemoryReadRepository",
     "InMemoryRepository",
     "InMemoryWriteRepository",
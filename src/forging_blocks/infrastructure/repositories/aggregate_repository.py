@@ -1,16 +1,39 @@
 """Aggregate RepositoryPort implementation.
 
 Provides a repository specifically designed for AggregateRoot persistence
-with event sourcing support.
+with event sourcing support and optional snapshotting.
 """
 
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import UUID
 
+from forging_blocks.application.ports.outbound.event_store_port import (
+    EventStorePort,
+    StreamAppend,
+)
+from forging_blocks.application.ports.outbound.snapshot_store_port import (
+    Snapshot,
+    SnapshotStorePort,
+)
 from forging_blocks.domain.aggregate_root.aggregate_root import AggregateRoot
+from forging_blocks.domain.aggregate_root.aggregate_version import AggregateVersion
+from forging_blocks.domain.aggregate_root.snapshottable_aggregate_root import (
+    SnapshottableAggregateRoot,
+)
 from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.caching.bounded_cache import BoundedCache, CacheStats
 from forging_blocks.infrastructure.event_stores.event_store_base import EventStoreBase
 from forging_blocks.infrastructure.repositories.in_memory_repository import InMemoryRepository
+from forging_blocks.infrastructure.snapshots.snapshot_policy import (
+    EventCountSnapshotPolicy,
+    SnapshotPolicy,
+)
+
+_DEFAULT_SNAPSHOT_EVERY = 100
 
 
 class AggregateRepository[
@@ -22,6 +45,26 @@ class AggregateRepository[
     Coordinates event store writes with in-memory snapshot caching
     for AggregateRoot subtypes.
 
+    When a ``SnapshotStorePort`` is supplied, loading an aggregate that is
+    not cached starts from its latest stored snapshot and replays only
+    the events appended after it. After each save the ``SnapshotPolicy``
+    decides whether a new snapshot is written. The aggregate type must
+    then derive from ``SnapshottableAggregateRoot``.
+
+    By default every saved or loaded aggregate stays cached for the
+    lifetime of the repository. Pass a ``BoundedCache`` to cap the cache
+    with LRU or LFU eviction and an optional TTL; evicted aggregates are
+    simply reloaded from the event store (and snapshot store) on the next
+    access, and `cache_stats` reports hits, misses and evictions.
+
+    With ``stream_batch_size`` set, aggregates are replayed from
+    ``stream_events`` batch by batch instead of from one fully loaded
+    event list, which bounds peak memory for very long streams.
+
+    `save_all` persists many aggregates with a single ``append_batch``
+    call on an ``EventStorePort``, so either all of their events are
+    stored or none are.
+
     Type Parameters:
         EventPayloadType: The event payload type tracked by the event store.
             Flows through the public generic interface.
@@ -78,27 +121,74 @@ class AggregateRepository[
         ```
     """
 
-    _event_store: EventStoreBase[EventPayloadType]
+    _event_store: EventStoreBase[EventPayloadType] | EventStorePort[EventPayloadType]
 
     def __init__(
         self,
-        event_store: EventStoreBase[EventPayloadType],
+        event_store: EventStoreBase[EventPayloadType] | EventStorePort[EventPayloadType],
         aggregate_type: type[TAggregateRoot],
         storage: dict[TId, TAggregateRoot] | None = None,
+        snapshot_store: SnapshotStorePort | None = None,
+        snapshot_policy: SnapshotPolicy | None = None,
+        cache: BoundedCache[TId, TAggregateRoot] | None = None,
+        stream_batch_size: int | None = None,
     ) -> None:
         """Initialize the aggregate repository.
 
         Args:
-            event_store: The event store for persisting domain events.
+            event_store: The event store for persisting domain events —
+                either an ``EventStoreBase`` or an ``EventStorePort``
+                implementation such as ``FileEventStore``.
             aggregate_type: The aggregate root class. Used via
                 its ``reconstitute`` classmethod when an aggregate
                 must be rebuilt from stored events.
             storage: Optional in-memory storage for aggregate snapshots.
+            snapshot_store: Optional store for persisted snapshots. When
+                omitted, aggregates are always replayed from their first
+                event.
+            snapshot_policy: Decides when a snapshot is written after a
+                save. Defaults to snapshotting every 100 events when a
+                *snapshot_store* is given.
+            cache: Optional bounded cache replacing the unbounded
+                in-memory storage. Entries from *storage* are copied into
+                it.
+            stream_batch_size: When given, replay aggregates from
+                ``stream_events`` in batches of this many events instead
+                of loading the whole stream at once.
+
+        Raises:
+            ConfigurationError: If *snapshot_store* is given but
+                *aggregate_type* is not a ``SnapshottableAggregateRoot``, or
+                if *stream_batch_size* is not positive.
 
         """
         super().__init__(storage)
         self._event_store = event_store
         self._aggregate_type = aggregate_type
+        if snapshot_store is not None and not issubclass(
+            aggregate_type, SnapshottableAggregateRoot
+        ):
+            raise ConfigurationError(
+                f"{aggregate_type.__name__} must derive from SnapshottableAggregateRoot "
+                "to use snapshots"
+            )
+        if stream_batch_size is not None and stream_batch_size <= 0:
+            raise ConfigurationError(f"stream_batch_size must be positive, got {stream_batch_size}")
+        self._snapshot_store = snapshot_store
+        self._stream_batch_size = stream_batch_size
+        self._snapshot_policy = snapshot_policy or EventCountSnapshotPolicy(_DEFAULT_SNAPSHOT_EVERY)
+        self._snapshot_marks: dict[TId, tuple[int, datetime]] = {}
+        self._replay_seconds: dict[TId, float] = {}
+        self._cache = cache
+        if cache is not None:
+            cache.update(self._storage)
+            cache.add_removal_listener(self._forget)
+            self._storage = cache
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Return the counters of the bounded cache, or ``None`` if unbounded."""
+        return self._cache.stats if self._cache is not None else None
 
     async def save(self, aggregate: TAggregateRoot) -> None:
         """Save an aggregate and its uncommitted events.
@@ -115,6 +205,11 @@ class AggregateRepository[
         cross-TypeVar-bound relationship (see PEP 695, pyright
         ``reportGeneralTypeIssues``).
 
+        When snapshots are enabled and the snapshot policy asks for it, a
+        snapshot is written after the events. A failed snapshot write does
+        not fail the save: the events are already durable and a later save
+        tries again.
+
         Args:
             aggregate: The aggregate to save.
 
@@ -132,14 +227,51 @@ class AggregateRepository[
             )
             if not result.is_ok:
                 raise result.error
-        await super().save(aggregate)
+        await self._store(aggregate, bool(events))
+
+    async def save_all(self, aggregates: Sequence[TAggregateRoot]) -> None:
+        """Save several aggregates with one batched event store write.
+
+        With an ``EventStorePort`` the uncommitted events of all
+        *aggregates* are written through a single ``append_batch`` call:
+        every expected version is checked first and either every stream
+        is appended or none is. Stores derived from ``EventStoreBase``
+        fall back to saving the aggregates one by one.
+
+        Args:
+            aggregates: Aggregates to save; each may appear only once.
+
+        Raises:
+            EventStoreError: If the batched write fails (e.g., concurrency
+                conflict on any aggregate, I/O error). No aggregate is
+                cached as saved in that case.
+
+        """
+        if not isinstance(self._event_store, EventStorePort):
+            for aggregate in aggregates:
+                await self.save(aggregate)
+            return
+
+        appends: list[StreamAppend[EventPayloadType]] = []
+        for aggregate in aggregates:
+            events = cast(list[Event[EventPayloadType]], aggregate.uncommitted_changes)
+            if events and aggregate.id is not None:
+                appends.append((aggregate.id, events, aggregate.version.value - len(events)))
+        if appends:
+            result = await self._event_store.append_batch(appends)
+            if not result.is_ok:
+                raise result.error
+        written = {aggregate_id for aggregate_id, _, _ in appends}
+        for aggregate in aggregates:
+            await self._store(aggregate, aggregate.id in written)
 
     async def get_by_id(self, entity_id: TId) -> TAggregateRoot | None:
         """Retrieve an aggregate by ID and replay its events.
 
         Checks the in-memory cache first; if not cached, replays the
         aggregate from the event store and caches the result so subsequent
-        reads avoid a full replay.
+        reads avoid a full replay. With a snapshot store, replay starts
+        from the latest snapshot and reads only the events after it.
 
         Args:
             entity_id: Unique identifier of the aggregate.
@@ -148,25 +280,116 @@ class AggregateRepository[
             The retrieved aggregate or None if not found.
 
         Raises:
-            EventStoreError: If the event store read fails. Callers can
-                distinguish infrastructure failures from "not found" (None).
+            EventStoreError: If the event store or snapshot store read
+                fails. Callers can distinguish infrastructure failures from
+                "not found" (None).
 
         """
         aggregate = await super().get_by_id(entity_id)
         if aggregate is not None:
             return aggregate
 
-        result = await self._event_store.get_events(cast(UUID, entity_id))
+        snapshot = await self._latest_snapshot(entity_id)
+        if self._stream_batch_size is None:
+            aggregate = await self._replay(entity_id, snapshot)
+        else:
+            aggregate = await self._replay_stream(entity_id, snapshot, self._stream_batch_size)
+        if aggregate is None:
+            return None
+
+        if snapshot is not None:
+            self._snapshot_marks[entity_id] = (snapshot.version, snapshot.taken_at)
+        await super().save(aggregate)
+
+        return aggregate
+
+    async def _replay(self, entity_id: TId, snapshot: Snapshot | None) -> TAggregateRoot | None:
+        if snapshot is None:
+            result = await self._event_store.get_events(cast(UUID, entity_id))
+        else:
+            result = await self._event_store.get_events(
+                cast(UUID, entity_id), from_version=snapshot.version
+            )
 
         if not result.is_ok:
             raise result.error
 
         events = result.value
 
-        if not events:
-            return None
+        started = time.perf_counter()
+        if snapshot is None:
+            if not events:
+                return None
+            aggregate = self._aggregate_type.reconstitute(entity_id, events)
+        else:
+            aggregate = self._restore(entity_id, snapshot, events)
+        self._replay_seconds[entity_id] = time.perf_counter() - started
+        return aggregate
+
+    async def _replay_stream(
+        self, entity_id: TId, snapshot: Snapshot | None, batch_size: int
+    ) -> TAggregateRoot | None:
+        from_version = snapshot.version if snapshot is not None else None
+        batches = self._event_store.stream_events(cast(UUID, entity_id), from_version, batch_size)
+
+        started = time.perf_counter()
+        if snapshot is None:
+            aggregate = await self._aggregate_type.reconstitute_stream(entity_id, batches)
+            if aggregate.version.value == 0:
+                return None
+        else:
+            aggregate = self._restore(entity_id, snapshot, ())
+            async for batch in batches:
+                for event in batch:
+                    aggregate.replay(event)
+        self._replay_seconds[entity_id] = time.perf_counter() - started
+        return aggregate
 
-        aggregate = self._aggregate_type.reconstitute(entity_id, events)
+    def _restore(
+        self, entity_id: TId, snapshot: Snapshot, events: Sequence[Event[EventPayloadType]]
+    ) -> TAggregateRoot:
+        # Only reached with a snapshot store, which __init__ accepts for
+        # SnapshottableAggregateRoot subtypes alone.
+        aggregate_type = cast(
+            type[SnapshottableAggregateRoot[UUID, EventPayloadType]], self._aggregate_type
+        )
+        aggregate = aggregate_type.from_snapshot(
+            entity_id, AggregateVersion(snapshot.version), snapshot.state, events
+        )
+        return cast(TAggregateRoot, aggregate)
+
+    async def _store(self, aggregate: TAggregateRoot, appended: bool) -> None:
         await super().save(aggregate)
+        if appended and self._snapshot_store is not None:
+            await self._snapshot_if_due(aggregate, self._snapshot_store)
 
-        return aggregate
+    def _forget(self, entity_id: TId) -> None:
+        self._snapshot_marks.pop(entity_id, None)
+        self._replay_seconds.pop(entity_id, None)
+
+    async def _latest_snapshot(self, entity_id: TId) -> Snapshot | None:
+        if self._snapshot_store is None:
+            return None
+        result = await self._snapshot_store.get_latest_snapshot(cast(UUID, entity_id))
+        if not result.is_ok:
+            raise result.error
+        return result.value
+
+    async def _snapshot_if_due(
+        self, aggregate: TAggregateRoot, snapshot_store: SnapshotStorePort
+    ) -> None:
+        entity_id = cast(TId, aggregate.id)
+        version = aggregate.version.value
+        mark = self._snapshot_marks.get(entity_id)
+        covered = mark[0] if mark is not None else 0
+        age = (datetime.now(UTC) - mark[1]).total_seconds() if mark is not None else None
+        if not self._snapshot_policy.should_snapshot(
+            version - covered, age, self._replay_seconds.get(entity_id)
+        ):
+            return
+        state = cast(SnapshottableAggregateRoot[UUID, Any], aggregate).snapshot_state()
+        snapshot = Snapshot(cast(UUID, entity_id), version, state)
+        result = await snapshot_store.save_snapshot(snapshot)
+        if result.is_ok:
+            self._snapshot_marks[entity_id] = (version, snapshot.taken_at)
+            self._replay_seconds.pop(entity_id, None)
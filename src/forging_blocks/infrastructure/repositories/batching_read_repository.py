@@ -0,0 +1,79 @@
+"""Read repository decorator batching ``get_by_id`` calls.
+
+`BatchingReadRepository` routes ``get_by_id`` through a `BatchLoader`
+backed by the wrapped repository's ``get_many``, so N concurrent
+lookups (the N+1 pattern of query handlers resolving related entities)
+cost one bulk read.
+"""
+
+from collections.abc import Hashable, Mapping, Sequence
+
+from forging_blocks.application.ports.outbound.repository_port import ReadOnlyRepositoryPort
+from forging_blocks.infrastructure.batching.batch_loader import BatchLoader
+
+
+class BatchingReadRepository[TReadAggregateRoot, TId: Hashable](
+    ReadOnlyRepositoryPort[TReadAggregateRoot, TId]
+):
+    """Read repository coalescing concurrent ``get_by_id`` calls.
+
+    Lookups issued in the same event-loop tick, or within *window*
+    seconds, are resolved with one ``get_many`` call on the wrapped
+    repository. ``get_many`` and ``list_all`` are passed through.
+
+    Attributes:
+        _inner: Repository answering the bulk reads.
+        _loader: Loader collecting the lookups.
+
+    Example:
+        ```python
+        customers = BatchingReadRepository(SqlCustomerReadRepository(pool))
+
+
+        async def handle(query: ListOrders) -> list[OrderView]:
+            orders = await order_repository.list_all()
+            found = await asyncio.gather(*(customers.get_by_id(o.customer_id) for o in orders))
+            return [OrderView(o, c) for o, c in zip(orders, found)]  # one customer query
+        ```
+    """
+
+    __slots__ = ("_inner", "_loader")
+
+    def __init__(
+        self,
+        inner: ReadOnlyRepositoryPort[TReadAggregateRoot, TId],
+        window: float = 0.0,
+        max_batch_size: int | None = None,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            inner: Repository whose ``get_many`` resolves the batches.
+            window: Seconds to collect lookups before reading; 0 batches
+                the lookups of the current loop tick.
+            max_batch_size: Largest number of IDs per ``get_many`` call.
+
+        Raises:
+            ConfigurationError: If *window* or *max_batch_size* is
+                invalid.
+
+        """
+        self._inner = inner
+        self._loader = BatchLoader(inner.get_many, window, max_batch_size)
+
+    @property
+    def batches(self) -> int:
+        """Return the number of ``get_many`` calls issued for ``get_by_id``."""
+        return self._loader.batches
+
+    async def get_by_id(self, entity_id: TId) -> TReadAggregateRoot | None:
+        """Retrieve a resource by ID as part of the current batch."""
+        return await self._loader.load(entity_id)
+
+    async def get_many(self, entity_ids: Sequence[TId]) -> Mapping[TId, TReadAggregateRoot]:
+        """Retrieve several resources by ID with one call to the wrapped repository."""
+        return await self._inner.get_many(entity_ids)
+
+    async def list_all(self) -> Sequence[TReadAggregateRoot]:
+        """Retrieve all resources from the wrapped repository."""
+        return await self._inner.list_all()
@@ -5,7 +5,7 @@ query-side operations in CQRS architectures. Storage is a plain
 dictionary keyed by entity identifier.
 """
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping, MutableMapping, Sequence
 
 from forging_blocks.application.ports.outbound.repository_port import ReadOnlyRepositoryPort
 from forging_blocks.domain.specification import Specification
@@ -47,7 +47,7 @@ class InMemoryReadRepository[TEntity, TId](ReadOnlyRepositoryPort[TEntity, TId])
 
         """
         super().__init__()
-        self._storage: dict[TId, TEntity] = dict(storage) if storage is not None else {}
+        self._storage: MutableMapping[TId, TEntity] = dict(storage) if storage is not None else {}
 
     async def get_by_id(self, entity_id: TId) -> TEntity | None:
         """Retrieve an entity by ID.
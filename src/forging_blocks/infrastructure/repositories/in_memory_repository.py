@@ -4,7 +4,7 @@ Combines InMemoryReadRepository and InMemoryWriteRepository into a single
 class suitable for non-CQRS applications or simplified contexts.
 """
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
 from typing import Any
 
 from forging_blocks.foundation.identified import Identified
@@ -63,4 +63,4 @@ class InMemoryRepository[TEntity: Identified[Any], TId](
 
         """
         super().__init__()
-        self._storage: dict[TId, TEntity] = dict(storage) if storage is not None else {}
+        self._storage: MutableMapping[TId, TEntity] = dict(storage) if storage is not None else {}
@@ -4,7 +4,7 @@ Stores entities keyed by identifier, supporting insert, update, and
 delete operations with optimistic concurrency via etag versioning.
 """
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
 from typing import Any, cast
 
 from forging_blocks.application.ports.outbound.repository_port import WriteOnlyRepositoryPort
@@ -51,7 +51,7 @@ class InMemoryWriteRepository[TEntity: Identified[Any], TId](WriteOnlyRepository
 
         """
         super().__init__()
-        self._storage: dict[TId, TEntity] = dict(storage) if storage is not None else {}
+        self._storage: MutableMapping[TId, TEntity] = dict(storage) if storage is not None else {}
 
     async def delete_by_id(self, id: TId) -> None:
         """Delete an entity by ID.
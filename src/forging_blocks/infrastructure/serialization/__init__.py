@@ -1,10 +1,18 @@
 """Serialization infrastructure for the application.
 
 Provides abstract and concrete codecs for encoding/decoding messages
-to and from different representations.
+to and from different representations, plus an upcaster registry that
+migrates payloads stored with older schema versions.
 """
 
 from ._dict_message_codec import DictMessageCodec
 from ._message_codec import MessageCodec
+from ._upcaster_registry import INITIAL_SCHEMA_VERSION, PayloadUpcaster, UpcasterRegistry
 
-__all__ = ["DictMessageCodec", "MessageCodec"]
+__all__ = [
+    "INITIAL_SCHEMA_VERSION",
+    "DictMessageCodec",
+    "MessageCodec",
+    "PayloadUpcaster",
+    "UpcasterRegistry",
+]
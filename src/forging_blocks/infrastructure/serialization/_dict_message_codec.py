@@ -7,6 +7,7 @@ from uuid import UUID
 from forging_blocks.domain.messages import Message, MessageMetadata
 
 from ._message_codec import MessageCodec
+from ._upcaster_registry import INITIAL_SCHEMA_VERSION, UpcasterRegistry
 
 
 def _get_required(data: dict[str, object], key: str) -> object:
@@ -25,6 +26,11 @@ class DictMessageCodec[M: Message[dict[str, object]]](MessageCodec[M, dict[str,
     goes through the ``from_payload_fields`` classmethod that every
     concrete ``Message`` subclass provides.
 
+    With an `UpcasterRegistry`, encoded messages carry a
+    ``schema_version`` key and decoding first migrates older payloads to
+    the current schema through the registry's cached upcaster chains.
+    Messages stored without a ``schema_version`` are treated as version 1.
+
     Example:
         ```python
         class StubCommand[T](Message[T]):
@@ -61,20 +67,52 @@ class DictMessageCodec[M: Message[dict[str, object]]](MessageCodec[M, dict[str,
 
     """
 
+    __slots__ = ("_upcasters",)
+
+    def __init__(self, upcasters: UpcasterRegistry | None = None) -> None:
+        """Initialize the codec.
+
+        Args:
+            upcasters: Optional registry migrating payloads written with
+                an older schema version on decode.
+
+        """
+        self._upcasters = upcasters
+
     def encode(self, message: M) -> dict[str, object]:
-        """Encode *message* to a dictionary with ``metadata`` and ``payload`` keys."""
-        return {
+        """Encode *message* to a dictionary with ``metadata`` and ``payload`` keys.
+
+        With an upcaster registry a ``schema_version`` key holding the
+        message type's current version is added.
+        """
+        encoded: dict[str, object] = {
             "metadata": message.metadata.value,
             "payload": message.value,
         }
+        if self._upcasters is not None:
+            encoded["schema_version"] = self._upcasters.current_version(
+                message.metadata.message_type
+            )
+        return encoded
 
     def decode(self, data: dict[str, object], message_type: type[M]) -> M:
-        """Decode *data* back into a message of *message_type*."""
+        """Decode *data* back into a message of *message_type*.
+
+        Raises:
+            ValueError: If required metadata is missing, or the payload
+                cannot be upcast to the current schema version.
+
+        """
         raw_metadata = cast(dict[str, object], data["metadata"])
         payload = cast(dict[str, object], data.get("payload", {}))
+        type_name = str(raw_metadata.get("message_type", message_type.__name__))
+
+        if self._upcasters is not None:
+            schema_version = int(cast(int, data.get("schema_version", INITIAL_SCHEMA_VERSION)))
+            payload = self._upcasters.upcast(type_name, schema_version, payload)
 
         metadata = MessageMetadata(
-            message_type=str(raw_metadata.get("message_type", message_type.__name__)),
+            message_type=type_name,
             message_id=UUID(
                 str(_get_required(raw_metadata, "message_id")),
             ),
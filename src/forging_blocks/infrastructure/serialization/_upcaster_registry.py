@@ -0,0 +1,130 @@
+"""Registry of payload upcasters that migrate stored messages to their current schema."""
+
+from collections.abc import Callable
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+type PayloadUpcaster = Callable[[dict[str, object]], dict[str, object]]
+"""Transforms a payload from one schema version to the next."""
+
+INITIAL_SCHEMA_VERSION = 1
+"""Schema version assumed for messages stored without one."""
+
+
+def _identity(payload: dict[str, object]) -> dict[str, object]:
+    return payload
+
+
+def _compose(steps: tuple[PayloadUpcaster, ...]) -> PayloadUpcaster:
+    def chain(payload: dict[str, object]) -> dict[str, object]:
+        payload = dict(payload)
+        for step in steps:
+            payload = step(payload)
+        return payload
+
+    return chain
+
+
+class UpcasterRegistry:
+    """Upcasters keyed by ``(message_type, schema_version)``.
+
+    Each registered upcaster lifts a payload from ``from_version`` to
+    ``from_version + 1``. The current schema version of a message type is
+    one past its highest registered upcaster. The chain leading from a
+    given version to the current one is composed the first time it is
+    needed and cached, so decoding an old message costs one dictionary
+    lookup and one call regardless of how many upcasters it passes
+    through. Registering a new upcaster drops the cached chains of that
+    message type.
+
+    Attributes:
+        _upcasters: Single-step upcasters per message type and source
+            version.
+        _current_versions: Current schema version per message type.
+        _chains: Composed upcasters per message type and source version.
+
+    Example:
+        ```python
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, lambda p: {**p, "currency": "EUR"})
+        registry.register("OrderPlaced", 2, lambda p: {**p, "total": int(p.pop("amount"))})
+
+        codec = DictMessageCodec[OrderPlaced](upcasters=registry)
+        registry.current_version("OrderPlaced")  # 3
+        ```
+    """
+
+    __slots__ = ("_chains", "_current_versions", "_upcasters")
+
+    def __init__(self) -> None:
+        self._upcasters: dict[str, dict[int, PayloadUpcaster]] = {}
+        self._current_versions: dict[str, int] = {}
+        self._chains: dict[tuple[str, int], PayloadUpcaster] = {}
+
+    def register(self, message_type: str, from_version: int, upcaster: PayloadUpcaster) -> None:
+        """Register *upcaster* lifting *message_type* from *from_version* to the next version.
+
+        Args:
+            message_type: Name recorded in ``MessageMetadata.message_type``,
+                by default the message class name.
+            from_version: Schema version the upcaster accepts.
+            upcaster: Function returning the payload in the next version.
+                It may mutate and return its argument: `upcast` hands the
+                chain a shallow copy of the caller's payload.
+
+        Raises:
+            ConfigurationError: If *from_version* is lower than the
+                initial schema version or an upcaster is already
+                registered for it.
+
+        """
+        if from_version < INITIAL_SCHEMA_VERSION:
+            raise ConfigurationError(
+                f"from_version must be at least {INITIAL_SCHEMA_VERSION}, got {from_version}"
+            )
+        steps = self._upcasters.setdefault(message_type, {})
+        if from_version in steps:
+            raise ConfigurationError(
+                f"An upcaster for {message_type} version {from_version} is already registered"
+            )
+        steps[from_version] = upcaster
+        self._current_versions[message_type] = max(steps) + 1
+        self._chains = {key: chain for key, chain in self._chains.items() if key[0] != message_type}
+
+    def current_version(self, message_type: str) -> int:
+        """Return the schema version new messages of *message_type* are written with."""
+        return self._current_versions.get(message_type, INITIAL_SCHEMA_VERSION)
+
+    def upcast(
+        self, message_type: str, schema_version: int, payload: dict[str, object]
+    ) -> dict[str, object]:
+        """Return *payload* migrated from *schema_version* to the current version.
+
+        *payload* itself is left untouched; upcasters run on a shallow
+        copy of it. Nested values are shared with the copy.
+
+        Raises:
+            ValueError: If *schema_version* is newer than the current
+                version or an upcaster is missing along the way.
+
+        """
+        key = (message_type, schema_version)
+        chain = self._chains.get(key)
+        if chain is None:
+            chain = self._chains[key] = self._build_chain(message_type, schema_version)
+        return chain(payload)
+
+    def _build_chain(self, message_type: str, schema_version: int) -> PayloadUpcaster:
+        current = self.current_version(message_type)
+        if schema_version > current:
+            raise ValueError(
+                f"{message_type} schema version {schema_version} is newer than the "
+                f"current version {current}"
+            )
+        if schema_version == current:
+            return _identity
+        steps = self._upcasters.get(message_type, {})
+        missing = [version for version in range(schema_version, current) if version not in steps]
+        if missing:
+            raise ValueError(f"No upcaster registered for {message_type} version {missing[0]}")
+        return _compose(tuple(steps[version] for version in range(schema_version, current)))
@@ -0,0 +1,19 @@
+"""Snapshot store implementations and snapshot policies."""
+
+from .file_snapshot_store import FileSnapshotStore
+from .in_memory_snapshot_store import InMemorySnapshotStore
+from .snapshot_policy import (
+    EventCountSnapshotPolicy,
+    IntervalSnapshotPolicy,
+    ReplayCostSnapshotPolicy,
+    SnapshotPolicy,
+)
+
+__all__ = [
+    "EventCountSnapshotPolicy",
+    "FileSnapshotStore",
+    "InMemorySnapshotStore",
+    "IntervalSnapshotPolicy",
+    "ReplayCostSnapshotPolicy",
+    "SnapshotPolicy",
+]
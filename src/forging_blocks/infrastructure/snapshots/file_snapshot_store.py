@@ -0,0 +1,143 @@
+"""Durable, file-backed implementation of the SnapshotStorePort port.
+
+Each aggregate's latest snapshot is stored as a small JSON document named
+after the aggregate id. Writes go to a temporary file which is then
+atomically renamed over the previous snapshot, so a crash never leaves a
+half-written snapshot behind. Snapshot state must be JSON-serializable.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import cast
+from uuid import UUID
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.snapshot_store_port import (
+    Snapshot,
+    SnapshotStorePort,
+)
+from forging_blocks.foundation.result import Err, Ok, Result
+
+
+class FileSnapshotStore(SnapshotStorePort):
+    """Snapshot store persisting one JSON file per aggregate.
+
+    Attributes:
+        _directory: Directory holding the snapshot files.
+        _fsync: Whether snapshot files are flushed to stable storage
+            before being renamed into place.
+
+    Example:
+        ```python
+        store = FileSnapshotStore("/var/lib/orders/snapshots")
+        aggregate_id = UUID("00000000-0000-0000-0000-000000000001")
+        await store.save_snapshot(Snapshot(aggregate_id, 10, {"total": 5}))
+        result = await store.get_latest_snapshot(aggregate_id)
+        ```
+    """
+
+    __slots__ = ("_directory", "_fsync")
+
+    def __init__(self, directory: Path | str, *, fsync: bool = True) -> None:
+        """Open (or create) the snapshot directory.
+
+        Args:
+            directory: Directory holding the snapshot files. Created if
+                missing.
+            fsync: Whether every snapshot is flushed to stable storage
+                before it replaces the previous one.
+
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+
+    async def save_snapshot(self, snapshot: Snapshot) -> Result[None, EventStoreError]:
+        """Persist *snapshot* unless a newer one is already stored.
+
+        Args:
+            snapshot: The snapshot to persist. Its state must be
+                JSON-serializable.
+
+        Returns:
+            ``Ok(None)`` on success, or an ``EventStoreError`` if the state
+            cannot be serialized or the write fails.
+
+        """
+        document = {
+            "aggregate_id": str(snapshot.aggregate_id),
+            "version": snapshot.version,
+            "taken_at": snapshot.taken_at.isoformat(),
+            "state": snapshot.state,
+        }
+        try:
+            data = json.dumps(document, separators=(",", ":")).encode()
+        except (TypeError, ValueError) as exc:
+            return Err(EventStoreError(f"Failed to encode snapshot: {exc}"))
+        try:
+            await asyncio.to_thread(self._write, snapshot.aggregate_id, snapshot.version, data)
+        except OSError as exc:
+            return Err(EventStoreError(f"Failed to write snapshot: {exc}"))
+        return Ok(None)
+
+    async def get_latest_snapshot(
+        self, aggregate_id: UUID
+    ) -> Result[Snapshot | None, EventStoreError]:
+        """Load the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+
+        Returns:
+            A ``Result`` containing the snapshot, ``None`` if there is none,
+            or an ``EventStoreError`` if the file cannot be read or parsed.
+
+        """
+        try:
+            return Ok(await asyncio.to_thread(self._read, aggregate_id))
+        except OSError as exc:
+            return Err(EventStoreError(f"Failed to read snapshot: {exc}"))
+        except (KeyError, TypeError, ValueError) as exc:
+            return Err(EventStoreError(f"Corrupt snapshot for aggregate {aggregate_id}: {exc}"))
+
+    def _path(self, aggregate_id: UUID) -> Path:
+        return self._directory / f"{aggregate_id}.json"
+
+    def _write(self, aggregate_id: UUID, version: int, data: bytes) -> None:
+        try:
+            current = self._read(aggregate_id)
+        except (KeyError, TypeError, ValueError):
+            current = None  # a corrupt snapshot is simply replaced
+        if current is not None and current.version > version:
+            return
+        path = self._path(aggregate_id)
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f"{path.stem}.", suffix=".tmp", dir=self._directory
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+                if self._fsync:
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def _read(self, aggregate_id: UUID) -> Snapshot | None:
+        try:
+            data = self._path(aggregate_id).read_bytes()
+        except FileNotFoundError:
+            return None
+        document = cast(dict[str, object], json.loads(data))
+        return Snapshot(
+            UUID(str(document["aggregate_id"])),
+            int(cast(int, document["version"])),
+            document["state"],
+            datetime.fromisoformat(str(document["taken_at"])),
+        )
@@ -0,0 +1,64 @@
+"""In-memory implementation of the SnapshotStorePort port.
+
+Keeps the latest ``Snapshot`` of each aggregate in a dictionary keyed by
+aggregate UUID. Suitable for testing and single-process applications.
+"""
+
+from uuid import UUID
+
+from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.snapshot_store_port import (
+    Snapshot,
+    SnapshotStorePort,
+)
+from forging_blocks.foundation.result import Ok, Result
+
+
+class InMemorySnapshotStore(SnapshotStorePort):
+    """Snapshot store backed by a dictionary.
+
+    Attributes:
+        _snapshots: Latest snapshot per aggregate.
+
+    Example:
+        ```python
+        store = InMemorySnapshotStore()
+        aggregate_id = UUID("00000000-0000-0000-0000-000000000001")
+        await store.save_snapshot(Snapshot(aggregate_id, 10, {"total": 5}))
+        result = await store.get_latest_snapshot(aggregate_id)
+        ```
+    """
+
+    __slots__ = ("_snapshots",)
+
+    def __init__(self) -> None:
+        self._snapshots: dict[UUID, Snapshot] = {}
+
+    async def save_snapshot(self, snapshot: Snapshot) -> Result[None, EventStoreError]:
+        """Store *snapshot* unless a newer one is already stored.
+
+        Args:
+            snapshot: The snapshot to store.
+
+        Returns:
+            ``Ok(None)``.
+
+        """
+        current = self._snapshots.get(snapshot.aggregate_id)
+        if current is None or current.version <= snapshot.version:
+            self._snapshots[snapshot.aggregate_id] = snapshot
+        return Ok(None)
+
+    async def get_latest_snapshot(
+        self, aggregate_id: UUID
+    ) -> Result[Snapshot | None, EventStoreError]:
+        """Return the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: The aggregate identifier.
+
+        Returns:
+            A ``Result`` containing the snapshot or ``None``.
+
+        """
+        return Ok(self._snapshots.get(aggregate_id))
@@ -0,0 +1,163 @@
+"""Policies deciding when a repository snapshots an aggregate.
+
+``AggregateRepository`` consults its ``SnapshotPolicy`` after every
+successful save. The policy sees how many events were appended since the
+last snapshot, how long ago that snapshot was taken, and how long the
+last replay of the aggregate took, and answers whether a new snapshot
+should be taken now.
+"""
+
+from abc import ABC, abstractmethod
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+
+
+class SnapshotPolicy(ABC):
+    """Decides whether an aggregate should be snapshotted after a save.
+
+    Example:
+        ```python
+        class NeverSnapshot(SnapshotPolicy):
+            def should_snapshot(
+                self,
+                events_since_snapshot: int,
+                seconds_since_snapshot: float | None,
+                replay_seconds: float | None,
+            ) -> bool:
+                return False
+        ```
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def should_snapshot(
+        self,
+        events_since_snapshot: int,
+        seconds_since_snapshot: float | None,
+        replay_seconds: float | None,
+    ) -> bool:
+        """Return whether a snapshot should be taken now.
+
+        Args:
+            events_since_snapshot: Events in the stream that are not yet
+                covered by a snapshot.
+            seconds_since_snapshot: Age of the latest snapshot, or ``None``
+                if the aggregate has never been snapshotted.
+            replay_seconds: Duration of the last replay of the aggregate
+                by this repository, or ``None`` if it was not replayed.
+
+        """
+        ...
+
+
+class EventCountSnapshotPolicy(SnapshotPolicy):
+    """Snapshot once *every* events have been appended since the last one.
+
+    Example:
+        ```python
+        policy = EventCountSnapshotPolicy(every=500)
+        ```
+    """
+
+    __slots__ = ("_every",)
+
+    def __init__(self, every: int) -> None:
+        """Initialize the policy.
+
+        Args:
+            every: Number of uncovered events that triggers a snapshot.
+
+        Raises:
+            ConfigurationError: If *every* is not positive.
+
+        """
+        if every <= 0:
+            raise ConfigurationError(f"every must be positive, got {every}")
+        self._every = every
+
+    def should_snapshot(
+        self,
+        events_since_snapshot: int,
+        seconds_since_snapshot: float | None,
+        replay_seconds: float | None,
+    ) -> bool:
+        """Return whether at least *every* events are uncovered."""
+        return events_since_snapshot >= self._every
+
+
+class IntervalSnapshotPolicy(SnapshotPolicy):
+    """Snapshot when the latest snapshot is older than *seconds*.
+
+    Aggregates that were never snapshotted are snapshotted on their first
+    save with new events.
+
+    Example:
+        ```python
+        policy = IntervalSnapshotPolicy(seconds=3600)
+        ```
+    """
+
+    __slots__ = ("_seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        """Initialize the policy.
+
+        Args:
+            seconds: Maximum snapshot age.
+
+        Raises:
+            ConfigurationError: If *seconds* is not positive.
+
+        """
+        if seconds <= 0:
+            raise ConfigurationError(f"seconds must be positive, got {seconds}")
+        self._seconds = seconds
+
+    def should_snapshot(
+        self,
+        events_since_snapshot: int,
+        seconds_since_snapshot: float | None,
+        replay_seconds: float | None,
+    ) -> bool:
+        """Return whether there are new events and the snapshot is stale."""
+        if events_since_snapshot <= 0:
+            return False
+        return seconds_since_snapshot is None or seconds_since_snapshot >= self._seconds
+
+
+class ReplayCostSnapshotPolicy(SnapshotPolicy):
+    """Snapshot when replaying the aggregate took longer than *seconds*.
+
+    Example:
+        ```python
+        policy = ReplayCostSnapshotPolicy(seconds=0.005)
+        ```
+    """
+
+    __slots__ = ("_seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        """Initialize the policy.
+
+        Args:
+            seconds: Replay duration above which a snapshot is taken.
+
+        Raises:
+            ConfigurationError: If *seconds* is not positive.
+
+        """
+        if seconds <= 0:
+            raise ConfigurationError(f"seconds must be positive, got {seconds}")
+        self._seconds = seconds
+
+    def should_snapshot(
+        self,
+        events_since_snapshot: int,
+        seconds_since_snapshot: float | None,
+        replay_seconds: float | None,
+    ) -> bool:
+        """Return whether there are new events and the last replay was too slow."""
+        if events_since_snapshot <= 0 or replay_seconds is None:
+            return False
+        return replay_seconds >= self._seconds
@@ -1,16 +1,28 @@
 """In-memory Unit of Work implementation.
 
 Provides an in-memory transactional boundary that coordinates changes across
-repositories and publishes domain events on successful commit.
+repositories and publishes domain events on successful commit. Given an
+event store, it also persists the events of every registered aggregate
+with one batched append on commit. Given an outbox, it defers publication
+to an outbox relay instead of publishing directly; the outbox is written
+after the append, not atomically with it.
 """
 
 from types import TracebackType
-from typing import Self
+from typing import Self, cast
+from uuid import UUID
 
 from forging_blocks.application.errors.unit_of_work_error import UnitOfWorkError
 from forging_blocks.application.ports.outbound.event_publisher_port import EventPublisherPort
+from forging_blocks.application.ports.outbound.event_store_port import (
+    EventStorePort,
+    StreamAppend,
+)
+from forging_blocks.application.ports.outbound.outbox_port import OutboxPort
 from forging_blocks.application.ports.outbound.unit_of_work_port import UnitOfWorkPort
 from forging_blocks.domain import AggregateRoot
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
 from forging_blocks.foundation.errors.core import ErrorMessage
 
 
@@ -22,6 +34,27 @@ class InMemoryUnitOfWork[IdType, EventPayloadType](UnitOfWorkPort):
     is handled by the repositories, while this class coordinates event
     publication and transactional consistency.
 
+    When constructed with an *event_store*, commit first writes the
+    uncommitted events of all registered aggregates through a single
+    ``append_batch`` call, so a transaction touching many aggregates
+    costs one store round trip. Aggregates must then be registered
+    instead of being saved through an event-sourced repository, and
+    their identities must be UUIDs.
+
+    When constructed with an *outbox*, commit writes the collected events
+    to the outbox right after persisting them and does not publish them;
+    an ``OutboxRelay`` publishes them later, at least once, so no
+    *event_publisher* may be given alongside it. A publisher
+    failure then no longer loses events that were already stored.
+
+    The outbox write is a separate call after ``append_batch``, not part
+    of its transaction. If it fails, the events are stored but never
+    queued, commit raises ``UnitOfWorkError`` and retrying the commit is
+    rejected with a ``ConcurrencyError``. For an atomic outbox, give a
+    ``SqliteEventStore`` created with ``outbox=True`` as *event_store*,
+    pass no *outbox* here and run the relay over a ``SqliteOutbox`` on
+    the same database.
+
     Example:
         ```python
         # Dependencies injected by the DI container
@@ -32,20 +65,67 @@ class InMemoryUnitOfWork[IdType, EventPayloadType](UnitOfWorkPort):
         async with InMemoryUnitOfWork(event_publisher) as uow:
             uow.register_modified(aggregate)
             await write_repo.save(aggregate)
+
+        # Batched persistence: one append for every registered aggregate
+        async with InMemoryUnitOfWork(event_publisher, event_store=store) as uow:
+            for aggregate in aggregates:
+                uow.register_modified(aggregate)
+
+        # Deferred publication through an outbox written after the append
+        async with InMemoryUnitOfWork(event_store=store, outbox=outbox) as uow:
+            uow.register_modified(aggregate)
+        await OutboxRelay(outbox, event_publisher).drain()
+
+        # Atomic: the store fills the outbox table in the append transaction
+        store = SqliteEventStore[OrderData]("orders.db", codec, event_types, outbox=True)
+        async with InMemoryUnitOfWork(event_store=store) as uow:
+            uow.register_modified(aggregate)
+        await OutboxRelay(
+            SqliteOutbox[OrderData]("orders.db", codec, event_types), publisher
+        ).drain()
         ```
     """
 
-    __slots__ = ("_committed", "_event_publisher", "_modified_aggregates", "_rolled_back")
+    __slots__ = (
+        "_committed",
+        "_event_publisher",
+        "_event_store",
+        "_modified_aggregates",
+        "_outbox",
+        "_rolled_back",
+    )
 
-    def __init__(self, event_publisher: EventPublisherPort[EventPayloadType] | None = None) -> None:
+    def __init__(
+        self,
+        event_publisher: EventPublisherPort[EventPayloadType] | None = None,
+        event_store: EventStorePort[EventPayloadType] | None = None,
+        outbox: OutboxPort[EventPayloadType] | None = None,
+    ) -> None:
         """Initialize the in-memory unit of work.
 
         Args:
             event_publisher: An optional EventPublisherPort for publishing
                 domain events collected from aggregates on commit.
+            event_store: An optional event store receiving the events of
+                all registered aggregates in one ``append_batch`` on
+                commit, before they are published.
+            outbox: An optional outbox receiving the collected events on
+                commit, after they were appended to *event_store*;
+                exclusive with *event_publisher*.
+
+        Raises:
+            ConfigurationError: If both *event_publisher* and *outbox*
+                are given.
 
         """
+        if event_publisher is not None and outbox is not None:
+            raise ConfigurationError(
+                "Pass either event_publisher or outbox: with an outbox, events are "
+                "published by an OutboxRelay"
+            )
         self._event_publisher = event_publisher
+        self._event_store = event_store
+        self._outbox = outbox
         self._modified_aggregates: dict[IdType, AggregateRoot[IdType, EventPayloadType]] = {}
         self._committed = False
         self._rolled_back = False
@@ -94,11 +174,17 @@ class InMemoryUnitOfWork[IdType, EventPayloadType](UnitOfWorkPort):
         """Commit all changes and publish collected domain events.
 
         Raises:
-            UnitOfWorkError: If commit fails.
+            UnitOfWorkError: If commit fails. When the batched append is
+                rejected nothing is published and the aggregates keep
+                their uncommitted events.
 
         """
         try:
-            await self._publish_events()
+            await self._persist_events()
+            if self._outbox is None:
+                await self._publish_events()
+            else:
+                await self._enqueue_events(self._outbox)
             self._clear_events()
             self._mark_committed()
         except Exception as exc:
@@ -109,14 +195,48 @@ class InMemoryUnitOfWork[IdType, EventPayloadType](UnitOfWorkPort):
         self._discard_all_events()
         self._mark_rolled_back()
 
+    async def _persist_events(self) -> None:
+        """Append the events of all modified aggregates in one batch."""
+        if self._event_store is None:
+            return
+
+        appends: list[StreamAppend[EventPayloadType]] = []
+        for aggregate in self._modified_aggregates.values():
+            events = aggregate.uncommitted_changes
+            if events:
+                expected_version = aggregate.version.value - len(events)
+                appends.append((cast(UUID, aggregate.id), events, expected_version))
+        if not appends:
+            return
+        result = await self._event_store.append_batch(appends)
+        if not result.is_ok:
+            raise result.error
+
     async def _publish_events(self) -> None:
-        """Publish all uncommitted events from modified aggregates."""
+        """Publish all uncommitted events from modified aggregates in one batch."""
         if self._event_publisher is None:
             return
 
-        for aggregate in self._modified_aggregates.values():
-            for event in aggregate.uncommitted_changes:
-                await self._event_publisher.publish(event)
+        events = self._collect_uncommitted()
+        if events:
+            await self._event_publisher.publish_many(events)
+
+    async def _enqueue_events(self, outbox: OutboxPort[EventPayloadType]) -> None:
+        """Write all uncommitted events from modified aggregates to the outbox."""
+        events = self._collect_uncommitted()
+        if not events:
+            return
+        result = await outbox.add(events)
+        if not result.is_ok:
+            raise result.error
+
+    def _collect_uncommitted(self) -> list[Event[EventPayloadType]]:
+        """Return the uncommitted events of all modified aggregates, in order."""
+        return [
+            event
+            for aggregate in self._modified_aggregates.values()
+            for event in aggregate.uncommitted_changes
+        ]
 
     def _clear_events(self) -> None:
         """Clear events from all modified aggregates."""
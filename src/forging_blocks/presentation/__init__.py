@@ -21,6 +21,8 @@ from the primary/adapter side. It includes:
   short-circuits on failure.
 """
 
+from forging_blocks.foundation.middleware import Middleware, NextHandler, Pipeline
+
 from .adapters.presentation_adapter import PresentationAdapter
 from .adapters.request_adapter import RequestAdapter
 from .adapters.response_adapter import ResponseAdapter
@@ -34,9 +36,6 @@ from .errors.error_message_model import ErrorMessageModel
 from .errors.error_presenter import ErrorPresenter
 from .errors.error_status_code_mapper import ErrorStatusCodeMapper
 from .errors.error_view_model import ErrorViewModel
-from .middleware.middleware import Middleware
-from .middleware.next_handler import NextHandler
-from .middleware.pipeline import Pipeline
 from .presenter_contract import PresenterPort
 
 __all__ = [
@@ -13,6 +13,7 @@ An optional ``Pipeline`` wraps the use case in cross-cutting middleware
 from dataclasses import replace
 from typing import TYPE_CHECKING, cast
 
+from forging_blocks.foundation.middleware.pipeline import Pipeline
 from forging_blocks.foundation.result import Result
 from forging_blocks.presentation.adapters.request_adapter import RequestAdapter
 from forging_blocks.presentation.adapters.response_adapter import ResponseAdapter
@@ -21,7 +22,6 @@ from forging_blocks.presentation.errors.error_status_code_mapper import (
     ErrorStatusCodeMapper,
 )
 from forging_blocks.presentation.errors.error_view_model import ErrorViewModel
-from forging_blocks.presentation.middleware.pipeline import Pipeline
 
 if TYPE_CHECKING:
     from forging_blocks.application.ports.inbound import UseCasePort
@@ -3,10 +3,10 @@
 from collections.abc import Callable
 
 from forging_blocks.application.ports.outbound.logger_port import LoggerPort
+from forging_blocks.foundation.middleware.middleware import Middleware
+from forging_blocks.foundation.middleware.next_handler import NextHandler
 from forging_blocks.presentation.errors.error_presenter import ErrorPresenter
 from forging_blocks.presentation.errors.error_view_model import ErrorViewModel
-from forging_blocks.presentation.middleware.middleware import Middleware
-from forging_blocks.presentation.middleware.next_handler import NextHandler
 
 
 class ErrorHandlingMiddleware[RequestType, ResponseType](Middleware[RequestType, ResponseType]):
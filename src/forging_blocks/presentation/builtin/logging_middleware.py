@@ -1,8 +1,8 @@
 """Middleware that logs each request before and after delegation."""
 
 from forging_blocks.application.ports.outbound.logger_port import LoggerPort
-from forging_blocks.presentation.middleware.middleware import Middleware
-from forging_blocks.presentation.middleware.next_handler import NextHandler
+from forging_blocks.foundation.middleware.middleware import Middleware
+from forging_blocks.foundation.middleware.next_handler import NextHandler
 
 
 class LoggingMiddleware[RequestType, ResponseType](Middleware[RequestType, ResponseType]):
@@ -3,8 +3,8 @@
 import time
 
 from forging_blocks.application.ports.outbound.logger_port import LoggerPort
-from forging_blocks.presentation.middleware.middleware import Middleware
-from forging_blocks.presentation.middleware.next_handler import NextHandler
+from forging_blocks.foundation.middleware.middleware import Middleware
+from forging_blocks.foundation.middleware.next_handler import NextHandler
 
 
 class TimingMiddleware[RequestType, ResponseType](Middleware[RequestType, ResponseType]):
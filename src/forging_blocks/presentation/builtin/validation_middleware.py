@@ -2,8 +2,8 @@
 
 from collections.abc import Callable
 
-from forging_blocks.presentation.middleware.middleware import Middleware
-from forging_blocks.presentation.middleware.next_handler import NextHandler
+from forging_blocks.foundation.middleware.middleware import Middleware
+from forging_blocks.foundation.middleware.next_handler import NextHandler
 
 
 class ValidationMiddleware[RequestType, ResponseType](Middleware[RequestType, ResponseType]):
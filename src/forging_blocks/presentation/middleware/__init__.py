@@ -1,12 +1,10 @@
-"""Middleware protocol and composition primitives.
+"""Middleware primitives, re-exported from ``forging_blocks.foundation.middleware``.
 
-Defines the ``Middleware`` structural protocol, the ``NextHandler`` type alias,
-and ``Pipeline`` for composing middleware into executable chains.
+The protocol and pipeline live in the foundation so every layer can
+compose middleware; this package keeps the presentation import path.
 """
 
-from .middleware import Middleware
-from .next_handler import NextHandler
-from .pipeline import Pipeline
+from forging_blocks.foundation.middleware import Middleware, NextHandler, Pipeline
 
 __all__ = [
     "Middleware",
@@ -1,10 +1,5 @@
-"""Next-handler type alias for the middleware pipeline.
+"""Re-export kept for the former import path; see ``forging_blocks.foundation.middleware``."""
 
-``NextHandler`` represents the callable that each middleware delegates
-to after performing its own processing. It accepts a request of type
-*RequestType* and returns an awaitable that resolves to *ResponseType*.
-"""
+from forging_blocks.foundation.middleware.next_handler import NextHandler
 
-from collections.abc import Awaitable, Callable
-
-type NextHandler[RequestType, ResponseType] = Callable[[RequestType], Awaitable[ResponseType]]
+__all__ = ["NextHandler"]
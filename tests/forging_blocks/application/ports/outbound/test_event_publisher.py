@@ -60,3 +60,12 @@ class TestEventPublisherPortContract:
 
         assert event in publisher.published
         assert len(publisher.published) == 1
+
+    async def test_publish_many_defaults_to_publishing_each_event_in_order(self) -> None:
+        """Implementations that only define ``publish`` inherit ``publish_many``."""
+        publisher = FakeEventPublisher()
+        events = [FakeEvent(), FakeEvent(), FakeEvent()]
+
+        await publisher.publish_many(events)
+
+        assert publisher.published == events
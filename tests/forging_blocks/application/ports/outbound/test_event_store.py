@@ -0,0 +1,131 @@
+"""Tests for the EventStorePort outbound port.
+
+These verify the default ``append_batch`` and ``stream_events`` built on
+``append_events`` and ``get_events``.
+"""
+
+from collections.abc import Sequence
+from uuid import UUID, uuid7
+
+import pytest
+
+from forging_blocks.application.errors import ConcurrencyError, EventStoreError
+from forging_blocks.application.ports.outbound.event_store_port import EventStorePort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.result import Ok, Result
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+class _ListEventStore(EventStorePort[dict[str, object]]):
+    """Minimal port implementation relying on the default batch methods."""
+
+    def __init__(self) -> None:
+        self.streams: dict[UUID, list[Event[dict[str, object]]]] = {}
+        self.reads = 0
+
+    async def append_events(
+        self,
+        aggregate_id: UUID,
+        events: Sequence[Event[dict[str, object]]],
+        expected_version: int | None = None,
+    ) -> Result[int, EventStoreError]:
+        stream = self.streams.setdefault(aggregate_id, [])
+        stream.extend(events)
+        return Ok(len(stream))
+
+    async def get_events(
+        self,
+        aggregate_id: UUID,
+        from_version: int | None = None,
+        to_version: int | None = None,
+    ) -> Result[Sequence[Event[dict[str, object]]], EventStoreError]:
+        stream = self.streams.get(aggregate_id, [])
+        start = from_version if from_version is not None else 0
+        end = to_version + 1 if to_version is not None else len(stream)
+        self.reads += 1
+        return Ok(stream[start:end])
+
+    async def get_current_version(self, aggregate_id: UUID) -> Result[int, EventStoreError]:
+        return Ok(len(self.streams.get(aggregate_id, [])))
+
+
+@pytest.mark.unit
+class TestEventStorePort:
+    """Contract tests for the EventStorePort default batch methods."""
+
+    def test_append_batch_is_not_abstract(self) -> None:
+        """Existing implementations inherit append_batch."""
+        assert "append_batch" not in EventStorePort.__abstractmethods__
+
+    async def test_append_batch_appends_every_stream(self) -> None:
+        """The default implementation returns each stream's new version."""
+        store = _ListEventStore()
+        first, second = uuid7(), uuid7()
+        await store.append_events(second, [FakeEventWithName("existing")])
+
+        result = await store.append_batch(
+            [
+                (first, [FakeEventWithName("a"), FakeEventWithName("b")], 0),
+                (second, [FakeEventWithName("c")], 1),
+            ]
+        )
+
+        assert result.is_ok
+        assert result.value == [2, 2]
+
+    async def test_append_batch_checks_all_versions_before_writing(self) -> None:
+        """A stale version anywhere in the batch leaves every stream untouched."""
+        store = _ListEventStore()
+        first, second = uuid7(), uuid7()
+
+        result = await store.append_batch(
+            [(first, [FakeEventWithName("a")], 0), (second, [FakeEventWithName("b")], 3)]
+        )
+
+        assert result.is_err
+        assert isinstance(result.error, ConcurrencyError)
+        assert store.streams == {}
+
+    async def test_append_batch_rejects_repeated_aggregate(self) -> None:
+        """An aggregate may appear only once per batch."""
+        store = _ListEventStore()
+        aggregate_id = uuid7()
+
+        result = await store.append_batch(
+            [
+                (aggregate_id, [FakeEventWithName("a")], None),
+                (aggregate_id, [FakeEventWithName("b")], None),
+            ]
+        )
+
+        assert result.is_err
+        assert store.streams == {}
+
+    async def test_stream_events_yields_bounded_batches(self) -> None:
+        """The stream is read window by window through get_events."""
+        store = _ListEventStore()
+        aggregate_id = uuid7()
+        await store.append_events(aggregate_id, [FakeEventWithName(f"e{i}") for i in range(7)])
+
+        batches = [batch async for batch in store.stream_events(aggregate_id, batch_size=3)]
+
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert store.reads == 3
+
+    async def test_stream_events_from_version_and_exact_multiple(self) -> None:
+        """A final empty window ends the stream without yielding it."""
+        store = _ListEventStore()
+        aggregate_id = uuid7()
+        await store.append_events(aggregate_id, [FakeEventWithName(f"e{i}") for i in range(6)])
+
+        batches = [batch async for batch in store.stream_events(aggregate_id, 2, batch_size=2)]
+
+        names = [[e.value["name"] for e in batch] for batch in batches]
+        assert names == [["e2", "e3"], ["e4", "e5"]]
+
+    async def test_stream_events_rejects_invalid_batch_size(self) -> None:
+        """batch_size must be positive."""
+        store = _ListEventStore()
+
+        with pytest.raises(ValueError, match="batch_size"):
+            await anext(store.stream_events(uuid7(), batch_size=0))
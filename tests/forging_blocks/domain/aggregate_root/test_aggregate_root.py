@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import Self
 
 import pytest
@@ -236,3 +237,26 @@ class TestAggregateRoot:
 
         with pytest.raises(RuntimeError, match="Replay failed"):
             _.reconstitute(1, events)
+
+    async def test_reconstitute_stream_when_called_then_replays_every_batch_in_order(
+        self,
+    ) -> None:
+        seen: list[str] = []
+
+        class _(AggregateRoot[int, raw_event]):
+            def __init__(self, aggregate_id: int) -> None:
+                super().__init__(aggregate_id)
+
+            def _handle(self, event: Event[raw_event]) -> None:
+                seen.append(event.value["name"])
+
+        async def batches() -> AsyncIterator[Sequence[Event[raw_event]]]:
+            yield [DummyEvent("a"), DummyEvent("b")]
+            yield [DummyEvent("c")]
+
+        aggregate = await _.reconstitute_stream(7, batches())
+
+        assert aggregate.id == 7
+        assert aggregate.version.value == 3
+        assert aggregate.uncommitted_changes == []
+        assert seen == ["a", "b", "c"]
@@ -0,0 +1,72 @@
+from typing import Self, cast
+
+import pytest
+
+from forging_blocks.domain import AggregateVersion, SnapshottableAggregateRoot
+from forging_blocks.domain.messages import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+
+raw_event = dict[str, str]
+
+
+class DummyEvent(Event[raw_event]):
+    def __init__(self, name: str, metadata: MessageMetadata | None = None) -> None:
+        super().__init__(metadata)
+        self.name = name
+
+    @property
+    def value(self) -> raw_event:
+        return {"name": self.name}
+
+    @property
+    def _payload(self) -> raw_event:
+        return {"name": self.name}
+
+    @classmethod
+    def from_payload_fields(cls, data: dict[str, object], metadata: MessageMetadata) -> Self:
+        return cls(name=str(data.get("name", "")), metadata=metadata)
+
+
+class NamesAggregate(SnapshottableAggregateRoot[int, raw_event]):
+    def __init__(self, aggregate_id: int) -> None:
+        super().__init__(aggregate_id)
+        self.names: list[str] = []
+
+    def snapshot_state(self) -> object:
+        return list(self.names)
+
+    def _restore_snapshot_state(self, state: object) -> None:
+        self.names = list(cast(list[str], state))
+
+    def _handle(self, event: Event[raw_event]) -> None:
+        self.names.append(event.value["name"])
+
+
+@pytest.mark.unit
+class TestSnapshottableAggregateRoot:
+    def test_from_snapshot_when_called_then_restores_state_and_replays_newer_events(
+        self,
+    ) -> None:
+        aggregate = NamesAggregate.from_snapshot(
+            1, AggregateVersion(2), ["a", "b"], [DummyEvent("c")]
+        )
+
+        assert aggregate.names == ["a", "b", "c"]
+        assert aggregate.version.value == 3
+        assert aggregate.uncommitted_changes == []
+        assert aggregate.snapshot_state() == ["a", "b", "c"]
+
+    def test_from_snapshot_when_no_events_then_keeps_snapshot_version(self) -> None:
+        aggregate = NamesAggregate.from_snapshot(1, AggregateVersion(5), ["a"], [])
+
+        assert aggregate.id == 1
+        assert aggregate.version == AggregateVersion(5)
+        assert aggregate.names == ["a"]
+
+    def test_init_when_hooks_not_implemented_then_raises_type_error(self) -> None:
+        class Incomplete(SnapshottableAggregateRoot[int, raw_event]):
+            def _handle(self, event: Event[raw_event]) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            cast(type[object], Incomplete)(1)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from forging_blocks.foundation.autoeq.helpers.eq_method_builder import EqMethodBuilder
+
+
+class _Record:
+    def __init__(self, **values: object) -> None:
+        for name, value in values.items():
+            setattr(self, name, value)
+
+
+class _OtherRecord(_Record):
+    pass
+
+
+class _Exploding:
+    def __eq__(self, other: object) -> bool:
+        raise AssertionError("compared after a mismatch")
+
+
+@pytest.mark.unit
+class TestEqMethodBuilder:
+    def test_eq_when_all_fields_match_then_true(self) -> None:
+        method = EqMethodBuilder.build(_Record, ("a", "b"))
+
+        assert method(_Record(a=1, b="x"), _Record(a=1, b="x")) is True
+
+    def test_eq_when_a_field_differs_then_false(self) -> None:
+        method = EqMethodBuilder.build(_Record, ("a", "b"))
+
+        assert method(_Record(a=1, b="x"), _Record(a=1, b="y")) is False
+
+    def test_eq_ignores_fields_not_listed(self) -> None:
+        method = EqMethodBuilder.build(_Record, ("a",))
+
+        assert method(_Record(a=1, b="x"), _Record(a=1, b="y")) is True
+
+    def test_eq_when_types_differ_then_false(self) -> None:
+        method = EqMethodBuilder.build(_Record, ("a",))
+
+        assert method(_Record(a=1), _OtherRecord(a=1)) is False
+
+    def test_eq_stops_at_the_first_mismatch(self) -> None:
+        method = EqMethodBuilder.build(_Record, ("a", "b"))
+
+        assert method(_Record(a=1, b=_Exploding()), _Record(a=2, b=_Exploding())) is False
+
+    def test_eq_compares_nan_like_all_with_equality(self) -> None:
+        nan = float("nan")
+        method = EqMethodBuilder.build(_Record, ("a",))
+
+        assert method(_Record(a=nan), _Record(a=nan)) is False
+
+    def test_eq_reads_non_identifier_fields_with_getattr(self) -> None:
+        method = EqMethodBuilder.build(_Record, ("not valid",))
+
+        assert method(_Record(**{"not valid": 1}), _Record(**{"not valid": 1})) is True
+
+    def test_build_names_the_method_after_the_class(self) -> None:
+        method = EqMethodBuilder.build(_Record, ())
+
+        assert method.__qualname__ == "_Record.__eq__"
+        assert method(_Record(), _Record()) is True
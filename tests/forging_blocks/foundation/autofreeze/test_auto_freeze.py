@@ -3,11 +3,17 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import Any
 
 import pytest
 
 from forging_blocks.foundation.autofreeze.auto_freeze import auto_freeze
+from forging_blocks.foundation.autofreeze.helpers.frozen_state import (
+    FrozenStateManager,
+    _SideEntry,
+)
 from forging_blocks.foundation.errors.cant_modify_immutable_attribute_error import (
     CantModifyImmutableAttributeError,
 )
@@ -297,49 +303,157 @@ class TestAutoFreezeDecorator:
 
 
 @pytest.mark.unit
-class TestFrozenStateManagerStaleFallback:
-    """Tests for FrozenStateManager stale fallback entry cleanup."""
+class TestFrozenStateManagerStorage:
+    """Tests for where FrozenStateManager keeps per-instance state."""
+
+    def test_instances_with_dict_keep_state_on_the_instance(self) -> None:
+        @auto_freeze
+        class Plain:
+            def __init__(self, value: int) -> None:
+                self.value = value
 
-    def test_read_is_frozen_when_stale_qualifier_then_deletes_entry_and_returns_false(
+        instance = Plain(1)
+
+        assert instance.__dict__["_autofreeze__frozen"] is True
+        assert id(instance) not in FrozenStateManager._side_table
+
+    def test_slotted_instances_with_state_slots_need_no_side_table(self) -> None:
+        @auto_freeze
+        class Slotted:
+            __slots__ = ("value", *FrozenStateManager.STATE_SLOTS)
+
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        instance = Slotted(1)
+
+        assert id(instance) not in FrozenStateManager._side_table
+        with pytest.raises(CantModifyImmutableAttributeError):
+            instance.value = 2
+
+    def test_side_table_entry_is_dropped_when_instance_is_collected(self) -> None:
+        @auto_freeze
+        class Slotted:
+            __slots__ = ("value", "__weakref__")
+
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        instance = Slotted(1)
+        key = id(instance)
+        assert key in FrozenStateManager._side_table
+
+        del instance
+        gc.collect()
+
+        assert key not in FrozenStateManager._side_table
+
+    def test_side_table_entry_is_dropped_when_init_ends_without_freeze(self) -> None:
+        class Slotted:
+            __slots__ = ("value",)
+
+        instance = Slotted()
+        FrozenStateManager.increment_init_depth(instance)
+        assert id(instance) in FrozenStateManager._side_table
+
+        assert FrozenStateManager.decrement_init_depth(instance) == 0
+
+        assert id(instance) not in FrozenStateManager._side_table
+
+    def test_read_is_frozen_when_entry_belongs_to_another_class_then_discards_it(
         self,
     ) -> None:
-        from forging_blocks.foundation.autofreeze.helpers.frozen_state import (
-            FrozenStateManager,
-        )
-
         class SomeClass:
-            pass
+            __slots__ = ()
 
         instance = SomeClass()
-        key = FrozenStateManager._fallback_key(instance)
-        FrozenStateManager._frozen_fallback[key] = ("WrongQualifier", True)
+        key = id(instance)
+        stale = _SideEntry("WrongQualifier")
+        stale._autofreeze__frozen = True
+        FrozenStateManager._side_table[key] = stale
 
         try:
-            result = FrozenStateManager._read_is_frozen(instance)
-            assert result is False
-            assert key not in FrozenStateManager._frozen_fallback
+            assert FrozenStateManager._read_is_frozen(instance) is False
+            assert key not in FrozenStateManager._side_table
         finally:
-            FrozenStateManager._frozen_fallback.pop(key, None)
-            FrozenStateManager._refs_by_id.pop(key, None)
+            FrozenStateManager._side_table.pop(key, None)
 
-    def test_read_frozen_attrs_when_stale_qualifier_then_deletes_entry_and_returns_none(
+    def test_read_frozen_attrs_when_weakref_points_elsewhere_then_discards_entry(
         self,
     ) -> None:
-        from forging_blocks.foundation.autofreeze.helpers.frozen_state import (
-            FrozenStateManager,
-        )
-
         class SomeClass:
-            pass
+            __slots__ = ("__weakref__",)
 
-        instance = SomeClass()
-        key = FrozenStateManager._fallback_key(instance)
-        FrozenStateManager._frozen_attrs_fallback[key] = ("WrongQualifier", {"x", "y"})
+        instance, other = SomeClass(), SomeClass()
+        key = id(instance)
+        stale = _SideEntry(SomeClass.__qualname__)
+        stale.ref = weakref.ref(other)
+        stale._autofreeze__frozen_attrs = {"x"}
+        FrozenStateManager._side_table[key] = stale
 
         try:
-            result = FrozenStateManager._read_frozen_attrs(instance)
-            assert result is None
-            assert key not in FrozenStateManager._frozen_attrs_fallback
+            assert FrozenStateManager._read_frozen_attrs(instance) is None
+            assert key not in FrozenStateManager._side_table
         finally:
-            FrozenStateManager._frozen_attrs_fallback.pop(key, None)
-            FrozenStateManager._refs_by_id.pop(key, None)
+            FrozenStateManager._side_table.pop(key, None)
+
+
+@pytest.mark.unit
+class TestFrozenStateManagerBlocksWrite:
+    """Tests for the allocation-free write check used by the frozen setattr."""
+
+    def test_when_instance_not_frozen_then_allows_writes(self) -> None:
+        class Plain:
+            pass
+
+        assert FrozenStateManager.blocks_write(Plain(), "value") is False
+
+    def test_when_fully_frozen_then_blocks_every_name(self) -> None:
+        @auto_freeze
+        class Plain:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        instance = Plain(1)
+
+        assert FrozenStateManager.blocks_write(instance, "value") is True
+        assert FrozenStateManager.blocks_write(instance, "other") is True
+
+    def test_when_selectively_frozen_then_blocks_only_frozen_names(self) -> None:
+        @auto_freeze(attrs=["value"])
+        class Plain:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        instance = Plain(1)
+
+        assert FrozenStateManager.blocks_write(instance, "value") is True
+        assert FrozenStateManager.blocks_write(instance, "other") is False
+
+    def test_when_frozen_instance_is_reinitialised_then_allows_writes_during_init(self) -> None:
+        @auto_freeze
+        class Plain:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        instance = Plain(1)
+        instance.__init__(2)
+
+        assert instance.value == 2
+        with pytest.raises(CantModifyImmutableAttributeError):
+            instance.value = 3
+
+    def test_when_state_is_in_side_table_then_blocks_writes(self) -> None:
+        @auto_freeze(attrs=["value"])
+        class Slotted:
+            __slots__ = ("value", "other", "__weakref__")
+
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        instance = Slotted(1)
+
+        assert FrozenStateManager.blocks_write(instance, "value") is True
+        assert FrozenStateManager.blocks_write(instance, "other") is False
+        instance.other = 2
+        assert instance.other == 2
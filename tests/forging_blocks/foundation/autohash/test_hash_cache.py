@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pytest
+
+from forging_blocks.foundation.autofreeze.auto_freeze import auto_freeze
+from forging_blocks.foundation.autohash.auto_hash import auto_hash
+from forging_blocks.foundation.autohash.helpers.hash_cache import HashCache
+
+
+class _CountingField:
+    """Descriptor counting how often the hashed field is read."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def __get__(self, instance: object, owner: type | None = None) -> object:
+        self.reads += 1
+        return instance.__dict__["_payload"]  # type: ignore[union-attr]
+
+
+def _make_class(cache: bool = True) -> tuple[type, _CountingField]:
+    field = _CountingField()
+
+    class Filter:
+        payload = field
+
+        def __init__(self, payload: object) -> None:
+            self._payload = payload
+
+    auto_hash(Filter, fields=["payload"], cache=cache)
+    return Filter, field
+
+
+@pytest.mark.unit
+class TestHashCache:
+    def test_frozen_instance_computes_its_hash_once(self) -> None:
+        class_, field = _make_class()
+        auto_freeze(class_)
+        instance = class_({"status": ["open", "closed"]})
+
+        first, second = hash(instance), hash(instance)
+
+        assert first == second == hash((frozenset({("status", ("open", "closed"))}),))
+        assert field.reads == 1
+
+    def test_cached_hash_is_per_instance(self) -> None:
+        class_, _ = _make_class()
+        auto_freeze(class_)
+
+        assert hash(class_("a")) != hash(class_("b"))
+
+    def test_instance_that_is_not_frozen_is_rehashed_every_time(self) -> None:
+        class_, field = _make_class()
+        instance = class_("a")
+
+        hash(instance), hash(instance)
+
+        assert field.reads == 2
+
+    def test_selectively_frozen_instance_is_not_cached(self) -> None:
+        class_, field = _make_class()
+        auto_freeze(class_, attrs=["_payload"])
+        instance = class_("a")
+
+        hash(instance), hash(instance)
+
+        assert field.reads == 2
+
+    def test_class_with_custom_setattr_is_not_cached(self) -> None:
+        class_, field = _make_class()
+        type.__setattr__(class_, "__setattr__", lambda self, name, value: None)
+        auto_freeze(class_)
+        instance = class_("a")
+        object.__setattr__(instance, "_payload", "a")
+
+        hash(instance), hash(instance)
+
+        assert field.reads == 2
+
+    def test_without_cache_frozen_instance_is_rehashed_every_time(self) -> None:
+        class_, field = _make_class(cache=False)
+        auto_freeze(class_)
+        instance = class_("a")
+
+        hash(instance), hash(instance)
+
+        assert field.reads == 2
+
+    def test_hash_from_another_process_is_recomputed(self) -> None:
+        class_, field = _make_class()
+        auto_freeze(class_)
+        instance = class_("a")
+        object.__setattr__(instance, HashCache.ATTRIBUTE, (object(), 12345))
+
+        assert hash(instance) == hash(("a",))
+        assert hash(instance) == hash(("a",))
+        assert field.reads == 1
+
+    def test_arm_ignores_classes_without_cache(self) -> None:
+        class Plain:
+            pass
+
+        instance = Plain()
+        HashCache.arm(instance)
+
+        assert not hasattr(instance, HashCache.ATTRIBUTE)
+
+    def test_arm_ignores_slotted_instances_without_room(self) -> None:
+        class Slotted:
+            __slots__ = ("x",)
+
+        HashCache.enable(Slotted, True)
+        instance = Slotted()
+
+        HashCache.arm(instance)
+
+        assert not hasattr(instance, HashCache.ATTRIBUTE)
+
+    def test_redecorating_without_cache_disables_it(self) -> None:
+        class_, _ = _make_class()
+        auto_hash(class_, fields=["payload"])
+
+        assert not HashCache.is_enabled(class_)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from forging_blocks.foundation.autohash.helpers.hash_method_builder import HashMethodBuilder
+from forging_blocks.foundation.autohash.helpers.hashable_converter import HashableConverter
+from forging_blocks.foundation.errors.non_hashable_value_error import NonHashableValueError
+
+
+class _Record:
+    def __init__(self, **values: object) -> None:
+        for name, value in values.items():
+            setattr(self, name, value)
+
+
+class _Flag(int):
+    """int subclass; must still go through the converter."""
+
+
+@pytest.mark.unit
+class TestHashMethodBuilder:
+    def test_hash_matches_hash_of_converted_field_tuple(self) -> None:
+        identifier = uuid4()
+        record = _Record(a="x", b=1, c=identifier, d=[1, [2]], e={"k": {3}})
+        method = HashMethodBuilder.build(_Record, ("a", "b", "c", "d", "e"))
+
+        expected = hash(
+            tuple(
+                HashableConverter.convert(value)
+                for value in ("x", 1, identifier, [1, [2]], {"k": {3}})
+            )
+        )
+        assert method(record) == expected
+
+    def test_hash_converts_nested_values_inside_tuples(self) -> None:
+        method = HashMethodBuilder.build(_Record, ("a",))
+
+        assert method(_Record(a=(1, [2]))) == hash(((1, (2,)),))
+
+    def test_hash_passes_subclasses_of_plain_types_through_the_converter(self) -> None:
+        method = HashMethodBuilder.build(_Record, ("a",))
+
+        assert method(_Record(a=_Flag(3))) == hash((3,))
+
+    def test_hash_without_fields_hashes_an_empty_tuple(self) -> None:
+        assert HashMethodBuilder.build(_Record, ())(_Record()) == hash(())
+
+    def test_hash_reads_non_identifier_fields_with_getattr(self) -> None:
+        record = _Record(**{"not valid": 1, "class": 2})
+        method = HashMethodBuilder.build(_Record, ("not valid", "class"))
+
+        assert method(record) == hash((1, 2))
+
+    def test_hash_when_value_cannot_be_hashed_then_raises_non_hashable_value_error(self) -> None:
+        method = HashMethodBuilder.build(_Record, ("a",))
+
+        with pytest.raises(NonHashableValueError):
+            method(_Record(a=bytearray(b"x")))
+
+    def test_build_names_the_method_after_the_class(self) -> None:
+        method = HashMethodBuilder.build(_Record, ("a",))
+
+        assert method.__name__ == "__hash__"
+        assert method.__qualname__ == "_Record.__hash__"
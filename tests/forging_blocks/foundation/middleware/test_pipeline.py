@@ -3,8 +3,8 @@
 
 import pytest
 
-from forging_blocks.presentation import Pipeline
-from forging_blocks.presentation.middleware.next_handler import NextHandler
+from forging_blocks.foundation.middleware import Pipeline
+from forging_blocks.foundation.middleware.next_handler import NextHandler
 
 
 class FakeRequest:
@@ -0,0 +1,91 @@
+"""Tests for BatchLoader."""
+
+import asyncio
+from collections.abc import Mapping, Sequence
+
+import pytest
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.batching.batch_loader import BatchLoader
+
+
+class _Squares:
+    """Bulk function recording every batch it receives."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.batches: list[list[int]] = []
+        self._error = error
+
+    async def __call__(self, keys: Sequence[int]) -> Mapping[int, int]:
+        self.batches.append(list(keys))
+        if self._error is not None:
+            raise self._error
+        return {key: key * key for key in keys if key >= 0}
+
+
+@pytest.mark.unit
+class TestBatchLoader:
+    """Coalescing, windowing and error propagation of BatchLoader."""
+
+    async def test_loads_in_the_same_tick_share_one_bulk_call(self) -> None:
+        squares = _Squares()
+        loader = BatchLoader(squares)
+
+        results = await asyncio.gather(*(loader.load(key) for key in (1, 2, 3)))
+
+        assert results == [1, 4, 9]
+        assert squares.batches == [[1, 2, 3]]
+        assert loader.batches == 1
+
+    async def test_duplicate_keys_are_requested_once(self) -> None:
+        squares = _Squares()
+        loader = BatchLoader(squares)
+
+        assert await loader.load_many([2, 2, 3, 2]) == [4, 4, 9, 4]
+        assert squares.batches == [[2, 3]]
+
+    async def test_missing_keys_load_as_none(self) -> None:
+        loader = BatchLoader(_Squares())
+
+        assert await loader.load_many([-1, 2]) == [None, 4]
+
+    async def test_sequential_loads_use_separate_batches(self) -> None:
+        squares = _Squares()
+        loader = BatchLoader(squares)
+
+        await loader.load(1)
+        await loader.load(2)
+
+        assert squares.batches == [[1], [2]]
+
+    async def test_window_collects_loads_issued_after_a_pause(self) -> None:
+        squares = _Squares()
+        loader = BatchLoader(squares, window=0.05)
+
+        async def late(key: int) -> int | None:
+            await asyncio.sleep(0.001)
+            return await loader.load(key)
+
+        assert await asyncio.gather(loader.load(1), late(2)) == [1, 4]
+        assert squares.batches == [[1, 2]]
+
+    async def test_max_batch_size_splits_batches(self) -> None:
+        squares = _Squares()
+        loader = BatchLoader(squares, max_batch_size=2)
+
+        assert await loader.load_many(range(5)) == [0, 1, 4, 9, 16]
+        assert squares.batches == [[0, 1], [2, 3], [4]]
+
+    async def test_bulk_failure_is_raised_by_every_load_of_the_batch(self) -> None:
+        loader = BatchLoader(_Squares(RuntimeError("database down")))
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.parametrize(("window", "max_batch_size"), [(-1.0, None), (0.0, 0)])
+    def test_init_with_invalid_settings_raises(
+        self, window: float, max_batch_size: int | None
+    ) -> None:
+        with pytest.raises(ConfigurationError):
+            BatchLoader(_Squares(), window, max_batch_size)
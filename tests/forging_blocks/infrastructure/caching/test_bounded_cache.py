@@ -0,0 +1,139 @@
+"""Tests for the BoundedCache mapping."""
+
+import pytest
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.caching import bounded_cache
+from forging_blocks.infrastructure.caching.bounded_cache import BoundedCache, EvictionPolicy
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestBoundedCache:
+    """Eviction, expiry and statistics of BoundedCache."""
+
+    def test_get_counts_hits_and_misses(self) -> None:
+        """Only get() lookups are counted."""
+        cache = BoundedCache[str, int](max_entries=2)
+        cache["a"] = 1
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("b", 0) == 0
+        assert cache["a"] == 1
+
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+        assert cache.stats.hit_ratio == pytest.approx(1 / 3)
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        """A full LRU cache evicts the entry looked up longest ago."""
+        evicted: list[str] = []
+        cache = BoundedCache[str, int](max_entries=2)
+        cache.add_removal_listener(evicted.append)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+
+        cache["c"] = 3
+
+        assert sorted(cache) == ["a", "c"]
+        assert evicted == ["b"]
+        assert cache.stats.evictions == 1
+
+    def test_lfu_evicts_least_frequently_used(self) -> None:
+        """A full LFU cache evicts the entry with the fewest lookups."""
+        cache = BoundedCache[str, int](max_entries=2, policy=EvictionPolicy.LFU)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        cache["c"] = 3
+        assert sorted(cache) == ["a", "c"]
+
+        cache.get("c")
+        cache["d"] = 4
+        assert sorted(cache) == ["a", "d"]
+
+    def test_lfu_breaks_ties_by_recency(self) -> None:
+        """Among equally used entries LFU evicts the oldest."""
+        cache = BoundedCache[str, int](max_entries=2, policy=EvictionPolicy.LFU)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        cache["c"] = 3
+
+        assert sorted(cache) == ["b", "c"]
+
+    def test_overwrite_does_not_evict(self) -> None:
+        """Replacing an existing key keeps the cache at the same size."""
+        cache = BoundedCache[str, int](max_entries=1)
+        cache["a"] = 1
+        cache["a"] = 2
+
+        assert dict(cache) == {"a": 2}
+        assert cache.stats.evictions == 0
+
+    def test_delete_removes_entry(self) -> None:
+        """Deleted entries are gone and do not count as evictions."""
+        cache = BoundedCache[str, int](max_entries=2, policy=EvictionPolicy.LFU)
+        cache["a"] = 1
+        del cache["a"]
+        cache["b"] = 2
+        cache["c"] = 3
+
+        assert sorted(cache) == ["b", "c"]
+        assert cache.stats.evictions == 0
+
+    def test_ttl_expires_entries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries older than the TTL are misses and get removed."""
+        clock = _Clock()
+        monkeypatch.setattr(bounded_cache.time, "monotonic", clock)
+        expired: list[str] = []
+        cache = BoundedCache[str, int](max_entries=4, ttl=10)
+        cache.add_removal_listener(expired.append)
+        cache["a"] = 1
+
+        clock.now += 5
+        assert cache.get("a") == 1
+        clock.now += 5
+        assert "a" not in cache
+        assert list(cache) == []
+        assert cache.get("a") is None
+
+        assert len(cache) == 0
+        assert expired == ["a"]
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+
+    def test_len_removes_expired_entries(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """len counts only live entries, like iteration."""
+        clock = _Clock()
+        monkeypatch.setattr(bounded_cache.time, "monotonic", clock)
+        expired: list[str] = []
+        cache = BoundedCache[str, int](max_entries=4, ttl=10)
+        cache.add_removal_listener(expired.append)
+        cache["a"] = 1
+        clock.now += 5
+        cache["b"] = 2
+
+        clock.now += 5
+
+        assert len(cache) == len(list(cache)) == 1
+        assert expired == ["a"]
+        assert cache.stats.expirations == 1
+
+    def test_invalid_configuration_raises(self) -> None:
+        """Capacity and TTL must be positive."""
+        with pytest.raises(ConfigurationError):
+            BoundedCache[str, int](max_entries=0)
+        with pytest.raises(ConfigurationError):
+            BoundedCache[str, int](max_entries=1, ttl=0)
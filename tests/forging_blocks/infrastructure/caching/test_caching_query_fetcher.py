@@ -0,0 +1,196 @@
+"""Tests for CachingQueryFetcher and QueryCacheInvalidator."""
+
+import asyncio
+
+import pytest
+
+from forging_blocks.application.ports.outbound.query_fetcher_port import QueryFetcherPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.messages.query import Query
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.caching.caching_query_fetcher import (
+    CachingQueryFetcher,
+    QueryCacheInvalidator,
+)
+from forging_blocks.infrastructure.caching.in_memory_cache import InMemoryCache
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+from tests.fixtures.simple_fake_query import SimpleFakeQuery
+
+
+class _CountingFetcher(QueryFetcherPort[dict[str, object], object]):
+    """Fetcher returning a numbered answer; can be held open or made to fail."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate: asyncio.Event | None = None
+        self.error: Exception | None = None
+
+    async def fetch(self, query: Query[dict[str, object]]) -> object:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return f"{query.value['name']}#{self.calls}"
+
+
+class _OrderPayload:
+    def __init__(self, order_id: int) -> None:
+        self.order_id = order_id
+
+
+class _GetOrder(Query[_OrderPayload]):
+    """Query whose payload is a plain object built on every access."""
+
+    def __init__(self, order_id: int, metadata: MessageMetadata | None = None) -> None:
+        super().__init__(metadata)
+        self._order_id = order_id
+
+    @property
+    def _payload(self) -> _OrderPayload:
+        return _OrderPayload(self._order_id)
+
+    @property
+    def value(self) -> _OrderPayload:
+        return self._payload
+
+    @classmethod
+    def from_payload_fields(cls, data: _OrderPayload, metadata: MessageMetadata) -> "_GetOrder":
+        return cls(data.order_id, metadata)
+
+
+class _OrderFetcher(QueryFetcherPort[_OrderPayload, object]):
+    async def fetch(self, query: Query[_OrderPayload]) -> object:
+        return query.value.order_id
+
+
+def _caching(inner: _CountingFetcher) -> CachingQueryFetcher[dict[str, object], object]:
+    return CachingQueryFetcher(inner, InMemoryCache[str, object](), ttl=60)
+
+
+@pytest.mark.unit
+class TestCachingQueryFetcher:
+    """Caching, single-flight and invalidation behaviour."""
+
+    async def test_fetch_serves_identical_queries_from_the_cache(self) -> None:
+        inner = _CountingFetcher()
+        fetcher = _caching(inner)
+
+        first = await fetcher.fetch(SimpleFakeQuery("a"))
+        second = await fetcher.fetch(SimpleFakeQuery("a"))
+        other = await fetcher.fetch(SimpleFakeQuery("b"))
+
+        assert first == second == "a#1"
+        assert other == "b#2"
+        assert inner.calls == 2
+
+    async def test_concurrent_identical_queries_share_one_fetch(self) -> None:
+        inner = _CountingFetcher()
+        inner.gate = asyncio.Event()
+        fetcher = _caching(inner)
+
+        tasks = [asyncio.create_task(fetcher.fetch(SimpleFakeQuery("a"))) for _ in range(5)]
+        await asyncio.sleep(0)
+        inner.gate.set()
+
+        assert await asyncio.gather(*tasks) == ["a#1"] * 5
+        assert inner.calls == 1
+
+    async def test_failed_fetch_reaches_every_waiter_and_is_not_cached(self) -> None:
+        inner = _CountingFetcher()
+        inner.gate = asyncio.Event()
+        inner.error = RuntimeError("read model down")
+        fetcher = _caching(inner)
+
+        tasks = [asyncio.create_task(fetcher.fetch(SimpleFakeQuery("a"))) for _ in range(3)]
+        await asyncio.sleep(0)
+        inner.gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        inner.error = None
+        assert await fetcher.fetch(SimpleFakeQuery("a")) == "a#2"
+
+    async def test_cancelling_the_first_caller_does_not_cancel_the_others(self) -> None:
+        inner = _CountingFetcher()
+        inner.gate = asyncio.Event()
+        fetcher = _caching(inner)
+
+        first = asyncio.create_task(fetcher.fetch(SimpleFakeQuery("a")))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(fetcher.fetch(SimpleFakeQuery("a")))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        inner.gate.set()
+
+        assert await second == "a#1"
+        assert first.cancelled()
+        assert await fetcher.fetch(SimpleFakeQuery("a")) == "a#1"
+        assert inner.calls == 1
+
+    async def test_invalidate_drops_the_cached_result(self) -> None:
+        inner = _CountingFetcher()
+        fetcher = _caching(inner)
+        await fetcher.fetch(SimpleFakeQuery("a"))
+
+        await fetcher.invalidate(SimpleFakeQuery("a"))
+
+        assert await fetcher.fetch(SimpleFakeQuery("a")) == "a#2"
+
+    async def test_invalidate_during_a_fetch_keeps_its_result_out_of_the_cache(self) -> None:
+        inner = _CountingFetcher()
+        inner.gate = asyncio.Event()
+        fetcher = _caching(inner)
+        stale = asyncio.create_task(fetcher.fetch(SimpleFakeQuery("a")))
+        await asyncio.sleep(0)
+
+        await fetcher.invalidate(SimpleFakeQuery("a"))
+        inner.gate.set()
+
+        assert await stale == "a#1"
+        assert await fetcher.fetch(SimpleFakeQuery("a")) == "a#2"
+
+    async def test_custom_key_controls_which_queries_are_identical(self) -> None:
+        inner = _CountingFetcher()
+        fetcher = CachingQueryFetcher(inner, InMemoryCache[str, object](), key=lambda q: "all")
+
+        await fetcher.fetch(SimpleFakeQuery("a"))
+
+        assert await fetcher.fetch(SimpleFakeQuery("b")) == "a#1"
+
+    async def test_fetch_when_payload_is_not_json_serializable_then_raises(self) -> None:
+        fetcher = CachingQueryFetcher(_OrderFetcher(), InMemoryCache[str, object]())
+
+        with pytest.raises(ConfigurationError):
+            await fetcher.fetch(_GetOrder(1))
+
+    async def test_object_payloads_with_explicit_key_never_share_results(self) -> None:
+        fetcher = CachingQueryFetcher(
+            _OrderFetcher(),
+            InMemoryCache[str, object](),
+            key=lambda query: f"order:{query.value.order_id}",
+        )
+
+        results = [await fetcher.fetch(_GetOrder(i)) for i in range(500)]
+
+        assert results == list(range(500))
+        assert await fetcher.fetch(_GetOrder(7)) == 7
+
+
+@pytest.mark.unit
+class TestQueryCacheInvalidator:
+    async def test_handle_invalidates_the_queries_affected_by_the_event(self) -> None:
+        inner = _CountingFetcher()
+        fetcher = _caching(inner)
+        await fetcher.fetch(SimpleFakeQuery("a"))
+        await fetcher.fetch(SimpleFakeQuery("b"))
+
+        def affected(event: Event[dict[str, object]]) -> list[Query[dict[str, object]]]:
+            return [SimpleFakeQuery(str(event.value["name"]))]
+
+        await QueryCacheInvalidator(fetcher, affected).handle(FakeEventWithName("a"))
+
+        assert await fetcher.fetch(SimpleFakeQuery("a")) == "a#3"
+        assert await fetcher.fetch(SimpleFakeQuery("b")) == "b#2"
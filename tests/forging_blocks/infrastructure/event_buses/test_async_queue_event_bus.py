@@ -0,0 +1,270 @@
+"""Tests for the AsyncQueueEventBus background publisher."""
+
+import asyncio
+
+import pytest
+
+from forging_blocks.application.errors.event_bus_error import EventBusError
+from forging_blocks.application.ports.inbound.message_handler_port import (
+    CommandHandlerPort,
+    EventHandlerPort,
+)
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.event_buses.async_queue_event_bus import (
+    AsyncQueueEventBus,
+    BackpressurePolicy,
+)
+from forging_blocks.infrastructure.event_buses.in_memory_event_bus import InMemoryEventBus
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+from tests.fixtures.simple_fake_command import SimpleFakeCommand
+
+type _Bus = AsyncQueueEventBus[dict[str, object], dict[str, object], object]
+
+
+class _GatedHandler(EventHandlerPort[dict[str, object]]):
+    """Handler that waits for ``gate`` before recording each event."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail_on = fail_on
+        self.received: list[str] = []
+
+    async def handle(self, message: Event[dict[str, object]]) -> None:  # type: ignore[override]
+        await self.gate.wait()
+        name = str(message.value["name"])
+        if name == self.fail_on:
+            raise ValueError(f"cannot handle {name}")
+        self.received.append(name)
+
+
+def _queue_bus(handler: _GatedHandler, **options: object) -> _Bus:
+    inner: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+    bus: _Bus = AsyncQueueEventBus(inner, **options)  # type: ignore[arg-type]
+    bus.register_handler(FakeEventWithName, handler)
+    return bus
+
+
+@pytest.mark.integration
+class TestAsyncQueueEventBus:
+    """Queueing, backpressure, shutdown and metrics."""
+
+    async def test_publish_returns_before_handlers_run(self) -> None:
+        """Publishing only queues the event; workers handle it later."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler)
+
+        result = await bus.publish(FakeEventWithName("queued"))
+
+        assert result.is_ok
+        assert handler.received == []
+        handler.gate.set()
+        await bus.close()
+        assert handler.received == ["queued"]
+        assert bus.stats.processed == 1
+
+    async def test_close_drains_queued_events(self) -> None:
+        """Graceful shutdown waits until every queued event is handled."""
+        handler = _GatedHandler()
+        async with _queue_bus(handler, workers=3) as bus:
+            for i in range(20):
+                await bus.publish(FakeEventWithName(f"e{i}"))
+
+        assert sorted(handler.received) == sorted(f"e{i}" for i in range(20))
+        assert bus.depth == 0
+        assert bus.stats.enqueued == bus.stats.processed == 20
+
+    async def test_close_without_drain_discards_queued_events(self) -> None:
+        """An immediate shutdown leaves queued events unhandled."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler)
+        for i in range(3):
+            await bus.publish(FakeEventWithName(f"e{i}"))
+
+        await bus.close(drain=False)
+
+        assert handler.received == []
+        assert bus.depth == 0
+        assert bus.stats.dropped == 3
+
+    async def test_close_rejects_publishers_blocked_on_a_full_queue(self) -> None:
+        """Publishers waiting for room are released with an error on shutdown."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler, max_size=1)
+        await bus.publish(FakeEventWithName("in-flight"))
+        await asyncio.sleep(0)
+        await bus.publish(FakeEventWithName("queued"))
+        blocked = asyncio.create_task(bus.publish(FakeEventWithName("waiting")))
+        await asyncio.sleep(0)
+
+        await bus.close(drain=False)
+        result = await asyncio.wait_for(blocked, timeout=1)
+
+        assert isinstance(result.error, EventBusError)
+        assert bus.stats.rejected == 1
+        assert handler.received == []
+
+    async def test_cancelling_a_blocked_publisher_propagates(self) -> None:
+        """Cancelling the publisher itself is not turned into a rejection."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler, max_size=1)
+        await bus.publish(FakeEventWithName("in-flight"))
+        await asyncio.sleep(0)
+        await bus.publish(FakeEventWithName("queued"))
+        blocked = asyncio.create_task(bus.publish(FakeEventWithName("waiting")))
+        await asyncio.sleep(0)
+
+        blocked.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+        assert bus.stats.rejected == 0
+        await bus.close(drain=False)
+
+    async def test_publish_after_close_is_rejected(self) -> None:
+        """A closed bus refuses new events."""
+        bus = _queue_bus(_GatedHandler())
+        await bus.close()
+
+        result = await bus.publish(FakeEventWithName("late"))
+
+        assert isinstance(result.error, EventBusError)
+        assert bus.stats.rejected == 1
+
+    async def test_reject_policy_refuses_events_when_full(self) -> None:
+        """REJECT returns an error instead of waiting for room."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler, max_size=2, backpressure=BackpressurePolicy.REJECT)
+        await bus.publish(FakeEventWithName("in-flight"))
+        await asyncio.sleep(0)
+
+        results = [await bus.publish(FakeEventWithName(f"e{i}")) for i in range(3)]
+
+        assert [result.is_ok for result in results] == [True, True, False]
+        assert bus.depth == 2
+        assert bus.stats.rejected == 1
+        handler.gate.set()
+        await bus.close()
+        assert handler.received == ["in-flight", "e0", "e1"]
+
+    async def test_drop_oldest_policy_discards_oldest_queued_event(self) -> None:
+        """DROP_OLDEST makes room by discarding the oldest waiting event."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler, max_size=2, backpressure=BackpressurePolicy.DROP_OLDEST)
+        await bus.publish(FakeEventWithName("in-flight"))
+        await asyncio.sleep(0)
+
+        for i in range(3):
+            assert (await bus.publish(FakeEventWithName(f"e{i}"))).is_ok
+
+        assert bus.stats.dropped == 1
+        handler.gate.set()
+        await bus.close()
+        assert handler.received == ["in-flight", "e1", "e2"]
+
+    async def test_block_policy_waits_for_room(self) -> None:
+        """BLOCK suspends the publisher until a worker frees a slot."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler, max_size=1)
+        await bus.publish(FakeEventWithName("in-flight"))
+        await asyncio.sleep(0)
+        await bus.publish(FakeEventWithName("queued"))
+
+        blocked = asyncio.create_task(bus.publish(FakeEventWithName("waiting")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        handler.gate.set()
+        assert (await blocked).is_ok
+        await bus.close()
+        assert handler.received == ["in-flight", "queued", "waiting"]
+
+    async def test_handler_failures_are_counted_and_reported(self) -> None:
+        """Errors of the wrapped bus go to stats and the on_error callback."""
+        errors: list[EventBusError] = []
+        handler = _GatedHandler(fail_on="bad")
+        async with _queue_bus(handler, on_error=errors.append) as bus:
+            await bus.publish(FakeEventWithName("bad"))
+            await bus.publish(FakeEventWithName("good"))
+
+        assert bus.stats.failed == 1
+        assert bus.stats.processed == 1
+        assert [str(cause) for error in errors for cause in error.causes] == ["cannot handle bad"]
+        assert handler.received == ["good"]
+
+    async def test_raising_on_error_callback_does_not_stop_the_worker(self) -> None:
+        """A failing on_error goes to the loop's exception handler; work continues."""
+        reported: list[dict[str, object]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: reported.append(context))
+
+        def on_error(error: EventBusError) -> None:
+            raise RuntimeError("callback broke")
+
+        handler = _GatedHandler(fail_on="bad")
+        try:
+            async with _queue_bus(handler, on_error=on_error) as bus:
+                await bus.publish(FakeEventWithName("bad"))
+                await bus.publish(FakeEventWithName("good"))
+        finally:
+            loop.set_exception_handler(None)
+
+        assert handler.received == ["good"]
+        assert bus.stats.failed == bus.stats.processed == 1
+        assert [str(context["exception"]) for context in reported] == ["callback broke"]
+
+    async def test_lag_and_depth_are_measured(self) -> None:
+        """Queue depth and time spent waiting in the queue are observable."""
+        handler = _GatedHandler()
+        handler.gate.clear()
+        bus = _queue_bus(handler)
+        for i in range(3):
+            await bus.publish(FakeEventWithName(f"e{i}"))
+        assert bus.depth == 3
+
+        await asyncio.sleep(0.02)
+        handler.gate.set()
+        await bus.close()
+
+        assert bus.depth == 0
+        assert bus.stats.max_lag >= 0.02
+        assert 0 < bus.stats.last_lag <= bus.stats.max_lag
+
+    async def test_publish_many_is_delivered_as_one_batch(self) -> None:
+        """A batch occupies one queue slot and reaches the inner publish_many."""
+        handler = _GatedHandler()
+        async with _queue_bus(handler) as bus:
+            await bus.publish_many([FakeEventWithName("a"), FakeEventWithName("b")])
+
+        assert bus.stats.enqueued == 1
+        assert handler.received == ["a", "b"]
+
+    async def test_send_bypasses_the_queue(self) -> None:
+        """Commands are dispatched inline on the wrapped bus."""
+        handled: list[str] = []
+
+        class Handler(CommandHandlerPort[dict[str, object]]):
+            async def handle(self, message: Command[dict[str, object]]) -> None:
+                handled.append(str(message.value["name"]))
+
+        bus = _queue_bus(_GatedHandler())
+        bus.register_handler(SimpleFakeCommand, Handler())
+
+        assert (await bus.send(SimpleFakeCommand("now"))).is_ok
+        assert handled == ["now"]
+        assert bus.stats.enqueued == 0
+
+    @pytest.mark.parametrize("options", [{"workers": 0}, {"max_size": 0}])
+    def test_invalid_configuration_is_rejected(self, options: dict[str, int]) -> None:
+        """Workers and queue size must be positive."""
+        with pytest.raises(ConfigurationError):
+            _queue_bus(_GatedHandler(), **options)
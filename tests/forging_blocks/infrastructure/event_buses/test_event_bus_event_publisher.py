@@ -0,0 +1,54 @@
+"""Tests for the EventBusEventPublisher adapter."""
+
+import pytest
+
+from forging_blocks.application.errors.event_bus_error import EventBusError
+from forging_blocks.application.ports.inbound.message_handler_port import EventHandlerPort
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_buses.event_bus_event_publisher import (
+    EventBusEventPublisher,
+)
+from forging_blocks.infrastructure.event_buses.in_memory_event_bus import InMemoryEventBus
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+class _RecordingHandler(EventHandlerPort[dict[str, object]]):
+    def __init__(self) -> None:
+        self.received: list[str] = []
+
+    async def handle(self, message: Event[dict[str, object]]) -> None:  # type: ignore[override]
+        name = str(message.value["name"])
+        if name == "boom":
+            raise RuntimeError("handler failed")
+        self.received.append(name)
+
+
+@pytest.mark.integration
+class TestEventBusEventPublisher:
+    """EventPublisherPort adapter over an EventBusPort."""
+
+    @pytest.fixture
+    def handler(self) -> _RecordingHandler:
+        return _RecordingHandler()
+
+    @pytest.fixture
+    def publisher(self, handler: _RecordingHandler) -> EventBusEventPublisher[dict[str, object]]:
+        bus: InMemoryEventBus[dict[str, object], object, object] = InMemoryEventBus()
+        bus.register_handler(FakeEventWithName, handler)
+        return EventBusEventPublisher(bus)
+
+    async def test_publish_and_publish_many_delegate_to_the_bus(
+        self, publisher: EventBusEventPublisher[dict[str, object]], handler: _RecordingHandler
+    ) -> None:
+        await publisher.publish(FakeEventWithName("one"))
+        await publisher.publish_many([FakeEventWithName("two"), FakeEventWithName("three")])
+
+        assert handler.received == ["one", "two", "three"]
+
+    async def test_bus_failure_is_raised(
+        self, publisher: EventBusEventPublisher[dict[str, object]]
+    ) -> None:
+        with pytest.raises(EventBusError):
+            await publisher.publish(FakeEventWithName("boom"))
+        with pytest.raises(EventBusError):
+            await publisher.publish_many([FakeEventWithName("boom")])
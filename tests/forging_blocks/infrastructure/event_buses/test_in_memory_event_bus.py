@@ -1,5 +1,7 @@
 """Tests for the InMemoryEventBus implementation."""
 
+import asyncio
+from collections.abc import Awaitable, Sequence
 from typing import cast
 
 import pytest
@@ -11,9 +13,12 @@ from forging_blocks.application.ports.inbound.message_handler_port import (
 )
 from forging_blocks.domain.messages.command import Command
 from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.event_buses.dispatch_strategy import DispatchStrategy
 from forging_blocks.infrastructure.event_buses.in_memory_event_bus import (
     InMemoryEventBus,
 )
+from forging_blocks.infrastructure.metrics import DispatchInstrumentation, InMemoryMetrics
 from tests.fixtures.fake_event_with_name import FakeEventWithName
 from tests.fixtures.simple_fake_command import SimpleFakeCommand
 
@@ -92,3 +97,306 @@ class TestInMemoryEventBus:
         assert result.is_err
         assert isinstance(result.error, EventBusError)
         assert "Handler exploded" in str(result.error.message)
+
+
+class _TrackingHandler(EventHandlerPort[dict[str, object]]):
+    """Handler that records how many handlers run at the same time."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = 0
+
+    async def handle(self, message: Event[dict[str, object]]) -> None:  # type: ignore[override]
+        cls = type(self)
+        cls.running += 1
+        cls.peak = max(cls.peak, cls.running)
+        try:
+            await asyncio.sleep(0.01)
+            self.calls += 1
+            if self.fail:
+                raise ValueError(f"failure {id(self)}")
+        finally:
+            cls.running -= 1
+
+
+def _tracking_bus(
+    dispatch: DispatchStrategy, handlers: list[_TrackingHandler], max_concurrency: int | None = None
+) -> InMemoryEventBus[dict[str, object], dict[str, object], object]:
+    _TrackingHandler.running = _TrackingHandler.peak = 0
+    bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus(
+        dispatch, max_concurrency
+    )
+    for handler in handlers:
+        bus.register_handler(FakeEventWithName, handler)
+    return bus
+
+
+@pytest.mark.integration
+class TestInMemoryEventBusDispatchStrategies:
+    """Sequential, concurrent and bounded fan-out with aggregated failures."""
+
+    @pytest.mark.parametrize(
+        ("dispatch", "max_concurrency", "expected_peak"),
+        [
+            (DispatchStrategy.SEQUENTIAL, None, 1),
+            (DispatchStrategy.CONCURRENT, None, 6),
+            (DispatchStrategy.BOUNDED, 2, 2),
+        ],
+    )
+    async def test_strategy_controls_handler_overlap(
+        self, dispatch: DispatchStrategy, max_concurrency: int | None, expected_peak: int
+    ) -> None:
+        """Every handler runs; the strategy decides how many overlap."""
+        handlers = [_TrackingHandler() for _ in range(6)]
+        bus = _tracking_bus(dispatch, handlers, max_concurrency)
+
+        result = await bus.publish(FakeEventWithName("fan-out"))
+
+        assert result.is_ok
+        assert [handler.calls for handler in handlers] == [1] * 6
+        assert _TrackingHandler.peak == expected_peak
+
+    @pytest.mark.parametrize(
+        ("dispatch", "max_concurrency"),
+        [
+            (DispatchStrategy.SEQUENTIAL, None),
+            (DispatchStrategy.CONCURRENT, None),
+            (DispatchStrategy.BOUNDED, 2),
+        ],
+    )
+    async def test_failures_are_aggregated_without_short_circuit(
+        self, dispatch: DispatchStrategy, max_concurrency: int | None
+    ) -> None:
+        """A failing handler does not stop the others; all failures are reported."""
+        handlers = [_TrackingHandler(fail=i in (0, 2)) for i in range(4)]
+        bus = _tracking_bus(dispatch, handlers, max_concurrency)
+
+        result = await bus.publish(FakeEventWithName("partial"))
+
+        assert result.is_err
+        assert isinstance(result.error, EventBusError)
+        assert [handler.calls for handler in handlers] == [1, 1, 1, 1]
+        assert [str(cause) for cause in result.error.causes] == [
+            f"failure {id(handlers[0])}",
+            f"failure {id(handlers[2])}",
+        ]
+
+    @pytest.mark.parametrize(
+        ("dispatch", "max_concurrency"),
+        [
+            (DispatchStrategy.SEQUENTIAL, None),
+            (DispatchStrategy.CONCURRENT, None),
+            (DispatchStrategy.BOUNDED, 2),
+        ],
+    )
+    async def test_handler_raising_synchronously_is_reported_as_error(
+        self, dispatch: DispatchStrategy, max_concurrency: int | None
+    ) -> None:
+        """A handle() that raises before returning an awaitable is an ordinary failure."""
+        healthy = [_TrackingHandler(), _TrackingHandler()]
+        bus = InMemoryEventBus[dict[str, object], object, object](dispatch, max_concurrency)
+        bus.register_handler(FakeEventWithName, _SyncRaisingHandler())
+        for handler in healthy:
+            bus.register_handler(FakeEventWithName, handler)
+
+        published = await bus.publish(FakeEventWithName("sync"))
+        published_many = await bus.publish_many([FakeEventWithName("sync")])
+
+        for result in (published, published_many):
+            assert result.is_err
+            assert [str(cause) for cause in result.error.causes] == ["rejected before awaiting"]
+        assert [handler.calls for handler in healthy] == [2, 2]
+
+    def test_bounded_dispatch_requires_positive_max_concurrency(self) -> None:
+        """Bounded dispatch without a positive limit is a configuration error."""
+        with pytest.raises(ConfigurationError):
+            InMemoryEventBus[object, object, object](DispatchStrategy.BOUNDED)
+        with pytest.raises(ConfigurationError):
+            InMemoryEventBus[object, object, object](DispatchStrategy.BOUNDED, max_concurrency=0)
+
+    def test_max_concurrency_is_rejected_for_unbounded_strategies(self) -> None:
+        """A limit that would be ignored is refused."""
+        with pytest.raises(ConfigurationError):
+            InMemoryEventBus[object, object, object](DispatchStrategy.CONCURRENT, max_concurrency=4)
+
+
+class _SyncRaisingHandler:
+    def handle(self, message: object) -> Awaitable[None]:
+        raise RuntimeError("rejected before awaiting")
+
+
+class _RenamedEvent(FakeEventWithName):
+    """Subclass used to check polymorphic dispatch."""
+
+
+class _RecordingHandler(EventHandlerPort[dict[str, object]]):
+    def __init__(self, label: str, received: list[str]) -> None:
+        self.label = label
+        self.received = received
+
+    async def handle(self, message: Event[dict[str, object]]) -> None:  # type: ignore[override]
+        self.received.append(self.label)
+
+
+@pytest.mark.integration
+class TestInMemoryEventBusPolymorphicDispatch:
+    """Handlers registered for a base event class also receive subclasses."""
+
+    async def test_base_class_handlers_receive_subclass_events(self) -> None:
+        """Handlers run most specific class first, base classes after."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+        received: list[str] = []
+        bus.register_handler(Event, _RecordingHandler("event", received))
+        bus.register_handler(FakeEventWithName, _RecordingHandler("named", received))
+        bus.register_handler(_RenamedEvent, _RecordingHandler("renamed", received))
+
+        await bus.publish(_RenamedEvent("sub"))
+        await bus.publish(FakeEventWithName("base"))
+
+        assert received == ["renamed", "named", "event", "named", "event"]
+
+    async def test_register_after_publish_invalidates_dispatch_table(self) -> None:
+        """A handler added for a base class is seen by already-published subtypes."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+        received: list[str] = []
+        bus.register_handler(_RenamedEvent, _RecordingHandler("renamed", received))
+        await bus.publish(_RenamedEvent("first"))
+
+        bus.register_handler(FakeEventWithName, _RecordingHandler("named", received))
+        await bus.publish(_RenamedEvent("second"))
+
+        assert received == ["renamed", "renamed", "named"]
+
+    async def test_subclass_handlers_do_not_receive_base_events(self) -> None:
+        """Dispatch follows the published type's MRO, not its subclasses."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+        received: list[str] = []
+        bus.register_handler(_RenamedEvent, _RecordingHandler("renamed", received))
+
+        result = await bus.publish(FakeEventWithName("base"))
+
+        assert result.is_ok
+        assert received == []
+
+
+class _BatchRecordingHandler(EventHandlerPort[dict[str, object]]):
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self.single: list[str] = []
+
+    async def handle(self, message: Event[dict[str, object]]) -> None:  # type: ignore[override]
+        self.single.append(str(message.value["name"]))
+
+    async def handle_batch(self, messages: Sequence[Event[dict[str, object]]]) -> None:
+        if self.fail:
+            raise RuntimeError("bulk write failed")
+        self.batches.append([str(message.value["name"]) for message in messages])
+
+
+@pytest.mark.integration
+class TestInMemoryEventBusPublishMany:
+    """Batch publishing grouped by event type."""
+
+    async def test_batch_handlers_receive_each_type_group_once(self) -> None:
+        """handle_batch is called once per event type, preserving order."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+        batch_handler = _BatchRecordingHandler()
+        bus.register_handler(FakeEventWithName, batch_handler)
+
+        result = await bus.publish_many(
+            [
+                FakeEventWithName("a1"),
+                _RenamedEvent("b1"),
+                FakeEventWithName("a2"),
+                _RenamedEvent("b2"),
+            ]
+        )
+
+        assert result.is_ok
+        assert batch_handler.batches == [["a1", "a2"], ["b1", "b2"]]
+        assert batch_handler.single == []
+
+    async def test_handlers_without_handle_batch_get_each_event(self) -> None:
+        """Plain handlers are called once per event of the group."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+        received: list[str] = []
+        bus.register_handler(FakeEventWithName, _RecordingHandler("plain", received))
+
+        result = await bus.publish_many([FakeEventWithName("x"), FakeEventWithName("y")])
+
+        assert result.is_ok
+        assert received == ["plain", "plain"]
+
+    async def test_publish_many_aggregates_handler_failures(self) -> None:
+        """A failing batch handler does not stop the other handlers."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+        failing, healthy = _BatchRecordingHandler(fail=True), _BatchRecordingHandler()
+        bus.register_handler(FakeEventWithName, failing)
+        bus.register_handler(FakeEventWithName, healthy)
+
+        result = await bus.publish_many([FakeEventWithName("x")])
+
+        assert result.is_err
+        assert [str(cause) for cause in result.error.causes] == ["bulk write failed"]
+        assert healthy.batches == [["x"]]
+
+    async def test_publish_many_without_handlers_is_ok(self) -> None:
+        """Events nobody subscribed to are ignored."""
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus()
+
+        assert (await bus.publish_many([FakeEventWithName("x")])).is_ok
+        assert (await bus.publish_many([])).is_ok
+
+
+@pytest.mark.integration
+class TestInMemoryEventBusInstrumentation:
+    """Dispatch counts and handler metrics recorded through DispatchInstrumentation."""
+
+    async def test_publish_records_dispatch_and_handler_metrics(self) -> None:
+        metrics = InMemoryMetrics()
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus(
+            instrumentation=DispatchInstrumentation(metrics)
+        )
+        bus.register_handler(FakeEventWithName, _RecordingHandler("a", []))
+
+        await bus.publish(FakeEventWithName("x"))
+        await bus.publish_many([FakeEventWithName("y"), FakeEventWithName("z")])
+
+        tags = {"message_type": "FakeEventWithName", "handler": "_RecordingHandler"}
+        assert metrics.counter("messages.dispatched", {"message_type": "FakeEventWithName"}) == 3
+        assert len(metrics.histogram("handler.duration", tags)) == 2
+
+    async def test_publish_many_counts_handler_errors(self) -> None:
+        metrics = InMemoryMetrics()
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus(
+            instrumentation=DispatchInstrumentation(metrics)
+        )
+        bus.register_handler(FakeEventWithName, _BatchRecordingHandler(fail=True))
+
+        result = await bus.publish_many([FakeEventWithName("x")])
+
+        assert result.is_err
+        tags = {
+            "message_type": "FakeEventWithName",
+            "handler": "_BatchRecordingHandler",
+            "error": "RuntimeError",
+        }
+        assert metrics.counter("handler.errors", tags) == 1
+
+    async def test_send_records_the_command_handler(self) -> None:
+        metrics = InMemoryMetrics()
+        bus: InMemoryEventBus[dict[str, object], dict[str, object], object] = InMemoryEventBus(
+            instrumentation=DispatchInstrumentation(metrics)
+        )
+        handler = _RecordingHandler("command", [])
+        bus.register_handler(SimpleFakeCommand, handler)
+
+        assert (await bus.send(SimpleFakeCommand("go"))).is_ok
+
+        tags = {"message_type": "SimpleFakeCommand", "handler": "_RecordingHandler"}
+        assert metrics.counter("messages.dispatched", {"message_type": "SimpleFakeCommand"}) == 1
+        assert len(metrics.histogram("handler.duration", tags)) == 1
@@ -81,6 +81,27 @@ class TestInMemoryEventBusBase:
         assert len(received_1) == 1
         assert len(received_2) == 1
 
+    async def test_publish_dispatches_to_base_class_handlers(
+        self,
+        event_bus: InMemoryEventBusBase[TestPayload, TestPayload, object],
+    ) -> None:
+        """Handlers registered for a base event class receive subclass events."""
+        received: list[str] = []
+
+        class SpecificEvent(FakeEventWithValue):
+            pass
+
+        class BaseHandler(EventHandlerPort[TestPayload]):
+            async def handle(self, message: Event[TestPayload]) -> None:
+                received.append(type(message).__name__)
+
+        event_bus.register_handler(FakeEventWithValue, BaseHandler())
+        await event_bus.publish(SpecificEvent("first"))
+        event_bus.register_handler(SpecificEvent, BaseHandler())
+        await event_bus.publish(SpecificEvent("second"))
+
+        assert received == ["SpecificEvent", "SpecificEvent", "SpecificEvent"]
+
     async def test_publish_no_subscribers(
         self,
         event_bus: InMemoryEventBusBase[TestPayload, TestPayload, object],
@@ -0,0 +1,480 @@
+"""Tests for the FileEventStore implementation."""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+from uuid import UUID, uuid7
+
+import pytest
+
+from forging_blocks.application.errors import ConcurrencyError, EventStoreError
+from forging_blocks.domain.aggregate_root.aggregate_root import AggregateRoot
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.event_stores.file_event_store import FileEventStore
+from forging_blocks.infrastructure.event_stores.helpers.event_segment_log import (
+    EventSegmentLog,
+    segment_name,
+)
+from forging_blocks.infrastructure.event_stores.lazy_event_sequence import LazyEventSequence
+from forging_blocks.infrastructure.repositories.aggregate_repository import AggregateRepository
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+def _open_store(
+    directory: Path, max_segment_bytes: int = 1 << 20
+) -> FileEventStore[dict[str, object]]:
+    return FileEventStore[dict[str, object]](
+        directory,
+        codec=DictMessageCodec[Event[dict[str, object]]](),
+        event_types=[FakeEventWithName],
+        max_segment_bytes=max_segment_bytes,
+        fsync=False,
+    )
+
+
+def _names(events: object) -> list[object]:
+    return [cast(FakeEventWithName, e).value["name"] for e in cast(list[object], events)]
+
+
+@pytest.mark.integration
+class TestFileEventStore:
+    """FileEventStore append / get / version / recovery behaviour."""
+
+    async def test_append_and_get_events(self, tmp_path: Path) -> None:
+        """Events appended to a stream can be retrieved in order."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        events = [FakeEventWithName("evt1"), FakeEventWithName("evt2")]
+
+        version = await store.append_events(agg_id, events, expected_version=0)
+        assert version.is_ok
+        assert version.value == 2
+
+        result = await store.get_events(agg_id)
+        assert result.is_ok
+        assert _names(result.value) == ["evt1", "evt2"]
+        assert result.value[0] == events[0]
+        assert result.value[0].metadata == events[0].metadata
+        store.close()
+
+    async def test_get_events_empty_stream(self, tmp_path: Path) -> None:
+        """Getting events from an unknown aggregate returns an empty list."""
+        store = _open_store(tmp_path)
+        result = await store.get_events(uuid7())
+        assert result.is_ok
+        assert result.value == []
+        assert (await store.get_current_version(uuid7())).value == 0
+        store.close()
+
+    async def test_concurrency_error(self, tmp_path: Path) -> None:
+        """Appending with a wrong expected_version returns a ConcurrencyError."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("first")], expected_version=0)
+
+        result = await store.append_events(
+            agg_id, [FakeEventWithName("conflict")], expected_version=0
+        )
+        assert result.is_err
+        assert isinstance(result.error, ConcurrencyError)
+        assert (await store.get_current_version(agg_id)).value == 1
+        store.close()
+
+    async def test_get_events_with_version_range(self, tmp_path: Path) -> None:
+        """Only the requested version range is returned, across interleaved streams."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        other_id = uuid7()
+        for i in range(5):
+            await store.append_events(agg_id, [FakeEventWithName(f"evt{i}")])
+            await store.append_events(other_id, [FakeEventWithName(f"other{i}")])
+
+        result = await store.get_events(agg_id, from_version=1, to_version=3)
+        assert result.is_ok
+        assert _names(result.value) == ["evt1", "evt2", "evt3"]
+        store.close()
+
+    async def test_reopen_rebuilds_index(self, tmp_path: Path) -> None:
+        """A reopened store sees every previously committed event."""
+        store = _open_store(tmp_path, max_segment_bytes=256)
+        agg_id = uuid7()
+        for i in range(10):
+            await store.append_events(agg_id, [FakeEventWithName(f"evt{i}")])
+        store.close()
+
+        assert len(list(tmp_path.glob("segment-*.log"))) > 1
+
+        reopened = _open_store(tmp_path, max_segment_bytes=256)
+        assert (await reopened.get_current_version(agg_id)).value == 10
+        result = await reopened.get_events(agg_id, from_version=8)
+        assert _names(result.value) == ["evt8", "evt9"]
+
+        appended = await reopened.append_events(
+            agg_id, [FakeEventWithName("evt10")], expected_version=10
+        )
+        assert appended.value == 11
+        reopened.close()
+
+    async def test_reopen_discards_torn_append(self, tmp_path: Path) -> None:
+        """A partially written trailing batch is discarded on recovery."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("kept")])
+        await store.append_events(agg_id, [FakeEventWithName("a"), FakeEventWithName("b")])
+        store.close()
+
+        segment = tmp_path / segment_name(0)
+        segment.write_bytes(segment.read_bytes()[:-5])
+
+        reopened = _open_store(tmp_path)
+        assert (await reopened.get_current_version(agg_id)).value == 1
+        assert _names((await reopened.get_events(agg_id)).value) == ["kept"]
+        reopened.close()
+
+    async def test_corrupt_record_returns_error(self, tmp_path: Path) -> None:
+        """A checksum mismatch surfaces as an EventStoreError."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("evt")])
+
+        segment = tmp_path / segment_name(0)
+        data = bytearray(segment.read_bytes())
+        data[-3] ^= 0xFF
+        segment.write_bytes(bytes(data))
+
+        result = await store.get_events(agg_id)
+        assert result.is_err
+        assert isinstance(result.error, EventStoreError)
+        store.close()
+
+    async def test_unknown_event_type_returns_error(self, tmp_path: Path) -> None:
+        """Events whose type was not registered cannot be decoded."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("evt")])
+        store.close()
+
+        reopened = FileEventStore[dict[str, object]](
+            tmp_path, codec=DictMessageCodec[Event[dict[str, object]]](), event_types=[]
+        )
+        result = await reopened.get_events(agg_id)
+        assert result.is_err
+        reopened.close()
+
+    def test_invalid_segment_size_raises_configuration_error(self, tmp_path: Path) -> None:
+        """A non-positive segment size is rejected."""
+        with pytest.raises(ConfigurationError):
+            _open_store(tmp_path, max_segment_bytes=0)
+
+
+def _failing_once(function: Callable[..., None], error: OSError) -> Callable[..., None]:
+    calls: list[object] = []
+
+    def fail_first(*args: int) -> None:
+        calls.append(args)
+        if len(calls) == 1:
+            raise error
+        function(*args)
+
+    return fail_first
+
+
+@pytest.mark.integration
+class TestFileEventStoreFailedWrites:
+    """A failed write must not corrupt later acknowledged appends."""
+
+    async def test_failed_fsync_is_truncated_away(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = FileEventStore[dict[str, object]](
+            tmp_path,
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[FakeEventWithName],
+        )
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("kept")])
+        monkeypatch.setattr(os, "fsync", _failing_once(os.fsync, OSError("disk full")))
+
+        failed = await store.append_events(agg_id, [FakeEventWithName("failed")])
+        acknowledged = await store.append_events(agg_id, [FakeEventWithName("acked")])
+
+        assert failed.is_err
+        assert acknowledged.value == 2
+        assert _names((await store.get_events(agg_id)).value) == ["kept", "acked"]
+        store.close()
+        reopened = _open_store(tmp_path)
+        assert _names((await reopened.get_events(agg_id)).value) == ["kept", "acked"]
+        reopened.close()
+
+    async def test_failed_truncate_rejects_further_appends(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = FileEventStore[dict[str, object]](
+            tmp_path,
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[FakeEventWithName],
+        )
+        agg_id = uuid7()
+        monkeypatch.setattr(os, "fsync", _failing_once(os.fsync, OSError("disk full")))
+        monkeypatch.setattr(os, "ftruncate", _failing_once(os.ftruncate, OSError("read-only")))
+
+        failed = await store.append_events(agg_id, [FakeEventWithName("failed")])
+        rejected = await store.append_events(agg_id, [FakeEventWithName("later")])
+
+        assert failed.is_err
+        assert rejected.is_err
+        assert isinstance(rejected.error, EventStoreError)
+        assert (await store.get_current_version(agg_id)).value == 0
+        store.close()
+
+
+def _slow_open(barrier: threading.Barrier) -> Callable[..., int]:
+    """Wrap ``os.open`` so that concurrent callers reach it together and overlap."""
+    real_open = os.open
+
+    def slow_open(path: object, flags: int, *args: int) -> int:
+        if str(path).endswith(segment_name(0)):
+            try:
+                barrier.wait(timeout=0.2)
+            except threading.BrokenBarrierError:
+                pass
+            time.sleep(0.01)
+        return real_open(path, flags, *args)
+
+    return slow_open
+
+
+def _open_segment_descriptors(directory: Path) -> int:
+    fds = Path("/proc/self/fd")
+    segment = str(directory / segment_name(0))
+    count = 0
+    for fd in fds.iterdir():
+        try:
+            count += os.readlink(fd) == segment
+        except OSError:
+            continue
+    return count
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not Path("/proc/self/fd").is_dir(), reason="needs /proc/self/fd")
+class TestFileEventStoreConcurrentReaders:
+    """Concurrent first reads of a segment share one descriptor."""
+
+    async def test_concurrent_readers_open_each_segment_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("a"), FakeEventWithName("b")])
+        writers = _open_segment_descriptors(tmp_path)
+        readers = 8
+        monkeypatch.setattr(os, "open", _slow_open(threading.Barrier(readers)))
+
+        results = await asyncio.gather(*(store.get_events(agg_id) for _ in range(readers)))
+
+        assert all(_names(result.value) == ["a", "b"] for result in results)
+        assert _open_segment_descriptors(tmp_path) == writers + 1
+        store.close()
+        assert _open_segment_descriptors(tmp_path) == 0
+
+    def test_concurrent_map_range_maps_each_segment_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log = EventSegmentLog(tmp_path, max_segment_bytes=1 << 20, fsync=False)
+        agg_id = uuid7()
+        log.append(agg_id, [b"a", b"b"])
+        writers = _open_segment_descriptors(tmp_path)
+        readers = 8
+        monkeypatch.setattr(os, "open", _slow_open(threading.Barrier(readers)))
+
+        with ThreadPoolExecutor(max_workers=readers) as pool:
+            ranges = list(pool.map(lambda _: log.map_range(agg_id, 0, 2), range(readers)))
+
+        assert all([bytes(view) for view in records] == [b"a", b"b"] for records in ranges)
+        # One cached reader, plus the descriptor the single mmap keeps for itself.
+        assert _open_segment_descriptors(tmp_path) == writers + 2
+        log.close()
+
+
+@pytest.mark.integration
+class TestFileEventStoreAppendBatch:
+    """Single-write multi-stream append_batch."""
+
+    async def test_append_batch_survives_reopen(self, tmp_path: Path) -> None:
+        """Every stream of a batch is recovered after reopening."""
+        store = _open_store(tmp_path)
+        first, second = uuid7(), uuid7()
+        await store.append_events(second, [FakeEventWithName("b0")])
+
+        result = await store.append_batch(
+            [
+                (first, [FakeEventWithName("a1"), FakeEventWithName("a2")], 0),
+                (second, [FakeEventWithName("b1")], 1),
+            ]
+        )
+        assert result.value == [2, 2]
+        store.close()
+
+        reopened = _open_store(tmp_path)
+        assert _names((await reopened.get_events(first)).value) == ["a1", "a2"]
+        assert _names((await reopened.get_events(second)).value) == ["b0", "b1"]
+        reopened.close()
+
+    async def test_torn_batch_is_discarded_for_every_stream(self, tmp_path: Path) -> None:
+        """A batch cut short by a crash is dropped from all of its streams."""
+        store = _open_store(tmp_path)
+        first, second = uuid7(), uuid7()
+        await store.append_events(first, [FakeEventWithName("kept")])
+        await store.append_batch(
+            [(first, [FakeEventWithName("a")], 1), (second, [FakeEventWithName("b")], 0)]
+        )
+        store.close()
+
+        segment = tmp_path / segment_name(0)
+        segment.write_bytes(segment.read_bytes()[:-5])
+
+        reopened = _open_store(tmp_path)
+        assert _names((await reopened.get_events(first)).value) == ["kept"]
+        assert (await reopened.get_current_version(second)).value == 0
+        reopened.close()
+
+    async def test_append_batch_conflict_writes_nothing(self, tmp_path: Path) -> None:
+        """One stale expected version rejects the whole batch."""
+        store = _open_store(tmp_path)
+        first, second = uuid7(), uuid7()
+        size = (tmp_path / segment_name(0)).stat().st_size
+
+        result = await store.append_batch(
+            [(first, [FakeEventWithName("a")], 0), (second, [FakeEventWithName("b")], 4)]
+        )
+
+        assert isinstance(result.error, ConcurrencyError)
+        assert (tmp_path / segment_name(0)).stat().st_size == size
+        assert (await store.get_current_version(first)).value == 0
+        store.close()
+
+    async def test_append_batch_rejects_repeated_aggregate(self, tmp_path: Path) -> None:
+        """A batch naming the same aggregate twice is refused."""
+        store = _open_store(tmp_path)
+        agg_id = uuid7()
+
+        result = await store.append_batch(
+            [(agg_id, [FakeEventWithName("a")], None), (agg_id, [FakeEventWithName("b")], None)]
+        )
+
+        assert isinstance(result.error, EventStoreError)
+        assert (await store.get_current_version(agg_id)).value == 0
+        store.close()
+
+
+@pytest.mark.integration
+class TestFileEventStoreMemoryMapped:
+    """FileEventStore reads through memory-mapped segments."""
+
+    @staticmethod
+    def _open(
+        directory: Path, max_segment_bytes: int = 1 << 20
+    ) -> FileEventStore[dict[str, object]]:
+        return FileEventStore[dict[str, object]](
+            directory,
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[FakeEventWithName],
+            max_segment_bytes=max_segment_bytes,
+            fsync=False,
+            memory_map=True,
+        )
+
+    async def test_get_events_returns_lazy_sequence(self, tmp_path: Path) -> None:
+        """Mapped reads return a lazily decoded sequence over the range."""
+        store = self._open(tmp_path, max_segment_bytes=256)
+        agg_id = uuid7()
+        for i in range(6):
+            await store.append_events(agg_id, [FakeEventWithName(f"evt{i}")])
+
+        result = await store.get_events(agg_id, from_version=1, to_version=4)
+        assert result.is_ok
+        events = result.value
+        assert isinstance(events, LazyEventSequence)
+        assert len(events) == 4
+        assert _names(list(events)) == ["evt1", "evt2", "evt3", "evt4"]
+        assert _names(list(events[2:])) == ["evt3", "evt4"]
+        assert cast(FakeEventWithName, events[-1]).value["name"] == "evt4"
+        store.close()
+
+    async def test_sequence_survives_later_appends(self, tmp_path: Path) -> None:
+        """A previously returned sequence stays readable after the segment grows."""
+        store = self._open(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("first")])
+        before = (await store.get_events(agg_id)).value
+
+        await store.append_events(agg_id, [FakeEventWithName(f"n{i}") for i in range(50)])
+        after = (await store.get_events(agg_id)).value
+
+        assert _names(list(before)) == ["first"]
+        assert len(after) == 51
+        store.close()
+
+    async def test_empty_stream(self, tmp_path: Path) -> None:
+        """An unknown stream maps to an empty sequence."""
+        store = self._open(tmp_path)
+        result = await store.get_events(uuid7())
+        assert result.is_ok
+        assert len(result.value) == 0
+        assert list(result.value) == []
+        store.close()
+
+    async def test_corrupt_record_raises_on_access(self, tmp_path: Path) -> None:
+        """Checksum mismatches surface while iterating the lazy sequence."""
+        store = self._open(tmp_path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("evt")])
+        segment = tmp_path / segment_name(0)
+        data = bytearray(segment.read_bytes())
+        data[-3] ^= 0xFF
+        segment.write_bytes(bytes(data))
+
+        events = (await store.get_events(agg_id)).value
+        with pytest.raises(EventStoreError):
+            list(events)
+        store.close()
+
+    async def test_aggregate_repository_reconstitutes_from_mapped_events(
+        self, tmp_path: Path
+    ) -> None:
+        """AggregateRepository replays mapped events through reconstitute."""
+        store = self._open(tmp_path)
+        writer = AggregateRepository[dict[str, object], _NamesAggregate, UUID](
+            event_store=store, aggregate_type=_NamesAggregate
+        )
+        aggregate = _NamesAggregate(uuid7())
+        for name in ("a", "b", "c"):
+            aggregate.apply(FakeEventWithName(name))
+        await writer.save(aggregate)
+
+        reader = AggregateRepository[dict[str, object], _NamesAggregate, UUID](
+            event_store=store, aggregate_type=_NamesAggregate
+        )
+        loaded = await reader.get_by_id(cast(UUID, aggregate.id))
+
+        assert loaded is not None
+        assert loaded.names == ["a", "b", "c"]
+        assert loaded.version.value == 3
+        store.close()
+
+
+class _NamesAggregate(AggregateRoot[UUID, dict[str, object]]):
+    def __init__(self, aggregate_id: UUID) -> None:
+        super().__init__(aggregate_id)
+        self.names: list[object] = []
+
+    def _handle(self, event: Event[dict[str, object]]) -> None:
+        self.names.append(event.value["name"])
@@ -1,14 +1,19 @@
 """Tests for the InMemoryEventStore implementation."""
 
+import asyncio
+from collections.abc import Sequence
 from typing import cast
-from uuid import uuid7
+from uuid import UUID, uuid7
 
 import pytest
 
 from forging_blocks.application.errors import ConcurrencyError
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
 from forging_blocks.infrastructure.event_stores.in_memory_event_store import (
     InMemoryEventStore,
 )
+from forging_blocks.infrastructure.event_stores.recorded_event import RecordedEvent
 from tests.fixtures.fake_event_with_name import FakeEventWithName
 
 
@@ -84,3 +89,263 @@ class TestInMemoryEventStore:
 
         await store.append_events(agg_id, [FakeEventWithName("c")])
         assert (await store.get_current_version(agg_id)).value == 3
+
+
+def _name(recorded: RecordedEvent[dict[str, object]]) -> object:
+    return cast(FakeEventWithName, recorded.event).value["name"]
+
+
+@pytest.mark.integration
+class TestInMemoryEventStoreAppendBatch:
+    """Atomic multi-stream append_batch."""
+
+    async def test_append_batch_writes_every_stream(self) -> None:
+        """Each stream receives its events and the new versions are returned."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        first, second = uuid7(), uuid7()
+        await store.append_events(second, [FakeEventWithName("b0")])
+
+        result = await store.append_batch(
+            [
+                (first, [FakeEventWithName("a1"), FakeEventWithName("a2")], 0),
+                (second, [FakeEventWithName("b1")], 1),
+            ]
+        )
+
+        assert result.is_ok
+        assert result.value == [2, 2]
+        second_events = (await store.get_events(second)).value
+        assert [cast(FakeEventWithName, e).value["name"] for e in second_events] == ["b0", "b1"]
+        recorded = [r async for batch in store.read_all() for r in batch]
+        assert [(r.aggregate_id, r.version) for r in recorded] == [
+            (second, 1),
+            (first, 1),
+            (first, 2),
+            (second, 2),
+        ]
+
+    async def test_append_batch_conflict_leaves_all_streams_unchanged(self) -> None:
+        """One stale expected version rejects the whole batch."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        first, second = uuid7(), uuid7()
+        await store.append_events(second, [FakeEventWithName("b0")])
+
+        result = await store.append_batch(
+            [(first, [FakeEventWithName("a1")], 0), (second, [FakeEventWithName("b1")], 0)]
+        )
+
+        assert result.is_err
+        assert isinstance(result.error, ConcurrencyError)
+        assert result.error.aggregate_id == second
+        assert (await store.get_current_version(first)).value == 0
+        assert (await store.get_current_version(second)).value == 1
+        assert store.position == 1
+
+    async def test_append_batch_rejects_repeated_aggregate(self) -> None:
+        """A batch naming the same aggregate twice is refused."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        agg_id = uuid7()
+
+        result = await store.append_batch(
+            [(agg_id, [FakeEventWithName("a")], None), (agg_id, [FakeEventWithName("b")], None)]
+        )
+
+        assert result.is_err
+        assert store.position == 0
+
+
+class _SlowEventStore(InMemoryEventStore[dict[str, object]]):
+    """Store whose writes yield to the event loop, like real I/O would."""
+
+    def __init__(self, lock_stripes: int = 64) -> None:
+        super().__init__(lock_stripes)
+        self.gates: dict[UUID, asyncio.Event] = {}
+
+    async def _persist(
+        self, aggregate_id: UUID, base_version: int, events: Sequence[Event[dict[str, object]]]
+    ) -> None:
+        gate = self.gates.get(aggregate_id)
+        if gate is not None:
+            await gate.wait()
+        await asyncio.sleep(0)
+
+
+@pytest.mark.integration
+class TestInMemoryEventStoreConcurrency:
+    """Striped per-aggregate append locks."""
+
+    def test_lock_stripes_must_be_positive(self) -> None:
+        """A store needs at least one lock stripe."""
+        with pytest.raises(ConfigurationError):
+            InMemoryEventStore[dict[str, object]](lock_stripes=0)
+
+    async def test_concurrent_appends_with_same_expected_version_admit_one(self) -> None:
+        """Only one of many racing writers wins when the write awaits."""
+        store = _SlowEventStore()
+        agg_id = uuid7()
+
+        results = await asyncio.gather(
+            *(
+                store.append_events(agg_id, [FakeEventWithName(f"w{i}")], expected_version=0)
+                for i in range(50)
+            )
+        )
+
+        assert sum(result.is_ok for result in results) == 1
+        assert all(isinstance(r.error, ConcurrencyError) for r in results if r.is_err)
+        assert (await store.get_current_version(agg_id)).value == 1
+        assert store.position == 1
+
+    async def test_unversioned_concurrent_appends_keep_versions_contiguous(self) -> None:
+        """Appends without expected_version are serialized, never interleaved."""
+        store = _SlowEventStore(lock_stripes=1)
+        agg_id = uuid7()
+
+        results = await asyncio.gather(
+            *(
+                store.append_events(agg_id, [FakeEventWithName("a"), FakeEventWithName("b")])
+                for _ in range(20)
+            )
+        )
+
+        assert sorted(result.value for result in results) == list(range(2, 41, 2))
+        recorded = [r async for batch in store.read_all() for r in batch]
+        assert [r.version for r in recorded] == list(range(1, 41))
+
+    async def test_aggregates_on_other_stripes_do_not_wait(self) -> None:
+        """A blocked write does not hold up an aggregate on another stripe."""
+        store = _SlowEventStore(lock_stripes=2)
+        blocked, free = UUID(int=0), UUID(int=1)
+        store.gates[blocked] = asyncio.Event()
+
+        pending = asyncio.create_task(store.append_events(blocked, [FakeEventWithName("x")]))
+        await asyncio.sleep(0)
+        result = await asyncio.wait_for(
+            store.append_events(free, [FakeEventWithName("y")]), timeout=1
+        )
+
+        assert result.value == 1
+        assert not pending.done()
+        store.gates[blocked].set()
+        assert (await pending).value == 1
+
+    async def test_overlapping_batches_do_not_deadlock(self) -> None:
+        """Batches naming the same aggregates in opposite order both complete."""
+        store = _SlowEventStore(lock_stripes=4)
+        first, second = UUID(int=1), UUID(int=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                store.append_batch(
+                    [
+                        (first, [FakeEventWithName("a")], None),
+                        (second, [FakeEventWithName("b")], None),
+                    ]
+                ),
+                store.append_batch(
+                    [
+                        (second, [FakeEventWithName("c")], None),
+                        (first, [FakeEventWithName("d")], None),
+                    ]
+                ),
+            ),
+            timeout=1,
+        )
+
+        assert all(result.is_ok for result in results)
+        assert (await store.get_current_version(first)).value == 2
+        assert (await store.get_current_version(second)).value == 2
+
+
+@pytest.mark.integration
+class TestInMemoryEventStoreGlobalLog:
+    """Global positions, read_all and subscribe."""
+
+    async def test_read_all_returns_events_in_append_order_across_streams(self) -> None:
+        """Positions follow append order, not stream order."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        first, second = uuid7(), uuid7()
+        await store.append_events(first, [FakeEventWithName("a1"), FakeEventWithName("a2")])
+        await store.append_events(second, [FakeEventWithName("b1")])
+        await store.append_events(first, [FakeEventWithName("a3")])
+
+        batches = [batch async for batch in store.read_all(batch_size=3)]
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        recorded = [r for batch in batches for r in batch]
+        assert [r.position for r in recorded] == [0, 1, 2, 3]
+        assert [_name(r) for r in recorded] == ["a1", "a2", "b1", "a3"]
+        assert [(r.aggregate_id, r.version) for r in recorded] == [
+            (first, 1),
+            (first, 2),
+            (second, 1),
+            (first, 3),
+        ]
+        assert store.position == 4
+
+    async def test_read_all_from_position_skips_earlier_events(self) -> None:
+        """Reading resumes at the requested position."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        await store.append_events(uuid7(), [FakeEventWithName(f"e{i}") for i in range(5)])
+
+        recorded = [r async for batch in store.read_all(from_position=3) for r in batch]
+
+        assert [_name(r) for r in recorded] == ["e3", "e4"]
+
+    async def test_read_all_rejects_invalid_arguments(self) -> None:
+        """Negative positions and non-positive batch sizes are rejected."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        with pytest.raises(ValueError):
+            await anext(store.read_all(from_position=-1))
+        with pytest.raises(ValueError):
+            await anext(store.read_all(batch_size=0))
+
+    async def test_rejected_append_is_not_recorded(self) -> None:
+        """A concurrency conflict leaves the global log untouched."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("ok")])
+        await store.append_events(agg_id, [FakeEventWithName("late")], expected_version=0)
+
+        assert store.position == 1
+
+    async def test_subscribe_catches_up_then_follows_live_appends(self) -> None:
+        """A subscription yields history first and then new events as they arrive."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("old")])
+        received: list[object] = []
+
+        async def consume() -> None:
+            subscription = store.subscribe()
+            async for recorded in subscription:
+                received.append(_name(recorded))
+                if len(received) == 3:
+                    break
+            await subscription.aclose()
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        assert received == ["old"]
+
+        await store.append_events(agg_id, [FakeEventWithName("new1")])
+        await store.append_events(uuid7(), [FakeEventWithName("new2")])
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert received == ["old", "new1", "new2"]
+
+    async def test_subscribe_from_future_position_waits(self) -> None:
+        """Subscribing past the end yields only events appended later."""
+        store: InMemoryEventStore[dict[str, object]] = InMemoryEventStore()
+        await store.append_events(uuid7(), [FakeEventWithName("skipped")])
+        subscription = store.subscribe(from_position=store.position)
+        pending = asyncio.ensure_future(anext(subscription))
+        await asyncio.sleep(0)
+        assert not pending.done()
+
+        await store.append_events(uuid7(), [FakeEventWithName("seen")])
+
+        recorded = await asyncio.wait_for(pending, timeout=1)
+        assert recorded.position == 1
+        assert _name(recorded) == "seen"
+        await subscription.aclose()
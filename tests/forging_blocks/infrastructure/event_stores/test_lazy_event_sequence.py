@@ -0,0 +1,50 @@
+"""Tests for the LazyEventSequence view."""
+
+from typing import cast
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores.lazy_event_sequence import LazyEventSequence
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+@pytest.mark.unit
+class TestLazyEventSequence:
+    """Decoding happens on access and slices stay lazy."""
+
+    @staticmethod
+    def _sequence(
+        names: list[str], decoded: list[str]
+    ) -> LazyEventSequence[str, dict[str, object]]:
+        def decode(name: str) -> Event[dict[str, object]]:
+            decoded.append(name)
+            return FakeEventWithName(name)
+
+        return LazyEventSequence(names, decode)
+
+    def test_len_does_not_decode(self) -> None:
+        """Taking the length decodes nothing."""
+        decoded: list[str] = []
+        events = self._sequence(["a", "b"], decoded)
+        assert len(events) == 2
+        assert decoded == []
+
+    def test_index_decodes_single_record(self) -> None:
+        """Indexing decodes only the requested record."""
+        decoded: list[str] = []
+        events = self._sequence(["a", "b", "c"], decoded)
+        assert cast(FakeEventWithName, events[1]).value["name"] == "b"
+        assert decoded == ["b"]
+
+    def test_slice_is_lazy(self) -> None:
+        """Slicing returns another lazy sequence without decoding."""
+        decoded: list[str] = []
+        tail = self._sequence(["a", "b", "c"], decoded)[1:]
+        assert isinstance(tail, LazyEventSequence)
+        assert decoded == []
+        assert [cast(FakeEventWithName, e).value["name"] for e in tail] == ["b", "c"]
+
+    def test_repr_shows_length(self) -> None:
+        """The repr reports the length without decoding."""
+        assert repr(self._sequence(["a"], [])) == "LazyEventSequence(len=1)"
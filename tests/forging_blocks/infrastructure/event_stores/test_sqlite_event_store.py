@@ -0,0 +1,201 @@
+"""Tests for the SqliteEventStore implementation."""
+
+import sqlite3
+from pathlib import Path
+from typing import cast
+from uuid import uuid7
+
+import pytest
+
+from forging_blocks.application.errors import ConcurrencyError, EventStoreError
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.event_stores.sqlite_event_store import SqliteEventStore
+from forging_blocks.infrastructure.outbox.sqlite_outbox import SqliteOutbox
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+def _open_store(path: Path) -> SqliteEventStore[dict[str, object]]:
+    return SqliteEventStore[dict[str, object]](
+        path,
+        codec=DictMessageCodec[Event[dict[str, object]]](),
+        event_types=[FakeEventWithName],
+        fsync=False,
+    )
+
+
+def _names(events: object) -> list[object]:
+    return [cast(FakeEventWithName, e).value["name"] for e in cast(list[object], events)]
+
+
+@pytest.mark.integration
+class TestSqliteEventStore:
+    """SqliteEventStore append / get / version / durability behaviour."""
+
+    async def test_append_and_get_events(self, tmp_path: Path) -> None:
+        """Events appended to a stream can be retrieved in order."""
+        store = _open_store(tmp_path / "events.db")
+        agg_id = uuid7()
+
+        version = await store.append_events(
+            agg_id, [FakeEventWithName("evt1"), FakeEventWithName("evt2")], expected_version=0
+        )
+
+        assert version.value == 2
+        assert _names((await store.get_events(agg_id)).value) == ["evt1", "evt2"]
+        assert (await store.get_current_version(agg_id)).value == 2
+        store.close()
+
+    async def test_get_events_empty_stream(self, tmp_path: Path) -> None:
+        """An unknown aggregate has no events and version 0."""
+        store = _open_store(tmp_path / "events.db")
+        agg_id = uuid7()
+
+        assert (await store.get_events(agg_id)).value == []
+        assert (await store.get_current_version(agg_id)).value == 0
+        store.close()
+
+    async def test_get_events_with_version_range(self, tmp_path: Path) -> None:
+        """from_version and to_version are inclusive, 0-indexed bounds."""
+        store = _open_store(tmp_path / "events.db")
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName(f"evt{i}") for i in range(5)])
+
+        result = await store.get_events(agg_id, from_version=1, to_version=3)
+
+        assert _names(result.value) == ["evt1", "evt2", "evt3"]
+        assert _names((await store.get_events(agg_id, from_version=4)).value) == ["evt4"]
+        store.close()
+
+    async def test_concurrency_error(self, tmp_path: Path) -> None:
+        """Appending with a stale expected_version returns a ConcurrencyError."""
+        store = _open_store(tmp_path / "events.db")
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("first")], expected_version=0)
+
+        result = await store.append_events(
+            agg_id, [FakeEventWithName("conflict")], expected_version=0
+        )
+
+        assert isinstance(result.error, ConcurrencyError)
+        assert result.error.actual_version == 1
+        assert (await store.get_current_version(agg_id)).value == 1
+        store.close()
+
+    async def test_reopen_keeps_events(self, tmp_path: Path) -> None:
+        """Committed events survive closing and reopening the database."""
+        path = tmp_path / "events.db"
+        store = _open_store(path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("kept")])
+        store.close()
+
+        reopened = _open_store(path)
+        assert _names((await reopened.get_events(agg_id)).value) == ["kept"]
+        appended = await reopened.append_events(
+            agg_id, [FakeEventWithName("next")], expected_version=1
+        )
+        assert appended.value == 2
+        reopened.close()
+
+    async def test_database_uses_wal_and_unique_stream_index(self, tmp_path: Path) -> None:
+        """The schema enforces one event per (aggregate_id, version)."""
+        path = tmp_path / "events.db"
+        store = _open_store(path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("evt")])
+
+        connection = sqlite3.connect(path)
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with pytest.raises(sqlite3.IntegrityError):
+            connection.execute(
+                "INSERT INTO events (aggregate_id, version, body) VALUES (?, 1, x'')",
+                (agg_id.bytes,),
+            )
+        connection.close()
+        store.close()
+
+    async def test_append_batch_is_atomic(self, tmp_path: Path) -> None:
+        """One stale version rejects the whole batch; a valid batch writes all streams."""
+        store = _open_store(tmp_path / "events.db")
+        first, second = uuid7(), uuid7()
+        await store.append_events(second, [FakeEventWithName("b0")])
+
+        rejected = await store.append_batch(
+            [(first, [FakeEventWithName("a1")], 0), (second, [FakeEventWithName("b1")], 0)]
+        )
+        accepted = await store.append_batch(
+            [(first, [FakeEventWithName("a1")], 0), (second, [FakeEventWithName("b1")], 1)]
+        )
+
+        assert isinstance(rejected.error, ConcurrencyError)
+        assert accepted.value == [1, 2]
+        assert _names((await store.get_events(second)).value) == ["b0", "b1"]
+        store.close()
+
+    async def test_unknown_event_type_returns_error(self, tmp_path: Path) -> None:
+        """Events whose type was not registered cannot be decoded."""
+        path = tmp_path / "events.db"
+        store = _open_store(path)
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("evt")])
+        store.close()
+
+        reopened = SqliteEventStore[dict[str, object]](
+            path, codec=DictMessageCodec[Event[dict[str, object]]](), event_types=[]
+        )
+        result = await reopened.get_events(agg_id)
+        assert isinstance(result.error, EventStoreError)
+        reopened.close()
+
+    def test_unopenable_database_raises_event_store_error(self, tmp_path: Path) -> None:
+        """A path that cannot hold a database is reported as EventStoreError."""
+        with pytest.raises(EventStoreError):
+            _open_store(tmp_path / "missing" / "events.db")
+
+
+@pytest.mark.integration
+class TestSqliteEventStoreOutbox:
+    """SqliteEventStore(outbox=True) fills the outbox table atomically."""
+
+    async def test_appended_events_are_pending_in_outbox_on_same_database(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "events.db"
+        codec = DictMessageCodec[Event[dict[str, object]]]()
+        store = SqliteEventStore[dict[str, object]](
+            path, codec=codec, event_types=[FakeEventWithName], fsync=False, outbox=True
+        )
+        outbox = SqliteOutbox[dict[str, object]](
+            path, codec=codec, event_types=[FakeEventWithName], fsync=False
+        )
+        first, second = uuid7(), uuid7()
+
+        await store.append_batch(
+            [(first, [FakeEventWithName("a1")], 0), (second, [FakeEventWithName("b1")], 0)]
+        )
+        pending = (await outbox.fetch_pending(limit=10)).value
+
+        assert _names([message.event for message in pending]) == ["a1", "b1"]
+        store.close()
+        outbox.close()
+
+    async def test_rejected_append_queues_nothing(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.db"
+        store = SqliteEventStore[dict[str, object]](
+            path,
+            codec=DictMessageCodec[Event[dict[str, object]]](),
+            event_types=[FakeEventWithName],
+            fsync=False,
+            outbox=True,
+        )
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName("evt")], expected_version=0)
+
+        rejected = await store.append_events(agg_id, [FakeEventWithName("late")], 0)
+
+        assert isinstance(rejected.error, ConcurrencyError)
+        connection = sqlite3.connect(path)
+        assert connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0] == 1
+        connection.close()
+        store.close()
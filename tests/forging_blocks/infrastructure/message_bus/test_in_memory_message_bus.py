@@ -1,3 +1,6 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Self
 
 import pytest
@@ -5,9 +8,12 @@ import pytest
 from forging_blocks.domain.messages.command import Command
 from forging_blocks.domain.messages.message import MessageMetadata
 from forging_blocks.domain.messages.query import Query
+from forging_blocks.foundation.middleware import NextHandler
 from forging_blocks.infrastructure.message_bus.in_memory_message_bus import (
     InMemoryMessageBus,
 )
+from forging_blocks.infrastructure.metrics import DispatchInstrumentation, InMemoryMetrics
+from forging_blocks.infrastructure.serialization import DictMessageCodec
 
 
 class FakeCommand(Command[str]):
@@ -48,6 +54,11 @@ class FakeQuery(Query[dict[str, Any]]):
         return cls(data=str(data.get("data", "")), metadata=metadata)
 
 
+def _describe_in_worker(query: FakeQuery) -> dict[str, Any]:
+    """Module-level so a process pool can pickle it."""
+    return {"data": query.value["data"].upper(), "pid": os.getpid()}
+
+
 @pytest.mark.integration
 class TestInMemoryMessageBus:
     def test_init_when_created_then_has_empty_handler_registry(self) -> None:
@@ -158,3 +169,208 @@ class TestInMemoryMessageBus:
         result = await bus.dispatch(FakeCommand("hello"))
 
         assert result == "HELLO"
+
+
+@pytest.mark.integration
+class TestInMemoryMessageBusExecutors:
+    async def test_dispatch_with_thread_pool_runs_handler_off_the_event_loop(self) -> None:
+        bus = InMemoryMessageBus[Query[dict[str, Any]], dict[str, Any]]()
+        threads: list[str] = []
+
+        def handler(query: FakeQuery) -> dict[str, Any]:
+            threads.append(threading.current_thread().name)
+            return query.value
+
+        with ThreadPoolExecutor(thread_name_prefix="bus-worker") as pool:
+            bus.register(FakeQuery, handler, executor=pool)
+            result = await bus.dispatch(FakeQuery("x"))
+
+        assert result == {"data": "x"}
+        assert threads[0].startswith("bus-worker")
+
+    async def test_dispatch_with_thread_pool_and_codec_passes_a_decoded_copy(self) -> None:
+        bus = InMemoryMessageBus[Query[dict[str, Any]], dict[str, Any]]()
+        received: list[FakeQuery] = []
+        query = FakeQuery("x")
+
+        def handler(message: FakeQuery) -> None:
+            received.append(message)
+
+        with ThreadPoolExecutor() as pool:
+            bus.register(FakeQuery, handler, executor=pool, codec=DictMessageCodec())
+            await bus.dispatch(query)
+
+        assert received[0] is not query
+        assert received[0].message_id == query.message_id
+        assert received[0].value == query.value
+
+    async def test_dispatch_with_process_pool_runs_handler_in_another_process(self) -> None:
+        bus = InMemoryMessageBus[Query[dict[str, Any]], dict[str, Any]]()
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            bus.register(FakeQuery, _describe_in_worker, executor=pool, codec=DictMessageCodec())
+            result = await bus.dispatch(FakeQuery("x"))
+
+        assert result["data"] == "X"
+        assert result["pid"] != os.getpid()
+
+    async def test_dispatch_with_executor_propagates_handler_errors(self) -> None:
+        bus = InMemoryMessageBus[Command[object], object]()
+
+        def handler(command: FakeCommand) -> None:
+            raise RuntimeError("pricing failed")
+
+        with ThreadPoolExecutor() as pool:
+            bus.register(FakeCommand, handler, executor=pool)
+            with pytest.raises(RuntimeError, match="pricing failed"):
+                await bus.dispatch(FakeCommand("x"))
+
+    def test_register_when_async_handler_with_executor_then_raises_value_error(self) -> None:
+        bus = InMemoryMessageBus[Command[object], object]()
+
+        async def handler(command: FakeCommand) -> None:
+            return None
+
+        with ThreadPoolExecutor() as pool, pytest.raises(ValueError):
+            bus.register(FakeCommand, handler, executor=pool)
+
+    def test_register_when_process_pool_without_codec_then_raises_value_error(self) -> None:
+        bus = InMemoryMessageBus[Query[dict[str, Any]], dict[str, Any]]()
+
+        with ProcessPoolExecutor(max_workers=1) as pool, pytest.raises(ValueError, match="codec"):
+            bus.register(FakeQuery, _describe_in_worker, executor=pool)
+
+    def test_register_when_codec_without_executor_then_raises_value_error(self) -> None:
+        bus = InMemoryMessageBus[Command[object], object]()
+
+        with pytest.raises(ValueError):
+            bus.register(FakeCommand, lambda command: None, codec=DictMessageCodec())
+
+
+class _RecordingMiddleware:
+    """Middleware appending its name to a shared log on the way in and out."""
+
+    def __init__(self, name: str, log: list[str]) -> None:
+        self._name = name
+        self._log = log
+
+    async def process(self, request: object, next_handler: NextHandler[object, object]) -> object:
+        self._log.append(f"{self._name}>")
+        response = await next_handler(request)
+        self._log.append(f"<{self._name}")
+        return response
+
+
+class _ShortCircuitMiddleware:
+    async def process(self, request: object, next_handler: NextHandler[object, object]) -> object:
+        return "cached"
+
+
+@pytest.mark.integration
+class TestInMemoryMessageBusMiddleware:
+    async def test_dispatch_runs_middleware_outermost_first_around_the_handler(self) -> None:
+        log: list[str] = []
+        bus = InMemoryMessageBus[Command[object], object](
+            [_RecordingMiddleware("outer", log), _RecordingMiddleware("inner", log)]
+        )
+
+        def handler(command: FakeCommand) -> str:
+            log.append("handler")
+            return command.value
+
+        bus.register(FakeCommand, handler)
+        result = await bus.dispatch(FakeCommand("x"))
+
+        assert result == "x"
+        assert log == ["outer>", "inner>", "handler", "<inner", "<outer"]
+
+    async def test_dispatch_awaits_async_handlers_inside_the_chain(self) -> None:
+        log: list[str] = []
+        bus = InMemoryMessageBus[Query[dict[str, Any]], dict[str, Any]](
+            [_RecordingMiddleware("mw", log)]
+        )
+
+        async def handler(query: FakeQuery) -> dict[str, Any]:
+            return query.value
+
+        bus.register(FakeQuery, handler)
+
+        assert await bus.dispatch(FakeQuery("x")) == {"data": "x"}
+        assert log == ["mw>", "<mw"]
+
+    async def test_dispatch_when_middleware_short_circuits_then_skips_the_handler(self) -> None:
+        calls: list[FakeCommand] = []
+        bus = InMemoryMessageBus[Command[object], object]([_ShortCircuitMiddleware()])
+        bus.register(FakeCommand, calls.append)
+
+        assert await bus.dispatch(FakeCommand("x")) == "cached"
+        assert calls == []
+
+    async def test_dispatch_wraps_handlers_running_on_an_executor(self) -> None:
+        log: list[str] = []
+        bus = InMemoryMessageBus[Command[object], object]([_RecordingMiddleware("mw", log)])
+
+        with ThreadPoolExecutor() as pool:
+            bus.register(FakeCommand, lambda command: command.value, executor=pool)
+            result = await bus.dispatch(FakeCommand("x"))
+
+        assert result == "x"
+        assert log == ["mw>", "<mw"]
+
+
+@pytest.mark.integration
+class TestInMemoryMessageBusInstrumentation:
+    async def test_dispatch_records_dispatch_and_handler_metrics(self) -> None:
+        metrics = InMemoryMetrics()
+        bus = InMemoryMessageBus[Query[dict[str, Any]], dict[str, Any]](
+            instrumentation=DispatchInstrumentation(metrics)
+        )
+
+        async def describe(query: FakeQuery) -> dict[str, Any]:
+            return query.value
+
+        bus.register(FakeQuery, describe)
+
+        assert await bus.dispatch(FakeQuery("x")) == {"data": "x"}
+
+        tags = {
+            "message_type": "FakeQuery",
+            "handler": "TestInMemoryMessageBusInstrumentation."
+            "test_dispatch_records_dispatch_and_handler_metrics.<locals>.describe",
+        }
+        assert metrics.counter("messages.dispatched", {"message_type": "FakeQuery"}) == 1
+        assert len(metrics.histogram("handler.duration", tags)) == 1
+
+    async def test_dispatch_counts_handler_errors_and_reraises(self) -> None:
+        metrics = InMemoryMetrics()
+        bus = InMemoryMessageBus[Command[object], object](
+            instrumentation=DispatchInstrumentation(metrics)
+        )
+
+        def fail(command: FakeCommand) -> None:
+            raise ValueError(command.value)
+
+        bus.register(FakeCommand, fail)
+
+        with pytest.raises(ValueError):
+            await bus.dispatch(FakeCommand("x"))
+
+        tags = {"message_type": "FakeCommand", "handler": fail.__qualname__, "error": "ValueError"}
+        assert metrics.counter("handler.errors", tags) == 1
+
+    async def test_dispatch_times_the_handler_inside_the_middleware_chain(self) -> None:
+        log: list[str] = []
+        metrics = InMemoryMetrics()
+        bus = InMemoryMessageBus[Command[object], object](
+            [_ShortCircuitMiddleware()], instrumentation=DispatchInstrumentation(metrics)
+        )
+        bus.register(FakeCommand, log.append)
+
+        assert await bus.dispatch(FakeCommand("x")) == "cached"
+        assert metrics.counter("messages.dispatched", {"message_type": "FakeCommand"}) == 1
+        assert (
+            metrics.histogram(
+                "handler.duration", {"message_type": "FakeCommand", "handler": "list.append"}
+            )
+            == ()
+        )
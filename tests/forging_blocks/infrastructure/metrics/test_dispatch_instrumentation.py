@@ -0,0 +1,119 @@
+import pytest
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.metrics import DispatchInstrumentation, InMemoryMetrics
+from tests.forging_blocks.presentation.builtin.conftest import FakeLogger
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Handler:
+    async def handle(self, message: object) -> None: ...
+
+
+async def _work(clock: _Clock, seconds: float, result: object = None) -> object:
+    clock.now += seconds
+    return result
+
+
+async def _failing(clock: _Clock, seconds: float) -> None:
+    clock.now += seconds
+    raise ValueError("boom")
+
+
+_TAGS = {"message_type": "int", "handler": "_Handler"}
+
+
+@pytest.mark.unit
+class TestDispatchInstrumentation:
+    def test_init_when_slow_threshold_not_positive_then_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            DispatchInstrumentation(InMemoryMetrics(), slow_threshold=0)
+
+    def test_dispatched_counts_per_message_type(self) -> None:
+        metrics = InMemoryMetrics()
+        instrumentation = DispatchInstrumentation(metrics)
+
+        instrumentation.dispatched(int)
+        instrumentation.dispatched(int, 3)
+
+        assert metrics.counter("messages.dispatched", {"message_type": "int"}) == 4
+
+    async def test_observe_records_duration_and_returns_the_result(self) -> None:
+        metrics, clock = InMemoryMetrics(), _Clock()
+        instrumentation = DispatchInstrumentation(metrics, clock=clock)
+
+        result = await instrumentation.observe(int, _Handler(), _work(clock, 0.5, "done"))
+
+        assert result == "done"
+        assert metrics.histogram("handler.duration", _TAGS) == (0.5,)
+        assert metrics.gauge("handler.in_flight", _TAGS) == 0
+
+    async def test_observe_names_function_handlers_by_qualname(self) -> None:
+        metrics, clock = InMemoryMetrics(), _Clock()
+        instrumentation = DispatchInstrumentation(metrics, clock=clock)
+
+        await instrumentation.observe(int, _work, _work(clock, 0.1))
+
+        tags = {"message_type": "int", "handler": "_work"}
+        assert metrics.histogram("handler.duration", tags) == (0.1,)
+
+    async def test_observe_counts_errors_and_reraises(self) -> None:
+        metrics, clock = InMemoryMetrics(), _Clock()
+        instrumentation = DispatchInstrumentation(metrics, clock=clock)
+
+        with pytest.raises(ValueError):
+            await instrumentation.observe(int, _Handler(), _failing(clock, 0.2))
+
+        assert metrics.counter("handler.errors", {**_TAGS, "error": "ValueError"}) == 1
+        assert metrics.histogram("handler.duration", _TAGS) == (0.2,)
+        assert metrics.gauge("handler.in_flight", _TAGS) == 0
+
+    async def test_observe_tracks_calls_in_flight(self) -> None:
+        metrics, clock = InMemoryMetrics(), _Clock()
+        instrumentation = DispatchInstrumentation(metrics, clock=clock)
+        handler = _Handler()
+        seen: list[float | None] = []
+
+        async def nested() -> None:
+            seen.append(metrics.gauge("handler.in_flight", _TAGS))
+            await instrumentation.observe(int, handler, _probe())
+
+        async def _probe() -> None:
+            seen.append(metrics.gauge("handler.in_flight", _TAGS))
+
+        await instrumentation.observe(int, handler, nested())
+
+        assert seen == [1, 2]
+        assert metrics.gauge("handler.in_flight", _TAGS) == 0
+
+    async def test_observe_when_call_exceeds_threshold_then_counts_and_logs_it(self) -> None:
+        metrics, clock, logger = InMemoryMetrics(), _Clock(), FakeLogger()
+        instrumentation = DispatchInstrumentation(
+            metrics, logger=logger, slow_threshold=0.25, clock=clock
+        )
+
+        await instrumentation.observe(int, _Handler(), _work(clock, 0.1))
+        await instrumentation.observe(int, _Handler(), _work(clock, 0.5))
+
+        assert metrics.counter("handler.slow", _TAGS) == 1
+        assert logger.messages == [
+            (
+                "Slow handler: handler=%s message_type=%s duration=%s threshold=%s",
+                ("_Handler", "int", "0.500000", "0.250000"),
+            )
+        ]
+
+    async def test_observe_without_threshold_never_reports_slow_calls(self) -> None:
+        metrics, clock = InMemoryMetrics(), _Clock()
+        instrumentation = DispatchInstrumentation(metrics, clock=clock)
+
+        await instrumentation.observe(int, _Handler(), _work(clock, 60.0))
+
+        assert metrics.counter("handler.slow", _TAGS) == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from forging_blocks.application.ports.outbound.metrics_port import MetricsPort
+from forging_blocks.infrastructure.metrics import InMemoryMetrics
+
+
+@pytest.mark.unit
+class TestInMemoryMetrics:
+    def test_is_a_metrics_port(self) -> None:
+        assert isinstance(InMemoryMetrics(), MetricsPort)
+
+    def test_increment_accumulates_per_series(self) -> None:
+        metrics = InMemoryMetrics()
+
+        metrics.increment("orders", tags={"channel": "web"})
+        metrics.increment("orders", 2, tags={"channel": "web"})
+        metrics.increment("orders", tags={"channel": "api"})
+
+        assert metrics.counter("orders", {"channel": "web"}) == 3
+        assert metrics.counter("orders", {"channel": "api"}) == 1
+        assert metrics.counter("orders") == 0
+
+    def test_series_ignore_tag_order(self) -> None:
+        metrics = InMemoryMetrics()
+
+        metrics.increment("orders", tags={"a": "1", "b": "2"})
+
+        assert metrics.counter("orders", {"b": "2", "a": "1"}) == 1
+
+    def test_observe_keeps_every_sample_in_order(self) -> None:
+        metrics = InMemoryMetrics()
+
+        metrics.observe("latency", 0.2)
+        metrics.observe("latency", 0.1)
+
+        assert metrics.histogram("latency") == (0.2, 0.1)
+        assert metrics.histogram("unknown") == ()
+
+    def test_set_gauge_keeps_the_last_value(self) -> None:
+        metrics = InMemoryMetrics()
+
+        metrics.set_gauge("depth", 3)
+        metrics.set_gauge("depth", 1)
+
+        assert metrics.gauge("depth") == 1
+        assert metrics.gauge("unknown") is None
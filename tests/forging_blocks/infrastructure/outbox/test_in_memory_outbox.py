@@ -0,0 +1,54 @@
+"""Tests for the InMemoryOutbox implementation."""
+
+from typing import cast
+
+import pytest
+
+from forging_blocks.application.ports.outbound.outbox_port import OutboxMessage
+from forging_blocks.infrastructure.outbox.in_memory_outbox import InMemoryOutbox
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+def _names(messages: object) -> list[object]:
+    return [
+        cast(FakeEventWithName, message.event).value["name"]
+        for message in cast(list[OutboxMessage[dict[str, object]]], messages)
+    ]
+
+
+@pytest.mark.unit
+class TestInMemoryOutbox:
+    """InMemoryOutbox add / fetch / acknowledge behaviour."""
+
+    async def test_fetch_pending_returns_oldest_messages_first(self) -> None:
+        outbox = InMemoryOutbox[dict[str, object]]()
+        await outbox.add([FakeEventWithName("a"), FakeEventWithName("b")])
+        await outbox.add([FakeEventWithName("c")])
+
+        pending = (await outbox.fetch_pending(limit=2)).value
+
+        assert [message.position for message in pending] == [1, 2]
+        assert _names(pending) == ["a", "b"]
+        assert len(outbox) == 3
+
+    async def test_mark_delivered_removes_messages_and_ignores_unknown_positions(self) -> None:
+        outbox = InMemoryOutbox[dict[str, object]]()
+        await outbox.add([FakeEventWithName(name) for name in "abc"])
+
+        result = await outbox.mark_delivered([1, 3, 99])
+
+        assert result.is_ok
+        assert _names((await outbox.fetch_pending(limit=10)).value) == ["b"]
+
+    async def test_positions_are_not_reused_after_delivery(self) -> None:
+        outbox = InMemoryOutbox[dict[str, object]]()
+        await outbox.add([FakeEventWithName("a")])
+        await outbox.mark_delivered([1])
+
+        await outbox.add([FakeEventWithName("b")])
+
+        assert [message.position for message in (await outbox.fetch_pending(1)).value] == [2]
+
+    async def test_fetch_pending_with_non_positive_limit_raises(self) -> None:
+        with pytest.raises(ValueError):
+            await InMemoryOutbox[dict[str, object]]().fetch_pending(limit=0)
@@ -0,0 +1,103 @@
+"""Tests for the OutboxRelay."""
+
+import asyncio
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.outbox.in_memory_outbox import InMemoryOutbox
+from forging_blocks.infrastructure.outbox.outbox_relay import OutboxRelay
+from tests.fixtures.fake_event_publisher import FakeEventPublisher
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+class _FlakyPublisher(FakeEventPublisher):
+    """Publisher whose first ``failures`` batches raise."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.batches: list[int] = []
+
+    async def publish_many(self, events: object) -> None:
+        batch = list(events)  # type: ignore[call-overload]
+        self.batches.append(len(batch))
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("broker unavailable")
+        for event in batch:
+            await self.publish(event)
+
+
+def _names(events: list[Event[object]]) -> list[object]:
+    return [event.value["name"] for event in events]  # type: ignore[index]
+
+
+async def _outbox_with(*names: str) -> InMemoryOutbox[object]:
+    outbox = InMemoryOutbox[object]()
+    await outbox.add([FakeEventWithName(name) for name in names])
+    return outbox
+
+
+@pytest.mark.integration
+class TestOutboxRelay:
+    """Batching, acknowledgement and redelivery of the relay."""
+
+    async def test_relay_once_publishes_one_batch_and_acknowledges_it(self) -> None:
+        outbox = await _outbox_with("a", "b", "c")
+        publisher = _FlakyPublisher(failures=0)
+        relay = OutboxRelay(outbox, publisher, batch_size=2)
+
+        assert await relay.relay_once() == 2
+
+        assert publisher.batches == [2]
+        assert _names(publisher.published_events) == ["a", "b"]
+        assert len(outbox) == 1
+        assert relay.delivered == 2
+
+    async def test_drain_relays_until_the_outbox_is_empty(self) -> None:
+        outbox = await _outbox_with(*"abcde")
+        publisher = _FlakyPublisher(failures=0)
+
+        delivered = await OutboxRelay(outbox, publisher, batch_size=2).drain()
+
+        assert delivered == 5
+        assert publisher.batches == [2, 2, 1]
+        assert _names(publisher.published_events) == list("abcde")
+        assert len(outbox) == 0
+
+    async def test_failed_batch_stays_pending_and_is_redelivered(self) -> None:
+        outbox = await _outbox_with("a", "b")
+        publisher = _FlakyPublisher(failures=1)
+        relay = OutboxRelay(outbox, publisher)
+
+        with pytest.raises(RuntimeError):
+            await relay.relay_once()
+        assert len(outbox) == 2
+
+        assert await relay.drain() == 2
+        assert _names(publisher.published_events) == ["a", "b"]
+        assert len(outbox) == 0
+
+    async def test_run_reports_errors_and_keeps_relaying(self) -> None:
+        outbox = await _outbox_with("a")
+        publisher = _FlakyPublisher(failures=2)
+        errors: list[Exception] = []
+        relay = OutboxRelay(outbox, publisher, poll_interval=0.001, on_error=errors.append)
+
+        task = asyncio.create_task(relay.run())
+        while len(outbox):
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+        assert len(errors) == 2
+        assert all(isinstance(error, RuntimeError) for error in errors)
+        assert _names(publisher.published_events) == ["a"]
+
+    @pytest.mark.parametrize(("batch_size", "poll_interval"), [(0, 0.1), (10, 0.0)])
+    def test_init_with_non_positive_settings_raises(
+        self, batch_size: int, poll_interval: float
+    ) -> None:
+        with pytest.raises(ConfigurationError):
+            OutboxRelay(InMemoryOutbox[object](), FakeEventPublisher(), batch_size, poll_interval)
@@ -0,0 +1,96 @@
+"""Tests for the SqliteOutbox implementation."""
+
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from forging_blocks.application.errors import EventStoreError
+from forging_blocks.application.ports.outbound.outbox_port import OutboxMessage
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.outbox.sqlite_outbox import SqliteOutbox
+from forging_blocks.infrastructure.serialization import DictMessageCodec
+from tests.fixtures.fake_event_with_name import FakeEventWithName
+
+
+def _open_outbox(path: Path | str) -> SqliteOutbox[dict[str, object]]:
+    return SqliteOutbox[dict[str, object]](
+        path,
+        codec=DictMessageCodec[Event[dict[str, object]]](),
+        event_types=[FakeEventWithName],
+        fsync=False,
+    )
+
+
+def _names(messages: object) -> list[object]:
+    return [
+        cast(FakeEventWithName, message.event).value["name"]
+        for message in cast(list[OutboxMessage[dict[str, object]]], messages)
+    ]
+
+
+@pytest.mark.integration
+class TestSqliteOutbox:
+    """SqliteOutbox add / fetch / acknowledge / durability behaviour."""
+
+    async def test_fetch_pending_returns_oldest_messages_first(self, tmp_path: Path) -> None:
+        outbox = _open_outbox(tmp_path / "outbox.db")
+        await outbox.add([FakeEventWithName(name) for name in "abc"])
+
+        pending = (await outbox.fetch_pending(limit=2)).value
+
+        assert [message.position for message in pending] == [1, 2]
+        assert _names(pending) == ["a", "b"]
+        outbox.close()
+
+    async def test_decoded_events_keep_their_metadata(self, tmp_path: Path) -> None:
+        outbox = _open_outbox(tmp_path / "outbox.db")
+        event = FakeEventWithName("a")
+        await outbox.add([event])
+
+        (message,) = (await outbox.fetch_pending(limit=1)).value
+
+        assert message.event.message_id == event.message_id
+        outbox.close()
+
+    async def test_mark_delivered_deletes_messages(self, tmp_path: Path) -> None:
+        outbox = _open_outbox(tmp_path / "outbox.db")
+        await outbox.add([FakeEventWithName(name) for name in "abc"])
+
+        assert (await outbox.mark_delivered([1, 3])).is_ok
+
+        assert _names((await outbox.fetch_pending(limit=10)).value) == ["b"]
+        outbox.close()
+
+    async def test_pending_messages_survive_reopening(self, tmp_path: Path) -> None:
+        path = tmp_path / "outbox.db"
+        outbox = _open_outbox(path)
+        await outbox.add([FakeEventWithName("a"), FakeEventWithName("b")])
+        await outbox.mark_delivered([1])
+        outbox.close()
+
+        reopened = _open_outbox(path)
+        await reopened.add([FakeEventWithName("c")])
+        pending = (await reopened.fetch_pending(limit=10)).value
+
+        assert [message.position for message in pending] == [2, 3]
+        assert _names(pending) == ["b", "c"]
+        reopened.close()
+
+    async def test_unknown_event_type_is_returned_as_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "outbox.db"
+        outbox = _open_outbox(path)
+        await outbox.add([FakeEventWithName("a")])
+        outbox.close()
+        other = SqliteOutbox[dict[str, object]](
+            path, codec=DictMessageCodec[Event[dict[str, object]]](), event_types=[], fsync=False
+        )
+
+        result = await other.fetch_pending(limit=1)
+
+        assert isinstance(result.error, EventStoreError)
+        other.close()
+
+    def test_opening_an_invalid_path_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(EventStoreError):
+            _open_outbox(tmp_path / "missing" / "outbox.db")
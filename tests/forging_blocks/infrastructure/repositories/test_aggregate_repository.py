@@ -6,17 +6,30 @@ from uuid import UUID, uuid7
 
 import pytest
 
+from forging_blocks.application.errors.concurrency_error import ConcurrencyError
 from forging_blocks.application.errors.event_store_error import EventStoreError
+from forging_blocks.application.ports.outbound.event_store_port import StreamAppend
+from forging_blocks.application.ports.outbound.snapshot_store_port import Snapshot
 from forging_blocks.domain.aggregate_root.aggregate_root import AggregateRoot
+from forging_blocks.domain.aggregate_root.snapshottable_aggregate_root import (
+    SnapshottableAggregateRoot,
+)
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
 from forging_blocks.foundation.result import Err, Result
+from forging_blocks.infrastructure.caching.bounded_cache import BoundedCache, EvictionPolicy
+from forging_blocks.infrastructure.event_stores.in_memory_event_store import InMemoryEventStore
 from forging_blocks.infrastructure.event_stores.in_memory_event_store_base import (
     InMemoryEventStoreBase,
 )
 from forging_blocks.infrastructure.repositories.aggregate_repository import (
     AggregateRepository,
 )
+from forging_blocks.infrastructure.snapshots import (
+    EventCountSnapshotPolicy,
+    InMemorySnapshotStore,
+)
 
 
 class FakeEvent(Event[object]):
@@ -212,3 +225,367 @@ class TestAggregateRepository:
 
         with pytest.raises(EventStoreError, match="Connection lost"):
             await repo.get_by_id(uuid7())
+
+
+class SnapshottingAggregate(SnapshottableAggregateRoot[UUID, object]):
+    def __init__(self, aggregate_id: UUID) -> None:
+        super().__init__(aggregate_id)
+        self.items: list[str] = []
+
+    def add_item(self, name: str) -> None:
+        self.apply(FakeEvent(name))
+
+    def snapshot_state(self) -> object:
+        return list(self.items)
+
+    def _restore_snapshot_state(self, state: object) -> None:
+        self.items = list(cast(list[str], state))
+
+    def _handle(self, event: Event[object]) -> None:
+        if isinstance(event, FakeEvent):
+            self.items.append(cast(str, event.value["name"]))
+
+
+class RecordingEventStore(InMemoryEventStoreBase[object]):
+    """Event store remembering the ``from_version`` of every read."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[int | None] = []
+
+    async def get_events(
+        self,
+        aggregate_id: UUID,
+        from_version: int | None = None,
+        to_version: int | None = None,
+    ) -> Result[Sequence[Event[object]], EventStoreError]:
+        self.reads.append(from_version)
+        return await super().get_events(aggregate_id, from_version, to_version)
+
+
+@pytest.mark.integration
+class TestAggregateRepositorySnapshots:
+    async def test_save_when_policy_is_due_then_writes_snapshot(self) -> None:
+        snapshots = InMemorySnapshotStore()
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=InMemoryEventStoreBase[object](),
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=snapshots,
+            snapshot_policy=EventCountSnapshotPolicy(every=2),
+        )
+        aggregate = SnapshottingAggregate(uuid7())
+        aggregate.add_item("a")
+        aggregate.add_item("b")
+
+        await repo.save(aggregate)
+
+        snapshot = (await snapshots.get_latest_snapshot(cast(UUID, aggregate.id))).value
+        assert snapshot is not None
+        assert snapshot.version == 2
+        assert snapshot.state == ["a", "b"]
+
+    async def test_save_when_policy_is_not_due_then_skips_snapshot(self) -> None:
+        snapshots = InMemorySnapshotStore()
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=InMemoryEventStoreBase[object](),
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=snapshots,
+            snapshot_policy=EventCountSnapshotPolicy(every=5),
+        )
+        aggregate = SnapshottingAggregate(uuid7())
+        aggregate.add_item("a")
+
+        await repo.save(aggregate)
+
+        assert (await snapshots.get_latest_snapshot(cast(UUID, aggregate.id))).value is None
+
+    async def test_get_by_id_when_snapshot_exists_then_replays_only_newer_events(self) -> None:
+        aggregate_id = uuid7()
+        event_store = RecordingEventStore()
+        await event_store.append_events(
+            aggregate_id, [FakeEvent("a"), FakeEvent("b"), FakeEvent("c")]
+        )
+        snapshots = InMemorySnapshotStore()
+        await snapshots.save_snapshot(Snapshot(aggregate_id, 2, ["A", "B"]))
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=event_store,
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=snapshots,
+        )
+
+        retrieved = await repo.get_by_id(aggregate_id)
+
+        assert retrieved is not None
+        assert retrieved.items == ["A", "B", "c"]
+        assert retrieved.version.value == 3
+        assert event_store.reads == [2]
+
+    async def test_get_by_id_when_snapshot_is_current_then_returns_snapshot_state(self) -> None:
+        aggregate_id = uuid7()
+        event_store = InMemoryEventStoreBase[object]()
+        await event_store.append_events(aggregate_id, [FakeEvent("a")])
+        snapshots = InMemorySnapshotStore()
+        await snapshots.save_snapshot(Snapshot(aggregate_id, 1, ["a"]))
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=event_store,
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=snapshots,
+        )
+
+        retrieved = await repo.get_by_id(aggregate_id)
+
+        assert retrieved is not None
+        assert retrieved.items == ["a"]
+        assert retrieved.version.value == 1
+
+    async def test_snapshot_counts_events_since_loaded_snapshot(self) -> None:
+        aggregate_id = uuid7()
+        event_store = InMemoryEventStoreBase[object]()
+        await event_store.append_events(aggregate_id, [FakeEvent("a"), FakeEvent("b")])
+        snapshots = InMemorySnapshotStore()
+        await snapshots.save_snapshot(Snapshot(aggregate_id, 2, ["a", "b"]))
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=event_store,
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=snapshots,
+            snapshot_policy=EventCountSnapshotPolicy(every=2),
+        )
+        aggregate = await repo.get_by_id(aggregate_id)
+        assert aggregate is not None
+
+        aggregate.add_item("c")
+        await repo.save(aggregate)
+        first = (await snapshots.get_latest_snapshot(aggregate_id)).value
+        assert first is not None
+        assert first.version == 2
+
+        aggregate.discard_events()
+        aggregate.add_item("d")
+        await repo.save(aggregate)
+        latest = (await snapshots.get_latest_snapshot(aggregate_id)).value
+        assert latest is not None
+        assert latest.version == 4
+        assert latest.state == ["a", "b", "c", "d"]
+
+    async def test_get_by_id_when_snapshot_store_fails_then_raises_error(self) -> None:
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=InMemoryEventStoreBase[object](),
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=FailingSnapshotStore(),
+        )
+
+        with pytest.raises(EventStoreError):
+            await repo.get_by_id(uuid7())
+
+    async def test_save_when_snapshot_write_fails_then_save_succeeds(self) -> None:
+        event_store = InMemoryEventStoreBase[object]()
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=event_store,
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=FailingSnapshotStore(),
+            snapshot_policy=EventCountSnapshotPolicy(every=1),
+        )
+        aggregate = SnapshottingAggregate(uuid7())
+        aggregate.add_item("a")
+
+        await repo.save(aggregate)
+
+        assert (await event_store.get_current_version(cast(UUID, aggregate.id))).value == 1
+
+    def test_init_when_aggregate_cannot_snapshot_then_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            AggregateRepository[object, FakeAggregate, UUID](
+                event_store=InMemoryEventStoreBase[object](),
+                aggregate_type=FakeAggregate,
+                snapshot_store=InMemorySnapshotStore(),
+            )
+
+
+class FailingSnapshotStore(InMemorySnapshotStore):
+    """Snapshot store whose reads and writes always fail."""
+
+    async def save_snapshot(self, snapshot: Snapshot) -> Result[None, EventStoreError]:
+        return Err(EventStoreError("Snapshot disk full"))
+
+    async def get_latest_snapshot(
+        self, aggregate_id: UUID
+    ) -> Result[Snapshot | None, EventStoreError]:
+        return Err(EventStoreError("Snapshot disk unavailable"))
+
+
+@pytest.mark.integration
+class TestAggregateRepositoryBoundedCache:
+    async def test_evicted_aggregate_is_reloaded_from_event_store(self) -> None:
+        event_store = InMemoryEventStoreBase[object]()
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=event_store,
+            aggregate_type=FakeAggregate,
+            cache=BoundedCache[UUID, FakeAggregate](max_entries=1),
+        )
+        first = FakeAggregate(uuid7())
+        first.add_item("a")
+        second = FakeAggregate(uuid7())
+        second.add_item("b")
+        await repo.save(first)
+        await repo.save(second)
+
+        reloaded = await repo.get_by_id(cast(UUID, first.id))
+
+        assert reloaded is not None
+        assert reloaded is not first
+        assert reloaded.items == ["a"]
+        stats = repo.cache_stats
+        assert stats is not None
+        assert (stats.hits, stats.misses, stats.evictions) == (0, 1, 2)
+
+    async def test_cached_aggregate_counts_as_hit(self) -> None:
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=InMemoryEventStoreBase[object](),
+            aggregate_type=FakeAggregate,
+            cache=BoundedCache[UUID, FakeAggregate](max_entries=4, policy=EvictionPolicy.LFU),
+        )
+        aggregate = FakeAggregate(uuid7())
+        await repo.save(aggregate)
+
+        assert await repo.get_by_id(cast(UUID, aggregate.id)) is aggregate
+        assert repo.cache_stats is not None
+        assert repo.cache_stats.hits == 1
+
+    async def test_cache_receives_initial_storage(self) -> None:
+        aggregate = FakeAggregate(uuid7())
+        cache = BoundedCache[UUID, FakeAggregate](max_entries=4)
+        AggregateRepository[object, FakeAggregate, UUID](
+            event_store=InMemoryEventStoreBase[object](),
+            aggregate_type=FakeAggregate,
+            storage={cast(UUID, aggregate.id): aggregate},
+            cache=cache,
+        )
+
+        assert list(cache) == [aggregate.id]
+
+    def test_cache_stats_when_unbounded_then_none(self) -> None:
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=InMemoryEventStoreBase[object](),
+            aggregate_type=FakeAggregate,
+        )
+
+        assert repo.cache_stats is None
+
+
+class BatchCountingEventStore(InMemoryEventStore[object]):
+    """Event store counting ``append_batch`` calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = 0
+
+    async def append_batch(
+        self, appends: Sequence[StreamAppend[object]]
+    ) -> Result[list[int], EventStoreError]:
+        self.batches += 1
+        return await super().append_batch(appends)
+
+
+@pytest.mark.integration
+class TestAggregateRepositorySaveAll:
+    async def test_save_all_writes_every_aggregate_in_one_batch(self) -> None:
+        event_store = BatchCountingEventStore()
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=event_store, aggregate_type=FakeAggregate
+        )
+        aggregates = [FakeAggregate(uuid7()) for _ in range(3)]
+        for aggregate in aggregates:
+            aggregate.add_item("widget")
+
+        await repo.save_all(aggregates)
+
+        assert event_store.batches == 1
+        for aggregate in aggregates:
+            assert (await event_store.get_current_version(cast(UUID, aggregate.id))).value == 1
+            assert await repo.get_by_id(cast(UUID, aggregate.id)) is aggregate
+
+    async def test_save_all_when_one_version_conflicts_then_nothing_is_saved(self) -> None:
+        event_store = InMemoryEventStore[object]()
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=event_store, aggregate_type=FakeAggregate
+        )
+        fresh = FakeAggregate(uuid7())
+        fresh.add_item("widget")
+        stale = FakeAggregate(uuid7())
+        stale.add_item("gadget")
+        await event_store.append_events(cast(UUID, stale.id), [FakeEvent("concurrent")])
+
+        with pytest.raises(ConcurrencyError):
+            await repo.save_all([fresh, stale])
+
+        assert (await event_store.get_current_version(cast(UUID, fresh.id))).value == 0
+        assert await repo.get_by_id(cast(UUID, fresh.id)) is None
+
+    async def test_save_all_with_event_store_base_saves_one_by_one(self) -> None:
+        event_store = InMemoryEventStoreBase[object]()
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=event_store, aggregate_type=FakeAggregate
+        )
+        aggregates = [FakeAggregate(uuid7()) for _ in range(2)]
+        for aggregate in aggregates:
+            aggregate.add_item("widget")
+
+        await repo.save_all(aggregates)
+
+        for aggregate in aggregates:
+            assert (await event_store.get_current_version(cast(UUID, aggregate.id))).value == 1
+
+
+@pytest.mark.integration
+class TestAggregateRepositoryStreaming:
+    async def test_get_by_id_with_stream_batch_size_then_reads_in_windows(self) -> None:
+        event_store = RecordingEventStore()
+        aggregate_id = uuid7()
+        await event_store.append_events(aggregate_id, [FakeEvent(f"item{i}") for i in range(5)])
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=event_store, aggregate_type=FakeAggregate, stream_batch_size=2
+        )
+
+        aggregate = await repo.get_by_id(aggregate_id)
+
+        assert aggregate is not None
+        assert aggregate.items == [f"item{i}" for i in range(5)]
+        assert aggregate.version.value == 5
+        assert event_store.reads == [0, 2, 4]
+
+    async def test_get_by_id_with_stream_batch_size_when_stream_empty_then_none(self) -> None:
+        repo = AggregateRepository[object, FakeAggregate, UUID](
+            event_store=InMemoryEventStore[object](),
+            aggregate_type=FakeAggregate,
+            stream_batch_size=10,
+        )
+
+        assert await repo.get_by_id(uuid7()) is None
+
+    async def test_get_by_id_with_stream_batch_size_starts_after_snapshot(self) -> None:
+        event_store = RecordingEventStore()
+        snapshots = InMemorySnapshotStore()
+        aggregate_id = uuid7()
+        await event_store.append_events(aggregate_id, [FakeEvent(f"item{i}") for i in range(4)])
+        await snapshots.save_snapshot(Snapshot(aggregate_id, 3, ["item0", "item1", "item2"]))
+        repo = AggregateRepository[object, SnapshottingAggregate, UUID](
+            event_store=event_store,
+            aggregate_type=SnapshottingAggregate,
+            snapshot_store=snapshots,
+            stream_batch_size=2,
+        )
+
+        aggregate = await repo.get_by_id(aggregate_id)
+
+        assert aggregate is not None
+        assert aggregate.items == ["item0", "item1", "item2", "item3"]
+        assert aggregate.version.value == 4
+        assert event_store.reads == [3]
+
+    def test_init_when_stream_batch_size_not_positive_then_raises(self) -> None:
+        with pytest.raises(ConfigurationError):
+            AggregateRepository[object, FakeAggregate, UUID](
+                event_store=InMemoryEventStore[object](),
+                aggregate_type=FakeAggregate,
+                stream_batch_size=0,
+            )
@@ -0,0 +1,52 @@
+"""Tests for BatchingReadRepository."""
+
+import asyncio
+from collections.abc import Mapping, Sequence
+
+import pytest
+
+from forging_blocks.infrastructure.repositories.batching_read_repository import (
+    BatchingReadRepository,
+)
+from forging_blocks.infrastructure.repositories.in_memory_read_repository import (
+    InMemoryReadRepository,
+)
+
+
+class _CountingReadRepository(InMemoryReadRepository[str, int]):
+    """Read repository counting bulk and single reads."""
+
+    def __init__(self) -> None:
+        super().__init__({1: "alice", 2: "bob", 3: "carol"})
+        self.bulk_reads: list[list[int]] = []
+        self.single_reads = 0
+
+    async def get_by_id(self, entity_id: int) -> str | None:
+        self.single_reads += 1
+        return await super().get_by_id(entity_id)
+
+    async def get_many(self, entity_ids: Sequence[int]) -> Mapping[int, str]:
+        self.bulk_reads.append(list(entity_ids))
+        return {i: self._storage[i] for i in entity_ids if i in self._storage}
+
+
+@pytest.mark.integration
+class TestBatchingReadRepository:
+    async def test_concurrent_get_by_id_calls_become_one_get_many(self) -> None:
+        inner = _CountingReadRepository()
+        repository = BatchingReadRepository(inner)
+
+        names = await asyncio.gather(*(repository.get_by_id(i) for i in (3, 1, 4)))
+
+        assert names == ["carol", "alice", None]
+        assert inner.bulk_reads == [[3, 1, 4]]
+        assert inner.single_reads == 0
+        assert repository.batches == 1
+
+    async def test_get_many_and_list_all_are_passed_through(self) -> None:
+        inner = _CountingReadRepository()
+        repository = BatchingReadRepository(inner)
+
+        assert await repository.get_many([2]) == {2: "bob"}
+        assert await repository.list_all() == ["alice", "bob", "carol"]
+        assert repository.batches == 0
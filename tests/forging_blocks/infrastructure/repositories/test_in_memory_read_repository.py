@@ -38,6 +38,14 @@ class TestInMemoryReadRepository:
 
         assert result is None
 
+    async def test_get_many_when_some_ids_exist_then_returns_only_found_items(self) -> None:
+        storage = {"1": FakeReadModel("1", "Alice"), "2": FakeReadModel("2", "Bob")}
+        repo = InMemoryReadRepository[FakeReadModel, str](storage)
+
+        result = await repo.get_many(["2", "missing", "1"])
+
+        assert result == {"2": storage["2"], "1": storage["1"]}
+
     async def test_list_all_when_storage_has_items_then_returns_all_items(self) -> None:
         storage = {
             "1": FakeReadModel("1", "Alice"),
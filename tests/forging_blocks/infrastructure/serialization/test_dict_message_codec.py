@@ -11,7 +11,7 @@ from forging_blocks.domain.messages import (
 from forging_blocks.domain.messages.command import Command
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.domain.messages.query import Query
-from forging_blocks.infrastructure.serialization import DictMessageCodec
+from forging_blocks.infrastructure.serialization import DictMessageCodec, UpcasterRegistry
 
 PAYLOAD_MSG: dict[str, object] = {"_name": "write_in", "_value": 42}
 
@@ -149,3 +149,55 @@ class TestDictMessageCodecEdgeCases:
             ValueError, match="Missing required key 'message_id' in message metadata"
         ):
             e_codec.decode(encoded, SimpleEvent)
+
+
+@pytest.mark.unit
+class TestDictMessageCodecUpcasting:
+    """DictMessageCodec with an UpcasterRegistry."""
+
+    @staticmethod
+    def _registry() -> UpcasterRegistry:
+        registry = UpcasterRegistry()
+        registry.register("SimpleEvent", 1, lambda p: {"name": str(p["title"])})
+        registry.register("SimpleEvent", 2, lambda p: {"name": str(p["name"]).upper()})
+        return registry
+
+    def test_encode_records_current_schema_version(self) -> None:
+        codec: DictMessageCodec[SimpleEvent] = DictMessageCodec(upcasters=self._registry())
+
+        encoded = codec.encode(SimpleEvent(name="current"))
+
+        assert encoded["schema_version"] == 3
+
+    def test_decode_current_version_is_not_upcast(self) -> None:
+        codec: DictMessageCodec[SimpleEvent] = DictMessageCodec(upcasters=self._registry())
+
+        decoded = codec.decode(codec.encode(SimpleEvent(name="current")), SimpleEvent)
+
+        assert decoded.name == "current"
+
+    def test_decode_without_schema_version_upcasts_from_version_one(self) -> None:
+        codec: DictMessageCodec[SimpleEvent] = DictMessageCodec(upcasters=self._registry())
+        encoded = DictMessageCodec[SimpleEvent]().encode(SimpleEvent(name="ignored"))
+        encoded["payload"] = {"title": "legacy"}
+
+        decoded = codec.decode(encoded, SimpleEvent)
+
+        assert decoded.name == "LEGACY"
+
+    def test_decode_intermediate_version_applies_remaining_upcasters(self) -> None:
+        codec: DictMessageCodec[SimpleEvent] = DictMessageCodec(upcasters=self._registry())
+        encoded = codec.encode(SimpleEvent(name="middle"))
+        encoded["schema_version"] = 2
+
+        decoded = codec.decode(encoded, SimpleEvent)
+
+        assert decoded.name == "MIDDLE"
+
+    def test_decode_newer_schema_version_raises_value_error(self) -> None:
+        codec: DictMessageCodec[SimpleEvent] = DictMessageCodec(upcasters=self._registry())
+        encoded = codec.encode(SimpleEvent(name="future"))
+        encoded["schema_version"] = 4
+
+        with pytest.raises(ValueError, match="newer than the current version"):
+            codec.decode(encoded, SimpleEvent)
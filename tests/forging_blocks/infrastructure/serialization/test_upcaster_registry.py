@@ -0,0 +1,101 @@
+"""Unit tests for UpcasterRegistry."""
+
+import pytest
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.serialization import UpcasterRegistry
+
+
+def _append(tag: str, calls: list[str]):
+    def upcaster(payload: dict[str, object]) -> dict[str, object]:
+        calls.append(tag)
+        return {**payload, "steps": [*list(payload.get("steps", [])), tag]}
+
+    return upcaster
+
+
+@pytest.mark.unit
+class TestUpcasterRegistry:
+    """Registration, versioning and cached chain composition."""
+
+    def test_current_version_defaults_to_initial_version(self) -> None:
+        assert UpcasterRegistry().current_version("Unknown") == 1
+
+    def test_current_version_is_one_past_highest_upcaster(self) -> None:
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, _append("v2", []))
+        registry.register("OrderPlaced", 2, _append("v3", []))
+
+        assert registry.current_version("OrderPlaced") == 3
+        assert registry.current_version("OrderShipped") == 1
+
+    def test_upcast_applies_steps_from_source_version_in_order(self) -> None:
+        calls: list[str] = []
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 2, _append("v3", calls))
+        registry.register("OrderPlaced", 1, _append("v2", calls))
+
+        assert registry.upcast("OrderPlaced", 1, {})["steps"] == ["v2", "v3"]
+        assert registry.upcast("OrderPlaced", 2, {})["steps"] == ["v3"]
+        assert registry.upcast("OrderPlaced", 3, {"steps": []})["steps"] == []
+
+    def test_upcast_reuses_composed_chain(self) -> None:
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, _append("v2", []))
+        registry.register("OrderPlaced", 2, _append("v3", []))
+
+        registry.upcast("OrderPlaced", 1, {})
+        chain = registry._chains[("OrderPlaced", 1)]
+        registry.upcast("OrderPlaced", 1, {})
+
+        assert registry._chains[("OrderPlaced", 1)] is chain
+
+    def test_register_invalidates_cached_chains_of_that_type(self) -> None:
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, _append("v2", []))
+        assert registry.upcast("OrderPlaced", 1, {})["steps"] == ["v2"]
+
+        registry.register("OrderPlaced", 2, _append("v3", []))
+
+        assert registry.upcast("OrderPlaced", 1, {})["steps"] == ["v2", "v3"]
+
+    def test_upcast_does_not_mutate_the_callers_payload(self) -> None:
+        def rename(payload: dict[str, object]) -> dict[str, object]:
+            payload["total"] = payload.pop("amount")
+            return payload
+
+        def tag(payload: dict[str, object]) -> dict[str, object]:
+            payload["currency"] = "EUR"
+            return payload
+
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, rename)
+        registry.register("OrderPlaced", 2, tag)
+        payload: dict[str, object] = {"amount": 5}
+
+        assert registry.upcast("OrderPlaced", 1, payload) == {"total": 5, "currency": "EUR"}
+        assert registry.upcast("OrderPlaced", 2, payload) == {"amount": 5, "currency": "EUR"}
+        assert payload == {"amount": 5}
+
+    def test_upcast_with_gap_in_chain_raises_value_error(self) -> None:
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, _append("v2", []))
+        registry.register("OrderPlaced", 3, _append("v4", []))
+
+        with pytest.raises(ValueError, match="version 2"):
+            registry.upcast("OrderPlaced", 1, {})
+
+    def test_upcast_newer_version_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="newer"):
+            UpcasterRegistry().upcast("OrderPlaced", 2, {})
+
+    def test_register_duplicate_version_raises_configuration_error(self) -> None:
+        registry = UpcasterRegistry()
+        registry.register("OrderPlaced", 1, _append("v2", []))
+
+        with pytest.raises(ConfigurationError):
+            registry.register("OrderPlaced", 1, _append("again", []))
+
+    def test_register_version_below_initial_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            UpcasterRegistry().register("OrderPlaced", 0, _append("v1", []))
@@ -0,0 +1,84 @@
+"""Tests for the FileSnapshotStore implementation."""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid7
+
+import pytest
+
+from forging_blocks.application.ports.outbound.snapshot_store_port import Snapshot
+from forging_blocks.infrastructure.snapshots.file_snapshot_store import FileSnapshotStore
+
+
+@pytest.mark.integration
+class TestFileSnapshotStore:
+    """Persistence and recovery of snapshot files."""
+
+    async def test_snapshot_survives_reopen(self, tmp_path: Path) -> None:
+        """A snapshot written by one store is read back by another."""
+        aggregate_id = uuid7()
+        taken_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        await FileSnapshotStore(tmp_path, fsync=False).save_snapshot(
+            Snapshot(aggregate_id, 7, {"items": ["a", "b"]}, taken_at)
+        )
+
+        result = await FileSnapshotStore(tmp_path).get_latest_snapshot(aggregate_id)
+
+        assert result.is_ok
+        snapshot = result.value
+        assert snapshot is not None
+        assert snapshot.aggregate_id == aggregate_id
+        assert snapshot.version == 7
+        assert snapshot.state == {"items": ["a", "b"]}
+        assert snapshot.taken_at == taken_at
+
+    async def test_get_latest_snapshot_when_missing_then_returns_none(self, tmp_path: Path) -> None:
+        """An aggregate without a snapshot file yields None."""
+        result = await FileSnapshotStore(tmp_path).get_latest_snapshot(uuid7())
+        assert result.is_ok
+        assert result.value is None
+
+    async def test_save_older_snapshot_keeps_newer_one(self, tmp_path: Path) -> None:
+        """Saving a snapshot older than the stored one is ignored."""
+        store = FileSnapshotStore(tmp_path, fsync=False)
+        aggregate_id = uuid7()
+        await store.save_snapshot(Snapshot(aggregate_id, 10, "newer"))
+        await store.save_snapshot(Snapshot(aggregate_id, 5, "older"))
+
+        snapshot = (await store.get_latest_snapshot(aggregate_id)).value
+        assert snapshot is not None
+        assert snapshot.state == "newer"
+
+    async def test_concurrent_saves_use_separate_temporary_files(self, tmp_path: Path) -> None:
+        """Concurrent writers for one aggregate never share a temporary file."""
+        aggregate_id = uuid7()
+        store = FileSnapshotStore(tmp_path, fsync=False)
+
+        results = await asyncio.gather(
+            *(store.save_snapshot(Snapshot(aggregate_id, 1, i)) for i in range(20))
+        )
+
+        assert all(result.is_ok for result in results)
+        assert [path.name for path in tmp_path.iterdir()] == [f"{aggregate_id}.json"]
+        latest = (await store.get_latest_snapshot(aggregate_id)).value
+        assert latest is not None
+        assert latest.version == 1
+
+    async def test_save_when_state_not_serializable_then_returns_error(
+        self, tmp_path: Path
+    ) -> None:
+        """State that cannot be encoded as JSON is rejected."""
+        result = await FileSnapshotStore(tmp_path).save_snapshot(Snapshot(uuid7(), 1, object()))
+        assert result.is_err
+
+    async def test_get_latest_snapshot_when_corrupt_then_returns_error(
+        self, tmp_path: Path
+    ) -> None:
+        """An unreadable snapshot file surfaces as an error."""
+        aggregate_id = uuid7()
+        (tmp_path / f"{aggregate_id}.json").write_text("{not json", encoding="utf-8")
+
+        result = await FileSnapshotStore(tmp_path).get_latest_snapshot(aggregate_id)
+
+        assert result.is_err
@@ -0,0 +1,39 @@
+"""Tests for the InMemorySnapshotStore implementation."""
+
+from uuid import uuid7
+
+import pytest
+
+from forging_blocks.application.ports.outbound.snapshot_store_port import Snapshot
+from forging_blocks.infrastructure.snapshots.in_memory_snapshot_store import (
+    InMemorySnapshotStore,
+)
+
+
+@pytest.mark.unit
+class TestInMemorySnapshotStore:
+    """Latest-snapshot bookkeeping of the in-memory store."""
+
+    async def test_get_latest_snapshot_when_none_saved_then_returns_none(self) -> None:
+        """An aggregate without snapshots yields None."""
+        result = await InMemorySnapshotStore().get_latest_snapshot(uuid7())
+        assert result.is_ok
+        assert result.value is None
+
+    async def test_save_then_get_returns_snapshot(self) -> None:
+        """A saved snapshot is returned as the latest one."""
+        store = InMemorySnapshotStore()
+        snapshot = Snapshot(uuid7(), 3, {"total": 3})
+
+        assert (await store.save_snapshot(snapshot)).is_ok
+        assert (await store.get_latest_snapshot(snapshot.aggregate_id)).value is snapshot
+
+    async def test_save_older_snapshot_keeps_newer_one(self) -> None:
+        """Saving a snapshot older than the stored one is ignored."""
+        store = InMemorySnapshotStore()
+        aggregate_id = uuid7()
+        newer = Snapshot(aggregate_id, 10, "newer")
+        await store.save_snapshot(newer)
+        await store.save_snapshot(Snapshot(aggregate_id, 5, "older"))
+
+        assert (await store.get_latest_snapshot(aggregate_id)).value is newer
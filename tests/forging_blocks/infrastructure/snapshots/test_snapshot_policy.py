@@ -0,0 +1,55 @@
+"""Tests for the snapshot policies."""
+
+import pytest
+
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.snapshots.snapshot_policy import (
+    EventCountSnapshotPolicy,
+    IntervalSnapshotPolicy,
+    ReplayCostSnapshotPolicy,
+)
+
+
+@pytest.mark.unit
+class TestEventCountSnapshotPolicy:
+    def test_should_snapshot_when_threshold_reached(self) -> None:
+        policy = EventCountSnapshotPolicy(every=3)
+        assert not policy.should_snapshot(2, None, None)
+        assert policy.should_snapshot(3, None, None)
+
+    def test_init_when_not_positive_then_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            EventCountSnapshotPolicy(every=0)
+
+
+@pytest.mark.unit
+class TestIntervalSnapshotPolicy:
+    def test_should_snapshot_when_never_snapshotted(self) -> None:
+        assert IntervalSnapshotPolicy(seconds=60).should_snapshot(1, None, None)
+
+    def test_should_snapshot_when_snapshot_is_stale(self) -> None:
+        policy = IntervalSnapshotPolicy(seconds=60)
+        assert not policy.should_snapshot(1, 59.0, None)
+        assert policy.should_snapshot(1, 60.0, None)
+
+    def test_should_not_snapshot_without_new_events(self) -> None:
+        assert not IntervalSnapshotPolicy(seconds=60).should_snapshot(0, 600.0, None)
+
+    def test_init_when_not_positive_then_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            IntervalSnapshotPolicy(seconds=0)
+
+
+@pytest.mark.unit
+class TestReplayCostSnapshotPolicy:
+    def test_should_snapshot_when_replay_was_slow(self) -> None:
+        policy = ReplayCostSnapshotPolicy(seconds=0.01)
+        assert not policy.should_snapshot(1, None, 0.001)
+        assert policy.should_snapshot(1, None, 0.02)
+
+    def test_should_not_snapshot_without_replay(self) -> None:
+        assert not ReplayCostSnapshotPolicy(seconds=0.01).should_snapshot(5, None, None)
+
+    def test_init_when_not_positive_then_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            ReplayCostSnapshotPolicy(seconds=-1)
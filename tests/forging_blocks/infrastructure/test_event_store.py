@@ -22,6 +22,7 @@ class TestEventStoreBase:
         assert "append_events" in EventStoreBase.__abstractmethods__
         assert "get_events" in EventStoreBase.__abstractmethods__
         assert "get_current_version" in EventStoreBase.__abstractmethods__
+        assert "stream_events" not in EventStoreBase.__abstractmethods__
 
 
 class TestInMemoryEventStoreBase:
@@ -84,3 +85,14 @@ class TestInMemoryEventStoreBase:
         await store.append_events(agg_id, [FakeEventWithName("a"), FakeEventWithName("b")])
         r = await store.get_current_version(agg_id)
         assert r.is_ok and r.value == 2
+
+    async def test_stream_events_yields_batches_of_the_stream(
+        self, store: InMemoryEventStoreBase[dict[str, object]]
+    ) -> None:
+        agg_id = uuid7()
+        await store.append_events(agg_id, [FakeEventWithName(f"e{i}") for i in range(5)])
+
+        batches = [batch async for batch in store.stream_events(agg_id, batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [batch async for batch in store.stream_events(uuid7())] == []
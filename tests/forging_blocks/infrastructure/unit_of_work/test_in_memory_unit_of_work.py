@@ -1,5 +1,6 @@
 # pyright: reportPrivateUsage=false, reportMissingTypeArgument=false, reportUnknownParameterType=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportMissingParameterType=false, reportIncompatibleMethodOverride=false, reportUnusedClass=false, reportFunctionMemberAccess=false, reportArgumentType=false
 from typing import Any, Self
+from uuid import UUID, uuid7
 
 import pytest
 
@@ -7,6 +8,10 @@ from forging_blocks.application import UnitOfWorkError
 from forging_blocks.domain.aggregate_root import AggregateRoot
 from forging_blocks.domain.messages.event import Event
 from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.foundation.errors.configuration_error import ConfigurationError
+from forging_blocks.infrastructure.event_stores.in_memory_event_store import InMemoryEventStore
+from forging_blocks.infrastructure.outbox.in_memory_outbox import InMemoryOutbox
+from forging_blocks.infrastructure.outbox.outbox_relay import OutboxRelay
 from forging_blocks.infrastructure.unit_of_work.in_memory_unit_of_work import (
     InMemoryUnitOfWork,
 )
@@ -44,6 +49,25 @@ class FakeAggregate(AggregateRoot[str, str]):
         pass
 
 
+class FakeUuidAggregate(AggregateRoot[UUID, str]):
+    """A fake aggregate root with a UUID identity for event store tests."""
+
+    def _handle(self, event: Event) -> None:
+        pass
+
+
+class BatchRecordingPublisher(FakeEventPublisher):
+    """Publisher that records each ``publish_many`` call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[Event[object]]] = []
+
+    async def publish_many(self, events) -> None:
+        self.batches.append(list(events))
+        await super().publish_many(events)
+
+
 @pytest.mark.integration
 class TestInMemoryUnitOfWork:
     @pytest.fixture
@@ -201,3 +225,80 @@ class TestInMemoryUnitOfWork:
 
         with pytest.raises(ValueError, match="Cannot register aggregate with None id"):
             uow.register_modified(draft_aggregate)
+
+
+@pytest.mark.integration
+class TestInMemoryUnitOfWorkBatchedAppend:
+    async def test_commit_with_event_store_appends_all_aggregates_in_one_batch(self) -> None:
+        store = InMemoryEventStore[str]()
+        publisher = FakeEventPublisher()
+        aggregates = [FakeUuidAggregate(uuid7()) for _ in range(3)]
+        for aggregate in aggregates:
+            aggregate.apply(FakeEvent("changed"))
+
+        async with InMemoryUnitOfWork(publisher, event_store=store) as uow:
+            for aggregate in aggregates:
+                uow.register_modified(aggregate)
+
+        assert uow.committed is True
+        assert store.position == 3
+        assert len(publisher.published_events) == 3
+        for aggregate in aggregates:
+            assert (await store.get_current_version(aggregate.id)).value == 1
+
+    async def test_commit_when_batch_is_rejected_then_publishes_nothing(self) -> None:
+        store = InMemoryEventStore[str]()
+        publisher = FakeEventPublisher()
+        aggregate = FakeUuidAggregate(uuid7())
+        aggregate.apply(FakeEvent("changed"))
+        await store.append_events(aggregate.id, [FakeEvent("concurrent")])
+        uow = InMemoryUnitOfWork(publisher, event_store=store)
+        uow.register_modified(aggregate)
+
+        with pytest.raises(UnitOfWorkError):
+            await uow.commit()
+
+        assert publisher.published_events == []
+        assert len(aggregate.uncommitted_changes) == 1
+        assert uow.committed is False
+
+    async def test_commit_publishes_events_of_all_aggregates_in_one_batch(self) -> None:
+        publisher = BatchRecordingPublisher()
+        aggregates = [FakeAggregate(f"agg-{i}") for i in range(3)]
+        events = [FakeEvent(f"event-{i}") for i in range(3)]
+        for aggregate, event in zip(aggregates, events, strict=True):
+            aggregate.record_event(event)
+
+        async with InMemoryUnitOfWork(publisher) as uow:
+            for aggregate in aggregates:
+                uow.register_modified(aggregate)
+
+        assert publisher.batches == [events]
+        assert publisher.published_events == events
+
+
+@pytest.mark.integration
+class TestInMemoryUnitOfWorkOutbox:
+    async def test_commit_with_outbox_stores_events_instead_of_publishing(self) -> None:
+        store = InMemoryEventStore[str]()
+        outbox = InMemoryOutbox[str]()
+        publisher = FakeEventPublisher()
+        aggregates = [FakeUuidAggregate(uuid7()) for _ in range(2)]
+        for aggregate in aggregates:
+            aggregate.apply(FakeEvent("changed"))
+
+        async with InMemoryUnitOfWork(event_store=store, outbox=outbox) as uow:
+            for aggregate in aggregates:
+                uow.register_modified(aggregate)
+
+        assert uow.committed is True
+        assert store.position == 2
+        assert len(outbox) == 2
+        assert publisher.published_events == []
+
+        assert await OutboxRelay(outbox, publisher).drain() == 2
+        assert len(publisher.published_events) == 2
+
+    def test_init_with_publisher_and_outbox_then_raises_configuration_error(self) -> None:
+        with pytest.raises(ConfigurationError):
+            InMemoryUnitOfWork(FakeEventPublisher(), outbox=InMemoryOutbox[str]())
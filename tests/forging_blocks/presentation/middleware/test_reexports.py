@@ -0,0 +1,26 @@
+"""The presentation middleware import paths still resolve after the move to the foundation."""
+
+import importlib
+
+import pytest
+
+from forging_blocks.foundation.middleware import Middleware, NextHandler, Pipeline
+
+
+@pytest.mark.unit
+class TestPresentationMiddlewareReexports:
+    @pytest.mark.parametrize(
+        ("module", "name", "expected"),
+        [
+            ("forging_blocks.presentation.middleware", "Middleware", Middleware),
+            ("forging_blocks.presentation.middleware", "NextHandler", NextHandler),
+            ("forging_blocks.presentation.middleware", "Pipeline", Pipeline),
+            ("forging_blocks.presentation.middleware.middleware", "Middleware", Middleware),
+            ("forging_blocks.presentation.middleware.next_handler", "NextHandler", NextHandler),
+            ("forging_blocks.presentation.middleware.pipeline", "Pipeline", Pipeline),
+        ],
+    )
+    def test_old_import_path_resolves_to_the_foundation_object(
+        self, module: str, name: str, expected: object
+    ) -> None:
+        assert getattr(importlib.import_module(module), name) is expected